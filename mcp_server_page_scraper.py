@@ -9,10 +9,21 @@ Tools:
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import http.client
+import json
+import os
 import re
+import threading
+import time
+import urllib.error
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from html import unescape
+from email.message import Message
+from html import escape, unescape
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, unquote, urljoin, urlparse
@@ -51,6 +62,363 @@ DEFAULT_HEADERS = {
 
 IMAGE_MD_PATTERN = re.compile(r"!\[([^\]]*)\]\((https?://[^)\s]+)\)")
 
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "data" / "page_scraper_cache"
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class _HttpPool:
+    """Keep-alive HTTP(S) connections shared per host with a concurrency cap.
+
+    Each host gets a semaphore limiting in-flight requests and a stack of
+    idle connections that are reused across pages, raw-markdown probes and
+    image downloads. Requests fall back to urllib when a proxy is configured
+    for the URL scheme, since http.client does not honor proxy settings.
+    """
+
+    def __init__(self, per_host_limit: int = 4) -> None:
+        self.per_host_limit = max(1, per_host_limit)
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._slots: dict[tuple[str, str], threading.BoundedSemaphore] = {}
+        self._proxies = urllib.request.getproxies()
+
+    def _host_slot(self, key: tuple[str, str]) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._slots[key] = slot
+            return slot
+
+    def _checkout(self, key: tuple[str, str], timeout: int) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                return conn, True
+        scheme, netloc = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(netloc, timeout=timeout), False
+
+    def _checkin(self, key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.per_host_limit:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _request_once(self, url: str, timeout: int, headers: dict[str, str]) -> tuple[int, Message, bytes, str]:
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        with self._host_slot(key):
+            for attempt in range(2):
+                conn, reused = self._checkout(key, timeout)
+                try:
+                    conn.request("GET", target, headers=headers)
+                    resp = conn.getresponse()
+                    body = resp.read()
+                except (http.client.HTTPException, ConnectionError, OSError):
+                    conn.close()
+                    # A reused keep-alive socket may have been closed by the server.
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                if resp.will_close:
+                    conn.close()
+                else:
+                    self._checkin(key, conn)
+                return resp.status, resp.msg, body, resp.reason
+        raise ConnectionError(f"Unable to fetch {url}")
+
+    def fetch(
+        self,
+        url: str,
+        timeout: int = 60,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, Message, bytes]:
+        """GET a URL, following redirects; return (status, headers, body).
+
+        Raises HTTPError for 4xx/5xx. A 304 Not Modified is returned, not raised.
+        """
+        request_headers = dict(DEFAULT_HEADERS)
+        if headers:
+            request_headers.update(headers)
+
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            scheme = urlparse(current).scheme
+            if scheme not in {"http", "https"} or scheme in self._proxies:
+                req = urllib.request.Request(current, headers=request_headers)
+                try:
+                    with urllib.request.urlopen(req, timeout=timeout) as resp:
+                        return resp.status, resp.headers, resp.read()
+                except urllib.error.HTTPError as exc:
+                    if exc.code == 304:
+                        return 304, exc.headers, b""
+                    raise
+
+            status, msg, body, reason = self._request_once(current, timeout, request_headers)
+            if status in REDIRECT_STATUSES and msg.get("Location"):
+                current = urljoin(current, msg["Location"])
+                continue
+            if status >= 400:
+                raise urllib.error.HTTPError(current, status, reason, msg, None)
+            return status, msg, body
+
+        raise urllib.error.HTTPError(current, 310, "Too many redirects", Message(), None)
+
+    def get(self, url: str, timeout: int = 60, headers: dict[str, str] | None = None) -> bytes:
+        """GET a URL, following redirects, and return the body bytes."""
+        return self.fetch(url, timeout=timeout, headers=headers)[2]
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+_HTTP_POOL = _HttpPool()
+
+
+class _HttpCache:
+    """On-disk conditional-GET cache with content-addressed bodies.
+
+    Layout under root:
+    - index.json: url -> {etag, last_modified, sha256, size}, in LRU order
+    - blobs/<sha256>: response bodies, shared by every URL with equal content
+
+    Only responses carrying an ETag or Last-Modified validator are stored;
+    re-fetches send If-None-Match / If-Modified-Since and reuse the blob on
+    304. When unique blob bytes exceed max_bytes, least recently used URLs
+    are evicted and unreferenced blobs deleted. Index changes (including
+    LRU touches) only mark it dirty; flush() writes it once per scrape call
+    and at interpreter exit.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.root = root
+        self.blob_dir = root / "blobs"
+        self.index_path = root / "index.json"
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._blob_sizes: dict[str, int] = {}
+        self._blob_refs: dict[str, int] = {}
+        self._local_copies: dict[str, Path] = {}
+        self._total_bytes = 0
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for url, entry in (payload.get("entries", []) if isinstance(payload, dict) else []):
+            digest = entry.get("sha256", "")
+            if not digest or not (self.blob_dir / digest).exists():
+                continue
+            self._entries[url] = entry
+            self._add_ref(digest, int(entry.get("size", 0)))
+
+    def flush(self) -> None:
+        """Write index.json if it changed; serialization happens outside the main lock."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                entries = list(self._entries.items())
+                self._dirty = False
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps({"entries": entries}, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _add_ref(self, digest: str, size: int) -> None:
+        if digest not in self._blob_sizes:
+            self._blob_sizes[digest] = size
+            self._total_bytes += size
+        self._blob_refs[digest] = self._blob_refs.get(digest, 0) + 1
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest
+
+    def store_blob(self, data: bytes) -> str:
+        """Write a content-addressed blob (if new) and return its sha256."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if not path.exists():
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{digest}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return digest
+
+    def validators(self, url: str) -> dict[str, str]:
+        """Conditional request headers for a cached URL."""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read(self, url: str) -> bytes | None:
+        """Return the cached body for url (verifying its digest) and touch it."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry:
+                return None
+            self._entries.move_to_end(url)
+            self._dirty = True
+        try:
+            data = self.blob_path(entry["sha256"]).read_bytes()
+        except OSError:
+            data = None
+        if data is None or hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            with self._lock:
+                self._drop(url)
+            return None
+        return data
+
+    def put(self, url: str, headers: Message, data: bytes) -> None:
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        digest = self.store_blob(data)
+        with self._lock:
+            previous = self._entries.get(url, {}).get("sha256")
+            self._drop(url, delete_blob=previous != digest)
+            self._entries[url] = {
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+                "sha256": digest,
+                "size": len(data),
+            }
+            self._add_ref(digest, len(data))
+            self._dirty = True
+            self._evict()
+
+    def _drop(self, url: str, delete_blob: bool = True) -> None:
+        entry = self._entries.pop(url, None)
+        if not entry:
+            return
+        self._dirty = True
+        digest = entry["sha256"]
+        refs = self._blob_refs.get(digest, 0) - 1
+        if refs > 0:
+            self._blob_refs[digest] = refs
+            return
+        self._blob_refs.pop(digest, None)
+        self._total_bytes -= self._blob_sizes.pop(digest, 0)
+        if delete_blob:
+            try:
+                self.blob_path(digest).unlink()
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        while self._entries and self._total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+
+    def link_or_write(self, local_file: Path, data: bytes) -> None:
+        """Materialize data at local_file, hard-linking identical content.
+
+        Reuses the cached blob when one exists, otherwise a previously
+        written local copy with the same digest; falls back to writing.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            sources = []
+            if digest in self._blob_refs:
+                sources.append(self.blob_path(digest))
+            if digest in self._local_copies:
+                sources.append(self._local_copies[digest])
+        for source in sources:
+            try:
+                os.link(source, local_file)
+                return
+            except OSError:
+                continue
+        local_file.write_bytes(data)
+        with self._lock:
+            self._local_copies.setdefault(digest, local_file)
+
+    def fetch(self, url: str, pool: _HttpPool, timeout: int = 60) -> bytes:
+        """Fetch url through the pool using conditional GET against the cache."""
+        status, headers, body = pool.fetch(url, timeout=timeout, headers=self.validators(url))
+        if status == 304:
+            cached = self.read(url)
+            if cached is not None:
+                with self._lock:
+                    self.revalidated += 1
+                    self.hits += 1
+                return cached
+            status, headers, body = pool.fetch(url, timeout=timeout)
+        with self._lock:
+            self.misses += 1
+        self.put(url, headers, body)
+        return body
+
+
+_HTTP_CACHES: dict[Path, _HttpCache] = {}
+_HTTP_CACHES_LOCK = threading.Lock()
+
+
+def _get_http_cache(
+    use_cache: bool = True,
+    cache_dir: str | Path | None = None,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+) -> _HttpCache | None:
+    """Shared cache instance per directory (None when caching is disabled)."""
+    if not use_cache:
+        return None
+    root = Path(cache_dir).resolve() if cache_dir else DEFAULT_CACHE_DIR
+    with _HTTP_CACHES_LOCK:
+        cache = _HTTP_CACHES.get(root)
+        if cache is None:
+            cache = _HttpCache(root, max_bytes=max_bytes)
+            _HTTP_CACHES[root] = cache
+        return cache
+
+
+def _flush_http_caches() -> None:
+    with _HTTP_CACHES_LOCK:
+        caches = list(_HTTP_CACHES.values())
+    for cache in caches:
+        try:
+            cache.flush()
+        except OSError:
+            pass
+
+
+atexit.register(_flush_http_caches)
+
 
 def _resolve_path(path_value: str) -> Path:
     return Path(path_value).resolve()
@@ -60,17 +428,25 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _fetch_text(url: str, timeout: int = 60) -> str:
-    req = urllib.request.Request(url, headers=DEFAULT_HEADERS)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read()
+def _fetch_text(
+    url: str,
+    timeout: int = 60,
+    pool: _HttpPool | None = None,
+    cache: _HttpCache | None = None,
+) -> str:
+    data = _fetch_bytes(url, timeout=timeout, pool=pool, cache=cache)
     return data.decode("utf-8", errors="replace")
 
 
-def _fetch_bytes(url: str, timeout: int = 60) -> bytes:
-    req = urllib.request.Request(url, headers=DEFAULT_HEADERS)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+def _fetch_bytes(
+    url: str,
+    timeout: int = 60,
+    pool: _HttpPool | None = None,
+    cache: _HttpCache | None = None,
+) -> bytes:
+    if cache is not None:
+        return cache.fetch(url, pool or _HTTP_POOL, timeout=timeout)
+    return (pool or _HTTP_POOL).get(url, timeout=timeout)
 
 
 def _slugify(text: str, fallback: str = "page") -> str:
@@ -87,50 +463,46 @@ def _slug_from_url(url: str) -> str:
 
 
 def _extract_tag_block(html: str, start_idx: int, tag_name: str) -> str:
-    pos = start_idx
     depth = 0
-    length = len(html)
-    open_pattern = re.compile(rf"<{tag_name}(\s|>)", re.I)
-    close_pattern = re.compile(rf"</{tag_name}\s*>", re.I)
-
-    while pos < length:
-        open_match = open_pattern.search(html, pos)
-        close_match = close_pattern.search(html, pos)
-
-        if close_match is None:
-            break
+    token_pattern = re.compile(rf"(?P<open><{tag_name}(\s|>))|</{tag_name}\s*>", re.I)
 
-        if open_match is not None and open_match.start() < close_match.start():
+    for token in token_pattern.finditer(html, start_idx):
+        if token.group("open"):
             depth += 1
-            pos = open_match.end()
         else:
             depth -= 1
-            pos = close_match.end()
             if depth == 0:
-                return html[start_idx:pos]
+                return html[start_idx:token.end()]
 
     return html[start_idx:]
 
 
+_FRAGMENT_CANDIDATE_PATTERN = re.compile(
+    r"<(?P<tag>article|main|body)(\s|>)|(?P<div><div[^>]*class=\"[^\"]*page-wrapper[^\"]*\")",
+    re.I,
+)
+_FRAGMENT_PRIORITY = ("article", "main", "div", "body")
+
+
 def _extract_best_fragment(html: str) -> str:
-    candidates = [
-        (r"<article(\s|>)", "article"),
-        (r"<main(\s|>)", "main"),
-        (r"<div[^>]*class=\"[^\"]*page-wrapper[^\"]*\"", "div"),
-        (r"<body(\s|>)", "body"),
-    ]
-
-    for pattern, tag in candidates:
-        match = re.search(pattern, html, flags=re.I)
-        if not match:
+    # One scan records the first occurrence of each candidate container.
+    first: dict[str, int] = {}
+    for match in _FRAGMENT_CANDIDATE_PATTERN.finditer(html):
+        kind = "div" if match.group("div") else match.group("tag").lower()
+        first.setdefault(kind, match.start())
+        if kind == "article":
+            break
+
+    for tag in _FRAGMENT_PRIORITY:
+        if tag not in first:
             continue
         if tag == "div":
             # Find the closest opening <div> for matched class.
-            open_idx = html.rfind("<div", 0, match.start())
+            open_idx = html.rfind("<div", 0, first[tag])
             if open_idx >= 0:
                 return _extract_tag_block(html, open_idx, "div")
             continue
-        return _extract_tag_block(html, match.start(), tag)
+        return _extract_tag_block(html, first[tag], tag)
 
     return html
 
@@ -180,7 +552,12 @@ def _looks_like_markdown_article(text: str) -> bool:
     return stripped.startswith("#") or "\n## " in stripped
 
 
-def _fetch_raw_markdown_if_available(url: str, html: str) -> tuple[str | None, str | None]:
+def _fetch_raw_markdown_if_available(
+    url: str,
+    html: str,
+    pool: _HttpPool | None = None,
+    cache: _HttpCache | None = None,
+) -> tuple[str | None, str | None]:
     candidate_urls: list[str] = []
 
     discovered = _extract_raw_endpoint_from_html(html, base_url=url)
@@ -193,7 +570,7 @@ def _fetch_raw_markdown_if_available(url: str, html: str) -> tuple[str | None, s
 
     for candidate in candidate_urls:
         try:
-            text = _fetch_text(candidate)
+            text = _fetch_text(candidate, pool=pool, cache=cache)
         except Exception:
             continue
         if _looks_like_markdown_article(text):
@@ -232,107 +609,380 @@ def _strip_leading_h1(markdown: str) -> str:
     return ("\n".join(lines).strip() + "\n") if lines else ""
 
 
-def _html_fragment_to_markdown(fragment: str, base_url: str) -> str:
+_NON_CONTENT_PATTERNS = tuple(
+    re.compile(rf"<{tag}[^>]*>.*?</{tag}>", re.S | re.I) for tag in ("script", "style", "noscript", "svg")
+)
+_CODE_BLOCK_PATTERN = re.compile(r"<pre[^>]*><code[^>]*>(.*?)</code></pre>", re.S | re.I)
+_INLINE_CODE_PATTERN = re.compile(r"<code[^>]*>(.*?)</code>", re.S | re.I)
+_HEADING_PATTERNS = tuple(
+    (lvl, re.compile(rf"<h{lvl}[^>]*>(.*?)</h{lvl}>", re.S | re.I)) for lvl in range(6, 0, -1)
+)
+_IMG_TAG_PATTERN = re.compile(r"<img[^>]*>", re.S | re.I)
+_LINK_PATTERN = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>(.*?)</a>', re.S | re.I)
+_LI_PATTERN = re.compile(r"<li[^>]*>(.*?)</li>", re.S | re.I)
+_BLOCK_CLOSE_PATTERN = re.compile(r"</(p|div|section|article|main|header|footer|aside|blockquote|tr)\s*>", re.I)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_HSPACE_PATTERN = re.compile(r"[ \t]+")
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+_IMG_SRC_PATTERN = re.compile(r'src\s*=\s*"([^"]+)"', re.I)
+_IMG_ALT_PATTERN = re.compile(r'alt\s*=\s*"([^"]*)"', re.I)
+_BARE_BREAK_PATTERN = re.compile(r"<(br|hr)\s*/?>", re.I)
+_CODE_PLACEHOLDER_PATTERN = re.compile("\ue000(\\d+)\ue001")
+
+
+def _inline_markdown_text(raw: str) -> str:
+    """Collapse whitespace and decode entities of a converted element's inner text."""
+    return unescape(_WHITESPACE_PATTERN.sub(" ", raw)).strip()
+
+
+def _render_code_block(code: str) -> str:
+    code = code.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in code.split("\n"))
+
+
+def _normalize_markdown_text(text: str) -> str:
+    text = unescape(text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _HSPACE_PATTERN.sub(" ", text)
+    text = _BLANK_LINES_PATTERN.sub("\n\n", text)
+    return "\n".join(line.rstrip() for line in text.split("\n"))
+
+
+def _html_fragment_to_markdown_regex(fragment: str, base_url: str) -> str:
+    """Multi-pass regex reference for _html_fragment_to_markdown.
+
+    Produces the same markdown as the single-pass converter on well-formed
+    fragments. Kept for parity tests and benchmarks: every lazy pass
+    rescans to the end of the fragment for each unclosed tag, so it is
+    quadratic on sloppy markup.
+
+    Converted text is re-escaped so later passes never treat decoded text
+    as markup and entities are decoded exactly once. Code blocks are
+    swapped for placeholders so their indentation survives whitespace
+    normalization.
+    """
     frag = fragment
+    code_blocks: list[str] = []
+
+    def _expand_code(inner: str) -> str:
+        return _CODE_PLACEHOLDER_PATTERN.sub(lambda m: escape(code_blocks[int(m.group(1))], quote=False), inner)
 
     # Remove non-content elements.
-    frag = re.sub(r"<script[^>]*>.*?</script>", "", frag, flags=re.S | re.I)
-    frag = re.sub(r"<style[^>]*>.*?</style>", "", frag, flags=re.S | re.I)
-    frag = re.sub(r"<noscript[^>]*>.*?</noscript>", "", frag, flags=re.S | re.I)
-    frag = re.sub(r"<svg[^>]*>.*?</svg>", "", frag, flags=re.S | re.I)
+    for pattern in _NON_CONTENT_PATTERNS:
+        frag = pattern.sub("", frag)
 
     # Code blocks first to preserve formatting.
     def _code_block_repl(match: re.Match[str]) -> str:
-        inner = re.sub(r"<[^>]+>", "", match.group(1))
-        inner = unescape(inner).strip("\n")
-        return f"\n```\n{inner}\n```\n"
-
-    frag = re.sub(
-        r"<pre[^>]*><code[^>]*>(.*?)</code></pre>",
-        _code_block_repl,
-        frag,
-        flags=re.S | re.I,
-    )
+        inner = _TAG_PATTERN.sub("", match.group(1))
+        code_blocks.append(unescape(inner).strip("\n"))
+        return f"\n```\n\ue000{len(code_blocks) - 1}\ue001\n```\n"
+
+    frag = _CODE_BLOCK_PATTERN.sub(_code_block_repl, frag)
 
     # Inline code.
     def _inline_code_repl(match: re.Match[str]) -> str:
-        inner = re.sub(r"<[^>]+>", "", match.group(1))
-        inner = unescape(re.sub(r"\s+", " ", inner)).strip()
-        return f"`{inner}`" if inner else ""
+        inner = _inline_markdown_text(_TAG_PATTERN.sub("", _expand_code(match.group(1))))
+        return f"`{escape(inner, quote=False)}`" if inner else ""
 
-    frag = re.sub(r"<code[^>]*>(.*?)</code>", _inline_code_repl, frag, flags=re.S | re.I)
+    frag = _INLINE_CODE_PATTERN.sub(_inline_code_repl, frag)
 
     # Headings.
-    for lvl in range(6, 0, -1):
-        pattern = rf"<h{lvl}[^>]*>(.*?)</h{lvl}>"
+    for lvl, pattern in _HEADING_PATTERNS:
 
         def _heading_repl(match: re.Match[str], level: int = lvl) -> str:
-            inner = re.sub(r"<[^>]+>", "", match.group(1))
-            inner = unescape(re.sub(r"\s+", " ", inner)).strip()
-            return "\n" + ("#" * level) + f" {inner}\n"
+            inner = _inline_markdown_text(_TAG_PATTERN.sub("", _expand_code(match.group(1))))
+            return "\n" + ("#" * level) + f" {escape(inner, quote=False)}\n"
 
-        frag = re.sub(pattern, _heading_repl, frag, flags=re.S | re.I)
+        frag = pattern.sub(_heading_repl, frag)
 
     # Images.
     def _img_repl(match: re.Match[str]) -> str:
-        tag = match.group(0)
-        src_match = re.search(r'src\s*=\s*"([^"]+)"', tag, flags=re.I)
-        alt_match = re.search(r'alt\s*=\s*"([^"]*)"', tag, flags=re.I)
-        if not src_match:
-            return ""
-
-        src = _decode_next_image_url(src_match.group(1).strip())
-        resolved_src = urljoin(base_url, src)
-        alt = unescape(alt_match.group(1).strip()) if alt_match else ""
-        return f"![{alt}]({resolved_src})"
+        return _img_markdown(match.group(0), base_url)
 
-    frag = re.sub(r"<img[^>]*>", _img_repl, frag, flags=re.S | re.I)
+    frag = _IMG_TAG_PATTERN.sub(_img_repl, frag)
 
     # Links.
     def _link_repl(match: re.Match[str]) -> str:
-        href = match.group(1).strip()
-        text = re.sub(r"<[^>]+>", "", match.group(2))
-        text = unescape(re.sub(r"\s+", " ", text)).strip()
-        if not text:
-            text = href
-        resolved_href = urljoin(base_url, href)
-        return f"[{text}]({resolved_href})"
+        return _link_markdown(
+            match.group(1),
+            _inline_markdown_text(_TAG_PATTERN.sub("", _expand_code(match.group(2)))),
+            base_url,
+        )
 
-    frag = re.sub(r'<a[^>]*href="([^"]+)"[^>]*>(.*?)</a>', _link_repl, frag, flags=re.S | re.I)
+    frag = _LINK_PATTERN.sub(_link_repl, frag)
 
     # Lists.
     def _li_repl(match: re.Match[str]) -> str:
-        inner = re.sub(r"<[^>]+>", "", match.group(1))
-        inner = unescape(re.sub(r"\s+", " ", inner)).strip()
-        return f"- {inner}\n" if inner else ""
+        inner = _inline_markdown_text(_TAG_PATTERN.sub("", _expand_code(match.group(1))))
+        return f"- {escape(inner, quote=False)}\n" if inner else ""
 
-    frag = re.sub(r"<li[^>]*>(.*?)</li>", _li_repl, frag, flags=re.S | re.I)
+    frag = _LI_PATTERN.sub(_li_repl, frag)
 
     # Paragraph and block separators.
-    frag = re.sub(r"</(p|div|section|article|main|header|footer|aside|blockquote|tr)\s*>", "\n\n", frag, flags=re.I)
-    frag = re.sub(r"<(br|hr)\s*/?>", "\n", frag, flags=re.I)
+    frag = _BLOCK_CLOSE_PATTERN.sub("\n\n", frag)
+    frag = _BARE_BREAK_PATTERN.sub("\n", frag)
 
-    # Remove remaining tags.
-    text = re.sub(r"<[^>]+>", "", frag)
-    text = unescape(text)
-
-    # Normalize whitespace.
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    # Remove remaining tags, normalize whitespace, then restore code blocks.
+    text = _normalize_markdown_text(_TAG_PATTERN.sub("", frag))
+    text = _CODE_PLACEHOLDER_PATTERN.sub(lambda m: _render_code_block(code_blocks[int(m.group(1))]), text)
     return text.strip() + "\n"
 
 
-def _localize_images(markdown: str, md_path: Path, slug: str) -> tuple[str, list[dict[str, str]]]:
+def _img_markdown(raw_tag: str, base_url: str) -> str:
+    src_match = _IMG_SRC_PATTERN.search(raw_tag)
+    if not src_match:
+        return ""
+    alt_match = _IMG_ALT_PATTERN.search(raw_tag)
+    src = _decode_next_image_url(src_match.group(1).strip())
+    alt = unescape(alt_match.group(1).strip()) if alt_match else ""
+    return f"![{escape(alt, quote=False)}]({urljoin(base_url, src)})"
+
+
+def _link_markdown(href: str, text: str, base_url: str) -> str:
+    href = href.strip()
+    label = escape(text, quote=False) if text else href
+    return f"[{label}]({urljoin(base_url, href)})"
+
+
+_MARKUP_TOKEN_PATTERN = re.compile(r"<(?=[^>])(/?)([A-Za-z][A-Za-z0-9]*|)([^>]*)>")
+_SKIP_CLOSE_PATTERNS = {tag: re.compile(rf"</{tag}>", re.I) for tag in ("script", "style", "noscript", "svg")}
+_BLOCK_CLOSE_TAGS = {"p", "div", "section", "article", "main", "header", "footer", "aside", "blockquote", "tr"}
+
+# Precedence follows the order of the passes in
+# _html_fragment_to_markdown_regex: an element nested inside a construct is
+# converted only if its pass runs earlier (lower value); otherwise its tags
+# are stripped and only its text survives. Headings run h6 first.
+_PREC_CODE_BLOCK = 0
+_PREC_CODE = 1
+_PREC_IMG = 8
+_PREC_LINK = 9
+_PREC_LI = 10
+_PREC_NONE = 99
+_HEADING_PREC = {f"h{lvl}": 8 - lvl for lvl in range(1, 7)}
+_CONTAINER_PREC = {"code": _PREC_CODE, "li": _PREC_LI, **_HEADING_PREC}
+_START_TAGS = {"pre", "a", "img", "br", "hr", *_CONTAINER_PREC}
+_END_TAGS = {"pre", "a", *_CONTAINER_PREC, *_BLOCK_CLOSE_TAGS}
+
+_LINK_START_PATTERN = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>', re.I | re.S)
+_CONTAINER_CLOSE_PATTERN = re.compile(r"</(code></pre|code|h[1-6]|a|li)>", re.I)
+
+
+class _Frame:
+    """An open markdown construct collecting raw inner text."""
+
+    __slots__ = ("tag", "prec", "parts", "href")
+
+    def __init__(self, tag: str, prec: int, href: str = "") -> None:
+        self.tag = tag
+        self.prec = prec
+        self.href = href
+        self.parts: list[str] = []
+
+
+class _MarkdownConverter:
+    """Single-pass HTML -> markdown converter.
+
+    Tags are what the regex pipeline considers tags (``<[^>]+>``), found
+    with one compiled search per tag; text between them is buffered on a
+    stack of open constructs. Whether a construct is ever closed is looked
+    up in a table of last closing-tag positions built once per fragment,
+    so unclosed tags cost a lookup instead of a rescan and runtime stays
+    linear in the fragment.
+    """
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        self._frames: list[_Frame] = []
+        self._segments: list[tuple[bool, str]] = []  # (is_code, text)
+        self._text: list[str] = []
+        self._pre_pending = False
+        self._code_close_pending = False
+        self._fragment = ""
+        self._last_close: dict[str, int] | None = None
+
+    def _closes_later(self, tag: str, pos: int) -> bool:
+        """Whether a ``</tag>`` occurs at or after ``pos`` (computed once, on demand)."""
+        if self._last_close is None:
+            self._last_close = {}
+            for match in _CONTAINER_CLOSE_PATTERN.finditer(self._fragment):
+                name = match.group(1).lower()
+                if name == "code></pre":
+                    self._last_close["pre"] = match.start()
+                    name = "code"
+                self._last_close[name] = match.start()
+        return self._last_close.get(tag, -1) >= pos
+
+    def _emit(self, text: str) -> None:
+        if self._frames:
+            self._frames[-1].parts.append(text)
+        else:
+            self._text.append(text)
+
+    def _close_frame(self, frame: _Frame) -> None:
+        if frame.tag == "pre":
+            code = unescape("".join(frame.parts)).strip("\n")
+            if self._frames:
+                self._emit(escape(f"\n```\n{code}\n```\n", quote=False))
+            else:
+                self._text.append("\n```\n")
+                self._segments.append((False, "".join(self._text)))
+                self._segments.append((True, code))
+                self._text = ["\n```\n"]
+            return
+
+        inner = _inline_markdown_text("".join(frame.parts))
+        if frame.tag == "a":
+            self._emit(_link_markdown(frame.href, inner, self.base_url))
+        elif frame.tag in _HEADING_PREC:
+            self._emit("\n" + ("#" * int(frame.tag[1])) + f" {escape(inner, quote=False)}\n")
+        elif inner:
+            self._emit(f"`{escape(inner, quote=False)}`" if frame.tag == "code" else f"- {escape(inner, quote=False)}\n")
+
+    def _start_tag(self, name: str, token: re.Match[str]) -> None:
+        pre_pending = self._pre_pending
+        self._pre_pending = self._code_close_pending = False
+        frames = self._frames
+        # Like the regex passes, a construct is only opened if its closing
+        # tag occurs later; otherwise the tag is dropped.
+        end = token.end()
+        if pre_pending and name == "code" and self._closes_later("pre", end):
+            frames.append(_Frame("pre", _PREC_CODE_BLOCK))
+            return
+
+        limit = frames[-1].prec if frames else _PREC_NONE
+        prec = _CONTAINER_PREC.get(name)
+        if prec is not None:
+            if prec < limit and self._closes_later(name, end):
+                frames.append(_Frame(name, prec))
+        elif name == "pre":
+            self._pre_pending = _PREC_CODE_BLOCK < limit
+        elif name == "a":
+            if _PREC_LINK < limit and self._closes_later("a", end):
+                link_match = _LINK_START_PATTERN.match(token.group(0))
+                if link_match:
+                    frames.append(_Frame("a", _PREC_LINK, href=link_match.group(1)))
+        elif name == "img":
+            if _PREC_IMG < limit:
+                self._emit(_img_markdown(token.group(0), self.base_url))
+        elif name in ("br", "hr") and not frames and _BARE_BREAK_PATTERN.fullmatch(token.group(0)):
+            self._text.append("\n")
+
+    def _end_tag(self, name: str, rest: str, pos: int) -> None:
+        code_close_pending = self._code_close_pending
+        self._pre_pending = self._code_close_pending = False
+        frames = self._frames
+
+        if frames and frames[-1].tag == "pre":
+            if not rest:
+                if code_close_pending and name == "pre":
+                    self._close_frame(frames.pop())
+                elif name == "code":
+                    self._code_close_pending = True
+            return
+
+        if not rest:
+            for idx in range(len(frames) - 1, -1, -1):
+                if frames[idx].tag == name:
+                    # A nested construct that closes later would have matched
+                    # across this tag in its (earlier) regex pass and dropped it.
+                    if any(self._closes_later(frame.tag, pos) for frame in frames[idx + 1:]):
+                        return
+                    while len(frames) > idx + 1:
+                        self._flush_raw(frames.pop())
+                    self._close_frame(frames.pop())
+                    return
+
+        if not frames and name in _BLOCK_CLOSE_TAGS and not rest.strip():
+            self._text.append("\n\n")
+
+    def _flush_raw(self, frame: _Frame) -> None:
+        """An unclosed construct degrades to its raw inner text."""
+        self._emit("".join(frame.parts))
+
+    def convert(self, fragment: str) -> str:
+        self._fragment = fragment
+        search = _MARKUP_TOKEN_PATTERN.search
+        pos = 0
+        while True:
+            token = search(fragment, pos)
+            if token is None:
+                break
+            start = token.start()
+            if start > pos:
+                self._pre_pending = self._code_close_pending = False
+                frames = self._frames
+                (frames[-1].parts if frames else self._text).append(fragment[pos:start])
+            pos = token.end()
+
+            closing, name, rest = token.groups()
+            name = name.lower()
+            if name not in (_END_TAGS if closing else _START_TAGS) and name not in _SKIP_CLOSE_PATTERNS:
+                self._pre_pending = self._code_close_pending = False  # tag is simply dropped
+            elif closing:
+                self._end_tag(name, rest, pos)
+            elif name in _SKIP_CLOSE_PATTERNS:
+                close = _SKIP_CLOSE_PATTERNS[name].search(fragment, pos)
+                if close is not None:
+                    pos = close.end()  # removed outright, like the regex pass
+                else:
+                    self._pre_pending = self._code_close_pending = False
+            else:
+                self._start_tag(name, token)
+        if pos < len(fragment):
+            self._emit(fragment[pos:])
+
+        while self._frames:
+            self._flush_raw(self._frames.pop())
+        self._segments.append((False, "".join(self._text)))
+
+        rendered = [
+            _render_code_block(chunk) if is_code else _normalize_markdown_text(chunk)
+            for is_code, chunk in self._segments
+        ]
+        return "".join(rendered).strip() + "\n"
+
+
+def _html_fragment_to_markdown_parser(fragment: str, base_url: str) -> str:
+    """Convert an HTML fragment to markdown in a single pass."""
+    return _MarkdownConverter(base_url).convert(fragment)
+
+
+_html_fragment_to_markdown = _html_fragment_to_markdown_parser
+
+
+def _download_image(
+    remote_url: str,
+    local_file: Path,
+    pool: _HttpPool | None = None,
+    cache: _HttpCache | None = None,
+) -> bool:
+    if local_file.exists():
+        return True
+    try:
+        data = _fetch_bytes(remote_url, pool=pool, cache=cache)
+        if cache is not None:
+            cache.link_or_write(local_file, data)
+        else:
+            local_file.write_bytes(data)
+    except Exception:
+        return False
+    return True
+
+
+def _localize_images(
+    markdown: str,
+    md_path: Path,
+    slug: str,
+    pool: _HttpPool | None = None,
+    image_workers: int = 4,
+    cache: _HttpCache | None = None,
+) -> tuple[str, list[dict[str, str]]]:
     img_dir = md_path.parent / f"{slug}-images"
     img_dir.mkdir(parents=True, exist_ok=True)
 
-    records: list[dict[str, str]] = []
-    updated = markdown
-
+    planned: list[tuple[re.Match[str], str, Path]] = []
     for match in IMAGE_MD_PATTERN.finditer(markdown):
-        alt = match.group(1)
         remote_url = _decode_next_image_url(match.group(2))
 
         parsed = urlparse(remote_url)
@@ -341,18 +991,39 @@ def _localize_images(markdown: str, md_path: Path, slug: str) -> tuple[str, list
 
         name = Path(parsed.path).name
         if not name:
-            name = f"image_{len(records)+1}.bin"
+            name = f"image_{len(planned)+1}.bin"
+
+        name = _slugify(name, fallback=f"image_{len(planned)+1}")
+        planned.append((match, remote_url, img_dir / name))
+
+    # Download each distinct file once, in parallel.
+    downloads: dict[Path, str] = {}
+    for _, remote_url, local_file in planned:
+        downloads.setdefault(local_file, remote_url)
+    if len(downloads) > 1 and image_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(image_workers, len(downloads))) as executor:
+            outcomes = dict(
+                zip(
+                    downloads,
+                    executor.map(
+                        lambda item: _download_image(item[1], item[0], pool, cache),
+                        downloads.items(),
+                    ),
+                )
+            )
+    else:
+        outcomes = {
+            local: _download_image(remote, local, pool, cache) for local, remote in downloads.items()
+        }
 
-        name = _slugify(name, fallback=f"image_{len(records)+1}")
-        local_file = img_dir / name
+    records: list[dict[str, str]] = []
+    updated = markdown
 
-        if not local_file.exists():
-            try:
-                data = _fetch_bytes(remote_url)
-                local_file.write_bytes(data)
-            except Exception:
-                continue
+    for match, remote_url, local_file in planned:
+        if not outcomes.get(local_file):
+            continue
 
+        alt = match.group(1)
         rel = f"{slug}-images/{local_file.name}"
         old = match.group(0)
         new = f"![{alt}]({rel})"
@@ -373,16 +1044,21 @@ def _scrape_to_markdown(
     output_dir: Path,
     localize_images: bool = True,
     prefer_raw_markdown: bool = True,
+    pool: _HttpPool | None = None,
+    image_workers: int = 4,
+    cache: _HttpCache | None = None,
 ) -> dict[str, Any]:
     output_dir.mkdir(parents=True, exist_ok=True)
     slug = _slug_from_url(url)
 
-    html = _fetch_text(url)
+    html = _fetch_text(url, pool=pool, cache=cache)
     title = _extract_title(html)
     raw_markdown: str | None = None
     raw_markdown_url: str | None = None
     if prefer_raw_markdown:
-        raw_markdown, raw_markdown_url = _fetch_raw_markdown_if_available(url, html)
+        raw_markdown, raw_markdown_url = _fetch_raw_markdown_if_available(
+            url, html, pool=pool, cache=cache
+        )
 
     if raw_markdown:
         scrape_method = "raw_markdown"
@@ -419,7 +1095,9 @@ def _scrape_to_markdown(
     image_records: list[dict[str, str]] = []
 
     if localize_images:
-        markdown, image_records = _localize_images(markdown, md_path, slug)
+        markdown, image_records = _localize_images(
+            markdown, md_path, slug, pool=pool, image_workers=image_workers, cache=cache
+        )
 
     md_path.write_text(markdown, encoding="utf-8")
 
@@ -445,14 +1123,22 @@ def scrape_page_to_markdown(
     output_dir: str = "analysis/ScrapedPages",
     localize_images: bool = True,
     prefer_raw_markdown: bool = True,
+    use_http_cache: bool = True,
+    cache_dir: str = "",
 ) -> dict[str, Any]:
-    """Scrape a generic web page into markdown with optional local image localization."""
+    """Scrape a generic web page into markdown with optional local image localization.
+
+    With use_http_cache, pages and images are revalidated with conditional
+    GETs against an on-disk cache (cache_dir, default data/page_scraper_cache).
+    """
+    cache = _get_http_cache(use_http_cache, cache_dir or None)
     try:
         return _scrape_to_markdown(
             url=url.strip(),
             output_dir=_resolve_path(output_dir),
             localize_images=localize_images,
             prefer_raw_markdown=prefer_raw_markdown,
+            cache=cache,
         )
     except Exception as exc:
         return {
@@ -461,19 +1147,28 @@ def scrape_page_to_markdown(
             "source_url": url,
             "error": str(exc),
         }
+    finally:
+        if cache is not None:
+            cache.flush()
 
 
 @mcp.tool()
-def scrape_page_text_only(url: str, prefer_raw_markdown: bool = True) -> dict[str, Any]:
+def scrape_page_text_only(
+    url: str,
+    prefer_raw_markdown: bool = True,
+    use_http_cache: bool = True,
+    cache_dir: str = "",
+) -> dict[str, Any]:
     """Scrape a generic page and return extracted markdown text in-memory only."""
+    cache = _get_http_cache(use_http_cache, cache_dir or None)
     try:
         url = url.strip()
-        html = _fetch_text(url)
+        html = _fetch_text(url, cache=cache)
         title = _extract_title(html)
         raw_markdown: str | None = None
         raw_markdown_url: str | None = None
         if prefer_raw_markdown:
-            raw_markdown, raw_markdown_url = _fetch_raw_markdown_if_available(url, html)
+            raw_markdown, raw_markdown_url = _fetch_raw_markdown_if_available(url, html, cache=cache)
 
         if raw_markdown:
             scrape_method = "raw_markdown"
@@ -501,6 +1196,40 @@ def scrape_page_text_only(url: str, prefer_raw_markdown: bool = True) -> dict[st
             "source_url": url,
             "error": str(exc),
         }
+    finally:
+        if cache is not None:
+            cache.flush()
+
+
+def _scrape_batch_item(
+    url: str,
+    output_dir: Path,
+    localize_images: bool,
+    prefer_raw_markdown: bool,
+    pool: _HttpPool,
+    image_workers: int,
+    cache: _HttpCache | None,
+) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        item = _scrape_to_markdown(
+            url=url,
+            output_dir=output_dir,
+            localize_images=localize_images,
+            prefer_raw_markdown=prefer_raw_markdown,
+            pool=pool,
+            image_workers=image_workers,
+            cache=cache,
+        )
+    except Exception as exc:
+        item = {
+            "status": "error",
+            "reason": "scrape_failed",
+            "source_url": url,
+            "error": str(exc),
+        }
+    item["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return item
 
 
 @mcp.tool()
@@ -509,8 +1238,18 @@ def scrape_pages_batch(
     output_dir: str = "analysis/ScrapedPages",
     localize_images: bool = True,
     prefer_raw_markdown: bool = True,
+    max_workers: int = 8,
+    per_host_limit: int = 4,
+    use_http_cache: bool = True,
+    cache_dir: str = "",
 ) -> dict[str, Any]:
-    """Scrape multiple pages from a comma-separated URL list into markdown files."""
+    """Scrape multiple pages from a comma-separated URL list into markdown files.
+
+    Pages are scraped concurrently by up to max_workers threads sharing
+    keep-alive connections, with at most per_host_limit in-flight requests
+    per host. Results keep input order and include per-URL elapsed_ms.
+    Identical images across pages are stored once via the HTTP cache.
+    """
     urls = [u.strip() for u in urls_csv.split(",") if u.strip()]
     if not urls:
         return {
@@ -520,19 +1259,33 @@ def scrape_pages_batch(
         }
 
     out = _resolve_path(output_dir)
-    results: list[dict[str, Any]] = []
-    ok_count = 0
+    pool = _HttpPool(per_host_limit=per_host_limit)
+    cache = _get_http_cache(use_http_cache, cache_dir or None)
+    workers = max(1, min(max_workers, len(urls)))
+    started = time.perf_counter()
 
-    for url in urls:
-        item = scrape_page_to_markdown(
-            url=url,
-            output_dir=str(out),
-            localize_images=localize_images,
-            prefer_raw_markdown=prefer_raw_markdown,
-        )
-        results.append(item)
-        if item.get("status") == "ok":
-            ok_count += 1
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda url: _scrape_batch_item(
+                        url,
+                        out,
+                        localize_images,
+                        prefer_raw_markdown,
+                        pool,
+                        image_workers=per_host_limit,
+                        cache=cache,
+                    ),
+                    urls,
+                )
+            )
+    finally:
+        pool.close()
+        if cache is not None:
+            cache.flush()
+
+    ok_count = sum(1 for item in results if item.get("status") == "ok")
 
     return {
         "status": "ok",
@@ -540,6 +1293,9 @@ def scrape_pages_batch(
         "succeeded": ok_count,
         "failed": len(urls) - ok_count,
         "output_dir": str(out),
+        "max_workers": workers,
+        "per_host_limit": pool.per_host_limit,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
         "results": results,
     }
 
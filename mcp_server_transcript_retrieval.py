@@ -6,22 +6,72 @@ Tools:
 - list_transcript_frontmatter
 - build_transcript_frontmatter_index
 - rank_transcript_documents
+
+Ranking is served from a persistent token index (``_token_index.json`` next
+to the transcripts) holding per-document term frequencies for the seed,
+frontmatter, summary and analysis fields. The index is refreshed
+incrementally by file mtime/size, so a query only reads files that changed
+and scores documents from postings lists.
+
+Two scoring modes are available: ``overlap`` (the original weighted
+query-token overlap ratio per field) and ``bm25`` (BM25F over the same
+fields and weights). BM25 uses NumPy when it is installed.
 """
 
 from __future__ import annotations
 
+import heapq
+import json
+import math
+import os
 import re
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
-from mcp.server.fastmcp import FastMCP
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - pure-Python fallback below
+    np = None
+
+try:
+    from mcp.server.fastmcp import FastMCP
+except ModuleNotFoundError:
+    class FastMCP:  # type: ignore[override]
+        """Fallback shim so CLI helpers can import this module without mcp installed."""
+
+        def __init__(self, _name: str) -> None:
+            self._name = _name
+
+        def tool(self):
+            def _decorator(fn):
+                return fn
+
+            return _decorator
+
+        def run(self) -> None:
+            raise RuntimeError(
+                "mcp package is not installed; server mode is unavailable. "
+                "Install MCP dependencies to run this as an MCP server."
+            )
 
 mcp = FastMCP("transcript-retrieval")
 
 DEFAULT_TRANSCRIPTS_DIR = str((Path(__file__).resolve().parent / "analysis" / "Transcripts").resolve())
 DEFAULT_FRONTMATTER_INDEX = str((Path(DEFAULT_TRANSCRIPTS_DIR) / "_frontmatter_index.yaml").resolve())
+TOKEN_INDEX_NAME = "_token_index.json"
+TOKEN_INDEX_VERSION = 1
+TOKEN_INDEX_CHECK_INTERVAL = 1.0
+INDEX_FIELDS = ("seed", "frontmatter", "summary", "analysis")
+FIELD_WEIGHTS = {"seed": 0.20, "frontmatter": 0.40, "summary": 0.25, "analysis": 0.15}
+SCORING_MODES = ("overlap", "bm25")
+BM25_K1 = 1.2
+BM25_B = 0.75
 
 
 def _resolve_path(path_value: str) -> Path:
@@ -86,15 +136,273 @@ def _read_transcript_doc(file_path: Path) -> dict[str, Any]:
     }
 
 
+def _frontmatter_text(frontmatter: dict[str, Any]) -> str:
+    return " ".join(
+        [
+            str(frontmatter.get("title", "")),
+            str(frontmatter.get("creator", "")),
+            str(frontmatter.get("video_id", "")),
+            " ".join(str(x) for x in frontmatter.get("topics_detected", []) if x),
+        ]
+    )
+
+
 def _candidate_seed_score(query: str, frontmatter: dict[str, Any], file_name: str) -> float:
-    fields = [
-        file_name,
-        str(frontmatter.get("title", "")),
-        str(frontmatter.get("creator", "")),
-        str(frontmatter.get("video_id", "")),
-        " ".join(str(x) for x in frontmatter.get("topics_detected", []) if x),
-    ]
-    return _token_overlap_score(query, " ".join(fields))
+    return _token_overlap_score(query, f"{file_name} {_frontmatter_text(frontmatter)}")
+
+
+def _summary_preview(summary: str) -> str:
+    return (summary[:300] + "...") if len(summary) > 300 else summary
+
+
+def _result_row(
+    file_path: str,
+    fm: dict[str, Any],
+    field_scores: dict[str, float],
+    final_score: float,
+    summary_preview: str,
+) -> dict[str, Any]:
+    return {
+        "file_path": file_path,
+        "title": fm.get("title"),
+        "creator": fm.get("creator"),
+        "video_id": fm.get("video_id"),
+        "scores": {
+            **{field: round(field_scores[field], 4) for field in INDEX_FIELDS},
+            "final": round(final_score, 4),
+        },
+        "summary_preview": summary_preview,
+    }
+
+
+def _index_entry(file_path: Path, stat: os.stat_result) -> dict[str, Any]:
+    """Read one transcript and reduce it to per-field term frequencies."""
+    entry: dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    try:
+        doc = _read_transcript_doc(file_path)
+        fm = doc["frontmatter"]
+        fm_text = _frontmatter_text(fm)
+    except Exception as exc:
+        entry["error"] = str(exc)
+        return entry
+
+    texts = {
+        "seed": f"{file_path.name} {fm_text}",
+        "frontmatter": fm_text,
+        "summary": doc["summary"],
+        "analysis": doc["analysis"],
+    }
+    entry["meta"] = {
+        "title": fm.get("title"),
+        "creator": fm.get("creator"),
+        "video_id": fm.get("video_id"),
+        "upload_date": fm.get("upload_date"),
+        "topics_detected": fm.get("topics_detected", []),
+        "transcript_segment_count": fm.get("transcript_segment_count"),
+        "retrieved_at_utc": fm.get("retrieved_at_utc"),
+    }
+    entry["summary_preview"] = _summary_preview(doc["summary"])
+    entry["fields"] = {field: dict(Counter(_tokenize(text))) for field, text in texts.items()}
+    return entry
+
+
+class TranscriptTokenIndex:
+    """Persistent per-field token index over one transcripts directory."""
+
+    def __init__(self, base: Path, path: Path):
+        self.base = base
+        self.path = path
+        self.docs: dict[str, dict[str, Any]] = {}
+        self.checked_at = 0.0
+        self._postings: dict[str, dict[str, list[str]]] | None = None
+        self._bm25: _Bm25Stats | None = None
+
+    @classmethod
+    def load(cls, base: Path, path: Path) -> "TranscriptTokenIndex":
+        index = cls(base, path)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if (
+            isinstance(payload, dict)
+            and payload.get("version") == TOKEN_INDEX_VERSION
+            and payload.get("source_directory") == str(base)
+            and isinstance(payload.get("docs"), dict)
+        ):
+            index.docs = payload["docs"]
+        return index
+
+    def refresh(self) -> dict[str, int]:
+        """Re-index files whose mtime/size changed and drop deleted ones."""
+        stats = {"indexed": 0, "reused": 0, "removed": 0}
+        seen: set[str] = set()
+        for file_path in self.base.glob("*.md"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            name = file_path.name
+            seen.add(name)
+            cached = self.docs.get(name)
+            if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                stats["reused"] += 1
+                continue
+            self.docs[name] = _index_entry(file_path, stat)
+            stats["indexed"] += 1
+
+        for name in [name for name in self.docs if name not in seen]:
+            del self.docs[name]
+            stats["removed"] += 1
+
+        if stats["indexed"] or stats["removed"]:
+            self._postings = None
+            self._bm25 = None
+        self.checked_at = time.monotonic()
+        return stats
+
+    def save(self) -> None:
+        payload = {
+            "version": TOKEN_INDEX_VERSION,
+            "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+            "source_directory": str(self.base),
+            "docs": self.docs,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def valid_names(self) -> list[str]:
+        return sorted(name for name, entry in self.docs.items() if "error" not in entry)
+
+    def postings(self) -> dict[str, dict[str, list[str]]]:
+        """field -> token -> document names (in sorted name order)."""
+        if self._postings is None:
+            postings: dict[str, dict[str, list[str]]] = {field: {} for field in INDEX_FIELDS}
+            for name in self.valid_names():
+                fields = self.docs[name]["fields"]
+                for field in INDEX_FIELDS:
+                    field_postings = postings[field]
+                    for token in fields.get(field, {}):
+                        field_postings.setdefault(token, []).append(name)
+            self._postings = postings
+        return self._postings
+
+    def overlap_scores(self, query_tokens: set[str]) -> dict[str, dict[str, float]]:
+        """field -> name -> |query ∩ field terms| / |query|, from postings only."""
+        scores: dict[str, dict[str, float]] = {field: {} for field in INDEX_FIELDS}
+        if not query_tokens:
+            return scores
+        postings = self.postings()
+        for field in INDEX_FIELDS:
+            counts: Counter[str] = Counter()
+            for token in query_tokens:
+                counts.update(postings[field].get(token, ()))
+            scores[field] = {name: count / len(query_tokens) for name, count in counts.items()}
+        return scores
+
+    def bm25(self) -> "_Bm25Stats":
+        if self._bm25 is None:
+            self._bm25 = _Bm25Stats(self.valid_names(), self.docs)
+        return self._bm25
+
+
+class _Bm25Stats:
+    """Precomputed BM25F impacts: token -> (doc positions, per-doc score).
+
+    Field weights are FIELD_WEIGHTS scaled to average 1.0 so that k1 keeps
+    its usual meaning. Each field's term frequency is length-normalized
+    against that field's average length before the fields are combined, so
+    a query only sums precomputed per-token impact vectors.
+    """
+
+    def __init__(self, names: list[str], docs: dict[str, dict[str, Any]]):
+        self.names = names
+        count = len(names)
+        boosts = {field: weight * len(INDEX_FIELDS) for field, weight in FIELD_WEIGHTS.items()}
+
+        norms: dict[str, list[float]] = {}
+        for field in INDEX_FIELDS:
+            lengths = [sum(docs[name]["fields"].get(field, {}).values()) for name in names]
+            avg = (sum(lengths) / count) if count else 0.0
+            norms[field] = [
+                (1.0 - BM25_B) + (BM25_B * (length / avg) if avg else 0.0) for length in lengths
+            ]
+
+        pseudo_tf: dict[str, dict[int, float]] = {}
+        for position, name in enumerate(names):
+            fields = docs[name]["fields"]
+            for field in INDEX_FIELDS:
+                boost = boosts[field] / norms[field][position]
+                for token, tf in fields.get(field, {}).items():
+                    per_doc = pseudo_tf.setdefault(token, {})
+                    per_doc[position] = per_doc.get(position, 0.0) + boost * tf
+
+        self.impacts: dict[str, tuple[Any, Any]] = {}
+        for token, per_doc in pseudo_tf.items():
+            df = len(per_doc)
+            idf = math.log(1.0 + (count - df + 0.5) / (df + 0.5))
+            positions = list(per_doc)
+            impacts = [idf * tf / (BM25_K1 + tf) for tf in per_doc.values()]
+            if np is not None:
+                self.impacts[token] = (np.asarray(positions, dtype=np.int64), np.asarray(impacts))
+            else:
+                self.impacts[token] = (positions, impacts)
+
+    def scores(self, query_tokens: set[str]) -> dict[int, float]:
+        """Doc position -> BM25F score for documents matching any query token."""
+        postings = [self.impacts[token] for token in sorted(query_tokens) if token in self.impacts]
+        if not postings:
+            return {}
+        if np is not None:
+            totals = np.zeros(len(self.names))
+            for positions, impacts in postings:
+                totals[positions] += impacts
+            matched = np.flatnonzero(totals > 0)
+            return dict(zip(matched.tolist(), totals[matched].tolist()))
+
+        totals: dict[int, float] = {}
+        for positions, impacts in postings:
+            for position, impact in zip(positions, impacts):
+                totals[position] = totals.get(position, 0.0) + impact
+        return {position: totals[position] for position in sorted(totals) if totals[position] > 0}
+
+
+_TOKEN_INDEXES: dict[str, TranscriptTokenIndex] = {}
+_TOKEN_INDEX_LOCK = threading.Lock()
+
+
+def _token_index_path(base: Path, index_file: str = "") -> Path:
+    return _resolve_path(index_file) if index_file else base / TOKEN_INDEX_NAME
+
+
+def _get_token_index(
+    base: Path,
+    index_file: str = "",
+    max_age: float = TOKEN_INDEX_CHECK_INTERVAL,
+) -> tuple[TranscriptTokenIndex, dict[str, int]]:
+    """Return the shared index for ``base``, revalidated at most every ``max_age`` seconds.
+
+    Caller must hold _TOKEN_INDEX_LOCK.
+    """
+    path = _token_index_path(base, index_file)
+    key = f"{base}|{path}"
+    index = _TOKEN_INDEXES.get(key)
+    if index is None:
+        index = TranscriptTokenIndex.load(base, path)
+        _TOKEN_INDEXES[key] = index
+        max_age = 0.0
+
+    stats = {"indexed": 0, "reused": len(index.docs), "removed": 0}
+    if time.monotonic() - index.checked_at >= max_age:
+        stats = index.refresh()
+        if stats["indexed"] or stats["removed"] or not index.path.exists():
+            try:
+                index.save()
+            except OSError:
+                pass
+    return index, stats
 
 
 @mcp.tool()
@@ -150,31 +458,23 @@ def list_transcript_frontmatter(directory: str = DEFAULT_TRANSCRIPTS_DIR) -> dic
 def build_transcript_frontmatter_index(
     directory: str = DEFAULT_TRANSCRIPTS_DIR,
     output_file: str = DEFAULT_FRONTMATTER_INDEX,
+    token_index_file: str = "",
 ) -> dict[str, Any]:
-    """Build a metadata index to support fast-thinking retrieval."""
+    """Build a metadata index to support fast-thinking retrieval.
+
+    Also refreshes the token index used by rank_transcript_documents; only
+    transcripts whose mtime or size changed are re-read.
+    """
     base = _resolve_path(directory)
     if not base.exists():
         return {"status": "error", "reason": "directory_not_found", "directory": str(base)}
 
-    rows: list[dict[str, Any]] = []
-    for file_path in sorted(base.glob("*.md")):
-        try:
-            doc = _read_transcript_doc(file_path)
-            fm = doc.get("frontmatter", {})
-            rows.append(
-                {
-                    "file_path": doc["file_path"],
-                    "title": fm.get("title"),
-                    "creator": fm.get("creator"),
-                    "video_id": fm.get("video_id"),
-                    "upload_date": fm.get("upload_date"),
-                    "topics_detected": fm.get("topics_detected", []),
-                    "transcript_segment_count": fm.get("transcript_segment_count"),
-                    "retrieved_at_utc": fm.get("retrieved_at_utc"),
-                }
-            )
-        except Exception:
-            continue
+    with _TOKEN_INDEX_LOCK:
+        index, stats = _get_token_index(base, token_index_file, max_age=0.0)
+        rows = [
+            {"file_path": str(base / name), **index.docs[name]["meta"]}
+            for name in index.valid_names()
+        ]
 
     out = _resolve_path(output_file)
     out.parent.mkdir(parents=True, exist_ok=True)
@@ -190,34 +490,21 @@ def build_transcript_frontmatter_index(
         "status": "ok",
         "output_file": str(out),
         "count": len(rows),
+        "token_index_file": str(index.path),
+        "token_index": stats,
     }
 
 
-@mcp.tool()
-def rank_transcript_documents(
-    query: str,
-    directory: str = DEFAULT_TRANSCRIPTS_DIR,
-    top_k: int = 5,
-) -> dict[str, Any]:
-    """Rank transcript docs using staged scoring: seed/frontmatter/summary/analysis.
+def _rank_documents_by_scan(query: str, base: Path, top_k: int = 5) -> tuple[int, list[dict[str, Any]]]:
+    """Reference ranking that re-reads every transcript (pre-index behaviour).
 
-    Stages:
-    1) Fast lookup seed score from filename + key frontmatter fields.
-    2) Frontmatter score.
-    3) Summary score.
-    4) Analysis score.
+    Kept for regression tests and ranking evaluation.
     """
-    base = _resolve_path(directory)
-    if not base.exists():
-        return {"status": "error", "reason": "directory_not_found", "directory": str(base)}
-
     candidates: list[dict[str, Any]] = []
     for file_path in sorted(base.glob("*.md")):
         try:
             doc = _read_transcript_doc(file_path)
-            frontmatter = doc["frontmatter"]
-            seed_score = _candidate_seed_score(query, frontmatter, file_path.name)
-
+            seed_score = _candidate_seed_score(query, doc["frontmatter"], file_path.name)
             if seed_score > 0:
                 candidates.append({"doc": doc, "seed_score": seed_score})
         except Exception:
@@ -235,54 +522,116 @@ def rank_transcript_documents(
     for item in candidates:
         doc = item["doc"]
         fm = doc["frontmatter"]
-
-        fm_text = " ".join(
-            [
-                str(fm.get("title", "")),
-                str(fm.get("creator", "")),
-                str(fm.get("video_id", "")),
-                " ".join(str(x) for x in fm.get("topics_detected", []) if x),
-            ]
-        )
         summary_text = doc.get("summary", "")
-        analysis_text = doc.get("analysis", "")
+        field_scores = {
+            "seed": item["seed_score"],
+            "frontmatter": _token_overlap_score(query, _frontmatter_text(fm)),
+            "summary": _token_overlap_score(query, summary_text),
+            "analysis": _token_overlap_score(query, doc.get("analysis", "")),
+        }
+        final_score = sum(FIELD_WEIGHTS[field] * field_scores[field] for field in INDEX_FIELDS)
+        ranked.append(_result_row(doc["file_path"], fm, field_scores, final_score, _summary_preview(summary_text)))
+
+    ranked.sort(key=lambda x: x["scores"]["final"], reverse=True)
+    return len(ranked), ranked[: max(1, top_k)]
 
-        frontmatter_score = _token_overlap_score(query, fm_text)
-        summary_score = _token_overlap_score(query, summary_text)
-        analysis_score = _token_overlap_score(query, analysis_text)
 
-        final_score = (
-            (0.20 * item["seed_score"])
-            + (0.40 * frontmatter_score)
-            + (0.25 * summary_score)
-            + (0.15 * analysis_score)
+def _rank_documents_indexed(
+    query: str,
+    index: TranscriptTokenIndex,
+    top_k: int = 5,
+) -> tuple[int, list[dict[str, Any]]]:
+    query_tokens = set(_tokenize(query))
+    field_scores = index.overlap_scores(query_tokens)
+
+    seeded = field_scores["seed"]
+    names = sorted(name for name in seeded if seeded[name] > 0) or index.valid_names()
+
+    def _final(name: str) -> float:
+        return sum(FIELD_WEIGHTS[field] * field_scores[field].get(name, 0.0) for field in INDEX_FIELDS)
+
+    finals = {name: _final(name) for name in names}
+    # nlargest is stable, so ties keep file-name order like the full sort did.
+    top = heapq.nlargest(max(1, top_k), names, key=lambda name: round(finals[name], 4))
+
+    results = []
+    for name in top:
+        entry = index.docs[name]
+        scores = {field: field_scores[field].get(name, 0.0) for field in INDEX_FIELDS}
+        results.append(
+            _result_row(str(index.base / name), entry["meta"], scores, finals[name], entry["summary_preview"])
         )
+    return len(names), results
+
 
-        ranked.append(
+def _rank_documents_bm25(
+    query: str,
+    index: TranscriptTokenIndex,
+    top_k: int = 5,
+) -> tuple[int, list[dict[str, Any]]]:
+    stats = index.bm25()
+    scores = stats.scores(set(_tokenize(query)))
+    positions = sorted(scores) or list(range(len(stats.names)))
+    top = heapq.nlargest(max(1, top_k), positions, key=lambda position: scores.get(position, 0.0))
+
+    results = []
+    for position in top:
+        name = stats.names[position]
+        entry = index.docs[name]
+        score = round(scores.get(position, 0.0), 4)
+        results.append(
             {
-                "file_path": doc["file_path"],
-                "title": fm.get("title"),
-                "creator": fm.get("creator"),
-                "video_id": fm.get("video_id"),
-                "scores": {
-                    "seed": round(item["seed_score"], 4),
-                    "frontmatter": round(frontmatter_score, 4),
-                    "summary": round(summary_score, 4),
-                    "analysis": round(analysis_score, 4),
-                    "final": round(final_score, 4),
-                },
-                "summary_preview": (summary_text[:300] + "...") if len(summary_text) > 300 else summary_text,
+                "file_path": str(index.base / name),
+                "title": entry["meta"].get("title"),
+                "creator": entry["meta"].get("creator"),
+                "video_id": entry["meta"].get("video_id"),
+                "scores": {"bm25": score, "final": score},
+                "summary_preview": entry["summary_preview"],
             }
         )
+    return len(positions), results
+
+
+@mcp.tool()
+def rank_transcript_documents(
+    query: str,
+    directory: str = DEFAULT_TRANSCRIPTS_DIR,
+    top_k: int = 5,
+    index_file: str = "",
+    scoring: str = "overlap",
+) -> dict[str, Any]:
+    """Rank transcript docs using staged scoring: seed/frontmatter/summary/analysis.
+
+    Stages:
+    1) Fast lookup seed score from filename + key frontmatter fields.
+    2) Frontmatter score.
+    3) Summary score.
+    4) Analysis score.
+
+    Scores come from the persistent token index, refreshed incrementally
+    when transcripts change. ``scoring="bm25"`` ranks with BM25F over the
+    same fields and weights instead of the overlap blend.
+    """
+    if scoring not in SCORING_MODES:
+        return {"status": "error", "reason": "unknown_scoring_mode", "scoring": scoring}
+
+    base = _resolve_path(directory)
+    if not base.exists():
+        return {"status": "error", "reason": "directory_not_found", "directory": str(base)}
+
+    ranker = _rank_documents_bm25 if scoring == "bm25" else _rank_documents_indexed
+    with _TOKEN_INDEX_LOCK:
+        index, _ = _get_token_index(base, index_file)
+        candidate_count, results = ranker(query, index, top_k)
 
-    ranked.sort(key=lambda x: x["scores"]["final"], reverse=True)
     return {
         "status": "ok",
         "query": query,
         "directory": str(base),
-        "candidate_count": len(ranked),
+        "scoring": scoring,
+        "candidate_count": candidate_count,
         "top_k": top_k,
-        "results": ranked[: max(1, top_k)],
+        "results": results,
     }
 
 
@@ -4,6 +4,7 @@
 Tools:
 - check_transcript
 - extract_brief
+- extract_briefs_batch
 - extract_transcript_only
 """
 
@@ -14,7 +15,26 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from mcp.server.fastmcp import FastMCP
+try:
+    from mcp.server.fastmcp import FastMCP
+except ModuleNotFoundError:
+    class FastMCP:  # type: ignore[override]
+        """Fallback shim so CLI helpers can import this module without mcp installed."""
+
+        def __init__(self, _name: str) -> None:
+            self._name = _name
+
+        def tool(self):
+            def _decorator(fn):
+                return fn
+
+            return _decorator
+
+        def run(self) -> None:
+            raise RuntimeError(
+                "mcp package is not installed; server mode is unavailable. "
+                "Install MCP dependencies to run this as an MCP server."
+            )
 
 from scripts.check_youtube_transcript_availability import (  # pylint: disable=import-error
     check_transcript_availability,
@@ -22,23 +42,23 @@ from scripts.check_youtube_transcript_availability import (  # pylint: disable=i
     parse_languages,
 )
 from scripts.extract_youtube_debate_brief import (  # pylint: disable=import-error
+    FetchLayer,
+    build_brief_for_video,
     build_document_stem,
-    build_analysis_section,
+    extract_briefs_batch as _run_briefs_batch,
     fetch_transcript_segments,
     fetch_video_metadata,
     frontmatter_block,
-    infer_topics,
+    resolve_video_ids,
     sanitize_slug,
-    split_sentences,
-    summarize_transcript,
-    transcript_to_markdown_lines,
     utc_now_iso,
-    write_brief,
+    write_transcription_lines,
 )
 
 mcp = FastMCP("youtube-transcript")
 
 DEFAULT_TRANSCRIPTS_DIR = str((Path(__file__).resolve().parent / "analysis" / "Transcripts").resolve())
+MCP_PROVENANCE = {"generator_mcp_server": "mcp_server_youtube_transcript.py"}
 
 
 def _resolve_path(path_value: str) -> Path:
@@ -62,18 +82,31 @@ def _safe_unlink(path: Path) -> bool:
     return True
 
 
-def _try_refresh_frontmatter_index() -> dict[str, Any] | None:
+def _try_refresh_frontmatter_index(directory: str = DEFAULT_TRANSCRIPTS_DIR) -> dict[str, Any] | None:
     """Best-effort refresh of retrieval index without hard coupling this server.
 
-    Returns None when retrieval server module is unavailable.
+    The retrieval index refresh is incremental, so only new or changed
+    briefs in ``directory`` are re-read. Returns None when retrieval server
+    module is unavailable.
     """
     try:
         mod = importlib.import_module("mcp_server_transcript_retrieval")
-        return mod.build_transcript_frontmatter_index()  # type: ignore[attr-defined]
+        base = _resolve_path(directory)
+        return mod.build_transcript_frontmatter_index(  # type: ignore[attr-defined]
+            directory=str(base),
+            output_file=str(base / "_frontmatter_index.yaml"),
+        )
     except Exception:
         return None
 
 
+def _cleanup_transcript_only(output_base: Path, file_stem: str) -> str | None:
+    transcript_path = output_base / f"{_ensure_suffix(file_stem, '-transcript')}.md"
+    if _safe_unlink(transcript_path):
+        return str(transcript_path)
+    return None
+
+
 
 
 @mcp.tool()
@@ -106,80 +139,108 @@ def extract_brief(
         return {"status": "error", "reason": "invalid_youtube_input", "input": url_or_video_id}
 
     languages = parse_languages(languages_csv)
-    availability = check_transcript_availability(video_id, languages)
-    if availability.get("status") != "transcript_available":
-        return availability
-
-    metadata = fetch_video_metadata(video_id)
-    segments, transcript_details = fetch_transcript_segments(video_id, languages)
-    if not segments:
-        return {
-            "status": "no_transcript_available",
-            "reason": "empty_transcript_after_fetch",
-            "video_id": video_id,
-        }
-
-    full_text = " ".join(seg.text for seg in segments)
-    sentences = split_sentences(full_text)
-    topics = infer_topics(full_text)
-
-    title = metadata.get("title") or f"YouTube-{video_id}"
-    creator = metadata.get("creator") or "Unknown"
-    file_stem = build_document_stem(
-        creator=creator,
-        upload_date=str(metadata.get("upload_date") or ""),
-        title=title,
-    )
-    transcript_stem = _ensure_suffix(file_stem, "-transcript")
     output_base = _resolve_path(output_dir)
-
-    out_path = write_brief(
-        output_dir=output_base,
-        file_stem=file_stem,
-        frontmatter={
-            "source_type": "youtube_video",
-            "video_url": metadata.get("watch_url"),
-            "video_id": video_id,
-            "title": title,
-            "creator": creator,
-            "upload_date": metadata.get("upload_date") or "",
-            "retrieved_at_utc": utc_now_iso(),
-            "transcript_available": True,
-            "transcript_language_requested": languages,
-            "transcript_language_selected": transcript_details.get("language_selected"),
-            "transcript_is_generated": transcript_details.get("is_generated"),
-            "transcript_segment_count": transcript_details.get("segment_count", len(segments)),
-            "video_duration_seconds": metadata.get("duration_seconds"),
-            "topics_detected": topics,
-            "generator_mcp_server": "mcp_server_youtube_transcript.py",
-        },
-        transcription_lines=transcript_to_markdown_lines(segments),
-        summary_lines=summarize_transcript(sentences, len(segments)),
-        analysis_lines=build_analysis_section(sentences, topics),
-    )
+    result = build_brief_for_video(video_id, languages, output_base, MCP_PROVENANCE)
+    if result.get("status") != "ok":
+        return result
 
     deleted_transcript_file = None
     if cleanup_transcript_only:
-        transcript_path = output_base / f"{transcript_stem}.md"
-        if _safe_unlink(transcript_path):
-            deleted_transcript_file = str(transcript_path)
+        deleted_transcript_file = _cleanup_transcript_only(output_base, result["file_stem"])
 
     refreshed_index = None
     if refresh_index:
-        refreshed_index = _try_refresh_frontmatter_index()
+        refreshed_index = _try_refresh_frontmatter_index(str(output_base))
 
     return {
         "status": "ok",
         "video_id": video_id,
-        "output_file": str(out_path),
-        "segment_count": len(segments),
-        "title": title,
-        "creator": creator,
+        "output_file": result["output_file"],
+        "segment_count": result["segment_count"],
+        "title": result["title"],
+        "creator": result["creator"],
         "deleted_transcript_file": deleted_transcript_file,
         "index_refresh": refreshed_index,
     }
 
 
+def _extract_briefs_batch(
+    urls_or_video_ids: list[str],
+    output_dir: str = DEFAULT_TRANSCRIPTS_DIR,
+    languages_csv: str = "en,en-US,en-GB",
+    playlist_url: str = "",
+    max_workers: int = 4,
+    requests_per_second: float = 2.0,
+    cleanup_transcript_only: bool = True,
+    refresh_index: bool = True,
+    fetch: FetchLayer | None = None,
+) -> dict[str, Any]:
+    fetch = fetch or FetchLayer()
+    languages = parse_languages(languages_csv)
+    output_base = _resolve_path(output_dir)
+    video_ids, invalid = resolve_video_ids(
+        urls_or_video_ids, [playlist_url] if playlist_url else [], fetch
+    )
+
+    results = _run_briefs_batch(
+        video_ids,
+        languages,
+        output_base,
+        MCP_PROVENANCE,
+        fetch=fetch,
+        max_workers=max_workers,
+        requests_per_second=requests_per_second,
+    )
+
+    written = [item for item in results if item.get("status") == "ok"]
+    for item in written:
+        file_stem = item.pop("file_stem")
+        item["deleted_transcript_file"] = (
+            _cleanup_transcript_only(output_base, file_stem) if cleanup_transcript_only else None
+        )
+
+    refreshed_index = None
+    if refresh_index and written:
+        refreshed_index = _try_refresh_frontmatter_index(str(output_base))
+
+    return {
+        "status": "ok" if written or not video_ids else "error",
+        "requested": len(video_ids),
+        "written": len(written),
+        "invalid_inputs": invalid,
+        "results": results,
+        "index_refresh": refreshed_index,
+    }
+
+
+@mcp.tool()
+def extract_briefs_batch(
+    urls_or_video_ids: list[str],
+    output_dir: str = DEFAULT_TRANSCRIPTS_DIR,
+    languages_csv: str = "en,en-US,en-GB",
+    playlist_url: str = "",
+    max_workers: int = 4,
+    requests_per_second: float = 2.0,
+    cleanup_transcript_only: bool = True,
+    refresh_index: bool = True,
+) -> dict[str, Any]:
+    """Extract briefs for many videos (and/or a playlist) concurrently.
+
+    YouTube requests share one rate limit across workers, briefs are written
+    in parallel, and the retrieval index is refreshed once at the end.
+    """
+    return _extract_briefs_batch(
+        urls_or_video_ids,
+        output_dir=output_dir,
+        languages_csv=languages_csv,
+        playlist_url=playlist_url,
+        max_workers=max_workers,
+        requests_per_second=requests_per_second,
+        cleanup_transcript_only=cleanup_transcript_only,
+        refresh_index=refresh_index,
+    )
+
+
 @mcp.tool()
 def extract_transcript_only(
     url_or_video_id: str,
@@ -235,18 +296,10 @@ def extract_transcript_only(
     output_path.mkdir(parents=True, exist_ok=True)
     out_file = output_path / f"{file_stem}.md"
 
-    text = "\n".join(
-        [
-            frontmatter_block(frontmatter),
-            "",
-            "# YouTube Transcript",
-            "",
-            "## Transcription",
-            *transcript_to_markdown_lines(segments),
-            "",
-        ]
-    )
-    out_file.write_text(text, encoding="utf-8")
+    with open(out_file, "w", encoding="utf-8", buffering=1 << 16) as handle:
+        handle.write(frontmatter_block(frontmatter))
+        handle.write("\n\n# YouTube Transcript\n\n## Transcription\n")
+        write_transcription_lines(handle, segments)
 
     return {
         "status": "ok",
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
 import json
+import os
 import re
-from collections import Counter, defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Iterable
 
+try:
+    from session_log_index import SessionLogIndex, default_index_path
+except ModuleNotFoundError:
+    # Module import path: from scripts.analyze_session_logs_for_ppa import ...
+    from scripts.session_log_index import SessionLogIndex, default_index_path
+
 
 PROJECT_ROOT = Path(r"G:\repos\AI\RoadTrip")
 PROMPT_TRACKING_DIR = PROJECT_ROOT / "PromptTracking"
@@ -142,6 +152,43 @@ STOPWORDS = {
     "claude", "vscode", "local", "start", "end", "true", "false",
 }
 
+
+# Each cue list is compiled once into a single alternation; a combined
+# pattern matches exactly when any of its cues would.
+def _combine(patterns: list[str]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.I)
+
+
+APPROACH_MATCHERS: dict[str, re.Pattern[str]] = {
+    approach: _combine(patterns) for approach, patterns in APPROACH_PATTERNS.items()
+}
+REJECT_MATCHER = _combine(REJECT_CUES)
+ACCEPT_MATCHER = _combine(ACCEPT_CUES)
+QUESTION_MATCHER = _combine(QUESTION_CUES)
+PRINCIPLE_MATCHERS: dict[str, list[re.Pattern[str]]] = {
+    principle: [re.compile(cue, re.I) for cue in cues] for principle, cues in PRINCIPLE_CUES.items()
+}
+
+BLOCK_PATTERN = re.compile(
+    r"# (?P<kind>Prompt|Response): \((?P<timestamp>[^)]+)\)\s*\n(?P<body>.*?)(?=\n# (?:Prompt|Response): \(|\Z)",
+    re.S,
+)
+
+# clean_text() passes, in order, each with a literal that must be present for it to match.
+CLEAN_PASSES: list[tuple[str, re.Pattern[str], str]] = [
+    ("<!--Start ", re.compile(r"<!--Start (Prompt|Response)-->"), ""),
+    ("<!--End ", re.compile(r"<!--End (Prompt|Response)-->"), ""),
+    ("](", re.compile(r"!?\[[^\]]*\]\([^)]*\)"), " "),
+    ("file:///", re.compile(r"file:///\S+"), " "),
+    ("://", re.compile(r"https?://\S+"), " "),
+    (":\\", re.compile(r"[A-Za-z]:\\[^\s\"]+"), " "),
+    ("```", re.compile(r"`{3}.*?`{3}", re.S), " "),
+]
+
+STATE_FILE_NAME = "session_log_state.json"
+STATE_VERSION = 1
+EVENTS_FILE_NAME = "session_log_events.jsonl"
+
 FOCUS_ORDER = [
     "personal-assistant-product",
     "memory-and-retrieval",
@@ -172,26 +219,20 @@ def iter_session_log_paths(prompt_tracking_dir: Path) -> list[Path]:
 
 def clean_text(text: str) -> str:
     text = text.replace("\r\n", "\n")
-    text = re.sub(r"<!--Start (Prompt|Response)-->", "", text)
-    text = re.sub(r"<!--End (Prompt|Response)-->", "", text)
-    text = re.sub(r"!?\[[^\]]*\]\([^)]*\)", " ", text)
-    text = re.sub(r"file:///\S+", " ", text)
-    text = re.sub(r"https?://\S+", " ", text)
-    text = re.sub(r"[A-Za-z]:\\[^\s\"]+", " ", text)
-    text = re.sub(r"`{3}.*?`{3}", " ", text, flags=re.S)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    for literal, pattern, replacement in CLEAN_PASSES:
+        if literal in text:
+            text = pattern.sub(replacement, text)
+    return " ".join(text.split())
 
 
 def parse_blocks(path: Path) -> list[Event]:
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    pattern = re.compile(
-        r"# (?P<kind>Prompt|Response): \((?P<timestamp>[^)]+)\)\s*\n(?P<body>.*?)(?=\n# (?:Prompt|Response): \(|\Z)",
-        re.S,
-    )
+    return parse_blocks_text(path.read_text(encoding="utf-8", errors="ignore"), path.name)
+
+
+def parse_blocks_text(text: str, source_file: str) -> list[Event]:
     events: list[Event] = []
     pair_index = 0
-    for match in pattern.finditer(text):
+    for match in BLOCK_PATTERN.finditer(text):
         kind = match.group("kind").lower()
         body = clean_text(match.group("body"))
         if not body:
@@ -202,7 +243,7 @@ def parse_blocks(path: Path) -> list[Event]:
         stance = classify_stance(body)
         events.append(
             Event(
-                source_file=path.name,
+                source_file=source_file,
                 event_kind=kind,
                 timestamp=match.group("timestamp"),
                 text=body,
@@ -215,21 +256,18 @@ def parse_blocks(path: Path) -> list[Event]:
 
 
 def classify_approaches(text: str) -> list[str]:
-    hits: list[str] = []
     lowered = text.lower()
-    for approach, patterns in APPROACH_PATTERNS.items():
-        if any(re.search(pattern, lowered, re.I) for pattern in patterns):
-            hits.append(approach)
+    hits = [approach for approach, matcher in APPROACH_MATCHERS.items() if matcher.search(lowered)]
     return hits or ["general"]
 
 
 def classify_stance(text: str) -> str:
     lowered = text.lower()
-    if any(re.search(pattern, lowered, re.I) for pattern in REJECT_CUES):
+    if REJECT_MATCHER.search(lowered):
         return "rejected-or-deprioritized"
-    if any(re.search(pattern, lowered, re.I) for pattern in ACCEPT_CUES):
+    if ACCEPT_MATCHER.search(lowered):
         return "adopted-or-endorsed"
-    if any(re.search(pattern, lowered, re.I) for pattern in QUESTION_CUES):
+    if QUESTION_MATCHER.search(lowered):
         return "open-question"
     return "exploration"
 
@@ -264,14 +302,21 @@ def summarize_reference_doc(path: Path, title: str) -> dict[str, object] | None:
     }
 
 
-def build_summary(events: list[Event], references: list[dict[str, object]]) -> tuple[dict[str, object], str]:
-    by_approach: dict[str, list[Event]] = defaultdict(list)
-    by_stance: Counter[str] = Counter()
+def collect_stats(events: list[Event]) -> dict[str, object]:
+    """Mergeable summary counters for a run of events (one session log, in order).
+
+    Dict insertion order records first appearance, so merging per-file stats
+    in file order reproduces the orderings build_summary() derives from the
+    full event list.
+    """
+    stances: Counter[str] = Counter()
     monthly_counts: Counter[str] = Counter()
+    approaches: dict[str, dict[str, object]] = {}
     rejected_examples: list[dict[str, str]] = []
+    corpus = "\n".join(event.text for event in events)
 
     for event in events:
-        by_stance[event.stance] += 1
+        stances[event.stance] += 1
         if event.timestamp:
             try:
                 month = datetime.strptime(event.timestamp, "%Y-%m-%d %H:%M:%S").strftime("%Y-%m")
@@ -279,7 +324,29 @@ def build_summary(events: list[Event], references: list[dict[str, object]]) -> t
             except ValueError:
                 pass
         for approach in event.approaches:
-            by_approach[approach].append(event)
+            row = approaches.get(approach)
+            if row is None:
+                row = approaches[approach] = {
+                    "event_count": 0,
+                    "prompt_count": 0,
+                    "response_count": 0,
+                    "stances": Counter(),
+                    "tokens": Counter(),
+                    "first_seen": None,
+                    "last_seen": None,
+                    "first_example": truncate(event.text, 280),
+                    "first_prompt_example": None,
+                }
+            row["event_count"] += 1
+            row["prompt_count"] += event.event_kind == "prompt"
+            row["response_count"] += event.event_kind == "response"
+            row["stances"][event.stance] += 1
+            row["tokens"].update(tokenize(event.text))
+            if event.timestamp:
+                row["first_seen"] = min(filter(None, [row["first_seen"], event.timestamp]))
+                row["last_seen"] = max(filter(None, [row["last_seen"], event.timestamp]))
+            if event.event_kind == "prompt" and row["first_prompt_example"] is None:
+                row["first_prompt_example"] = truncate(event.text, 280)
         if event.stance == "rejected-or-deprioritized" and len(rejected_examples) < 12:
             rejected_examples.append(
                 {
@@ -289,23 +356,88 @@ def build_summary(events: list[Event], references: list[dict[str, object]]) -> t
                 }
             )
 
+    return {
+        "event_count": len(events),
+        "source_files": sorted({event.source_file for event in events}),
+        "stances": dict(stances),
+        "monthly_counts": dict(monthly_counts),
+        "approaches": {
+            approach: {**row, "stances": dict(row["stances"]), "tokens": dict(row["tokens"])}
+            for approach, row in approaches.items()
+        },
+        "rejected_examples": rejected_examples,
+        "principle_cues": {
+            principle: [index for index, matcher in enumerate(matchers) if matcher.search(corpus)]
+            for principle, matchers in PRINCIPLE_MATCHERS.items()
+        },
+    }
+
+
+def merge_stats(parts: Iterable[dict[str, object]]) -> dict[str, object]:
+    """Combine collect_stats() results, given in event order."""
+    merged: dict[str, object] = {
+        "event_count": 0,
+        "source_files": set(),
+        "stances": Counter(),
+        "monthly_counts": Counter(),
+        "approaches": {},
+        "rejected_examples": [],
+        "principle_cues": {principle: set() for principle in PRINCIPLE_CUES},
+    }
+    for part in parts:
+        merged["event_count"] += part["event_count"]
+        merged["source_files"].update(part["source_files"])
+        merged["stances"].update(part["stances"])
+        merged["monthly_counts"].update(part["monthly_counts"])
+        room = 12 - len(merged["rejected_examples"])
+        merged["rejected_examples"].extend(part["rejected_examples"][:max(room, 0)])
+        for principle, hits in part["principle_cues"].items():
+            merged["principle_cues"].setdefault(principle, set()).update(hits)
+        for approach, row in part["approaches"].items():
+            target = merged["approaches"].get(approach)
+            if target is None:
+                target = merged["approaches"][approach] = {
+                    "event_count": 0,
+                    "prompt_count": 0,
+                    "response_count": 0,
+                    "stances": Counter(),
+                    "tokens": Counter(),
+                    "first_seen": None,
+                    "last_seen": None,
+                    "first_example": row["first_example"],
+                    "first_prompt_example": None,
+                }
+            for key in ("event_count", "prompt_count", "response_count"):
+                target[key] += row[key]
+            target["stances"].update(row["stances"])
+            target["tokens"].update(row["tokens"])
+            target["first_seen"] = min(filter(None, [target["first_seen"], row["first_seen"]]), default=None)
+            target["last_seen"] = max(filter(None, [target["last_seen"], row["last_seen"]]), default=None)
+            if target["first_prompt_example"] is None:
+                target["first_prompt_example"] = row["first_prompt_example"]
+    return merged
+
+
+def build_summary(events: list[Event], references: list[dict[str, object]]) -> tuple[dict[str, object], str]:
+    return build_summary_from_stats(merge_stats([collect_stats(events)]), references)
+
+
+def build_summary_from_stats(
+    stats: dict[str, object], references: list[dict[str, object]]
+) -> tuple[dict[str, object], str]:
     approach_row_map = {}
-    for approach, approach_events in sorted(by_approach.items(), key=lambda item: len(item[1]), reverse=True):
-        keywords = extract_keywords([event.text for event in approach_events])
-        stances = Counter(event.stance for event in approach_events)
-        first_seen = min((event.timestamp for event in approach_events if event.timestamp), default=None)
-        last_seen = max((event.timestamp for event in approach_events if event.timestamp), default=None)
-        exemplar = next((event for event in approach_events if event.event_kind == "prompt"), approach_events[0])
+    approaches = stats["approaches"]
+    for approach, row in sorted(approaches.items(), key=lambda item: item[1]["event_count"], reverse=True):
         approach_row_map[approach] = {
             "approach": approach,
-            "event_count": len(approach_events),
-            "prompt_count": sum(1 for event in approach_events if event.event_kind == "prompt"),
-            "response_count": sum(1 for event in approach_events if event.event_kind == "response"),
-            "stances": dict(stances),
-            "keywords": keywords,
-            "first_seen": first_seen,
-            "last_seen": last_seen,
-            "example": truncate(exemplar.text, 280),
+            "event_count": row["event_count"],
+            "prompt_count": row["prompt_count"],
+            "response_count": row["response_count"],
+            "stances": dict(row["stances"]),
+            "keywords": [word for word, _ in Counter(row["tokens"]).most_common(10)],
+            "first_seen": row["first_seen"],
+            "last_seen": row["last_seen"],
+            "example": row["first_prompt_example"] if row["first_prompt_example"] is not None else row["first_example"],
         }
 
     approach_rows = []
@@ -315,22 +447,21 @@ def build_summary(events: list[Event], references: list[dict[str, object]]) -> t
     approach_rows.extend(sorted(approach_row_map.values(), key=lambda row: row["event_count"], reverse=True))
 
     principle_rows = []
-    session_corpus = "\n".join(event.text for event in events)
-    for principle, cues in PRINCIPLE_CUES.items():
-        hit_count = sum(1 for cue in cues if re.search(cue, session_corpus, re.I))
+    for principle in PRINCIPLE_CUES:
+        hit_count = len(stats["principle_cues"].get(principle, ()))
         if hit_count:
             principle_rows.append({"principle": principle, "hits": hit_count})
     principle_rows.sort(key=lambda row: row["hits"], reverse=True)
 
     summary = {
         "generated_at": datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z"),
-        "event_count": len(events),
-        "source_file_count": len({event.source_file for event in events}),
-        "stances": dict(by_stance),
-        "monthly_counts": dict(sorted(monthly_counts.items())),
+        "event_count": stats["event_count"],
+        "source_file_count": len(stats["source_files"]),
+        "stances": dict(stats["stances"]),
+        "monthly_counts": dict(sorted(stats["monthly_counts"].items())),
         "approaches": approach_rows,
         "principles": principle_rows,
-        "rejected_examples": rejected_examples,
+        "rejected_examples": list(stats["rejected_examples"]),
         "references": references,
     }
     return summary, render_markdown(summary)
@@ -407,18 +538,257 @@ def write_jsonl(path: Path, rows: Iterable[dict[str, object]]) -> None:
             handle.write(json.dumps(row, ensure_ascii=True) + "\n")
 
 
+def event_row(event: Event) -> dict[str, object]:
+    return {
+        "source_file": event.source_file,
+        "event_kind": event.event_kind,
+        "timestamp": event.timestamp,
+        "pair_index": event.pair_index,
+        "approaches": event.approaches,
+        "stance": event.stance,
+        "text": event.text,
+    }
+
+
+def _row_line(row: dict[str, object]) -> str:
+    return json.dumps(row, ensure_ascii=True) + "\n"
+
+
+def _rows_digest(lines: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode("ascii"))
+    return digest.hexdigest()
+
+
+def analyze_session_log(path: str, known_sha256: str | None = None) -> dict[str, object]:
+    """Parse one session log into JSONL lines plus mergeable summary stats.
+
+    Runs in worker processes, so it only takes and returns plain data. When
+    the content hash equals ``known_sha256`` the file is reported unchanged
+    without being parsed.
+    """
+    data = Path(path).read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    if sha256 == known_sha256:
+        return {"path": path, "sha256": sha256, "unchanged": True}
+    # Decode exactly as Path.read_text(errors="ignore") does (incl. newline translation).
+    text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="ignore").read()
+    events = parse_blocks_text(text, Path(path).name)
+    lines = [_row_line(event_row(event)) for event in events]
+    return {
+        "path": path,
+        "sha256": sha256,
+        "unchanged": False,
+        "lines": lines,
+        "stats": collect_stats(events),
+    }
+
+
+def _load_state(path: Path) -> dict[str, object]:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return {}
+    return state
+
+
+def _save_state(path: Path, state: dict[str, object]) -> None:
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(state, ensure_ascii=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _map_files(jobs: list[tuple[str, str | None]], workers: int) -> list[dict[str, object]]:
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            return list(pool.map(analyze_session_log, *zip(*jobs)))
+    return [analyze_session_log(path, known) for path, known in jobs]
+
+
+def _rewrite_events(
+    events_path: Path,
+    drop_files: set[str] | None,
+    new_lines: dict[str, list[str]],
+    file_order: list[str],
+) -> None:
+    """Stream the events file, dropping rows of ``drop_files`` and merging in ``new_lines``.
+
+    Rows stay grouped by source file in ``file_order`` (the order a full run
+    writes), so event ids do not depend on run history.
+    ``drop_files=None`` discards the existing file entirely.
+    """
+    position = {name: index for index, name in enumerate(file_order)}
+    pending = [name for name in file_order if new_lines.get(name)]
+    written = 0
+    tmp_path = events_path.with_suffix(".jsonl.tmp")
+    with tmp_path.open("w", encoding="utf-8", newline="\n") as out:
+        if drop_files is not None and events_path.exists():
+            with events_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    source = json.loads(line).get("source_file")
+                    if source in drop_files:
+                        continue
+                    rank = position.get(source, len(file_order))
+                    while written < len(pending) and position[pending[written]] < rank:
+                        out.writelines(new_lines[pending[written]])
+                        written += 1
+                    out.write(line)
+        for name in pending[written:]:
+            out.writelines(new_lines[name])
+    os.replace(tmp_path, events_path)
+
+
+def run_analysis(
+    prompt_tracking_dir: Path,
+    output_dir: Path,
+    references: list[dict[str, object]] | None = None,
+    workers: int | None = None,
+    full: bool = False,
+    fts: bool = True,
+) -> dict[str, object]:
+    """Incrementally (re)build the events JSONL and approach summary.
+
+    Per-file state (size, mtime, content hash, row digest and summary stats)
+    is kept in ``session_log_state.json`` next to the outputs:
+
+    - files whose size and mtime are unchanged are not read at all; touched
+      files whose content hash is unchanged are not parsed;
+    - changed files are parsed in a process pool;
+    - rows for new files, or rows past the end of a file that only grew, are
+      appended to the events file when they sort after every file already in
+      it; otherwise, and for removed or rewritten files, one streaming rewrite
+      merges them in, so the events file is always in the same order as a
+      full run writes it;
+    - the summary is rebuilt by merging the stored per-file stats;
+    - with ``fts=True`` the SQLite FTS index next to the events file gets
+      the same deletes/appends (or a rebuild when it is out of step).
+
+    ``full=True`` (or missing/inconsistent state) reparses every file.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    events_path = output_dir / EVENTS_FILE_NAME
+    state_path = output_dir / STATE_FILE_NAME
+    state = {} if full else _load_state(state_path)
+    if state and (not events_path.exists() or events_path.stat().st_size != state.get("events_file_size")):
+        state = {}
+    old_files: dict[str, dict[str, object]] = state.get("files", {}) if state else {}
+
+    paths = iter_session_log_paths(prompt_tracking_dir)
+    current: dict[str, dict[str, object]] = {}
+    jobs: list[tuple[str, str | None]] = []
+    for path in paths:
+        stat = path.stat()
+        previous = old_files.get(path.name)
+        if previous and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+            current[path.name] = previous
+        else:
+            jobs.append((str(path), previous["sha256"] if previous else None))
+
+    report = {"files": len(paths), "parsed": 0, "unchanged": 0, "appended_rows": 0, "rewritten": False}
+    new_lines: dict[str, list[str]] = {}
+    appends: dict[str, list[str]] = {}
+    present = {path.name for path in paths}
+    needs_rewrite = not state or any(name not in present for name in old_files)
+
+    for result in _map_files(jobs, workers or os.cpu_count() or 1):
+        path = Path(result["path"])
+        stat = path.stat()
+        previous = old_files.get(path.name)
+        if result["unchanged"]:
+            report["unchanged"] += 1
+            current[path.name] = {**previous, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            continue
+        report["parsed"] += 1
+        lines = result["lines"]
+        entry = {
+            "sha256": result["sha256"],
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "event_count": len(lines),
+            "rows_sha256": _rows_digest(lines),
+            "stats": result["stats"],
+        }
+        current[path.name] = entry
+        new_lines[path.name] = lines
+        if previous is None:
+            appends[path.name] = lines
+        elif (
+            len(lines) >= previous["event_count"]
+            and _rows_digest(lines[: previous["event_count"]]) == previous["rows_sha256"]
+        ):
+            appends[path.name] = lines[previous["event_count"]:]
+        else:
+            needs_rewrite = True
+
+    order = [path.name for path in paths]
+    appends = {name: lines for name, lines in appends.items() if lines}
+    if appends and not needs_rewrite:
+        # Appending is only order-preserving past the last file with rows.
+        position = {name: index for index, name in enumerate(order)}
+        last_existing = max((position[name] for name, entry in old_files.items() if entry["event_count"]), default=-1)
+        needs_rewrite = min(position[name] for name in appends) < last_existing
+    append_lines = [line for name in order for line in appends.get(name, ())]
+    drop: set[str] | None = None
+    if needs_rewrite:
+        # Without trusted state every file was parsed above; start from an empty file.
+        drop = (set(old_files) - present) | set(new_lines) if state else None
+        _rewrite_events(events_path, drop, new_lines, order)
+        report["rewritten"] = True
+    elif append_lines:
+        with events_path.open("a", encoding="utf-8", newline="\n") as handle:
+            handle.writelines(append_lines)
+        report["appended_rows"] = len(append_lines)
+    elif not events_path.exists():
+        events_path.touch()
+
+    if fts:
+        with SessionLogIndex(default_index_path(events_path)) as index:
+            if not state or index.synced_events_size != state.get("events_file_size"):
+                report["fts_rows_indexed"] = index.rebuild(events_path)
+            elif needs_rewrite:
+                changed = (line for name in order for line in new_lines.get(name, ()))
+                report["fts_rows_indexed"] = index.sync(events_path, drop, changed)
+            else:
+                report["fts_rows_indexed"] = index.sync(events_path, (), append_lines)
+
+    ordered = {path.name: current[path.name] for path in paths}
+    _save_state(
+        state_path,
+        {"version": STATE_VERSION, "events_file_size": events_path.stat().st_size, "files": ordered},
+    )
+
+    stats = merge_stats(entry["stats"] for entry in ordered.values())
+    summary, markdown = build_summary_from_stats(stats, references or [])
+    summary_json = output_dir / "ppa_approach_summary.json"
+    summary_md = output_dir / "ppa_approach_summary.md"
+    summary_json.write_text(json.dumps(summary, indent=2, ensure_ascii=True), encoding="utf-8")
+    summary_md.write_text(markdown, encoding="utf-8")
+
+    report.update(
+        {
+            "event_count": stats["event_count"],
+            "summary_md": str(summary_md),
+            "summary_json": str(summary_json),
+            "events_jsonl": str(events_path),
+        }
+    )
+    return report
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Classify and summarize RoadTrip session logs for PPA planning.")
     parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Directory for summary outputs.")
+    parser.add_argument(
+        "--prompt-tracking-dir", default=str(PROMPT_TRACKING_DIR), help="Directory containing Session Log *.md files."
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count).")
+    parser.add_argument("--full", action="store_true", help="Ignore saved state and reparse every session log.")
+    parser.add_argument("--no-fts", action="store_true", help="Skip updating the SQLite full-text index.")
     args = parser.parse_args()
 
-    output_dir = Path(args.output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    events: list[Event] = []
-    for path in iter_session_log_paths(PROMPT_TRACKING_DIR):
-        events.extend(parse_blocks(path))
-
     references = []
     for item in [
         summarize_reference_doc(UNIFIED_AUTH_SPEC, "Unified Auth Spec v0.2"),
@@ -427,37 +797,16 @@ def main() -> None:
         if item:
             references.append(item)
 
-    summary, markdown = build_summary(events, references)
-
-    events_jsonl = output_dir / "session_log_events.jsonl"
-    summary_json = output_dir / "ppa_approach_summary.json"
-    summary_md = output_dir / "ppa_approach_summary.md"
-
-    write_jsonl(
-        events_jsonl,
-        [
-            {
-                "source_file": event.source_file,
-                "event_kind": event.event_kind,
-                "timestamp": event.timestamp,
-                "pair_index": event.pair_index,
-                "approaches": event.approaches,
-                "stance": event.stance,
-                "text": event.text,
-            }
-            for event in events
-        ],
+    report = run_analysis(
+        Path(args.prompt_tracking_dir),
+        Path(args.output_dir),
+        references=references,
+        workers=args.workers,
+        full=args.full,
+        fts=not args.no_fts,
     )
-    summary_json.write_text(json.dumps(summary, indent=2, ensure_ascii=True), encoding="utf-8")
-    summary_md.write_text(markdown, encoding="utf-8")
-
-    print(json.dumps({
-        "event_count": len(events),
-        "summary_md": str(summary_md),
-        "summary_json": str(summary_json),
-        "events_jsonl": str(events_jsonl),
-    }, indent=2))
+    print(json.dumps(report, indent=2))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
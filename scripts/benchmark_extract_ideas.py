@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark extract_ideas_two_pass over a synthetic doc tree.
+
+Builds --files .md/.txt files (plus excluded dirs full of noise) under a
+temporary root, then times the rglob + is_excluded walk against the pruned
+os.scandir walker and the full map/reduce run for each --workers value.
+Peak RSS is reported for the parent and for worker processes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import tempfile
+import time
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import extract_ideas_two_pass as extract
+
+WORDS = (
+    "memory context agent workflow plan should build implement spec architecture system decide question "
+    "risk problem travel hotel flight dashboard test quality core must next todo session pipeline design "
+    "idea option goal priority roadmap evaluate automate consider approach proposal retrieval gate policy"
+).split()
+FILLER = "alpha beta gamma delta epsilon zeta theta kappa lambda sigma omega route airport window".split()
+
+
+def synthesize_corpus(root: Path, files: int, seed: int = 11) -> None:
+    rng = random.Random(seed)
+    vocabulary = WORDS + FILLER
+    shared = [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(8, 30))) for _ in range(2_000)]
+    for index in range(files):
+        project = "RoadTrip" if index % 3 else "ControlPlane"
+        directory = root / project / f"area{index % 40:02d}" / f"topic{index % 500:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        paragraphs = []
+        for _ in range(rng.randint(3, 25)):
+            if rng.random() < 0.3:
+                paragraphs.append(rng.choice(shared))
+            else:
+                paragraphs.append(" ".join(rng.choice(vocabulary) for _ in range(rng.randint(5, 60))))
+        if index % 7 == 0:
+            paragraphs.insert(0, "00:01:02,500 --> 00:01:04,000\n[00:12] transcript line")
+        ext = ".md" if index % 2 else ".txt"
+        (directory / f"note{index:06d}{ext}").write_text("\n\n".join(paragraphs), encoding="utf-8")
+        if index % 1_000 == 0:
+            noise = root / project / "node_modules" / f"pkg{index}"
+            noise.mkdir(parents=True, exist_ok=True)
+            for extra in range(50):
+                (noise / f"README{extra}.md").write_text("we should build the plan " * 20, encoding="utf-8")
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def _rglob_walk(projects: list[Path]) -> int:
+    count = 0
+    for project in projects:
+        for file in project.rglob("*"):
+            if file.is_file() and file.suffix.lower() in extract.INCLUDE_EXTS and not extract.is_excluded(file):
+                count += 1
+    return count
+
+
+def _scandir_walk(projects: list[Path]) -> int:
+    return sum(1 for project in projects for _ in extract.iter_candidate_files(project))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark two-pass idea extraction")
+    parser.add_argument("--files", type=int, default=100_000, help="Number of synthetic doc files")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="Worker counts to time")
+    parser.add_argument("--root", default=None, help="Reuse/keep a corpus directory instead of a temp dir")
+    args = parser.parse_args()
+
+    temp = None if args.root else tempfile.TemporaryDirectory(prefix="idea_bench_")
+    root = Path(args.root or temp.name)
+    try:
+        projects = [root / "RoadTrip", root / "ControlPlane"]
+        if not projects[0].exists():
+            _, build_ms = _timed(lambda: synthesize_corpus(root, args.files))
+        else:
+            build_ms = 0.0
+
+        rglob_count, rglob_ms = _timed(lambda: _rglob_walk(projects))
+        scandir_count, scandir_ms = _timed(lambda: _scandir_walk(projects))
+        report = {
+            "files": args.files,
+            "corpus_build_ms": build_ms,
+            "walk": {
+                "rglob_ms": rglob_ms,
+                "scandir_ms": scandir_ms,
+                "rglob_files": rglob_count,
+                "scandir_files": scandir_count,
+            },
+            "runs": [],
+        }
+        for workers in args.workers:
+            summary, run_ms = _timed(
+                lambda: extract.run_extraction(projects, root / f"out_w{workers}", workers=workers)
+            )
+            report["runs"].append({"workers": workers, "ms": run_ms, **summary})
+
+        outputs = [(root / f"out_w{w}" / "idea_evidence.csv").read_bytes() for w in args.workers]
+        report["outputs_identical"] = all(output == outputs[0] for output in outputs)
+        report["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        report["peak_worker_rss_mb"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+        print(json.dumps(report, indent=2))
+    finally:
+        if temp is not None:
+            temp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark prompt -> intent routing throughput."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.skills.intent_router import IntentRouter, benchmark_router
+
+SAMPLE_PROMPTS = [
+    "please push the latest changes",
+    "git push",
+    "push my changes to github",
+    "commit and push",
+    "promote memory entry foo from working to episodic",
+    "move entry risk-list from prospective to long_term",
+    "show me a list of skills",
+    "registry list",
+    "what is the weather in flagstaff",
+    "summarize the session log for yesterday",
+    "sync my updates with the remote",
+    "explain the fingerprint verifier",
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark intent router throughput")
+    parser.add_argument("--router", default="adaptive_executor", help="Router name in intent-routes.yaml")
+    parser.add_argument("--routes", default=None, help="Path to intent-routes.yaml")
+    parser.add_argument("--prompts", default=None, help="Optional file with one prompt per line")
+    parser.add_argument("--total", type=int, default=100_000, help="Number of prompts to route")
+    args = parser.parse_args()
+
+    prompts = SAMPLE_PROMPTS
+    if args.prompts:
+        prompts = Path(args.prompts).read_text(encoding="utf-8").splitlines()
+
+    router = IntentRouter.from_config(args.router, args.routes)
+    print(json.dumps(benchmark_router(router, prompts, total=args.total), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark the single-pass HTML -> markdown converter against the regex reference pipeline."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from mcp_server_page_scraper import (
+    _extract_best_fragment,
+    _html_fragment_to_markdown,
+    _html_fragment_to_markdown_regex,
+)
+
+DEFAULT_HTML = REPO_ROOT / "data" / "Competition" / "zeropoint" / "whitepaper-article.html"
+BASE_URL = "https://example.com/article/"
+
+
+def _timed(fn, fragment: str, repeat: int) -> float:
+    fn(fragment, BASE_URL)  # warm-up, so the first function timed is not penalized
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(fragment, BASE_URL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _case(name: str, fragment: str, repeat: int) -> dict:
+    single_pass_s = _timed(_html_fragment_to_markdown, fragment, repeat)
+    regex_s = _timed(_html_fragment_to_markdown_regex, fragment, repeat)
+    size_mb = len(fragment.encode("utf-8")) / 1_000_000
+
+    def _rate(seconds: float) -> float:
+        return round(size_mb / seconds, 2) if seconds > 0 else float("inf")
+
+    return {
+        "case": name,
+        "bytes": len(fragment.encode("utf-8")),
+        "single_pass_mb_per_sec": _rate(single_pass_s),
+        "regex_mb_per_sec": _rate(regex_s),
+        "single_pass_ms": round(single_pass_s * 1000, 2),
+        "regex_ms": round(regex_s * 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark page scraper markdown conversion")
+    parser.add_argument("--html", default=str(DEFAULT_HTML), help="HTML page to convert")
+    parser.add_argument("--scale", type=int, default=10, help="Repeat the page body N times for the large case")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions per case (best is reported)")
+    args = parser.parse_args()
+
+    html = Path(args.html).read_text(encoding="utf-8", errors="replace")
+    fragment = _extract_best_fragment(html)
+
+    cases = [
+        ("page", fragment),
+        (f"page_x{args.scale}", fragment * max(1, args.scale)),
+        # Unclosed constructs make each lazy regex pass rescan to the end.
+        ("unclosed_li", "<ul>" + "<li>item text here " * 5000 + "</ul>"),
+        ("unclosed_links", "<p>" + '<a href="/x">link ' * 5000),
+    ]
+    results = [_case(name, body, args.repeat) for name, body in cases]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark ppa_ask memory-search scoring: JSONL scan vs the evidence index
+(per-candidate loop and, with NumPy, vectorized columns).
+
+Synthesizes a session_log_events.jsonl of --events rows by cycling the real
+events file (shifting timestamps so recency varies), then times one question
+through the fast + slow passes the way run_memory_search() does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import ppa_ask
+
+DEFAULT_SOURCE = REPO_ROOT / "analysis" / "ppa" / "session_log_events.jsonl"
+DEFAULT_SUMMARY = REPO_ROOT / "analysis" / "ppa" / "ppa_approach_summary.json"
+DEFAULT_QUESTIONS = [
+    "what did we decide about memory retrieval",
+    "auth policy delegation zero trust principals",
+    "deterministic execution safety gates before tools",
+]
+
+
+def synthesize_events(source: Path, target: Path, total: int, seed: int = 7) -> None:
+    rows = ppa_ask.load_jsonl(source)
+    rng = random.Random(seed)
+    now = datetime.now()
+    with target.open("w", encoding="utf-8", newline="\n") as handle:
+        for index in range(total):
+            row = dict(rows[index % len(rows)])
+            row["source_file"] = f"Session Log {index // 500:06d}.md"
+            row["timestamp"] = (now - timedelta(days=rng.randint(0, 200), seconds=rng.randint(0, 86_399))).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            handle.write(json.dumps(row, ensure_ascii=True) + "\n")
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ppa_ask evidence scoring")
+    parser.add_argument("--events", type=int, default=200_000, help="Number of synthetic events")
+    parser.add_argument("--source", default=str(DEFAULT_SOURCE), help="Seed session_log_events.jsonl")
+    parser.add_argument("--summary", default=str(DEFAULT_SUMMARY), help="ppa_approach_summary.json for approach hints")
+    parser.add_argument("--skip-scan", action="store_true", help="Skip the legacy full-scan timings")
+    args = parser.parse_args()
+
+    summary = ppa_ask.load_json(Path(args.summary))
+    weights = {"Session Log 000001.md": 0.15}
+    report: dict[str, object] = {"events": args.events}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        events_path = Path(tmp) / "session_log_events.jsonl"
+        synthesize_events(Path(args.source), events_path, args.events)
+
+        index, report["index_build_ms"] = _timed(lambda: ppa_ask.EvidenceIndex.open(events_path))
+        index.close()
+        index, report["index_open_ms"] = _timed(lambda: ppa_ask.EvidenceIndex.open(events_path))
+
+        if not args.skip_scan:
+            events, report["scan_load_ms"] = _timed(lambda: ppa_ask.load_jsonl(events_path))
+
+        questions = []
+        for question in DEFAULT_QUESTIONS:
+            hints = ppa_ask.infer_approach_hints(question, summary)
+            row: dict[str, object] = {"question": question, "approach_hints": hints}
+
+            def indexed(vectorized: bool):
+                index._candidates_key = index._array_candidates_key = None  # time a fresh question
+                return [index.score(question, hints, weights, mode, vectorized=vectorized)[0] for mode in ("fast", "slow")]
+
+            top, row["index_loop_ms"] = _timed(lambda: indexed(False))
+            if ppa_ask.np is not None:
+                vectorized, row["index_vectorized_ms"] = _timed(lambda: indexed(True))
+                row["vectorized_identical"] = [
+                    [(item.score, item.event) for item in ranked] for ranked in vectorized
+                ] == [[(item.score, item.event) for item in ranked] for ranked in top]
+            if not args.skip_scan:
+                def scan():
+                    return [ppa_ask.score_events(events, question, hints, weights, mode)[:12] for mode in ("fast", "slow")]
+
+                legacy, row["scan_ms"] = _timed(scan)
+                row["identical"] = [
+                    [(item.score, item.event) for item in ranked] for ranked in top
+                ] == [[(item.score, item.event) for item in ranked] for ranked in legacy]
+            questions.append(row)
+        report["questions"] = questions
+        index.close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
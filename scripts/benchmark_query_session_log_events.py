@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark query_session_log_events: JSONL scan vs the SQLite FTS5 index.
+
+Synthesizes --events rows with benchmark_ppa_ask.synthesize_events, builds
+the index once, then times each query (first page) both ways.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import query_session_log_events as query_events
+from scripts.benchmark_ppa_ask import DEFAULT_SOURCE, synthesize_events
+from scripts.session_log_index import SessionLogIndex
+
+DEFAULT_QUERIES = [
+    {"query": "memory retrieval"},
+    {"query": "auth policy delegation", "stance": "adopted-or-endorsed"},
+    {"query": "", "approach": "memory-and-retrieval", "since": "2026-01", "offset": 24},
+]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark session-log event queries")
+    parser.add_argument("--events", type=int, default=200_000, help="Number of synthetic events")
+    parser.add_argument("--source", default=str(DEFAULT_SOURCE), help="Seed session_log_events.jsonl")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        events_path = Path(temp_dir) / "session_log_events.jsonl"
+        synthesize_events(Path(args.source), events_path, args.events)
+        index, build_ms = _timed(lambda: SessionLogIndex.open(events_path, Path(temp_dir) / "events.sqlite"))
+        rows, load_ms = _timed(lambda: query_events.load_rows(events_path))
+        report = {"events": args.events, "index_build_ms": build_ms, "scan_load_ms": load_ms, "queries": []}
+        with index:
+            for params in DEFAULT_QUERIES:
+                indexed, index_ms = _timed(lambda: index.search(**params))
+                scanned, scan_ms = _timed(lambda: query_events.scan_rows(rows, **params))
+                report["queries"].append(
+                    {
+                        **params,
+                        "index_ms": index_ms,
+                        "scan_ms": scan_ms,
+                        "index_total": indexed.total,
+                        "scan_total": scanned.total,
+                    }
+                )
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
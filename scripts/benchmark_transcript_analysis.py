@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark single-pass brief analysis against the per-section passes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.extract_youtube_debate_brief import (
+    Segment,
+    analyze_transcript,
+    build_analysis_section,
+    infer_topics,
+    split_sentences,
+    summarize_transcript,
+)
+
+WORDS = (
+    "agents are always better than the benchmark suggests and the price of inference "
+    "never drops as fast as people think because cost curves improved slowly so what "
+    "does this model actually prove about code quality context windows or memory"
+).split()
+ENDINGS = (".", ".", "?", "!", "", "", "")
+
+
+def synthetic_segments(count: int, seed: int = 7) -> list[Segment]:
+    rng = random.Random(seed)
+    segments = []
+    for i in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 16))) + rng.choice(ENDINGS)
+        segments.append(Segment(start=i * 2.5, duration=2.5, text=text))
+    return segments
+
+
+def per_section(full_text: str, segment_count: int) -> tuple[list[str], list[str], list[str]]:
+    sentences = split_sentences(full_text)
+    topics = infer_topics(full_text)
+    return topics, summarize_transcript(sentences, segment_count), build_analysis_section(sentences, topics)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark transcript analysis for debate briefs")
+    parser.add_argument("--segments", type=int, default=50_000, help="Synthetic caption segments")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    segments = synthetic_segments(args.segments)
+    full_text = " ".join(seg.text for seg in segments)
+
+    single = analyze_transcript(full_text, len(segments))
+    identical = (single.topics, single.summary_lines, single.analysis_lines) == per_section(full_text, len(segments))
+
+    per_section_s = _best_of(lambda: per_section(full_text, len(segments)), args.repeat)
+    single_s = _best_of(lambda: analyze_transcript(full_text, len(segments)), args.repeat)
+
+    print(
+        json.dumps(
+            {
+                "segments": len(segments),
+                "sentences": len(split_sentences(full_text)),
+                "identical_output": identical,
+                "per_section_ms": round(per_section_s * 1000, 1),
+                "single_pass_ms": round(single_s * 1000, 1),
+                "speedup": round(per_section_s / single_s, 2) if single_s else None,
+            },
+            indent=2,
+        )
+    )
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
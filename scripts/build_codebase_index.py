@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+build_codebase_index.py - Incrementally rebuild CODEBASE_INDEX_ENHANCED.json
+
+Extracts modules, classes, functions, imports and entry points from every
+Python file in the repo with ``ast`` (in a process pool) and merges them into
+the enhanced index consumed by navigate_codebase.py and the dev dashboard.
+
+Per-file results are cached in ``<index>.cache.json`` keyed by content
+hash. A file whose size and mtime are unchanged is not even read; a file
+whose bytes hash to the cached digest is not re-parsed. The hand-curated
+sections of the index (skills, workflows, tasks, ...) are preserved; only
+``modules``, generated ``entry_points`` entries and metadata are rewritten,
+and the index file is left untouched when nothing changed.
+
+Usage:
+    py scripts/build_codebase_index.py               # incremental
+    py scripts/build_codebase_index.py --full        # ignore the cache
+    py scripts/build_codebase_index.py --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INDEX = REPO_ROOT / "CODEBASE_INDEX_ENHANCED.json"
+CACHE_VERSION = 1
+EXCLUDED_DIRS = {
+    ".git",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "env",
+    "node_modules",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    "build",
+    "dist",
+}
+
+
+def cache_path_for(index_path: Path) -> Path:
+    return index_path.with_name(index_path.stem + ".cache.json")
+
+
+def iter_python_files(root: Path) -> list[str]:
+    """Repo-relative POSIX paths of all .py files, pruning excluded directories."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in EXCLUDED_DIRS and not name.endswith(".egg-info"))
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in sorted(filenames):
+            if name.endswith(".py"):
+                found.append(name if rel_dir == "." else f"{rel_dir}/{name}".replace(os.sep, "/"))
+    return found
+
+
+def _first_line(docstring: str | None) -> str:
+    return docstring.strip().splitlines()[0].strip() if docstring and docstring.strip() else ""
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    operands = [node.test.left, *node.test.comparators]
+    return any(isinstance(op, ast.Name) and op.id == "__name__" for op in operands) and any(
+        isinstance(op, ast.Constant) and op.value == "__main__" for op in operands
+    )
+
+
+def summarize_source(source: bytes, rel_path: str) -> dict[str, object]:
+    """Module summary for one file: docstring, classes, functions, imports, entry point."""
+    summary: dict[str, object] = {
+        "module": rel_path[:-3].replace("/", ".").removesuffix(".__init__"),
+        "docstring": "",
+        "classes": [],
+        "functions": [],
+        "imports": [],
+        "entry_point": False,
+    }
+    try:
+        tree = ast.parse(source, filename=rel_path)
+    except (SyntaxError, ValueError) as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+        return summary
+
+    imports: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.add(node.module.split(".")[0])
+
+    classes, functions = [], []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes.append(
+                {
+                    "name": node.name,
+                    "line": node.lineno,
+                    "bases": [ast.unparse(base) for base in node.bases],
+                    "methods": [
+                        item.name
+                        for item in node.body
+                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and not item.name.startswith("_")
+                    ],
+                }
+            )
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append(
+                {
+                    "name": node.name,
+                    "line": node.lineno,
+                    "args": [arg.arg for arg in node.args.args],
+                }
+            )
+
+    summary["docstring"] = _first_line(ast.get_docstring(tree))
+    summary["classes"] = classes
+    summary["functions"] = functions
+    summary["imports"] = sorted(imports)
+    summary["entry_point"] = any(_is_main_guard(node) for node in tree.body)
+    return summary
+
+
+def index_file(root: str, rel_path: str, known_sha256: str | None) -> dict[str, object]:
+    """Worker: hash one file and parse it unless its content hash is already cached."""
+    path = Path(root) / rel_path
+    stat = path.stat()
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    result: dict[str, object] = {
+        "path": rel_path,
+        "sha256": digest,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if digest != known_sha256:
+        result["summary"] = summarize_source(data, rel_path)
+    return result
+
+
+def _map_files(root: Path, jobs: list[tuple[str, str | None]], workers: int) -> list[dict[str, object]]:
+    if workers > 1 and len(jobs) > 1:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            paths, known = zip(*jobs)
+            return list(pool.map(index_file, [str(root)] * len(jobs), paths, known, chunksize=chunksize))
+    return [index_file(str(root), path, known) for path, known in jobs]
+
+
+def _load_cache(path: Path) -> dict[str, dict[str, object]]:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def _write_json(path: Path, payload: object, indent: int | None = None) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=indent, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def merge_into_index(index: dict[str, object], modules: dict[str, dict[str, object]]) -> dict[str, object]:
+    """Return ``index`` with generated sections replaced; curated sections are kept as-is."""
+    merged = dict(index)
+    metadata = dict(merged.get("metadata") or {"version": "2.0", "description": "Enhanced codebase index"})
+    metadata["generated"] = datetime.now(UTC).strftime("%Y-%m-%d")
+    metadata["generator"] = "scripts/build_codebase_index.py"
+    metadata["total_modules"] = len(modules)
+    merged["metadata"] = metadata
+
+    entry_points = merged.get("entry_points")
+    if isinstance(entry_points, list):
+        curated = [entry for entry in entry_points if not (isinstance(entry, dict) and entry.get("generated"))]
+        listed = {entry.get("file") for entry in curated if isinstance(entry, dict)}
+        generated = [
+            {
+                "file": path,
+                "command": f"python {path}",
+                "purpose": summary["docstring"],
+                "interaction": "CLI",
+                "imports": summary["imports"],
+                "generated": True,
+            }
+            for path, summary in modules.items()
+            if summary.get("entry_point") and path not in listed
+        ]
+        merged["entry_points"] = curated + generated
+
+    merged["modules"] = modules
+    return merged
+
+
+def build_index(
+    root: Path = REPO_ROOT,
+    index_path: Path = DEFAULT_INDEX,
+    workers: int | None = None,
+    full: bool = False,
+) -> dict[str, object]:
+    """Refresh ``index_path`` from the Python files under ``root`` and return a run report."""
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    cache_path = cache_path_for(index_path)
+    cache = {} if full else _load_cache(cache_path)
+
+    files = iter_python_files(root)
+    jobs: list[tuple[str, str | None]] = []
+    unchanged_stat = 0
+    for rel_path in files:
+        entry = cache.get(rel_path)
+        if entry:
+            try:
+                stat = (root / rel_path).stat()
+            except OSError:
+                continue
+            if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                unchanged_stat += 1
+                continue
+        jobs.append((rel_path, entry.get("sha256") if entry else None))
+
+    new_cache = {path: cache[path] for path in files if path in cache}
+    parsed = 0
+    for result in _map_files(root, jobs, workers):
+        path = str(result.pop("path"))
+        summary = result.pop("summary", None)
+        if summary is None:
+            summary = cache[path]["summary"]
+        else:
+            parsed += 1
+        new_cache[path] = {**result, "summary": summary}
+
+    removed = sorted(set(cache) - set(new_cache))
+    changed = parsed > 0 or bool(removed) or list(cache) != list(new_cache)
+    if index_path.exists():
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    else:
+        index, changed = {}, True
+    changed = changed or "modules" not in index
+
+    if changed:
+        modules = {path: new_cache[path]["summary"] for path in files if path in new_cache}
+        _write_json(index_path, merge_into_index(index, modules), indent=2)
+    if changed or jobs:
+        _write_json(cache_path, {"version": CACHE_VERSION, "files": new_cache})
+
+    return {
+        "files": len(files),
+        "unchanged_stat": unchanged_stat,
+        "rehashed": len(jobs) - parsed,
+        "parsed": parsed,
+        "removed": len(removed),
+        "index_written": changed,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Incrementally rebuild CODEBASE_INDEX_ENHANCED.json from the source tree")
+    parser.add_argument("--root", default=str(REPO_ROOT), help="Repository root to scan")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX), help="Enhanced index file to update")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--full", action="store_true", help="Ignore the per-file cache and re-parse everything")
+    args = parser.parse_args()
+
+    report = build_index(Path(args.root), Path(args.index), workers=args.workers, full=args.full)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
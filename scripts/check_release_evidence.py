@@ -11,7 +11,12 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from src.skills.release_evidence_gate import evaluate_manifest, write_json_report
+from src.skills.release_evidence_gate import (
+    TELEMETRY_MODES,
+    TelemetryValidationCache,
+    evaluate_manifest,
+    write_json_report,
+)
 
 
 def main() -> int:
@@ -31,17 +36,54 @@ def main() -> int:
         default="workflows/010-memory-for-self-improvement/release-evidence-report.json",
         help="Output report path",
     )
+    parser.add_argument(
+        "--telemetry-mode",
+        choices=TELEMETRY_MODES,
+        default="full",
+        help="Validate every telemetry line (full) or evenly spaced windows of large JSONL files (sample)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Validation processes for large telemetry files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--validation-cache",
+        default="logs/release_evidence_validation_cache.json",
+        help="Telemetry validation cache keyed by (path, size, mtime)",
+    )
+    parser.add_argument(
+        "--no-validation-cache",
+        action="store_true",
+        help="Re-validate every telemetry file and leave the cache untouched",
+    )
     args = parser.parse_args()
 
     if not Path(args.manifest).exists():
         print(f"Manifest not found: {args.manifest}")
         return 2
 
-    result = evaluate_manifest(manifest_path=args.manifest, repo_root=args.repo_root)
+    cache = None if args.no_validation_cache else TelemetryValidationCache(args.validation_cache)
+    result = evaluate_manifest(
+        manifest_path=args.manifest,
+        repo_root=args.repo_root,
+        telemetry_mode=args.telemetry_mode,
+        workers=args.workers,
+        cache=cache,
+    )
     write_json_report(args.report, result)
 
     print(f"Decision: {result.decision}")
     print(f"Report: {args.report}")
+    for stats in result.telemetry_validation:
+        if stats["cached"]:
+            detail = "cached"
+        elif stats["mb_per_s"] is None:
+            detail = "not scanned"
+        else:
+            detail = f"{stats['bytes_read'] / 1_000_000:.1f} MB in {stats['scan_seconds']:.2f}s ({stats['mb_per_s']} MB/s)"
+        print(f"Telemetry {stats['key']}: {stats['mode']}, {stats['records']} records, {detail}")
 
     if result.decision == "NO-GO":
         if result.missing_required_evidence:
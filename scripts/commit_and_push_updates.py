@@ -60,12 +60,24 @@ def main():
     else:
         print(f"✅ Found {len(changed_files)} changed file(s): {', '.join(changed_files[:3])}")
         
+        # Stage before generating so the skill summarizes the real staged diff
+        print(f"  → Staging {len(changed_files)} file(s)...")
+        result = subprocess.run(
+            ["git", "add"] + changed_files,
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            print(f"❌ Staging failed: {result.stderr}")
+            return 1
+        
         # Step 2: Generate commit message using the skill
         print("\n[Step 2/3] Generating commit message with commit_message skill...")
         
-        commit_message = skill.generate(
+        commit_message = skill.generate_from_staged(
+            repo_path=str(Path(__file__).parent.parent),
             staged_files=changed_files,
-            diff="",
             user_message=None,
             dry_run=False
         )
@@ -80,15 +92,6 @@ def main():
         
         # Only commit if there are staged changes
         if changed_files:
-            # Stage all changed files
-            print(f"  → Staging {len(changed_files)} file(s)...")
-            subprocess.run(
-                ["git", "add"] + changed_files,
-                cwd=Path(__file__).parent.parent,
-                check=True,
-                capture_output=True
-            )
-            
             # Commit with the generated message
             print(f"  → Creating commit with message: {msg[:50]}...")
             result = subprocess.run(
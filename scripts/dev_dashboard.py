@@ -11,15 +11,17 @@ Requirements:
     py -m pip install pyyaml prompt-toolkit
 """
 
+import hashlib
 import json
 import os
 import sys
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -112,6 +114,149 @@ class DataProvider(ABC):
         pass
 
 
+class CachedDataProvider(DataProvider):
+    """
+    Data provider that caches load() until one of its source files changes.
+    
+    Each source is validated by (mtime_ns, size). get_data() never waits on
+    I/O once a value is cached: it returns the cached data and asks a worker
+    thread to re-validate (and reload if anything changed), so the next render
+    sees fresh data. Only the very first call, or refresh(), loads inline.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._signature: Optional[Tuple] = None
+        self._worker: Optional[threading.Thread] = None
+        self.load_count = 0
+    
+    @abstractmethod
+    def sources(self) -> List[Path]:
+        """Files whose changes invalidate the cached data"""
+        pass
+    
+    @abstractmethod
+    def load(self) -> Dict[str, Any]:
+        """Read the sources (uncached)"""
+        pass
+    
+    def _current_signature(self) -> Tuple:
+        signature = []
+        for path in self.sources():
+            try:
+                stat = path.stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((str(path), None, None))
+        return tuple(signature)
+    
+    def refresh(self) -> Dict[str, Any]:
+        """Re-validate now, reloading only when a source changed"""
+        signature = self._current_signature()
+        with self._lock:
+            if self._data is not None and signature == self._signature:
+                return self._data
+        data = self.load()
+        with self._lock:
+            self._data = data
+            self._signature = signature
+            self.load_count += 1
+        return data
+    
+    def refresh_in_background(self) -> Optional[threading.Thread]:
+        """Start a re-validation on a daemon thread (no-op if one is running)"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return self._worker
+            self._worker = threading.Thread(target=self._refresh_quietly, daemon=True)
+            self._worker.start()
+            return self._worker
+    
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            # Keep serving the last good data; the next refresh() will surface the error.
+            pass
+    
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until an in-flight background refresh finishes"""
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+    
+    def get_data(self) -> Dict[str, Any]:
+        with self._lock:
+            data = self._data
+        if data is None:
+            self.wait()
+            return self.refresh()
+        self.refresh_in_background()
+        return data
+
+
+class TelemetryCounter:
+    """
+    Line count of an append-only JSONL file kept in a JSON sidecar.
+    
+    The sidecar stores the byte offset counted so far, so an unchanged file
+    costs one stat() and an appended one only reads the new bytes. A file
+    that shrank or whose first block changed (rotated/rewritten) is recounted.
+    Counts match ``sum(1 for _ in open(path))``.
+    """
+    
+    HEAD_BYTES = 4096
+    CHUNK_BYTES = 1 << 20
+    
+    def __init__(self, path: Path, sidecar_path: Optional[Path] = None):
+        self.path = path
+        self.sidecar_path = sidecar_path or path.with_name(path.name + ".count.json")
+    
+    def _read_sidecar(self) -> Dict[str, Any]:
+        try:
+            state = json.loads(self.sidecar_path.read_text(encoding="utf-8"))
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_sidecar(self, state: Dict[str, Any]) -> None:
+        tmp_path = self.sidecar_path.with_name(self.sidecar_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp_path, self.sidecar_path)
+        except OSError:
+            pass  # read-only workspace: still return the count
+    
+    def count(self) -> int:
+        size = self.path.stat().st_size
+        state = self._read_sidecar()
+        offset = state.get("offset", 0)
+        newlines = state.get("newlines", 0)
+        ends_with_newline = state.get("ends_with_newline", True)
+        with open(self.path, "rb") as f:
+            if offset > size or state.get("head") != self._head(f, offset):
+                offset, newlines, ends_with_newline = 0, 0, True
+            f.seek(offset)
+            while True:
+                chunk = f.read(self.CHUNK_BYTES)
+                if not chunk:
+                    break
+                newlines += chunk.count(b"\n")
+                ends_with_newline = chunk.endswith(b"\n")
+            offset = f.tell()
+            head = self._head(f, offset)
+        self._write_sidecar(
+            {"offset": offset, "newlines": newlines, "ends_with_newline": ends_with_newline, "head": head}
+        )
+        return newlines + (0 if ends_with_newline else 1)
+    
+    def _head(self, f, offset: int) -> str:
+        """Hash of the first block counted so far (detects rewritten files)"""
+        f.seek(0)
+        return hashlib.sha256(f.read(min(offset, self.HEAD_BYTES))).hexdigest()
+
+
 # ============================================================================
 # QUIZ/SURVEY/CHOICE HELPERS
 # ============================================================================
@@ -249,16 +394,22 @@ class QuizHelper:
 # ============================================================================
 
 
-class ProjectStateProvider(DataProvider):
+class ProjectStateProvider(CachedDataProvider):
     """Provides project state data from MEMORY.md and other sources"""
     
     def __init__(self, workspace_root: Path):
+        super().__init__()
         self.workspace_root = workspace_root
         self.memory_path = workspace_root / "MEMORY.md"
         self.registry_path = workspace_root / "config" / "skills-registry.yaml"
         self.test_results_path = workspace_root / "test_results.txt"
+        self.telemetry_path = workspace_root / "data" / "telemetry.jsonl"
+        self.telemetry_counter = TelemetryCounter(self.telemetry_path)
     
-    def get_data(self) -> Dict[str, Any]:
+    def sources(self) -> List[Path]:
+        return [self.memory_path, self.registry_path, self.test_results_path, self.telemetry_path]
+    
+    def load(self) -> Dict[str, Any]:
         """Parse project state from multiple sources"""
         data = {
             "current_phase": "Unknown",
@@ -311,12 +462,10 @@ class ProjectStateProvider(DataProvider):
                     data["tests_passing"] = line.strip()
                     break
         
-        # Count telemetry events (if exists)
-        telemetry_path = self.workspace_root / "data" / "telemetry.jsonl"
-        if telemetry_path.exists():
+        # Count telemetry events (if exists); the sidecar makes this O(appended bytes)
+        if self.telemetry_path.exists():
             try:
-                with open(telemetry_path, "r", encoding="utf-8") as f:
-                    count = sum(1 for _ in f)
+                count = self.telemetry_counter.count()
                 data["telemetry_events"] = f"{count:,} total"
             except Exception:
                 pass
@@ -324,14 +473,18 @@ class ProjectStateProvider(DataProvider):
         return data
 
 
-class SkillsRegistryProvider(DataProvider):
+class SkillsRegistryProvider(CachedDataProvider):
     """Provides skills registry data"""
     
     def __init__(self, workspace_root: Path):
+        super().__init__()
         self.workspace_root = workspace_root
         self.registry_path = workspace_root / "config" / "skills-registry.yaml"
     
-    def get_data(self) -> Dict[str, Any]:
+    def sources(self) -> List[Path]:
+        return [self.registry_path]
+    
+    def load(self) -> Dict[str, Any]:
         """Parse skills registry YAML"""
         if not self.registry_path.exists():
             return {"skills": [], "total": 0}
@@ -361,14 +514,18 @@ class SkillsRegistryProvider(DataProvider):
         }
 
 
-class CodebaseNavProvider(DataProvider):
+class CodebaseNavProvider(CachedDataProvider):
     """Provides codebase navigation data"""
     
     def __init__(self, workspace_root: Path):
+        super().__init__()
         self.workspace_root = workspace_root
         self.index_path = workspace_root / "CODEBASE_INDEX_ENHANCED.json"
     
-    def get_data(self) -> Dict[str, Any]:
+    def sources(self) -> List[Path]:
+        return [self.index_path]
+    
+    def load(self) -> Dict[str, Any]:
         """Load codebase index"""
         if not self.index_path.exists():
             return {"error": "Index not found"}
@@ -429,6 +586,7 @@ class ProjectStateMenu(MenuItem):
         choice = user_input.strip().lower()
         
         if choice == "r" or choice == "refresh":
+            self.provider.refresh()
             return MenuResponse(MenuAction.REFRESH)
         elif choice == "b" or choice == "back":
             return MenuResponse(MenuAction.BACK)
@@ -695,8 +853,16 @@ class MenuSystem:
         print()
         print("Type number (1-8), 'help' for info, 'quit' to exit")
     
+    def warm_up(self):
+        """Load provider data on background threads before any menu is opened"""
+        for menu in self.menus.values():
+            provider = getattr(menu, "provider", None)
+            if isinstance(provider, CachedDataProvider):
+                provider.refresh_in_background()
+    
     def run(self):
         """Main interactive loop"""
+        self.warm_up()
         self.render_header()
         
         while True:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Compare transcript ranking quality and latency: overlap scorer vs BM25F.
+
+Known-item evaluation: each transcript yields queries (its title, and a
+snippet of its summary) whose single relevant document is that transcript.
+Reports MRR/hit rates and per-query latency for both indexed scoring modes,
+plus the latency of the original full-scan scorer. ``--synthetic`` corpora
+draw from a tiny vocabulary and are meant for latency, not quality.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import mcp_server_transcript_retrieval as retrieval
+
+VOCABULARY = (
+    "agent memory context retrieval server offline model code review gpt swarm spine "
+    "workflow saas pipeline index token latency cache storage power budget skill registry "
+    "debate claim evidence summary analysis transcript video creator topic benchmark"
+).split()
+
+
+def _write_synthetic(directory: Path, count: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for i in range(count):
+        title = " ".join(rng.sample(VOCABULARY, 4))
+        topics = "\n".join(f"  - {word}" for word in rng.sample(VOCABULARY, 5))
+        summary = " ".join(rng.choice(VOCABULARY) for _ in range(60))
+        analysis = " ".join(rng.choice(VOCABULARY) for _ in range(120))
+        (directory / f"synthetic-{i:06d}.md").write_text(
+            f"---\ntitle: {title}\ncreator: Creator {i % 50}\nvideo_id: syn{i:06d}\n"
+            f"topics_detected:\n{topics}\n---\n\n## Summary\n\n{summary}\n\n## Analysis\n\n{analysis}\n",
+            encoding="utf-8",
+        )
+
+
+def _known_item_queries(index: retrieval.TranscriptTokenIndex, limit: int) -> list[tuple[str, str]]:
+    queries: list[tuple[str, str]] = []
+    for name in index.valid_names():
+        entry = index.docs[name]
+        title = str(entry["meta"].get("title") or "")
+        if title:
+            queries.append((title, name))
+        words = entry["summary_preview"].split()
+        if len(words) >= 8:
+            start = len(words) // 3
+            queries.append((" ".join(words[start:start + 8]), name))
+    return queries[:limit] if limit else queries
+
+
+def _evaluate(mode: str, base: Path, index_file: str, queries: list[tuple[str, str]], top_k: int) -> dict:
+    # Warm up so lazily built postings/BM25 stats are not billed to one query.
+    retrieval.rank_transcript_documents(queries[0][0], directory=str(base), index_file=index_file, scoring=mode)
+    reciprocal_ranks: list[float] = []
+    latencies: list[float] = []
+    hits_at_1 = 0
+    hits_at_k = 0
+    for query, relevant in queries:
+        start = time.perf_counter()
+        result = retrieval.rank_transcript_documents(
+            query, directory=str(base), top_k=top_k, index_file=index_file, scoring=mode
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        names = [Path(row["file_path"]).name for row in result["results"]]
+        rank = names.index(relevant) + 1 if relevant in names else 0
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+        hits_at_1 += rank == 1
+        hits_at_k += rank > 0
+    return _summary(mode, queries, latencies, reciprocal_ranks, hits_at_1, hits_at_k)
+
+
+def _summary(mode, queries, latencies, reciprocal_ranks=None, hits_at_1=None, hits_at_k=None) -> dict:
+    latencies = sorted(latencies)
+    row = {
+        "mode": mode,
+        "queries": len(queries),
+        "latency_ms_mean": round(statistics.fmean(latencies), 3),
+        "latency_ms_p95": round(latencies[int(0.95 * (len(latencies) - 1))], 3),
+    }
+    if reciprocal_ranks is not None:
+        row["mrr"] = round(statistics.fmean(reciprocal_ranks), 4)
+        row["hit_at_1"] = round(hits_at_1 / len(queries), 4)
+        row["hit_at_k"] = round(hits_at_k / len(queries), 4)
+    return row
+
+
+def _scan_latency(base: Path, queries: list[tuple[str, str]], top_k: int, limit: int) -> dict:
+    sample = queries[:limit]
+    latencies = []
+    for query, _ in sample:
+        start = time.perf_counter()
+        retrieval._rank_documents_by_scan(query, base, top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return _summary("overlap_full_scan", sample, latencies)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Evaluate transcript ranking modes")
+    parser.add_argument("--directory", default=retrieval.DEFAULT_TRANSCRIPTS_DIR, help="Transcripts directory")
+    parser.add_argument("--synthetic", type=int, default=0, help="Evaluate on N generated transcripts instead")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--max-queries", type=int, default=500, help="Cap on known-item queries (0 = all)")
+    parser.add_argument("--scan-queries", type=int, default=20, help="Queries timed against the full-scan scorer")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(args.directory).resolve()
+        if args.synthetic:
+            base = Path(tmp) / "transcripts"
+            base.mkdir()
+            _write_synthetic(base, args.synthetic)
+        index_file = str(Path(tmp) / "token_index.json")
+
+        start = time.perf_counter()
+        index, stats = retrieval._get_token_index(base, index_file, max_age=0.0)
+        build_ms = round((time.perf_counter() - start) * 1000, 1)
+        queries = _known_item_queries(index, args.max_queries)
+        if not queries:
+            print(json.dumps({"status": "error", "reason": "no_queries", "directory": str(base)}))
+            return 1
+
+        report = {
+            "directory": str(base),
+            "documents": len(index.valid_names()),
+            "index_build_ms": build_ms,
+            "numpy": retrieval.np is not None,
+            "results": [
+                _evaluate(mode, base, index_file, queries, args.top_k) for mode in retrieval.SCORING_MODES
+            ]
+            + [_scan_latency(base, queries, args.top_k, args.scan_queries)],
+        }
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,27 @@
+"""Two-pass idea extraction over project doc trees (.md/.txt).
+
+Pass 1 (map) streams files from an os.scandir walker that prunes excluded
+directories; worker processes normalize each file, split it into chunks
+and emit per-file partial buckets keyed by idea_key. Pass 2 (reduce)
+merges the partials in walk order, so bucket order, canonical excerpts and
+theme/intent tie-breaks are the same as a serial run. Evidence rows are
+spilled to sorted temporary runs and merged on output, so memory holds
+the bucket aggregates rather than every candidate.
+"""
+
 from __future__ import annotations
 
+import argparse
 import csv
+import heapq
+import json
+import os
 import re
-from collections import Counter, defaultdict
+import tempfile
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 PROJECTS = [Path(r"G:\repos\AI\RoadTrip"), Path(r"G:\repos\AI\ControlPlane")]
 OUTPUT_DIR = Path(r"G:\repos\AI\RoadTrip\analysis\idea_extraction")
@@ -28,48 +45,61 @@ def is_excluded(path: Path) -> bool:
     return any(part in EXCLUDE_DIRS for part in path.parts)
 
 
+# normalize_text() passes, each guarded by a literal its matches must contain.
+NORMALIZE_PASSES = [
+    (":", re.compile(r"(?m)^\s*\d{1,2}:\d{2}(?::\d{2})?\s*[-–—]?\s*")),
+    (":", re.compile(r"(?m)^\s*\[\d{1,2}:\d{2}(?::\d{2})?\]\s*")),
+    (":", re.compile(r"(?m)^\s*\d{2}:\d{2}:\d{2}[,.]\d{3}\s*-->.*$")),
+    ("<!--", re.compile(r"(?m)^\s*<!--.*?-->\s*$")),
+]
+CHUNK_SPLIT_RE = re.compile(r"\n\s*\n")
+NON_TOKEN_RE = re.compile(r"[^a-z0-9\s]")
+ACTION_RE = re.compile(r"\b(need to|should|must|next|todo|plan|we can|build|implement|priority)\b", re.I)
+TOPIC_RE = re.compile(r"\b(architecture|spec|workflow|evaluation|automation|memory|context)\b", re.I)
+THEME_RULES = [
+    ("memory-and-context", re.compile(r"\b(memory|context|session|transcript|knowledge|state)\b")),
+    ("agent-workflow", re.compile(r"\b(agent|workflow|automation|pipeline|tool|mcp|skill)\b")),
+    ("architecture-and-spec", re.compile(r"\b(spec|architecture|design|system|component|interface)\b")),
+    ("evaluation-and-quality", re.compile(r"\b(test|evaluation|metric|quality|validate|benchmark)\b")),
+    ("ui-and-experience", re.compile(r"\b(ui|dashboard|xaml|window|view|ux)\b")),
+    ("travel-domain", re.compile(r"\b(road trip|flight|itinerary|travel|route|hotel|airport)\b")),
+]
+INTENT_RULES = [
+    ("decision", re.compile(r"\b(decide|decision|finalize|agreed|chosen)\b")),
+    ("question", re.compile(r"\b(question|should we|how do we|what if|unknown|unclear)\b")),
+    ("problem", re.compile(r"\b(problem|risk|issue|blocker|constraint|limitation)\b")),
+]
+CHUNK_CAP = 100
+BATCH_SIZE = 64
+EVIDENCE_RUN_ROWS = 50_000
+EVIDENCE_FIELDS = ["project", "file_path", "file_name", "ext", "confidence", "theme", "intent", "excerpt"]
+
+
 def normalize_text(text: str) -> str:
     text = text.replace("\r\n", "\n")
-    text = re.sub(r"(?m)^\s*\d{1,2}:\d{2}(?::\d{2})?\s*[-–—]?\s*", "", text)
-    text = re.sub(r"(?m)^\s*\[\d{1,2}:\d{2}(?::\d{2})?\]\s*", "", text)
-    text = re.sub(r"(?m)^\s*\d{2}:\d{2}:\d{2}[,.]\d{3}\s*-->.*$", "", text)
-    text = re.sub(r"(?m)^\s*<!--.*?-->\s*$", "", text)
+    for literal, pattern in NORMALIZE_PASSES:
+        if literal in text:
+            text = pattern.sub("", text)
     return text
 
 
 def tokenize(text: str) -> list[str]:
-    clean = re.sub(r"[^a-z0-9\s]", " ", text.lower())
-    clean = re.sub(r"\s+", " ", clean).strip()
-    if not clean:
-        return []
-    return [t for t in clean.split(" ") if len(t) >= 3 and t not in STOPWORDS]
+    return [t for t in NON_TOKEN_RE.sub(" ", text.lower()).split() if len(t) >= 3 and t not in STOPWORDS]
 
 
 def get_theme(text: str) -> str:
     t = text.lower()
-    if re.search(r"\b(memory|context|session|transcript|knowledge|state)\b", t):
-        return "memory-and-context"
-    if re.search(r"\b(agent|workflow|automation|pipeline|tool|mcp|skill)\b", t):
-        return "agent-workflow"
-    if re.search(r"\b(spec|architecture|design|system|component|interface)\b", t):
-        return "architecture-and-spec"
-    if re.search(r"\b(test|evaluation|metric|quality|validate|benchmark)\b", t):
-        return "evaluation-and-quality"
-    if re.search(r"\b(ui|dashboard|xaml|window|view|ux)\b", t):
-        return "ui-and-experience"
-    if re.search(r"\b(road trip|flight|itinerary|travel|route|hotel|airport)\b", t):
-        return "travel-domain"
+    for theme, pattern in THEME_RULES:
+        if pattern.search(t):
+            return theme
     return "general"
 
 
 def get_intent(text: str) -> str:
     t = text.lower()
-    if re.search(r"\b(decide|decision|finalize|agreed|chosen)\b", t):
-        return "decision"
-    if re.search(r"\b(question|should we|how do we|what if|unknown|unclear)\b", t):
-        return "question"
-    if re.search(r"\b(problem|risk|issue|blocker|constraint|limitation)\b", t):
-        return "problem"
+    for intent, pattern in INTENT_RULES:
+        if pattern.search(t):
+            return intent
     return "idea"
 
 
@@ -93,173 +123,311 @@ def priority_score(text: str, mentions: int, source_count: int) -> float:
     return round((impact * 0.45) + (urgency * 0.25) + (signal * 0.30), 2)
 
 
-def main() -> None:
-    candidates = []
-    files_scanned = 0
-
-    for project in PROJECTS:
-        if not project.exists():
+def iter_candidate_files(root: Path) -> Iterator[Path]:
+    """Yield included files under ``root`` without descending into excluded dirs.
+
+    Order matches ``root.rglob("*")``: each directory's entries in scandir
+    order, then its subdirectories depth-first. Symlinked directories are
+    not followed.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                listing = list(entries)
+        except OSError:
             continue
-        for file in project.rglob("*"):
-            if not file.is_file():
-                continue
-            if file.suffix.lower() not in INCLUDE_EXTS:
-                continue
-            if is_excluded(file):
-                continue
-
-            files_scanned += 1
+        subdirs = []
+        for entry in listing:
             try:
-                raw = file.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+                if entry.is_dir() and not entry.is_symlink():
+                    if entry.name not in EXCLUDE_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in INCLUDE_EXTS:
+                    yield Path(entry.path)
+            except OSError:
                 continue
-            if not raw.strip():
-                continue
-
-            text = normalize_text(raw)
-            chunks = re.split(r"\n\s*\n", text)
-            chunk_cap = 0
-            for chunk in chunks:
-                if chunk_cap >= 100:
-                    break
-                chunk = re.sub(r"\s+", " ", chunk).strip()
-                if len(chunk) < 35 or len(chunk) > 1200:
-                    continue
-                if not IDEA_RE.search(chunk):
-                    continue
-
-                tokens = tokenize(chunk)
-                if len(tokens) < 6:
-                    continue
-
-                key = idea_key(tokens)
-                if not key:
-                    continue
-
-                conf = 0.55
-                if re.search(r"\b(need to|should|must|next|todo|plan|we can|build|implement|priority)\b", chunk, re.I):
-                    conf += 0.20
-                if re.search(r"\b(architecture|spec|workflow|evaluation|automation|memory|context)\b", chunk, re.I):
-                    conf += 0.15
-                conf = min(conf, 0.95)
-
-                proj_name = "RoadTrip" if str(file).lower().startswith(str(PROJECTS[0]).lower()) else "ControlPlane"
-
-                candidates.append(
-                    {
-                        "idea_key": key,
-                        "excerpt": chunk,
-                        "project": proj_name,
-                        "file_path": str(file),
-                        "file_name": file.name,
-                        "ext": file.suffix.lower(),
-                        "theme": get_theme(chunk),
-                        "intent": get_intent(chunk),
-                        "confidence": round(conf, 2),
-                    }
-                )
-                chunk_cap += 1
+        stack.extend(reversed(subdirs))
+
+
+def scan_file(path: str) -> dict[str, object] | None:
+    """Map step for one file: partial buckets keyed by idea_key, in first-seen order.
+
+    Returns None when the file cannot be read.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as handle:
+            raw = handle.read()
+    except Exception:
+        return None
+    buckets: dict[str, dict[str, object]] = {}
+    candidates = 0
+    if not raw.strip():
+        return {"candidates": 0, "buckets": buckets}
+
+    file_name = os.path.basename(path)
+    ext = os.path.splitext(file_name)[1].lower()
+    for chunk in CHUNK_SPLIT_RE.split(normalize_text(raw)):
+        if candidates >= CHUNK_CAP:
+            break
+        chunk = " ".join(chunk.split())
+        if len(chunk) < 35 or len(chunk) > 1200:
+            continue
+        if not IDEA_RE.search(chunk):
+            continue
+        tokens = tokenize(chunk)
+        if len(tokens) < 6:
+            continue
+        key = idea_key(tokens)
+        if not key:
+            continue
 
-    buckets: dict[str, dict] = {}
-    for c in candidates:
-        key = c["idea_key"]
-        if key not in buckets:
-            buckets[key] = {
-                "canonical": c["excerpt"],
+        conf = 0.55
+        if ACTION_RE.search(chunk):
+            conf += 0.20
+        if TOPIC_RE.search(chunk):
+            conf += 0.15
+        conf = round(min(conf, 0.95), 2)
+        theme = get_theme(chunk)
+        intent = get_intent(chunk)
+
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {
+                "canonical": chunk,
                 "mentions": 0,
-                "sources": set(),
-                "theme_counts": Counter(),
-                "intent_counts": Counter(),
+                "theme_counts": {},
+                "intent_counts": {},
                 "evidences": [],
             }
-        b = buckets[key]
-        b["mentions"] += 1
-        b["sources"].add(c["file_path"])
-        b["theme_counts"][c["theme"]] += 1
-        b["intent_counts"][c["intent"]] += 1
-        b["evidences"].append(c)
-        if len(c["excerpt"]) > len(b["canonical"]):
-            b["canonical"] = c["excerpt"]
-
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    idea_register = []
-    idea_evidence = []
-
-    for idx, (k, b) in enumerate(buckets.items(), start=1):
-        idea_id = f"IDEA-{idx:04d}"
-        theme = b["theme_counts"].most_common(1)[0][0] if b["theme_counts"] else "general"
-        intent = b["intent_counts"].most_common(1)[0][0] if b["intent_counts"] else "idea"
-        mentions = b["mentions"]
-        source_count = len(b["sources"])
-        prio = priority_score(b["canonical"], mentions, source_count)
-        status = "implemented" if re.search(r"\b(done|completed|shipped|resolved)\b", b["canonical"], re.I) else "open"
-        sample_sources = " | ".join(list(b["sources"])[:3])
-
-        idea_register.append(
-            {
-                "idea_id": idea_id,
-                "idea_text": b["canonical"],
-                "theme": theme,
-                "intent": intent,
-                "priority_score": prio,
-                "status": status,
-                "mentions": mentions,
-                "source_count": source_count,
-                "sample_sources": sample_sources,
-            }
+        bucket["mentions"] += 1
+        bucket["theme_counts"][theme] = bucket["theme_counts"].get(theme, 0) + 1
+        bucket["intent_counts"][intent] = bucket["intent_counts"].get(intent, 0) + 1
+        bucket["evidences"].append((conf, theme, intent, chunk))
+        if len(chunk) > len(bucket["canonical"]):
+            bucket["canonical"] = chunk
+        candidates += 1
+    return {"candidates": candidates, "buckets": buckets, "file_name": file_name, "ext": ext}
+
+
+def scan_batch(batch: list[tuple[str, str]]) -> list[dict[str, object] | None]:
+    return [scan_file(path) for path, _ in batch]
+
+
+def _batches(projects: list[Path], batch_size: int) -> Iterator[list[tuple[str, str]]]:
+    batch: list[tuple[str, str]] = []
+    for project in projects:
+        if not project.exists():
+            continue
+        for file in iter_candidate_files(project):
+            batch.append((str(file), project.name))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def map_files(
+    projects: list[Path], workers: int = 1, batch_size: int = BATCH_SIZE
+) -> Iterator[tuple[str, str, dict[str, object] | None]]:
+    """Yield (path, project, partial) in walk order.
+
+    With workers > 1 batches go to a process pool with at most a few
+    batches per worker in flight, so neither the file list nor the
+    partials pile up ahead of the reducer.
+    """
+    batches = _batches(projects, batch_size)
+    if workers <= 1:
+        for batch in batches:
+            for (path, project), partial in zip(batch, scan_batch(batch)):
+                yield path, project, partial
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for batch in batches:
+            pending.append((batch, pool.submit(scan_batch, batch)))
+            if len(pending) >= workers * 4:
+                done_batch, future = pending.popleft()
+                yield from ((path, project, partial) for (path, project), partial in zip(done_batch, future.result()))
+        while pending:
+            done_batch, future = pending.popleft()
+            yield from ((path, project, partial) for (path, project), partial in zip(done_batch, future.result()))
+
+
+class EvidenceSpool:
+    """Evidence rows kept as sorted on-disk runs, merged in idea_evidence.csv order.
+
+    The legacy output sorts evidence by (idea_id, -confidence), stable on
+    arrival; each row carries that key plus an arrival sequence number.
+    """
+
+    def __init__(self, run_rows: int | None = None):
+        self.run_rows = run_rows or EVIDENCE_RUN_ROWS
+        self._buffer: list[tuple] = []
+        self._runs: list[Path] = []
+        self._seq = 0
+        self._dir = tempfile.TemporaryDirectory(prefix="idea_evidence_")
+
+    def add(self, idea_id: str, row: list[object]) -> None:
+        self._buffer.append((idea_id, -row[4], self._seq, row))
+        self._seq += 1
+        if len(self._buffer) >= self.run_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        self._buffer.sort(key=lambda item: item[:3])
+        path = Path(self._dir.name) / f"run_{len(self._runs):05d}.jsonl"
+        with path.open("w", encoding="utf-8") as handle:
+            for item in self._buffer:
+                handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+        self._runs.append(path)
+        self._buffer = []
+
+    def _read_run(self, path: Path) -> Iterator[tuple]:
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                yield tuple(json.loads(line))
+
+    def sorted_rows(self) -> Iterator[dict[str, object]]:
+        self._buffer.sort(key=lambda item: item[:3])
+        streams = [self._read_run(path) for path in self._runs] + [iter(self._buffer)]
+        for idea_id, _, _, row in heapq.merge(*streams, key=lambda item: item[:3]):
+            yield {"idea_id": idea_id, **dict(zip(EVIDENCE_FIELDS, row))}
+
+    def close(self) -> None:
+        self._dir.cleanup()
+
+
+def reduce_partials(
+    partials: Iterable[tuple[str, str, dict[str, object] | None]],
+    spool: EvidenceSpool,
+) -> tuple[dict[str, dict], int, int]:
+    """Merge per-file partial buckets in walk order.
+
+    Returns (buckets, files_scanned, candidates_found). Evidence rows go to
+    ``spool`` instead of being kept on the buckets.
+    """
+    buckets: dict[str, dict] = {}
+    files_scanned = 0
+    candidates = 0
+    for path, project, partial in partials:
+        files_scanned += 1
+        if partial is None:
+            continue
+        candidates += partial["candidates"]
+        for key, part in partial["buckets"].items():
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = {
+                    "idea_id": f"IDEA-{len(buckets) + 1:04d}",
+                    "canonical": part["canonical"],
+                    "mentions": 0,
+                    "sources": {},
+                    "theme_counts": Counter(),
+                    "intent_counts": Counter(),
+                }
+            bucket["mentions"] += part["mentions"]
+            bucket["sources"][path] = None
+            bucket["theme_counts"].update(part["theme_counts"])
+            bucket["intent_counts"].update(part["intent_counts"])
+            if len(part["canonical"]) > len(bucket["canonical"]):
+                bucket["canonical"] = part["canonical"]
+            for conf, theme, intent, excerpt in part["evidences"]:
+                spool.add(
+                    bucket["idea_id"],
+                    [project, path, partial["file_name"], partial["ext"], conf, theme, intent, excerpt],
+                )
+    return buckets, files_scanned, candidates
+
+
+def write_csv(path: Path, rows: Iterable[dict], fieldnames: list[str]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_extraction(projects: list[Path], output_dir: Path, workers: int = 1) -> dict[str, object]:
+    spool = EvidenceSpool()
+    try:
+        buckets, files_scanned, candidates = reduce_partials(map_files(projects, workers), spool)
+
+        idea_register = []
+        for b in buckets.values():
+            theme = b["theme_counts"].most_common(1)[0][0] if b["theme_counts"] else "general"
+            intent = b["intent_counts"].most_common(1)[0][0] if b["intent_counts"] else "idea"
+            mentions = b["mentions"]
+            source_count = len(b["sources"])
+            prio = priority_score(b["canonical"], mentions, source_count)
+            status = "implemented" if re.search(r"\b(done|completed|shipped|resolved)\b", b["canonical"], re.I) else "open"
+            sample_sources = " | ".join(list(b["sources"])[:3])
+
+            idea_register.append(
+                {
+                    "idea_id": b["idea_id"],
+                    "idea_text": b["canonical"],
+                    "theme": theme,
+                    "intent": intent,
+                    "priority_score": prio,
+                    "status": status,
+                    "mentions": mentions,
+                    "source_count": source_count,
+                    "sample_sources": sample_sources,
+                }
+            )
+        buckets.clear()
+
+        idea_register.sort(key=lambda x: (x["priority_score"], x["mentions"]), reverse=True)
+
+        theme_group = defaultdict(list)
+        for row in idea_register:
+            theme_group[row["theme"]].append(row)
+        idea_themes = []
+        for theme, rows in sorted(theme_group.items(), key=lambda kv: len(kv[1]), reverse=True):
+            avg = round(sum(r["priority_score"] for r in rows) / len(rows), 2)
+            idea_themes.append({"theme": theme, "idea_count": len(rows), "avg_priority": avg})
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        write_csv(
+            output_dir / "idea_register.csv",
+            idea_register,
+            ["idea_id", "idea_text", "theme", "intent", "priority_score", "status", "mentions", "source_count", "sample_sources"],
         )
+        write_csv(output_dir / "idea_evidence.csv", spool.sorted_rows(), ["idea_id", *EVIDENCE_FIELDS])
+        write_csv(output_dir / "idea_themes.csv", idea_themes, ["theme", "idea_count", "avg_priority"])
+        summary = {
+            "projects": "; ".join(str(p) for p in projects),
+            "files_scanned": files_scanned,
+            "candidates_found": candidates,
+            "idea_clusters": len(idea_register),
+            "output_dir": str(output_dir),
+        }
+        write_csv(output_dir / "run_summary.csv", [summary], list(summary))
+        return summary
+    finally:
+        spool.close()
 
-        for ev in b["evidences"]:
-            idea_evidence.append({"idea_id": idea_id, **{k2: ev[k2] for k2 in ["project", "file_path", "file_name", "ext", "confidence", "theme", "intent", "excerpt"]}})
-
-    idea_register.sort(key=lambda x: (x["priority_score"], x["mentions"]), reverse=True)
-    idea_evidence.sort(key=lambda x: (x["idea_id"], -x["confidence"]))
-
-    theme_group = defaultdict(list)
-    for row in idea_register:
-        theme_group[row["theme"]].append(row)
-    idea_themes = []
-    for theme, rows in sorted(theme_group.items(), key=lambda kv: len(kv[1]), reverse=True):
-        avg = round(sum(r["priority_score"] for r in rows) / len(rows), 2)
-        idea_themes.append({"theme": theme, "idea_count": len(rows), "avg_priority": avg})
-
-    def write_csv(path: Path, rows: list[dict], fieldnames: list[str]) -> None:
-        with path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-
-    write_csv(
-        OUTPUT_DIR / "idea_register.csv",
-        idea_register,
-        ["idea_id", "idea_text", "theme", "intent", "priority_score", "status", "mentions", "source_count", "sample_sources"],
-    )
-    write_csv(
-        OUTPUT_DIR / "idea_evidence.csv",
-        idea_evidence,
-        ["idea_id", "project", "file_path", "file_name", "ext", "confidence", "theme", "intent", "excerpt"],
-    )
-    write_csv(OUTPUT_DIR / "idea_themes.csv", idea_themes, ["theme", "idea_count", "avg_priority"])
-    write_csv(
-        OUTPUT_DIR / "run_summary.csv",
-        [
-            {
-                "projects": "; ".join(str(p) for p in PROJECTS),
-                "files_scanned": files_scanned,
-                "candidates_found": len(candidates),
-                "idea_clusters": len(idea_register),
-                "output_dir": str(OUTPUT_DIR),
-            }
-        ],
-        ["projects", "files_scanned", "candidates_found", "idea_clusters", "output_dir"],
-    )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Extract and cluster ideas from project docs.")
+    parser.add_argument("--projects", nargs="+", default=[str(p) for p in PROJECTS], help="Project roots to scan.")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR), help="Directory for the CSV outputs.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Map worker processes.")
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    run_extraction([Path(p) for p in args.projects], output_dir, workers=args.workers)
 
     print("Completed two-pass extraction")
-    print(OUTPUT_DIR / "idea_register.csv")
-    print(OUTPUT_DIR / "idea_evidence.csv")
-    print(OUTPUT_DIR / "idea_themes.csv")
-    print(OUTPUT_DIR / "run_summary.csv")
+    print(output_dir / "idea_register.csv")
+    print(output_dir / "idea_evidence.csv")
+    print(output_dir / "idea_themes.csv")
+    print(output_dir / "run_summary.csv")
 
 
 if __name__ == "__main__":
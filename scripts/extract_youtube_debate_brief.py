@@ -9,6 +9,10 @@ Output format:
 - ## Analysis
 
 If no transcript exists, the script exits with code 2 and does not write output.
+
+Several URLs/IDs (or --playlist) switch to batch mode: videos are fetched
+concurrently under a shared request-rate limit and each brief is written by
+its worker. Batch mode exits 0 when at least one brief was written.
 """
 
 from __future__ import annotations
@@ -16,12 +20,17 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import shutil
+import tempfile
+import threading
+import time
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from html import unescape
 from pathlib import Path
-from typing import Any, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional, TextIO
 from urllib.parse import quote_plus
 from urllib.request import Request, urlopen
 
@@ -288,20 +297,73 @@ def fetch_transcript_segments(video_id: str, languages: List[str]) -> tuple[list
     return segments, details
 
 
+def transcript_line(seg: Segment) -> str:
+    return f"- [{seconds_to_hms(seg.start)}] {seg.text}"
+
+
 def transcript_to_markdown_lines(segments: list[Segment]) -> list[str]:
-    lines: list[str] = []
-    for seg in segments:
-        lines.append(f"- [{seconds_to_hms(seg.start)}] {seg.text}")
-    return lines
+    return [transcript_line(seg) for seg in segments]
+
+
+SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.!?])\s+")
 
 
 def split_sentences(text: str) -> list[str]:
-    parts = re.split(r"(?<=[.!?])\s+", text)
+    parts = SENTENCE_BREAK_PATTERN.split(text)
     return [p.strip() for p in parts if p.strip()]
 
 
+class SentenceStream:
+    """Incremental split_sentences over segment texts joined by single spaces.
+
+    ``feed`` returns the sentences completed so far, so the caller never
+    holds the joined transcript. Only the unfinished sentence is buffered,
+    and each feed scans just the new text plus one character of look-behind.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[str] = []
+        self._last_char = ""
+        self._started = False
+
+    def feed(self, text: str) -> list[str]:
+        piece = f" {text}" if self._started else text
+        self._started = True
+        if not piece:
+            return []
+
+        window = self._last_char + piece
+        offset = len(self._last_char)
+        self._last_char = piece[-1]
+
+        sentences: list[str] = []
+        cursor = offset
+        for match in SENTENCE_BREAK_PATTERN.finditer(window, offset):
+            self._pending.append(window[cursor:match.start()])
+            self._emit("".join(self._pending), sentences)
+            self._pending = []
+            cursor = match.end()
+        self._pending.append(window[cursor:])
+        return sentences
+
+    def close(self) -> list[str]:
+        sentences: list[str] = []
+        self._emit("".join(self._pending), sentences)
+        self._pending = []
+        return sentences
+
+    @staticmethod
+    def _emit(part: str, sentences: list[str]) -> None:
+        part = part.strip()
+        if part:
+            sentences.append(part)
+
+
 def sentence_has_substance(sentence: str) -> bool:
-    lowered = sentence.lower().strip()
+    return _lowered_has_substance(sentence.lower().strip())
+
+
+def _lowered_has_substance(lowered: str) -> bool:
     if len(lowered) < 50:
         return False
     if lowered in {"i am sorry.", "thank you.", "let me know what you think in the comments."}:
@@ -315,8 +377,11 @@ def sentence_has_substance(sentence: str) -> bool:
     return not lowered.startswith(weak_starts)
 
 
+TOPIC_WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_-]{2,}")
+
+
 def infer_topics(text: str, top_n: int = 10) -> list[str]:
-    words = re.findall(r"[A-Za-z][A-Za-z0-9_-]{2,}", text.lower())
+    words = TOPIC_WORD_PATTERN.findall(text.lower())
     filtered = [w for w in words if w not in STOPWORDS]
     counts = Counter(filtered)
     return [w for w, _ in counts.most_common(top_n)]
@@ -341,6 +406,10 @@ def summarize_transcript(sentences: list[str], segment_count: int) -> list[str]:
         if len(picks) == 6:
             break
 
+    return _summary_lines(picks, segment_count)
+
+
+def _summary_lines(picks: list[str], segment_count: int) -> list[str]:
     summary = [
         f"Transcript length: approximately {segment_count} caption segments.",
         "Core points detected:",
@@ -364,20 +433,23 @@ def extract_question_answer_pairs(sentences: list[str]) -> list[tuple[str, str]]
     return pairs[:12]
 
 
+CLAIM_CUE_WORDS = (
+    "best",
+    "better",
+    "worse",
+    "always",
+    "never",
+    "proved",
+    "state-of-the-art",
+    "benchmark",
+    "price",
+    "cost",
+    "improved",
+)
+
+
 def extract_claim_candidates(sentences: list[str], limit: int = 8) -> list[str]:
-    cue_words = (
-        "best",
-        "better",
-        "worse",
-        "always",
-        "never",
-        "proved",
-        "state-of-the-art",
-        "benchmark",
-        "price",
-        "cost",
-        "improved",
-    )
+    cue_words = CLAIM_CUE_WORDS
     claims: list[str] = []
     for sentence in sentences:
         lower = sentence.lower()
@@ -393,6 +465,14 @@ def extract_claim_candidates(sentences: list[str], limit: int = 8) -> list[str]:
 def build_analysis_section(sentences: list[str], topics: list[str]) -> list[str]:
     qa_pairs = extract_question_answer_pairs(sentences)
     claim_candidates = extract_claim_candidates(sentences)
+    return _analysis_lines(qa_pairs, claim_candidates, topics)
+
+
+def _analysis_lines(
+    qa_pairs: list[tuple[str, str]],
+    claim_candidates: list[str],
+    topics: list[str],
+) -> list[str]:
     lines: list[str] = []
 
     lines.append("### Presenter Questions and Implied Answers")
@@ -435,6 +515,130 @@ def build_analysis_section(sentences: list[str], topics: list[str]) -> list[str]
     return lines
 
 
+@dataclass
+class BriefAnalysis:
+    topics: list[str]
+    summary_lines: list[str]
+    analysis_lines: list[str]
+
+
+class TranscriptAnalyzer:
+    """Single-pass accumulator for the Summary/Analysis sections and topics.
+
+    Each sentence is lowered once and visited once; topic counts, substance
+    flags, dedupe keys, question/answer windows and claim cues are all
+    updated in that visit, and the bounded features stop doing work once
+    they are full. The output is identical to infer_topics,
+    summarize_transcript and build_analysis_section run over the same
+    sentences.
+    """
+
+    SUMMARY_PICKS = 6
+    QA_PAIRS = 12
+    CLAIMS = 8
+    TOPIC_FLUSH_SENTENCES = 2048
+
+    def __init__(self, top_topics: int = 10):
+        self.top_topics = top_topics
+        self.sentence_count = 0
+        self._topic_counts: Counter[str] = Counter()
+        # Lowered sentences are tokenized in batches: one findall per batch
+        # keeps tokenization in C while memory stays bounded.
+        self._topic_buffer: list[str] = []
+        self._picks: list[str] = []
+        self._seen: set[str] = set()
+        self._fallback_picks: list[str] = []
+        self._fallback_seen: set[str] = set()
+        self._has_substance = False
+        # [question index, question, next sentence, sentence after that]
+        self._questions: list[list[Any]] = []
+        self._claims: list[str] = []
+
+    def add_sentences(self, sentences: Iterable[str]) -> None:
+        for sentence in sentences:
+            self.add_sentence(sentence)
+
+    def add_sentence(self, sentence: str) -> None:
+        idx = self.sentence_count
+        self.sentence_count += 1
+        lowered = sentence.lower()
+
+        self._topic_buffer.append(lowered)
+        if len(self._topic_buffer) >= self.TOPIC_FLUSH_SENTENCES:
+            self._flush_topics()
+
+        if len(self._picks) < self.SUMMARY_PICKS and _lowered_has_substance(lowered.strip()):
+            self._has_substance = True
+            self._pick(sentence, lowered, self._picks, self._seen)
+        if not self._has_substance and len(self._fallback_picks) < self.SUMMARY_PICKS:
+            self._pick(sentence, lowered, self._fallback_picks, self._fallback_seen)
+
+        if self._questions and self._questions[-1][0] >= idx - 2:
+            for question in self._questions[-2:]:
+                if question[0] == idx - 1:
+                    question[2] = sentence
+                elif question[0] == idx - 2:
+                    question[3] = sentence
+        if "?" in sentence and len(self._questions) < self.QA_PAIRS:
+            self._questions.append([idx, sentence, None, None])
+
+        if (
+            len(self._claims) < self.CLAIMS
+            and len(sentence) >= 60
+            and any(cue in lowered for cue in CLAIM_CUE_WORDS)
+        ):
+            self._claims.append(sentence)
+
+    @staticmethod
+    def _pick(sentence: str, lowered: str, picks: list[str], seen: set[str]) -> None:
+        normalized = re.sub(r"\W+", "", lowered)
+        if normalized not in seen:
+            seen.add(normalized)
+            picks.append(sentence)
+
+    def _flush_topics(self) -> None:
+        # Sentences never share a token, so joining them with a space is safe.
+        self._topic_counts.update(TOPIC_WORD_PATTERN.findall(" ".join(self._topic_buffer)))
+        self._topic_buffer = []
+
+    def topics(self) -> list[str]:
+        self._flush_topics()
+        counts = Counter(self._topic_counts)
+        for word in STOPWORDS:
+            counts.pop(word, None)
+        return [w for w, _ in counts.most_common(self.top_topics)]
+
+    def qa_pairs(self) -> list[tuple[str, str]]:
+        pairs: list[tuple[str, str]] = []
+        for _, question, first, second in self._questions:
+            answer = first or ""
+            if second is not None and len(answer) < 60:
+                answer = (answer + " " + second).strip()
+            if answer:
+                pairs.append((question, answer))
+        return pairs
+
+    def finish(self, segment_count: int) -> BriefAnalysis:
+        topics = self.topics()
+        if not self.sentence_count:
+            summary = ["Transcript is empty or could not be segmented into sentences."]
+        else:
+            picks = self._picks if self._has_substance else self._fallback_picks
+            summary = _summary_lines(picks, segment_count)
+        return BriefAnalysis(
+            topics=topics,
+            summary_lines=summary,
+            analysis_lines=_analysis_lines(self.qa_pairs(), self._claims, topics),
+        )
+
+
+def analyze_transcript(full_text: str, segment_count: int) -> BriefAnalysis:
+    """Topics plus Summary/Analysis section lines in one sweep over the sentences."""
+    analyzer = TranscriptAnalyzer()
+    analyzer.add_sentences(split_sentences(full_text))
+    return analyzer.finish(segment_count)
+
+
 def frontmatter_block(data: dict[str, Any]) -> str:
     lines = ["---"]
     for key, value in data.items():
@@ -451,7 +655,8 @@ def frontmatter_block(data: dict[str, Any]) -> str:
         else:
             text = str(value).replace("\n", " ").strip()
             if any(ch in text for ch in [":", "#", "[", "]", "{"]):
-                lines.append(f"{key}: \"{text.replace('"', '\\"')}\"")
+                escaped = text.replace('"', '\\"')
+                lines.append(f"{key}: \"{escaped}\"")
             else:
                 lines.append(f"{key}: {text}")
     lines.append("---")
@@ -488,73 +693,156 @@ def write_brief(
     return out_path
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Extract a YouTube transcript to markdown brief.")
-    parser.add_argument("url", help="YouTube URL or video ID")
-    parser.add_argument(
-        "--output-dir",
-        default="analysis/Transcripts",
-        help="Output directory for markdown files",
-    )
-    parser.add_argument(
-        "--languages",
-        default="en,en-US,en-GB",
-        help="Preferred language codes in order",
-    )
-    args = parser.parse_args()
+def write_transcription_lines(
+    handle: TextIO,
+    segments: Iterable[Segment],
+    analyzer: Optional[TranscriptAnalyzer] = None,
+) -> int:
+    """Write one transcript line per segment, feeding the analyzer as it goes."""
+    sentences = SentenceStream()
+    count = 0
+    for seg in segments:
+        handle.write(transcript_line(seg))
+        handle.write("\n")
+        if analyzer is not None:
+            analyzer.add_sentences(sentences.feed(seg.text))
+        count += 1
+    if analyzer is not None:
+        analyzer.add_sentences(sentences.close())
+    return count
 
-    video_id = extract_video_id(args.url)
-    if not video_id:
-        print(json.dumps({"status": "error", "reason": "invalid_youtube_input"}, indent=2))
-        return 1
 
-    languages = parse_languages(args.languages)
-    availability = check_transcript_availability(video_id, languages)
-    if availability.get("status") == "no_transcript_available":
-        print(json.dumps(availability, indent=2))
-        return 2
+def write_brief_streaming(
+    output_dir: Path,
+    file_stem: str,
+    frontmatter: dict[str, Any],
+    segments: Iterable[Segment],
+    segment_count: Optional[int] = None,
+    buffer_size: int = 1 << 16,
+) -> tuple[Path, BriefAnalysis]:
+    """Write the same file as write_brief while streaming the transcript.
+
+    Transcript lines go through a buffered spool file on disk while the
+    single-pass analyzer consumes the same segments, so memory does not
+    grow with transcript length. The frontmatter (which needs the topics)
+    is written once the stream ends, followed by the spooled transcript,
+    Summary and Analysis. ``topics_detected`` in ``frontmatter`` is filled
+    from the analysis, keeping its position when the key is present.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    out_path = output_dir / f"{file_stem}.md"
+    analyzer = TranscriptAnalyzer()
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="", dir=output_dir) as spool:
+        streamed = write_transcription_lines(spool, segments, analyzer)
+        analysis = analyzer.finish(streamed if segment_count is None else segment_count)
+        spool.seek(0)
+
+        header = {**frontmatter, "topics_detected": analysis.topics}
+        with open(out_path, "w", encoding="utf-8", buffering=buffer_size) as handle:
+            handle.write(frontmatter_block(header))
+            handle.write("\n\n# YouTube Transcript Brief\n\n## Transcription\n")
+            # The spool was written untranslated; this handle applies the
+            # platform newline exactly like write_brief's write_text did.
+            shutil.copyfileobj(spool, handle, buffer_size)
+            handle.write("\n## Summary\n")
+            handle.writelines(f"{line}\n" for line in analysis.summary_lines)
+            handle.write("\n## Analysis\n")
+            handle.writelines(f"{line}\n" for line in analysis.analysis_lines)
+
+    return out_path, analysis
+
+
+def fetch_playlist_video_ids(playlist_url: str) -> list[str]:
+    """Return the video IDs listed on a YouTube playlist page, in order."""
+    html = http_get_text(playlist_url)
+    seen: dict[str, None] = {}
+    for video_id in re.findall(r'"videoId"\s*:\s*"([A-Za-z0-9_-]{11})"', html):
+        seen.setdefault(video_id, None)
+    return list(seen)
+
+
+@dataclass
+class FetchLayer:
+    """Network calls used to build briefs; replace them to test against fakes."""
+
+    check_availability: Callable[[str, List[str]], dict[str, Any]] = field(
+        default_factory=lambda: check_transcript_availability
+    )
+    fetch_metadata: Callable[[str], dict[str, Any]] = field(default_factory=lambda: fetch_video_metadata)
+    fetch_segments: Callable[[str, List[str]], tuple[list[Segment], dict[str, Any]]] = field(
+        default_factory=lambda: fetch_transcript_segments
+    )
+    list_playlist: Callable[[str], list[str]] = field(default_factory=lambda: fetch_playlist_video_ids)
+
+
+class RateLimiter:
+    """Thread-safe token bucket: at most ``rate`` calls per second after ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def build_brief_for_video(
+    video_id: str,
+    languages: List[str],
+    output_dir: Path,
+    provenance: dict[str, str],
+    fetch: Optional[FetchLayer] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> dict[str, Any]:
+    """Fetch one video's transcript and write its brief.
+
+    Returns the result payload; ``status`` is ``ok`` when a brief was written,
+    otherwise the availability/no-transcript/error payload.
+    """
+    fetch = fetch or FetchLayer()
+
+    def _call(fn, *args):
+        if limiter is not None:
+            limiter.acquire()
+        return fn(*args)
+
+    availability = _call(fetch.check_availability, video_id, languages)
     if availability.get("status") != "transcript_available":
-        print(json.dumps(availability, indent=2))
-        return 1
+        return availability
 
-    metadata = fetch_video_metadata(video_id)
+    metadata = _call(fetch.fetch_metadata, video_id)
 
     try:
-        segments, transcript_details = fetch_transcript_segments(video_id, languages)
+        segments, transcript_details = _call(fetch.fetch_segments, video_id, languages)
     except Exception as exc:
-        print(
-            json.dumps(
-                {
-                    "status": "error",
-                    "reason": "transcript_fetch_failed",
-                    "video_id": video_id,
-                    "error": str(exc),
-                },
-                indent=2,
-            )
-        )
-        return 1
+        return {
+            "status": "error",
+            "reason": "transcript_fetch_failed",
+            "video_id": video_id,
+            "error": str(exc),
+        }
 
     if not segments:
-        print(
-            json.dumps(
-                {
-                    "status": "no_transcript_available",
-                    "video_id": video_id,
-                    "reason": "empty_transcript_after_fetch",
-                },
-                indent=2,
-            )
-        )
-        return 2
-
-    full_text = " ".join(seg.text for seg in segments)
-    sentences = split_sentences(full_text)
-    topics = infer_topics(full_text)
-
-    transcription_lines = transcript_to_markdown_lines(segments)
-    summary_lines = summarize_transcript(sentences, len(segments))
-    analysis_lines = build_analysis_section(sentences, topics)
+        return {
+            "status": "no_transcript_available",
+            "video_id": video_id,
+            "reason": "empty_transcript_after_fetch",
+        }
 
     title = metadata.get("title") or f"YouTube-{video_id}"
     creator = metadata.get("creator") or "Unknown"
@@ -578,33 +866,141 @@ def main() -> int:
         "transcript_is_generated": transcript_details.get("is_generated"),
         "transcript_segment_count": transcript_details.get("segment_count", len(segments)),
         "video_duration_seconds": metadata.get("duration_seconds"),
-        "topics_detected": topics,
-        "generator_script": "scripts/extract_youtube_debate_brief.py",
+        "topics_detected": [],
+        **provenance,
     }
 
-    out_path = write_brief(
-        output_dir=Path(args.output_dir),
+    out_path, _ = write_brief_streaming(
+        output_dir=output_dir,
         file_stem=file_stem,
         frontmatter=frontmatter,
-        transcription_lines=transcription_lines,
-        summary_lines=summary_lines,
-        analysis_lines=analysis_lines,
+        segments=segments,
     )
 
+    return {
+        "status": "ok",
+        "video_id": video_id,
+        "output_file": str(out_path),
+        "file_stem": file_stem,
+        "title": title,
+        "creator": creator,
+        "segment_count": len(segments),
+    }
+
+
+def extract_briefs_batch(
+    video_ids: Iterable[str],
+    languages: List[str],
+    output_dir: Path,
+    provenance: dict[str, str],
+    fetch: Optional[FetchLayer] = None,
+    max_workers: int = 4,
+    requests_per_second: float = 2.0,
+) -> list[dict[str, Any]]:
+    """Build briefs for many videos concurrently under one shared rate limit.
+
+    Results come back in input order; a failure in one video is reported in
+    its payload and does not stop the batch. Duplicate IDs are processed once.
+    """
+    fetch = fetch or FetchLayer()
+    unique_ids = list(dict.fromkeys(video_ids))
+    if not unique_ids:
+        return []
+
+    limiter = RateLimiter(requests_per_second, burst=max(1, max_workers))
+
+    def _one(video_id: str) -> dict[str, Any]:
+        try:
+            return build_brief_for_video(video_id, languages, output_dir, provenance, fetch, limiter)
+        except Exception as exc:
+            return {"status": "error", "reason": "brief_failed", "video_id": video_id, "error": str(exc)}
+
+    workers = max(1, min(max_workers, len(unique_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_one, unique_ids))
+
+
+def resolve_video_ids(
+    inputs: Iterable[str],
+    playlist_urls: Iterable[str] = (),
+    fetch: Optional[FetchLayer] = None,
+) -> tuple[list[str], list[str]]:
+    """Return (video IDs, unrecognized inputs) from URLs/IDs and playlist pages."""
+    fetch = fetch or FetchLayer()
+    video_ids: list[str] = []
+    invalid: list[str] = []
+    for value in inputs:
+        video_id = extract_video_id(value)
+        if video_id:
+            video_ids.append(video_id)
+        else:
+            invalid.append(value)
+    for playlist_url in playlist_urls:
+        video_ids.extend(fetch.list_playlist(playlist_url))
+    return list(dict.fromkeys(video_ids)), invalid
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Extract a YouTube transcript to markdown brief.")
+    parser.add_argument("url", nargs="*", help="YouTube URL(s) or video ID(s)")
+    parser.add_argument(
+        "--output-dir",
+        default="analysis/Transcripts",
+        help="Output directory for markdown files",
+    )
+    parser.add_argument(
+        "--languages",
+        default="en,en-US,en-GB",
+        help="Preferred language codes in order",
+    )
+    parser.add_argument("--playlist", action="append", default=[], help="Playlist URL to expand (repeatable)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent videos in batch mode")
+    parser.add_argument("--rate", type=float, default=2.0, help="Max YouTube requests per second in batch mode")
+    args = parser.parse_args()
+
+    provenance = {"generator_script": "scripts/extract_youtube_debate_brief.py"}
+    languages = parse_languages(args.languages)
+
+    if len(args.url) == 1 and not args.playlist:
+        video_id = extract_video_id(args.url[0])
+        if not video_id:
+            print(json.dumps({"status": "error", "reason": "invalid_youtube_input"}, indent=2))
+            return 1
+
+        result = build_brief_for_video(video_id, languages, Path(args.output_dir), provenance)
+        if result.get("status") == "ok":
+            result.pop("file_stem", None)
+        print(json.dumps(result, indent=2))
+        if result.get("status") == "ok":
+            return 0
+        return 2 if result.get("status") == "no_transcript_available" else 1
+
+    if not args.url and not args.playlist:
+        parser.error("provide at least one URL/video ID or --playlist")
+
+    video_ids, invalid = resolve_video_ids(args.url, args.playlist)
+    results = extract_briefs_batch(
+        video_ids,
+        languages,
+        Path(args.output_dir),
+        provenance,
+        max_workers=args.workers,
+        requests_per_second=args.rate,
+    )
+    written = sum(1 for item in results if item.get("status") == "ok")
     print(
         json.dumps(
             {
-                "status": "ok",
-                "video_id": video_id,
-                "output_file": str(out_path),
-                "title": title,
-                "creator": creator,
-                "segment_count": len(segments),
+                "status": "ok" if written else "error",
+                "requested": len(video_ids),
+                "written": written,
+                "invalid_inputs": invalid,
+                "results": results,
             },
             indent=2,
         )
     )
-    return 0
+    return 0 if written else 1
 
 
 if __name__ == "__main__":
@@ -14,9 +14,10 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from src.skills.trust_scorecard import (
+    GateResultCache,
     MockGateProvider,
     build_trust_bundle,
-    evaluate_registry,
+    run_registry_evaluation,
     summarize,
 )
 
@@ -105,6 +106,22 @@ def main() -> int:
         default="",
         help="Deprecated alias for --manifest-evidence-map",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Concurrent gate evaluations (default: CPU count + 4, max 32)",
+    )
+    parser.add_argument(
+        "--gate-cache",
+        default="logs/trust_gate_cache.json",
+        help="Gate outcome cache keyed by skill fingerprint + gate version",
+    )
+    parser.add_argument(
+        "--no-gate-cache",
+        action="store_true",
+        help="Re-evaluate every gate and leave the gate cache untouched",
+    )
     args = parser.parse_args()
 
     overrides = {}
@@ -124,9 +141,17 @@ def main() -> int:
         evidence_map = load_evidence_map(manifest_evidence_map)
 
     provider = MockGateProvider(overrides=overrides)
-    cards = evaluate_registry(registry_path=args.registry, gate_provider=provider)
+    cache = None if args.no_gate_cache else GateResultCache(args.gate_cache)
+    evaluation = run_registry_evaluation(
+        registry_path=args.registry,
+        gate_provider=provider,
+        max_workers=args.workers,
+        cache=cache,
+    )
+    cards = evaluation.scorecards
     report = {
         "summary": summarize(cards),
+        "timing": evaluation.timing,
         "scorecards": [
             {
                 **asdict(card),
@@ -163,6 +188,12 @@ def main() -> int:
         f"MANUAL_REVIEW={report['summary'].get('MANUAL_REVIEW', 0)} "
         f"BLOCK={report['summary'].get('BLOCK', 0)}"
     )
+    timing = evaluation.timing
+    print(
+        "Timing: "
+        f"{timing['total_ms']:.1f} ms for {timing['skills']} skills, "
+        f"{timing['gate_evaluations']} gates evaluated, {timing['cache_hits']} cached"
+    )
     return 0
 
 
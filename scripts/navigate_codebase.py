@@ -13,19 +13,200 @@ Usage:
 """
 
 import json
+import os
 import sys
 import argparse
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 import re
 
+try:
+    import re._parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse
+
+
+SEARCH_INDEX_VERSION = 2
+SEARCH_CACHE_SIZE = 64
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _required_literals(query: str, case_sensitive: bool) -> List[str]:
+    """
+    Lowercased literal runs every match of ``query`` must contain (top-level
+    sequence only).
+    
+    The trigram index is case-folded, so runs are always lowercased; the
+    compiled regex enforces case for case-sensitive searches. Anything the
+    prefilter cannot reason about safely (alternation, groups, repeats,
+    non-ASCII, whose lowercase form can depend on context) just ends the
+    current run, so the result is always a necessary condition, possibly
+    empty.
+    """
+    try:
+        parsed = sre_parse.parse(query, 0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return []
+    runs, current = [], []
+    for op, arg in parsed:
+        if op is sre_parse.LITERAL and arg < 128:
+            current.append(chr(arg))
+            continue
+        runs.append("".join(current))
+        current = []
+    runs.append("".join(current))
+    return [run.lower() for run in runs if len(run) >= 3]
+
+
+class SearchIndex:
+    """
+    Trigram index over every searchable string in a codebase index.
+    
+    Documents are file paths (with the path/category they are listed under)
+    plus symbol names (skills, library exports, programmatic APIs and the
+    generated ``modules`` section) pointing at their file. The index is
+    persisted next to the codebase index as ``<name>.search.json`` and
+    rebuilt when the source file's size or mtime changes.
+    """
+    
+    def __init__(self, documents: List[Dict], trigrams: Dict[str, List[int]]):
+        self.documents = documents
+        self.trigrams = trigrams
+        self.lowered = [doc['text'].lower() for doc in documents]
+    
+    @staticmethod
+    def sidecar_path(index_path: Path) -> Path:
+        return index_path.with_name(index_path.stem + ".search.json")
+    
+    @staticmethod
+    def collect_documents(index: Dict) -> List[Dict]:
+        documents = []
+        
+        def add(text, file, path, category, symbol=None):
+            if isinstance(text, str) and text:
+                documents.append({'text': text, 'file': file, 'path': path,
+                                  'category': category, 'symbol': symbol})
+        
+        # Old format: index > path > category > [files]
+        for path_name, path_data in index.get('index', {}).items():
+            for category, files in path_data.items():
+                if category == 'description' or not isinstance(files, list):
+                    continue
+                for file in files:
+                    add(file, file, path_name, category)
+        
+        # Enhanced format: file_classifications > grouping > key > [files]
+        for grouping, groups in index.get('file_classifications', {}).items():
+            for key, files in groups.items():
+                if isinstance(files, list):
+                    for file in files:
+                        add(file, file, grouping, key)
+        for skill in index.get('skills', []):
+            if isinstance(skill, dict):
+                add(skill.get('name'), skill.get('file', 'N/A'), 'skills', skill.get('layer', 'SKILL'), skill.get('name'))
+        for library in index.get('libraries', []):
+            if isinstance(library, dict):
+                for export in library.get('exports', []):
+                    add(export, library.get('file', 'N/A'), 'libraries', library.get('layer', 'LIBRARY'), export)
+        entry_points = index.get('entry_points', {})
+        if isinstance(entry_points, dict):
+            for api in entry_points.get('programmatic_apis', []):
+                file_path, _, symbol = api.partition('::')
+                if symbol:
+                    add(symbol, file_path, 'entry_points', 'programmatic_apis', symbol)
+        # Generated by scripts/build_codebase_index.py
+        for file, module in index.get('modules', {}).items():
+            for cls in module.get('classes', []):
+                add(cls['name'], file, 'modules', 'class', cls['name'])
+            for function in module.get('functions', []):
+                add(function['name'], file, 'modules', 'function', function['name'])
+        return documents
+    
+    @classmethod
+    def build(cls, index: Dict) -> "SearchIndex":
+        documents = cls.collect_documents(index)
+        trigrams: Dict[str, List[int]] = {}
+        for doc_id, doc in enumerate(documents):
+            for trigram in _trigrams(doc['text'].lower()):
+                trigrams.setdefault(trigram, []).append(doc_id)
+        return cls(documents, trigrams)
+    
+    @classmethod
+    def load_or_build(cls, index_path: Path, index: Dict) -> "SearchIndex":
+        """Load the persisted index if it matches ``index_path``; else build and persist it."""
+        stat = index_path.stat()
+        signature = {'version': SEARCH_INDEX_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        sidecar = cls.sidecar_path(index_path)
+        try:
+            payload = json.loads(sidecar.read_text(encoding='utf-8'))
+            if payload.get('signature') == signature:
+                return cls(payload['documents'], payload['trigrams'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        search_index = cls.build(index)
+        try:
+            tmp_path = sidecar.with_name(sidecar.name + '.tmp')
+            tmp_path.write_text(json.dumps({'signature': signature, 'documents': search_index.documents,
+                                            'trigrams': search_index.trigrams}), encoding='utf-8')
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            pass  # read-only checkout: keep the in-memory index
+        return search_index
+    
+    def candidates(self, query: str, case_sensitive: bool = False) -> Iterable[int]:
+        """Document ids that can match ``query``, in document order."""
+        literals = _required_literals(query, case_sensitive)
+        if not literals:
+            return range(len(self.documents))
+        # Intersect from the rarest trigram so the working set starts small.
+        lists = sorted((self.trigrams.get(trigram, []) for literal in literals for trigram in _trigrams(literal)), key=len)
+        postings = set(lists[0])
+        for ids in lists[1:]:
+            if not postings:
+                break
+            postings.intersection_update(ids)
+        return sorted(postings)
+    
+    def search(self, query: str, case_sensitive: bool = False) -> List[Dict]:
+        pattern = re.compile(query, flags=0 if case_sensitive else re.IGNORECASE)
+        return [self.documents[doc_id] for doc_id in self.candidates(query, case_sensitive)
+                if pattern.search(self.documents[doc_id]['text'])]
+
+
+def exists_many(root: Path, files: Iterable[str]) -> Dict[str, bool]:
+    """
+    Existence of many repo-relative paths with one directory listing per
+    parent directory instead of one stat() per file.
+    """
+    listings: Dict[str, Optional[Set[str]]] = {}
+    result = {}
+    for file in files:
+        if file in result:
+            continue
+        target = root / file
+        parent = os.path.normcase(str(target.parent))
+        if parent not in listings:
+            try:
+                with os.scandir(target.parent) as entries:
+                    listings[parent] = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                listings[parent] = None
+        names = listings[parent]
+        result[file] = names is not None and os.path.normcase(target.name) in names
+    return result
+
 
 class CodebaseNavigator:
     """Navigate and explore RoadTrip codebase structure."""
     
-    def __init__(self, index_path: str = "CODEBASE_INDEX_ENHANCED.json"):
+    def __init__(self, index_path: str = "CODEBASE_INDEX_ENHANCED.json", repo_root: Optional[Path] = None):
         """Load codebase index (defaults to enhanced version)."""
-        self.repo_root = Path(__file__).parent.parent
+        self.repo_root = Path(repo_root) if repo_root else Path(__file__).parent.parent
         self.index_path = self.repo_root / index_path
         
         # Fallback to old format if enhanced not found
@@ -43,6 +224,34 @@ class CodebaseNavigator:
         
         # Detect format version
         self.is_enhanced = 'taxonomies' in self.index
+        
+        self._search_index: Optional[SearchIndex] = None
+        # Interactive sessions repeat queries; one-shot CLI runs do not cache.
+        self.cache_results = False
+        self._result_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+    
+    @property
+    def search_index(self) -> SearchIndex:
+        if self._search_index is None:
+            self._search_index = SearchIndex.load_or_build(self.index_path, self.index)
+        return self._search_index
+    
+    def find(self, query: str, case_sensitive: bool = False) -> List[Dict]:
+        """Return matching entries ({file, path, category, symbol, text, exists}) in index order."""
+        key = (query, case_sensitive)
+        if self.cache_results and key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            return self._result_cache[key]
+        
+        matches = self.search_index.search(query, case_sensitive)
+        existing = exists_many(self.repo_root, [match['file'] for match in matches])
+        results = [{**match, 'exists': existing[match['file']]} for match in matches]
+        
+        if self.cache_results:
+            self._result_cache[key] = results
+            while len(self._result_cache) > SEARCH_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return results
     
     def show_summary(self):
         """Display codebase summary."""
@@ -120,24 +329,12 @@ class CodebaseNavigator:
             print(f"\n📊 Total files in {path_name} path: {total_files}")
     
     def search(self, query: str, case_sensitive: bool = False):
-        """Search for files matching query."""
-        pattern = re.compile(query if case_sensitive else query, 
-                           flags=0 if case_sensitive else re.IGNORECASE)
-        results = []
-        
-        # Search through all paths
-        for path_name, path_data in self.index['index'].items():
-            for category, files in path_data.items():
-                if category == 'description' or not isinstance(files, list):
-                    continue
-                
-                for file in files:
-                    if pattern.search(file):
-                        results.append({
-                            'file': file,
-                            'path': path_name,
-                            'category': category
-                        })
+        """Search for files (and, in the enhanced index, symbols) matching query."""
+        try:
+            results = self.find(query, case_sensitive)
+        except re.error as e:
+            print(f"❌ Invalid search pattern '{query}': {e}")
+            return
         
         if not results:
             print(f"❌ No files found matching: {query}")
@@ -145,9 +342,11 @@ class CodebaseNavigator:
         
         print(f"\n🔍 Found {len(results)} file(s) matching '{query}':\n")
         for result in results:
-            exists = (self.repo_root / result['file']).exists()
-            status = "✓" if exists else "✗"
-            print(f"{status} {result['file']}")
+            status = "✓" if result['exists'] else "✗"
+            if result.get('symbol'):
+                print(f"{status} {result['symbol']} ({result['file']})")
+            else:
+                print(f"{status} {result['file']}")
             print(f"   Path: {result['path']} > {result['category']}")
             print()
     
@@ -338,6 +537,7 @@ class CodebaseNavigator:
     
     def interactive_mode(self):
         """Run interactive navigation session."""
+        self.cache_results = True
         self.show_summary()
         
         while True:
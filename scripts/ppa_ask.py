@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import calendar
+import heapq
 import json
+import mmap
+import os
 import re
+import sys
+from array import array
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - pure-Python scorer below
+    np = None
+
 
 PROJECT_ROOT = Path(r"G:\repos\AI\RoadTrip")
 PPA_DIR = PROJECT_ROOT / "analysis" / "ppa"
@@ -17,6 +28,10 @@ LEARNING_LOG_PATH = PPA_DIR / "ppa_learning_log.jsonl"
 TRIAGE_DIR = PPA_DIR / "triage_packets"
 PROSPECTIVE_MEMORY_QUEUE_PATH = PPA_DIR / "prospective_memory_queue.jsonl"
 CONTRACT_VERSION = "ppa-v0"
+EVIDENCE_INDEX_VERSION = 2
+# Most evidence rows any caller reads (triage packets keep 12).
+EVIDENCE_LIMIT = 12
+TERM_FREQUENCY_CAP = 3
 
 FAST_PATH = "fast-path"
 THINKING_SLOW_PATH = "thinking-slow-path"
@@ -56,6 +71,7 @@ class AttemptResult:
     path: str
     evidence: list[ScoredEvent]
     answer: dict[str, object]
+    evidence_count: int = 0
 
 
 def load_json(path: Path) -> dict[str, object]:
@@ -258,6 +274,429 @@ def score_events(
     return scored
 
 
+def default_evidence_index_dir(events_path: Path) -> Path:
+    return events_path.with_name(events_path.stem + ".index")
+
+
+def _parse_event_timestamp(timestamp: object) -> int | None:
+    """Epoch seconds for a session-log timestamp, or None where recency_bonus gives 0."""
+    if not timestamp or not isinstance(timestamp, str):
+        return None
+    try:
+        return calendar.timegm(datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").timetuple())
+    except ValueError:
+        return None
+
+
+_NO_TIMESTAMP = -(2**63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROS_PER_DAY = 86_400_000_000
+
+
+class EvidenceIndex:
+    """Pre-tokenized, on-disk index over session_log_events.jsonl.
+
+    Layout under ``directory``:
+    - meta.json: source file stats, lookup tables and the term/approach lexicon
+      (key -> [start, count] into the postings arrays)
+    - postings.bin / tf.bin: uint32 event ids and capped (<= 3) term counts
+    - offset.bin, ts.bin, source.bin, stance.bin, prompt.bin, approach_mask.bin:
+      one value per indexed event (byte offset of its JSONL line, epoch
+      seconds, source id, stance id, 1 if event_kind == "prompt", bit i set
+      for approach ``meta["approach_bits"][i]``, first 64 approaches only)
+
+    Binary columns are memory-mapped, so a query only touches the postings of
+    its terms and approach hints, and only the returned events are read back
+    from the JSONL file. With NumPy installed the columns are scored as
+    vectorized array expressions; otherwise a per-candidate loop is used.
+    Both match score_events() exactly, ties included. The index is rebuilt
+    whenever the events file changes size or mtime.
+    """
+
+    COLUMNS = {
+        "postings": "I",
+        "tf": "B",
+        "offset": "Q",
+        "ts": "q",
+        "source": "I",
+        "stance": "H",
+        "prompt": "B",
+        "approach_mask": "Q",
+    }
+    NUMPY_TYPES = {"I": "<u4", "B": "u1", "Q": "<u8", "q": "<i8", "H": "<u2"}
+    MASK_BITS = 64
+
+    def __init__(self, events_path: Path, directory: Path, meta: dict[str, object], columns: dict[str, memoryview]):
+        self.events_path = events_path
+        self.directory = directory
+        self.meta = meta
+        self.columns = columns
+        self.sources: list[str] = list(meta["sources"])
+        self.stances: list[str] = list(meta["stances"])
+        self.terms: dict[str, list[int]] = meta["terms"]
+        self.approaches: dict[str, list[int]] = meta["approaches"]
+        self._maps: list[mmap.mmap] = []
+        self._candidates_key: tuple[object, ...] | None = None
+        self._candidates: list[tuple[int, int, int]] = []
+        self.approach_bits: dict[str, int] = {
+            name: bit for bit, name in enumerate(meta.get("approach_bits", [])[: self.MASK_BITS])
+        }
+        self._arrays: dict[str, object] = {}
+        self._array_candidates_key: tuple[object, ...] | None = None
+        self._array_candidates: tuple[object, object, object] | None = None
+
+    def __len__(self) -> int:
+        return int(self.meta["event_count"])
+
+    # -- building -------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, events_path: Path, directory: Path | None = None) -> "EvidenceIndex":
+        """Index ``events_path`` in one streaming pass (nothing is persisted)."""
+        directory = directory or default_evidence_index_dir(events_path)
+        stat = events_path.stat()
+        term_ids: dict[str, array] = {}
+        term_tfs: dict[str, array] = {}
+        approach_ids: dict[str, array] = {}
+        source_ids: dict[str, int] = {}
+        stance_ids: dict[str, int] = {}
+        approach_bits: dict[str, int] = {}
+        data = {name: array(code) for name, code in cls.COLUMNS.items() if name not in {"postings", "tf"}}
+
+        event_id = 0
+        offset = 0
+        with events_path.open("rb") as handle:
+            for raw in handle:
+                line_offset = offset
+                offset += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                event = json.loads(line)
+                text = str(event.get("text", ""))
+                if not text:
+                    continue
+
+                for term, count in Counter(tokenize(text)).items():
+                    term_ids.setdefault(term, array("I")).append(event_id)
+                    term_tfs.setdefault(term, array("B")).append(min(count, TERM_FREQUENCY_CAP))
+                mask = 0
+                for approach in {item for item in event.get("approaches", []) if isinstance(item, str)}:
+                    approach_ids.setdefault(approach, array("I")).append(event_id)
+                    bit = approach_bits.setdefault(approach, len(approach_bits))
+                    if bit < cls.MASK_BITS:
+                        mask |= 1 << bit
+
+                source = str(event.get("source_file", ""))
+                stance = str(event.get("stance", ""))
+                timestamp = _parse_event_timestamp(event.get("timestamp"))
+                data["offset"].append(line_offset)
+                data["ts"].append(_NO_TIMESTAMP if timestamp is None else timestamp)
+                data["source"].append(source_ids.setdefault(source, len(source_ids)))
+                data["stance"].append(stance_ids.setdefault(stance, len(stance_ids)))
+                data["prompt"].append(1 if event.get("event_kind") == "prompt" else 0)
+                data["approach_mask"].append(mask)
+                event_id += 1
+
+        postings = array("I")
+        tfs = array("B")
+        terms: dict[str, list[int]] = {}
+        for term in sorted(term_ids):
+            terms[term] = [len(postings), len(term_ids[term])]
+            postings.extend(term_ids[term])
+            tfs.extend(term_tfs[term])
+        approaches: dict[str, list[int]] = {}
+        for approach in sorted(approach_ids):
+            approaches[approach] = [len(postings), len(approach_ids[approach])]
+            postings.extend(approach_ids[approach])
+            tfs.extend(array("B", bytes(len(approach_ids[approach]))))
+        data["postings"] = postings
+        data["tf"] = tfs
+
+        meta = {
+            "version": EVIDENCE_INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "source_path": str(events_path.resolve()),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "event_count": event_id,
+            "sources": list(source_ids),
+            "stances": list(stance_ids),
+            "terms": terms,
+            "approaches": approaches,
+            "approach_bits": list(approach_bits),
+        }
+        return cls(events_path, directory, meta, {name: memoryview(values) for name, values in data.items()})
+
+    def save(self) -> None:
+        """Write the index atomically, column files first and meta.json last."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for name in self.COLUMNS:
+            tmp_path = self.directory / f"{name}.bin.tmp"
+            tmp_path.write_bytes(self.columns[name].tobytes())
+            os.replace(tmp_path, self.directory / f"{name}.bin")
+        tmp_meta = self.directory / "meta.json.tmp"
+        tmp_meta.write_text(json.dumps(self.meta, ensure_ascii=True), encoding="utf-8")
+        os.replace(tmp_meta, self.directory / "meta.json")
+
+    # -- loading --------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, events_path: Path, directory: Path | None = None) -> "EvidenceIndex | None":
+        """Open a persisted index if it is current for ``events_path``; else None."""
+        directory = directory or default_evidence_index_dir(events_path)
+        try:
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+            stat = events_path.stat()
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(meta, dict)
+            or meta.get("version") != EVIDENCE_INDEX_VERSION
+            or meta.get("byteorder") != sys.byteorder
+            or meta.get("source_size") != stat.st_size
+            or meta.get("source_mtime_ns") != stat.st_mtime_ns
+        ):
+            return None
+
+        index = cls(events_path, directory, meta, {})
+        try:
+            for name, code in cls.COLUMNS.items():
+                with (directory / f"{name}.bin").open("rb") as handle:
+                    if os.fstat(handle.fileno()).st_size == 0:
+                        index.columns[name] = memoryview(array(code))
+                        continue
+                    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                index._maps.append(mapped)
+                index.columns[name] = memoryview(mapped).cast(code)
+        except (OSError, TypeError, ValueError):
+            index.close()
+            return None
+        return index
+
+    @classmethod
+    def open(cls, events_path: Path, directory: Path | None = None) -> "EvidenceIndex":
+        """Load the persisted index, rebuilding and saving it when stale or missing."""
+        index = cls.load(events_path, directory)
+        if index is not None:
+            return index
+        index = cls.build(events_path, directory)
+        try:
+            index.save()
+        except OSError as error:
+            print(f"warning: evidence index not saved ({error}); using in-memory index", file=sys.stderr)
+        return index
+
+    def close(self) -> None:
+        # NumPy views hold buffer exports; drop them before releasing the maps.
+        self._arrays = {}
+        self._array_candidates_key = None
+        self._array_candidates = None
+        columns, self.columns = self.columns, {}
+        for view in columns.values():
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    # -- querying -------------------------------------------------------------------
+
+    def _postings(self, key: str, table: dict[str, list[int]]) -> tuple[memoryview, memoryview]:
+        start, count = table.get(key, (0, 0))
+        return self.columns["postings"][start : start + count], self.columns["tf"][start : start + count]
+
+    def candidates(self, query_terms: list[str], approach_hints: list[str]) -> list[tuple[int, int, int]]:
+        """(event id, overlap score, matched approach count) for every grounded event.
+
+        Visits only the postings of the query terms and approach hints; the
+        result is cached so the fast/slow/slower passes of one question share it.
+        """
+        key = (tuple(query_terms), tuple(approach_hints))
+        if key == self._candidates_key:
+            return self._candidates
+
+        overlap: dict[int, int] = defaultdict(int)
+        for term in query_terms:  # duplicates count twice, as in base_overlap_score
+            ids, tfs = self._postings(term, self.terms)
+            for event_id, tf in zip(ids, tfs):
+                overlap[event_id] += tf
+        matched: dict[int, int] = defaultdict(int)
+        for approach in dict.fromkeys(approach_hints):
+            ids, _ = self._postings(approach, self.approaches)
+            for event_id in ids:
+                matched[event_id] += 1
+
+        grounded = sorted(overlap.keys() | matched.keys())
+        self._candidates_key = key
+        self._candidates = [(event_id, overlap.get(event_id, 0), matched.get(event_id, 0)) for event_id in grounded]
+        return self._candidates
+
+    def score(
+        self,
+        query: str,
+        approach_hints: list[str],
+        learning_weights: dict[str, float],
+        mode: str,
+        limit: int = EVIDENCE_LIMIT,
+        vectorized: bool | None = None,
+    ) -> tuple[list[ScoredEvent], int]:
+        """Top ``limit`` events as score_events() would rank them, plus the total scored.
+
+        ``vectorized`` defaults to True when NumPy is importable.
+        """
+        if vectorized is None:
+            vectorized = np is not None
+        if vectorized:
+            return self._score_arrays(query, approach_hints, learning_weights, mode, limit)
+        return self._score_loop(query, approach_hints, learning_weights, mode, limit)
+
+    def _score_loop(
+        self,
+        query: str,
+        approach_hints: list[str],
+        learning_weights: dict[str, float],
+        mode: str,
+        limit: int,
+    ) -> tuple[list[ScoredEvent], int]:
+        query_terms = tokenize(query)
+        now_us = (datetime.now(UTC) - _EPOCH) // timedelta(microseconds=1)
+        ts_column = self.columns["ts"]
+        source_column = self.columns["source"]
+        stance_column = self.columns["stance"]
+        prompt_column = self.columns["prompt"]
+        stance_bonus = [
+            0.9 if stance == "adopted-or-endorsed" else 0.25 if stance == "open-question" else 0.0
+            for stance in self.stances
+        ]
+        source_weight = [learning_weights.get(source, 0.0) for source in self.sources]
+
+        scored: list[tuple[float, int]] = []
+        for event_id, overlap_score, matched_count in self.candidates(query_terms, approach_hints):
+            score = overlap_score
+            if approach_hints:
+                score += 1.3 * matched_count
+            score += stance_bonus[stance_column[event_id]]
+            score += source_weight[source_column[event_id]]
+
+            timestamp = ts_column[event_id]
+            if timestamp != _NO_TIMESTAMP:
+                days = max(1, (now_us - timestamp * 1_000_000) // _MICROS_PER_DAY)
+                score += 1.25 if days <= 7 else 0.8 if days <= 30 else 0.35 if days <= 90 else 0.0
+
+            if mode == "slow":
+                if prompt_column[event_id]:
+                    score += 0.15
+            elif mode == "slower":
+                score += 0.2
+
+            if score > 0:
+                scored.append((score, event_id))
+
+        top = heapq.nsmallest(limit, scored, key=lambda item: (-item[0], item[1]))
+        return [ScoredEvent(score=score, event=self.read_event(event_id)) for score, event_id in top], len(scored)
+
+    # -- vectorized scoring ------------------------------------------------------------
+
+    def _array(self, name: str):
+        values = self._arrays.get(name)
+        if values is None:
+            dtype = np.dtype(self.NUMPY_TYPES[self.COLUMNS[name]])
+            values = np.frombuffer(self.columns[name], dtype=dtype) if len(self.columns[name]) else np.zeros(0, dtype)
+            self._arrays[name] = values
+        return values
+
+    def _array_postings(self, key: str, table: dict[str, list[int]]):
+        start, count = table.get(key, (0, 0))
+        return self._array("postings")[start : start + count], self._array("tf")[start : start + count]
+
+    def array_candidates(self, query_terms: list[str], approach_hints: list[str]):
+        """Vectorized candidates(): (event ids, overlap, matched count) arrays, ids ascending."""
+        key = (tuple(query_terms), tuple(approach_hints))
+        if key == self._array_candidates_key and self._array_candidates is not None:
+            return self._array_candidates
+
+        count = len(self)
+        overlap = np.zeros(count, dtype=np.int64)
+        for term in query_terms:  # each term's postings hold an event at most once
+            ids, tfs = self._array_postings(term, self.terms)
+            overlap[ids] += tfs
+        matched = np.zeros(count, dtype=np.int64)
+        masks = self._array("approach_mask")
+        for approach in dict.fromkeys(approach_hints):
+            bit = self.approach_bits.get(approach)
+            if bit is not None:
+                matched += ((masks >> np.uint64(bit)) & np.uint64(1)).astype(np.int64)
+            else:
+                ids, _ = self._array_postings(approach, self.approaches)
+                matched[ids] += 1
+
+        event_ids = np.flatnonzero((overlap > 0) | (matched > 0))
+        self._array_candidates_key = key
+        self._array_candidates = (event_ids, overlap[event_ids], matched[event_ids])
+        return self._array_candidates
+
+    def _score_arrays(
+        self,
+        query: str,
+        approach_hints: list[str],
+        learning_weights: dict[str, float],
+        mode: str,
+        limit: int,
+    ) -> tuple[list[ScoredEvent], int]:
+        # Same additions in the same order as score_events(), so every score
+        # is bit-identical to the per-event loop.
+        event_ids, overlap, matched = self.array_candidates(tokenize(query), approach_hints)
+        score = overlap.astype(np.float64)
+        if approach_hints:
+            score = score + 1.3 * matched.astype(np.float64)
+        stance_bonus = np.array(
+            [0.9 if stance == "adopted-or-endorsed" else 0.25 if stance == "open-question" else 0.0 for stance in self.stances]
+            or [0.0],
+            dtype=np.float64,
+        )
+        source_weight = np.array([learning_weights.get(source, 0.0) for source in self.sources] or [0.0], dtype=np.float64)
+        score = score + stance_bonus[self._array("stance")[event_ids]]
+        score = score + source_weight[self._array("source")[event_ids]]
+
+        timestamps = self._array("ts")[event_ids]
+        dated = timestamps != _NO_TIMESTAMP
+        now_us = (datetime.now(UTC) - _EPOCH) // timedelta(microseconds=1)
+        days = np.maximum(1, (now_us - np.where(dated, timestamps, 0) * 1_000_000) // _MICROS_PER_DAY)
+        recency = np.select([days <= 7, days <= 30, days <= 90], [1.25, 0.8, 0.35], 0.0)
+        score = score + np.where(dated, recency, 0.0)
+
+        if mode == "slow":
+            score = np.where(self._array("prompt")[event_ids] == 1, score + 0.15, score)
+        elif mode == "slower":
+            score = score + 0.2
+
+        positive = score > 0
+        event_ids = event_ids[positive]
+        score = score[positive]
+        total = int(score.size)
+
+        k = min(limit, total)
+        if k <= 0:
+            return [], total
+        if total > k:
+            threshold = score[np.argpartition(-score, k - 1)[:k]].min()
+            above = np.flatnonzero(score > threshold)
+            ties = np.flatnonzero(score == threshold)[: k - above.size]
+            chosen = np.concatenate([above, ties])
+        else:
+            chosen = np.arange(total)
+        chosen = chosen[np.lexsort((event_ids[chosen], -score[chosen]))]
+        return [
+            ScoredEvent(score=float(score[position]), event=self.read_event(int(event_ids[position])))
+            for position in chosen
+        ], total
+
+    def read_event(self, event_id: int) -> dict[str, object]:
+        with self.events_path.open("rb") as handle:
+            handle.seek(self.columns["offset"][event_id])
+            return json.loads(handle.readline())
+
+
 def infer_approach_hints(query: str, summary: dict[str, object]) -> list[str]:
     query_tokens = set(tokenize(query))
     hints: list[str] = []
@@ -382,15 +821,19 @@ def compose_clarification_answer(sense: dict[str, object]) -> dict[str, object]:
 def attempt_memory_answer(
     question: str,
     summary: dict[str, object],
-    events: list[dict[str, object]],
+    events: list[dict[str, object]] | EvidenceIndex,
     learning_weights: dict[str, float],
     approach_hints: list[str],
     mode: str,
     path: str,
 ) -> AttemptResult:
-    scored = score_events(events, question, approach_hints, learning_weights, mode=mode)
+    if isinstance(events, EvidenceIndex):
+        scored, evidence_count = events.score(question, approach_hints, learning_weights, mode=mode)
+    else:
+        scored = score_events(events, question, approach_hints, learning_weights, mode=mode)
+        evidence_count = len(scored)
     answer = compose_answer(question, mode, scored, summary)
-    return AttemptResult(mode=mode, path=path, evidence=scored, answer=answer)
+    return AttemptResult(mode=mode, path=path, evidence=scored, answer=answer, evidence_count=evidence_count)
 
 
 def finalize_package(
@@ -549,7 +992,7 @@ def run_memory_search(
     question: str,
     skill: str,
     summary: dict[str, object],
-    events: list[dict[str, object]],
+    events: list[dict[str, object]] | EvidenceIndex,
     learning_weights: dict[str, float],
 ) -> dict[str, object]:
     sense = sense_request(question, skill)
@@ -604,7 +1047,7 @@ def run_memory_search(
                         {
                             "mode": prior.mode,
                             "path": prior.path,
-                            "evidence_count": len(prior.evidence),
+                            "evidence_count": prior.evidence_count,
                             "confidence": prior.answer.get("confidence"),
                         }
                         for prior in attempts
@@ -649,13 +1092,13 @@ def run_memory_search(
                 {
                     "mode": attempt.mode,
                     "path": attempt.path,
-                    "evidence_count": len(attempt.evidence),
+                    "evidence_count": attempt.evidence_count,
                     "confidence": attempt.answer.get("confidence"),
                 }
                 for attempt in [*attempts, invention_attempt]
             ],
             selected_mode="slower",
-            selected_evidence_count=min(12, len(invention_attempt.evidence)),
+            selected_evidence_count=min(12, invention_attempt.evidence_count),
         ),
         make_stage("compose", "completed", selected_skill="triage-packet", selected_path=INVENTION_PATH, strategy="escalate-capability-gap"),
         make_stage("gate", "passed", policy="pass-through"),
@@ -680,6 +1123,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--skill", choices=["memory-search", "echo", "assistance-request"], default="memory-search", help="Skill to run (memory-search, echo, or assistance-request)")
     parser.add_argument("--events", default=str(EVENT_INDEX_PATH), help="Path to session_log_events.jsonl")
     parser.add_argument("--summary", default=str(SUMMARY_PATH), help="Path to ppa_approach_summary.json")
+    parser.add_argument("--index-dir", help="Evidence index directory (default: <events>.index next to the events file)")
+    parser.add_argument("--no-index", action="store_true", help="Scan session_log_events.jsonl instead of using the evidence index")
     parser.add_argument("--feedback", choices=["helpful", "not-helpful"], help="Record feedback for a previous question")
     parser.add_argument("--question-id", help="Question id for feedback")
     parser.add_argument("--note", default="", help="Optional note for feedback")
@@ -722,7 +1167,10 @@ def main() -> None:
         if not events_path.exists() or not summary_path.exists():
             raise SystemExit("Memory index missing. Run: py scripts\\analyze_session_logs_for_ppa.py")
 
-        events = load_jsonl(events_path)
+        if args.no_index:
+            events = load_jsonl(events_path)
+        else:
+            events = EvidenceIndex.open(events_path, Path(args.index_dir) if args.index_dir else None)
         summary = load_json(summary_path)
         learning_weights = get_learning_weights(LEARNING_LOG_PATH)
         output = run_memory_search(question_id, question, args.skill, summary, events, learning_weights)
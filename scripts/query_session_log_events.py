@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
+try:
+    from session_log_index import SearchPage, SessionLogIndex, default_index_path
+except ModuleNotFoundError:
+    # Module import path: from scripts.query_session_log_events import ...
+    from scripts.session_log_index import SearchPage, SessionLogIndex, default_index_path
+
 
 DEFAULT_INDEX = Path(r"G:\repos\AI\RoadTrip\analysis\ppa\session_log_events.jsonl")
 
@@ -27,6 +34,46 @@ def score_row(row: dict[str, object], query_terms: list[str]) -> int:
     return score
 
 
+def scan_rows(
+    rows: list[dict[str, object]],
+    query: str = "",
+    approach: str | None = None,
+    stance: str | None = None,
+    kind: str | None = None,
+    source_file: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 12,
+    offset: int = 0,
+) -> SearchPage:
+    """Substring-count scoring over every row (the pre-index behaviour, kept for --no-index)."""
+    filtered = []
+    query_terms = [term.lower() for term in query.split() if term.strip()]
+
+    for row in rows:
+        if approach and approach not in row.get("approaches", []):
+            continue
+        if stance and stance != row.get("stance"):
+            continue
+        if kind and kind != row.get("event_kind"):
+            continue
+        if source_file and source_file != row.get("source_file"):
+            continue
+        timestamp = str(row.get("timestamp") or "")
+        if since and not (row.get("timestamp") and timestamp >= since):
+            continue
+        if until and not (row.get("timestamp") and timestamp[: len(until)] <= until):
+            continue
+        score = score_row(row, query_terms) if query_terms else 1
+        if score <= 0:
+            continue
+        filtered.append((score, row))
+
+    filtered.sort(key=lambda item: (item[0], item[1].get("timestamp") or ""), reverse=True)
+    page = filtered[max(offset, 0): max(offset, 0) + max(limit, 0)]
+    return SearchPage(total=len(filtered), hits=[{**row, "score": score} for score, row in page])
+
+
 def truncate(text: str, limit: int = 240) -> str:
     text = " ".join(text.split())
     if len(text) <= limit:
@@ -38,43 +85,50 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Query the PPA session-log event index.")
     parser.add_argument("query", nargs="?", default="", help="Free-text query string.")
     parser.add_argument("--index", default=str(DEFAULT_INDEX), help="Path to session_log_events.jsonl")
+    parser.add_argument("--db", help="SQLite full-text index (default: next to --index, .sqlite)")
+    parser.add_argument("--no-index", action="store_true", help="Scan the JSONL instead of using the full-text index")
     parser.add_argument("--approach", help="Filter by approach tag")
     parser.add_argument("--stance", help="Filter by stance")
     parser.add_argument("--kind", choices=["prompt", "response"], help="Filter by event kind")
+    parser.add_argument("--source", help="Filter by session log file name")
+    parser.add_argument("--since", help="Only events at or after this timestamp prefix (e.g. 2026-02-01)")
+    parser.add_argument("--until", help="Only events up to this timestamp prefix, inclusive (e.g. 2026-02)")
     parser.add_argument("--limit", type=int, default=12, help="Maximum matches to print")
+    parser.add_argument("--offset", type=int, default=0, help="Skip this many matches (pagination)")
     args = parser.parse_args()
 
     index_path = Path(args.index)
     if not index_path.exists():
         raise SystemExit(f"Index file not found: {index_path}. Run `py scripts\\analyze_session_logs_for_ppa.py` first.")
 
-    rows = load_rows(index_path)
-    filtered = []
-    query_terms = [term.lower() for term in args.query.split() if term.strip()]
-
-    for row in rows:
-        if args.approach and args.approach not in row.get("approaches", []):
-            continue
-        if args.stance and args.stance != row.get("stance"):
-            continue
-        if args.kind and args.kind != row.get("event_kind"):
-            continue
-        score = score_row(row, query_terms) if query_terms else 1
-        if score <= 0:
-            continue
-        filtered.append((score, row))
-
-    filtered.sort(key=lambda item: (item[0], item[1].get("timestamp") or ""), reverse=True)
-
-    for score, row in filtered[: args.limit]:
-        print(f"[{row.get('timestamp')}] {row.get('source_file')} | {row.get('event_kind')} | score={score}")
+    filters = {
+        "approach": args.approach,
+        "stance": args.stance,
+        "kind": args.kind,
+        "source_file": args.source,
+        "since": args.since,
+        "until": args.until,
+        "limit": args.limit,
+        "offset": args.offset,
+    }
+    if args.no_index:
+        page = scan_rows(load_rows(index_path), args.query, **filters)
+    else:
+        with SessionLogIndex.open(index_path, Path(args.db) if args.db else default_index_path(index_path)) as index:
+            page = index.search(args.query, **filters)
+
+    for row in page.hits:
+        print(f"[{row.get('timestamp')}] {row.get('source_file')} | {row.get('event_kind')} | score={row['score']}")
         print(f"approaches={','.join(row.get('approaches', []))} | stance={row.get('stance')}")
         print(truncate(str(row.get("text", ""))))
         print()
 
-    if not filtered:
+    if not page.total:
         print("No matches found.")
+    elif page.total > args.offset + len(page.hits) or args.offset:
+        first = args.offset + 1 if page.hits else args.offset
+        print(f"Showing {first}-{args.offset + len(page.hits)} of {page.total} matches.", file=sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
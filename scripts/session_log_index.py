@@ -0,0 +1,251 @@
+"""SQLite FTS5 index over analysis/ppa/session_log_events.jsonl.
+
+analyze_session_logs_for_ppa.py keeps the index in step with the events
+file as it appends or rewrites rows; query_session_log_events.py reads it.
+Each event row lives in ``events`` (metadata), ``events_fts`` (text, same
+rowid) and ``event_approaches`` (one row per approach tag). The
+``meta.events_file_size`` and ``meta.events_file_mtime_ns`` values record
+which version of the JSONL the index mirrors, so a reader can tell when it
+is stale (even after a same-size rewrite) and rebuild it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+SCHEMA_VERSION = 1
+QUERY_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def default_index_path(events_path: Path) -> Path:
+    return events_path.with_suffix(".sqlite")
+
+
+def fts_query(query: str) -> str:
+    """Turn free text into an FTS5 OR-query of prefix terms ("auth" matches "authorization")."""
+    terms = dict.fromkeys(term.lower() for term in QUERY_TERM_RE.findall(query))
+    return " OR ".join(f'"{term}"*' for term in terms)
+
+
+@dataclass
+class SearchPage:
+    total: int
+    hits: list[dict[str, object]]
+
+
+class SessionLogIndex:
+    """Incrementally maintained full-text index of session-log events."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        conn = self._conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            conn.executescript(
+                "DROP TABLE IF EXISTS events; DROP TABLE IF EXISTS events_fts; "
+                "DROP TABLE IF EXISTS event_approaches; DROP TABLE IF EXISTS meta;"
+            )
+        conn.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY,
+                source_file TEXT,
+                event_kind TEXT,
+                timestamp TEXT,
+                pair_index INTEGER,
+                stance TEXT,
+                approaches TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_source ON events(source_file);
+            CREATE INDEX IF NOT EXISTS idx_events_time ON events(timestamp);
+            CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(text);
+            CREATE TABLE IF NOT EXISTS event_approaches (
+                event_id INTEGER,
+                approach TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_event_approaches ON event_approaches(approach, event_id);
+            CREATE INDEX IF NOT EXISTS idx_event_approaches_event ON event_approaches(event_id);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            PRAGMA user_version = {SCHEMA_VERSION};
+            """
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SessionLogIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -- maintenance ----------------------------------------------------------
+
+    @property
+    def synced_events_size(self) -> int | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'events_file_size'").fetchone()
+        return int(row[0]) if row else None
+
+    @property
+    def synced_events_mtime_ns(self) -> int | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'events_file_mtime_ns'").fetchone()
+        return int(row[0]) if row else None
+
+    def is_current(self, events_path: Path) -> bool:
+        if not events_path.exists():
+            return False
+        stat = events_path.stat()
+        return self.synced_events_size == stat.st_size and self.synced_events_mtime_ns == stat.st_mtime_ns
+
+    def add_rows(self, rows: Iterable[dict[str, object]]) -> int:
+        """Insert event rows in JSONL order (the caller commits)."""
+        conn = self._conn
+        added = 0
+        for row in rows:
+            cursor = conn.execute(
+                "INSERT INTO events(source_file, event_kind, timestamp, pair_index, stance, approaches)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    row.get("source_file"),
+                    row.get("event_kind"),
+                    row.get("timestamp"),
+                    row.get("pair_index"),
+                    row.get("stance"),
+                    json.dumps(row.get("approaches") or []),
+                ),
+            )
+            event_id = cursor.lastrowid
+            conn.execute("INSERT INTO events_fts(rowid, text) VALUES (?, ?)", (event_id, str(row.get("text") or "")))
+            conn.executemany(
+                "INSERT INTO event_approaches(event_id, approach) VALUES (?, ?)",
+                [(event_id, approach) for approach in row.get("approaches") or []],
+            )
+            added += 1
+        return added
+
+    def add_lines(self, lines: Iterable[str]) -> int:
+        return self.add_rows(json.loads(line) for line in lines if line.strip())
+
+    def delete_sources(self, source_files: Iterable[str]) -> None:
+        conn = self._conn
+        for source_file in source_files:
+            ids = [(row[0],) for row in conn.execute("SELECT id FROM events WHERE source_file = ?", (source_file,))]
+            conn.executemany("DELETE FROM events_fts WHERE rowid = ?", ids)
+            conn.executemany("DELETE FROM event_approaches WHERE event_id = ?", ids)
+            conn.execute("DELETE FROM events WHERE source_file = ?", (source_file,))
+
+    def mark_synced(self, events_path: Path) -> None:
+        stat = events_path.stat()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
+            [("events_file_size", str(stat.st_size)), ("events_file_mtime_ns", str(stat.st_mtime_ns))],
+        )
+
+    def sync(self, events_path: Path, drop_sources: Iterable[str] = (), lines: Iterable[str] = ()) -> int:
+        """Apply one analyzer run in a single transaction: drop rewritten files, add new rows."""
+        with self._conn:
+            self.delete_sources(drop_sources)
+            added = self.add_lines(lines)
+            self.mark_synced(events_path)
+        return added
+
+    def rebuild(self, events_path: Path) -> int:
+        """Replace the whole index with the contents of ``events_path``."""
+        with self._conn:
+            self._conn.execute("DELETE FROM events")
+            self._conn.execute("DELETE FROM events_fts")
+            self._conn.execute("DELETE FROM event_approaches")
+            with events_path.open("r", encoding="utf-8") as handle:
+                count = self.add_lines(handle)
+            self.mark_synced(events_path)
+        return count
+
+    @classmethod
+    def open(cls, events_path: Path, db_path: Path | None = None) -> "SessionLogIndex":
+        """Open the index for ``events_path``, rebuilding it first if it is stale."""
+        index = cls(db_path or default_index_path(events_path))
+        if not index.is_current(events_path):
+            index.rebuild(events_path)
+        return index
+
+    # -- queries --------------------------------------------------------------
+
+    def search(
+        self,
+        query: str = "",
+        approach: str | None = None,
+        stance: str | None = None,
+        kind: str | None = None,
+        source_file: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 12,
+        offset: int = 0,
+    ) -> SearchPage:
+        """Ranked (BM25) multi-term search with metadata filters and pagination.
+
+        Without query terms every event passing the filters matches, newest
+        first. ``since``/``until`` compare against the "YYYY-MM-DD HH:MM:SS"
+        timestamps as strings, so date prefixes such as "2026-02" work.
+        """
+        match = fts_query(query)
+        clauses: list[str] = []
+        params: list[object] = []
+        if match:
+            clauses.append("events_fts MATCH ?")
+            params.append(match)
+        if approach:
+            clauses.append("e.id IN (SELECT event_id FROM event_approaches WHERE approach = ?)")
+            params.append(approach)
+        for column, value in (("stance", stance), ("event_kind", kind), ("source_file", source_file)):
+            if value:
+                clauses.append(f"e.{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("e.timestamp >= ?")
+            params.append(since)
+        if until:
+            # Inclusive upper bound for prefixes: "2026-02" keeps all of February.
+            clauses.append("substr(e.timestamp, 1, ?) <= ?")
+            params.extend([len(until), until])
+        where = " AND ".join(clauses) or "1"
+        if match:
+            base = "FROM events_fts JOIN events e ON e.id = events_fts.rowid WHERE " + where
+            order = "bm25(events_fts), e.timestamp DESC, e.id"
+            rank = "bm25(events_fts)"
+        else:
+            base = "FROM events e WHERE " + where
+            order = "e.timestamp DESC, e.id"
+            rank = "0"
+
+        total = self._conn.execute(f"SELECT COUNT(*) {base}", params).fetchone()[0]
+        rows = self._conn.execute(
+            f"SELECT e.*, {rank} AS rank {base} ORDER BY {order} LIMIT ? OFFSET ?",
+            [*params, max(limit, 0), max(offset, 0)],
+        ).fetchall()
+        # Text is only read for the rows on this page.
+        ids = [row["id"] for row in rows]
+        texts = dict(
+            self._conn.execute(
+                f"SELECT rowid, text FROM events_fts WHERE rowid IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+        ) if ids else {}
+        hits = []
+        for row in rows:
+            hit = {key: row[key] for key in ("source_file", "event_kind", "timestamp", "pair_index", "stance")}
+            hit["approaches"] = json.loads(row["approaches"] or "[]")
+            hit["text"] = texts.get(row["id"], "")
+            hit["score"] = round(-row["rank"], 3) if match else 1
+            hits.append(hit)
+        return SearchPage(total=total, hits=hits)
@@ -14,12 +14,17 @@ import importlib
 import importlib.util
 import yaml
 import json
-import re
 from pathlib import Path
 from typing import Any, Dict, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+try:
+    from src.skills.known_solutions import KnownSolutionIndex, load_known_solution_index
+except ImportError:
+    # Fallback for direct execution with src/ on sys.path
+    from skills.known_solutions import KnownSolutionIndex, load_known_solution_index
+
 
 @dataclass
 class SkillMetadata:
@@ -142,17 +147,11 @@ class Orchestrator:
 
     def _load_known_solutions(self):
         """Load known problem->solution entries from structured memory file."""
-        if not self.known_solutions_file.exists():
-            self.known_solutions = []
-            return
+        self.known_solutions = self._known_solution_index().solutions
 
-        try:
-            with open(self.known_solutions_file, "r", encoding="utf-8") as f:
-                payload = yaml.safe_load(f) or {}
-            entries = payload.get("solutions", [])
-            self.known_solutions = entries if isinstance(entries, list) else []
-        except Exception:
-            self.known_solutions = []
+    def _known_solution_index(self) -> KnownSolutionIndex:
+        """Shared compiled index, reloaded when the solutions file changes."""
+        return load_known_solution_index(self.known_solutions_file)
 
     def _log_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Append structured orchestration events for learning/diagnostics."""
@@ -199,31 +198,16 @@ class Orchestrator:
 
     def _lookup_known_solution(self, intent: str, error_code: str, error_message: str) -> Dict[str, Any] | None:
         """Find first known solution whose patterns match this failure."""
-        text = (error_message or "").lower()
-        code = (error_code or "").upper()
-
-        for solution in self.known_solutions:
-            solution_intent = str(solution.get("intent", "")).lower().strip()
-            if solution_intent and solution_intent != intent:
-                continue
-
-            matches = solution.get("matches", {}) if isinstance(solution.get("matches"), dict) else {}
-            error_codes = [str(item).upper() for item in matches.get("error_codes", [])]
-            if error_codes and code not in error_codes:
-                continue
-
-            patterns = [str(item) for item in matches.get("message_patterns", [])]
-            if patterns and not any(re.search(pattern, text) for pattern in patterns):
-                continue
-
-            return {
-                "id": solution.get("id"),
-                "title": solution.get("title"),
-                "summary": solution.get("summary"),
-                "steps": solution.get("steps", []),
-            }
-
-        return None
+        solution = self._known_solution_index().lookup(intent, error_code, error_message)
+        if solution is None:
+            return None
+
+        return {
+            "id": solution.get("id"),
+            "title": solution.get("title"),
+            "summary": solution.get("summary"),
+            "steps": solution.get("steps", []),
+        }
 
     def _resolve_fallback_skill(self, intent: str, excluded_skills: set[str]) -> str | None:
         """Pick fallback skill for retry path, excluding already-tried skills."""
@@ -8,13 +8,16 @@ import inspect
 import json
 import re
 import sys
+import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
-import yaml
 
+from src.skills.known_solutions import KnownSolutionIndex, load_known_solution_index
+from src.skills.intent_router import DEFAULT_ROUTES_PATH, IntentRouter, get_router
 from src.skills.registry.fingerprint_generator import FingerprintGenerator
 from src.skills.registry.fingerprint_verifier import FingerprintVerifier
 from src.skills.registry.registry_reader import RegistryReader
@@ -37,6 +40,77 @@ class AdaptiveExecutionResult:
     suggested_fix: Optional[dict] = None
 
 
+class SkillCallableCache:
+    """Bounded LRU cache of loaded skill modules.
+
+    Entries are keyed by module path and validated against the file's
+    mtime/size and the registry fingerprint, so a module is re-executed only
+    when its source (or certified fingerprint) changes. Evicted or stale
+    modules are removed from ``sys.modules``.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple[tuple[int, int, str], str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_module(self, path: Path, fingerprint: str = "") -> Optional[Any]:
+        """Return the loaded module for ``path``, importing it only if changed."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = str(path)
+        signature = (stat.st_mtime_ns, stat.st_size, fingerprint or "")
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[2]
+
+            self.misses += 1
+            if cached is not None:
+                self._entries.pop(key)
+                sys.modules.pop(cached[1], None)
+
+            module_name = f"adaptive_skill_{path.stem}_{hashlib.sha256(key.encode()).hexdigest()[:8]}"
+            spec = importlib.util.spec_from_file_location(module_name, key)
+            if spec is None or spec.loader is None:
+                return None
+
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(module_name, None)
+                raise
+
+            self._entries[key] = (signature, module_name, module)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted_name, _) = self._entries.popitem(last=False)
+                sys.modules.pop(evicted_name, None)
+            return module
+
+    def clear(self) -> None:
+        """Drop all cached modules and their ``sys.modules`` registrations."""
+        with self._lock:
+            for _, module_name, _ in self._entries.values():
+                sys.modules.pop(module_name, None)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_DEFAULT_CALLABLE_CACHE = SkillCallableCache()
+
+
 class AdaptiveExecutor:
     """Registry-first adaptive executor with one-step self-correct retry."""
 
@@ -46,13 +120,17 @@ class AdaptiveExecutor:
         registry_path: str = "config/skills-registry.yaml",
         metrics_log_path: str = "logs/execution_metrics.jsonl",
         known_solutions_path: str = "config/known-solutions.yaml",
+        intent_routes_path: str = "config/intent-routes.yaml",
         use_mock_fingerprint: bool = True,
+        callable_cache: Optional[SkillCallableCache] = None,
     ):
         self.repo_root = Path(repo_root).resolve()
         self.registry_path = self.repo_root / registry_path
         self.metrics_log_path = self.repo_root / metrics_log_path
         self.known_solutions_path = self.repo_root / known_solutions_path
+        self.intent_routes_path = self.repo_root / intent_routes_path
         self.use_mock_fingerprint = use_mock_fingerprint
+        self.callable_cache = callable_cache if callable_cache is not None else _DEFAULT_CALLABLE_CACHE
         self.known_solutions = self._load_known_solutions()
 
     def execute_prompt(
@@ -172,7 +250,10 @@ class AdaptiveExecutor:
                     )
                 continue
 
-            skill_callable = self._load_skill_callable(metadata.entry_point)
+            skill_callable = self._load_skill_callable(
+                metadata.entry_point,
+                fingerprint=str(getattr(metadata, "fingerprint", "") or ""),
+            )
             if not skill_callable:
                 self._log_event(
                     workflow_id,
@@ -296,18 +377,11 @@ class AdaptiveExecutor:
 
     def _load_known_solutions(self) -> list[dict[str, Any]]:
         """Load structured solution memory from config/known-solutions.yaml."""
-        if not self.known_solutions_path.exists():
-            return []
+        return self._known_solution_index().solutions
 
-        try:
-            with open(self.known_solutions_path, "r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
-            solutions = data.get("solutions", [])
-            if isinstance(solutions, list):
-                return [item for item in solutions if isinstance(item, dict)]
-            return []
-        except Exception:
-            return []
+    def _known_solution_index(self) -> KnownSolutionIndex:
+        """Shared compiled index, reloaded when the solutions file changes."""
+        return load_known_solution_index(self.known_solutions_path)
 
     def _extract_failure_message(self, output: Any) -> str:
         """Extract useful failure text from a skill output payload."""
@@ -323,22 +397,8 @@ class AdaptiveExecutor:
 
     def _lookup_solution(self, intent: str, error_code: str, message: str) -> Optional[dict]:
         """Find the first matching known solution for this failure."""
-        normalized_message = (message or "").lower()
-
-        for solution in self.known_solutions:
-            solution_intent = str(solution.get("intent", "")).strip().lower()
-            if solution_intent and solution_intent != intent:
-                continue
-
-            matches = solution.get("matches", {}) if isinstance(solution.get("matches"), dict) else {}
-            codes = [str(item).upper() for item in matches.get("error_codes", [])]
-            if codes and error_code.upper() not in codes:
-                continue
-
-            patterns = [str(item) for item in matches.get("message_patterns", [])]
-            if patterns and not any(re.search(pattern, normalized_message) for pattern in patterns):
-                continue
-
+        solution = self._known_solution_index().lookup(intent, error_code, message)
+        if solution is not None:
             found = {
                 "id": solution.get("id", ""),
                 "title": solution.get("title", ""),
@@ -359,38 +419,15 @@ class AdaptiveExecutor:
         )
         return None
 
-    def _semantic_intent(self, prompt: str) -> str:
-        normalized = (prompt or "").strip().lower()
-        if not normalized:
-            return "unknown"
-
-        push_patterns = (
-            r"\bpush\s+my\s+changes\b",
-            r"\bpush\s+changes\b",
-            r"\bpush\s+the\s+latest\s+changes\b",
-            r"\bplease\s+push\s+the\s+latest\s+changes\b",
-            r"\bgit\s+push\b",
-        )
-        if any(re.search(pattern, normalized) for pattern in push_patterns):
-            return "git_push"
-
-        memory_transition_patterns = (
-            r"\b(promote|move|expire)\b.*\b(memory|entry)\b",
-            r"\bfrom\s+[a-z_]+\s+to\s+[a-z_]+\b",
-        )
-        if any(re.search(pattern, normalized) for pattern in memory_transition_patterns):
-            return "memory_transition"
-
-        list_skill_patterns = (
-            r"\bshow\s+me\s+(a\s+)?list\s+of\s+skills\b",
-            r"\blist\s+skills\b",
-            r"\bshow\s+skills\b",
-            r"\bregistry\s+list\b",
-        )
-        if any(re.search(pattern, normalized) for pattern in list_skill_patterns):
-            return "list_skills"
+    def _intent_router(self) -> IntentRouter:
+        """Router from the repo's intent-routes.yaml, else the packaged default."""
+        routes_path = self.intent_routes_path
+        if not routes_path.exists():
+            routes_path = DEFAULT_ROUTES_PATH
+        return get_router("adaptive_executor", routes_path)
 
-        return "unknown"
+    def _semantic_intent(self, prompt: str) -> str:
+        return self._intent_router().route(prompt)
 
     def _resolve_skill(
         self,
@@ -451,7 +488,11 @@ class AdaptiveExecutor:
         enforcer = Verification(fingerprint_verifier=verifier, use_mock=self.use_mock_fingerprint)
         return enforcer.enforce(skill_name)
 
-    def _load_skill_callable(self, entry_point: str) -> Optional[Callable[..., Any]]:
+    def _load_skill_callable(
+        self,
+        entry_point: str,
+        fingerprint: str = "",
+    ) -> Optional[Callable[..., Any]]:
         if not entry_point:
             return None
 
@@ -464,15 +505,10 @@ class AdaptiveExecutor:
         if not path.exists():
             return None
 
-        module_name = f"adaptive_skill_{path.stem}_{uuid.uuid4().hex[:8]}"
-        spec = importlib.util.spec_from_file_location(module_name, str(path))
-        if spec is None or spec.loader is None:
+        module = self.callable_cache.get_module(path.resolve(), fingerprint=fingerprint)
+        if module is None:
             return None
 
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-
         return getattr(module, function_name, None)
 
     def _build_skill_input(self, intent: str, prompt: str, context: dict) -> dict:
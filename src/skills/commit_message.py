@@ -9,8 +9,13 @@ Generates semantic commit messages using cost-optimized Tier 1→2→3 approach.
 
 Standalone module; can be called directly or imported.
 
+Diffs are never held in memory whole: they are streamed once through
+diff_summary.summarize_diff_lines(), and both tiers work from the resulting
+DiffSummary (per-file/per-category stats plus a bounded excerpt).
+
 Usage:
     python commit_message.py --staged-files src/auth.py src/models.py --diff-file changes.patch
+    python commit_message.py --staged
     python commit_message.py --user-message "feat: custom message" --dry-run
 """
 
@@ -18,10 +23,11 @@ import sys
 import json
 import argparse
 import os
+import time
 from pathlib import Path
 from fnmatch import fnmatch
 from dataclasses import asdict
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Union
 from datetime import datetime
 
 # Import models from same package
@@ -47,6 +53,26 @@ except ImportError:
         sys.stderr.write("Error: commit_message_models.py not found. Must be in same directory.\n")
         sys.exit(1)
 
+try:
+    from .commit_message_cache import CachedTier2Response, Tier2ResponseCache, tier2_cache_key
+except ImportError:
+    from commit_message_cache import CachedTier2Response, Tier2ResponseCache, tier2_cache_key
+
+try:
+    from .diff_summary import (
+        DiffSummary,
+        summarize_diff_file,
+        summarize_diff_text,
+        summarize_staged_diff,
+    )
+except ImportError:
+    from diff_summary import (
+        DiffSummary,
+        summarize_diff_file,
+        summarize_diff_text,
+        summarize_staged_diff,
+    )
+
 try:
     import yaml
 except ImportError:
@@ -54,14 +80,40 @@ except ImportError:
     sys.exit(1)
 
 
+# Bump whenever the Tier 2 prompt text or layout changes.
+TIER2_PROMPT_VERSION = 2
+# Files listed individually in the Tier 2 prompt (highest churn first).
+TIER2_MAX_FILES = 40
+
+DiffInput = Union[str, DiffSummary]
+
+
 class CommitMessageSkill:
     """Generates commit messages using Tier 1→2→3 strategy."""
 
-    def __init__(self, config_path: str = "config/commit-strategy.yaml"):
-        """Load configuration from YAML."""
+    _CACHE_FROM_CONFIG = object()
+
+    def __init__(
+        self,
+        config_path: str = "config/commit-strategy.yaml",
+        llm_client=None,
+        response_cache=_CACHE_FROM_CONFIG,
+    ):
+        """
+        Load configuration from YAML.
+
+        Args:
+            config_path: Path to commit-strategy.yaml
+            llm_client: Object with an Anthropic-style ``messages.create``;
+                defaults to ``anthropic.Anthropic`` built on first Tier 2 call
+            response_cache: Tier 2 response cache; defaults to the one
+                described by ``tier2.cache`` in config, ``None`` disables it
+        """
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.cost_log: List[Dict] = []
+        self.llm_client = llm_client
+        self._response_cache = response_cache
 
     def _load_config(self) -> Dict:
         """Load commit-strategy.yaml configuration."""
@@ -85,6 +137,7 @@ class CommitMessageSkill:
         diff: str = "",
         user_message: Optional[str] = None,
         dry_run: bool = False,
+        diff_summary: Optional[DiffSummary] = None,
     ) -> CommitMessageResult:
         """
         Generate commit message using Tier 1→2→3 strategy.
@@ -94,6 +147,8 @@ class CommitMessageSkill:
             diff: Unified diff content (optional, for Tier 2)
             user_message: User-provided message (Tier 3, overrides all)
             dry_run: If True, only calculate; don't call external APIs
+            diff_summary: Pre-computed summary (e.g. streamed from git);
+                takes precedence over ``diff``
         
         Returns:
             CommitMessageResult with message, approach, confidence, cost, etc.
@@ -121,7 +176,8 @@ class CommitMessageSkill:
         # =====================================================================
         # TIER 1: Deterministic Logic
         # =====================================================================
-        tier1_result = self._tier1_generate(staged_files, diff)
+        summary = diff_summary if diff_summary is not None else self._summarize(diff)
+        tier1_result = self._tier1_generate(staged_files, summary)
         
         confidence_threshold = self.config.get('confidence_threshold', 0.85)
         
@@ -164,7 +220,15 @@ class CommitMessageSkill:
 
         # Tier 2 enabled; call LLM
         if dry_run:
-            # Don't actually call API in dry-run
+            # Don't actually call API in dry-run, but a cached answer is free
+            cache = self.response_cache
+            cache_key = self._tier2_cache_key(staged_files, summary)
+            if cache is not None and cache_key is not None:
+                cached = cache.get(cache_key, record=False)
+                if cached is not None:
+                    return self._cached_result(
+                        cached, f"{tier1_result.reasoning}; Tier 2 response cached (dry-run mode)"
+                    )
             return CommitMessageResult(
                 message=f"[DRY-RUN] {tier1_result.message}",
                 approach_used=CommitApproach.TIER_2,
@@ -180,10 +244,106 @@ class CommitMessageSkill:
                 ),
             )
 
-        tier2_result = self._tier2_generate(staged_files, diff)
+        tier2_result = self._tier2_generate(staged_files, summary)
         return tier2_result
 
-    def _tier1_generate(self, staged_files: List[str], diff: str = "") -> Tier1Score:
+    @property
+    def response_cache(self) -> Optional[Tier2ResponseCache]:
+        """Tier 2 response cache (built lazily from config)."""
+        if self._response_cache is CommitMessageSkill._CACHE_FROM_CONFIG:
+            self._response_cache = Tier2ResponseCache.from_config(self.config)
+        return self._response_cache
+
+    def _tier2_model(self) -> str:
+        return self.config['tier2'].get('model', 'claude-3-5-sonnet-20241022')
+
+    def _tier2_cache_key(self, staged_files: List[str], summary: Optional[DiffSummary]) -> Optional[str]:
+        """Cache key for a Tier 2 request, or None when there is no diff to key on.
+
+        A key built from file names alone would hand one change's message to
+        any later change touching the same files, so diff-less calls bypass
+        the cache.
+        """
+        if summary is None or not summary.content_hash:
+            return None
+        return tier2_cache_key(
+            staged_files,
+            summary.content_hash,
+            self._tier2_model(),
+            TIER2_PROMPT_VERSION,
+        )
+
+    def _cost_tracking(
+        self,
+        model: Optional[str],
+        tokens_input: int = 0,
+        tokens_output: int = 0,
+        cost_usd: float = 0.0,
+        cache_hit: bool = False,
+    ) -> CostTracking:
+        """CostTracking carrying the response cache's running counters."""
+        cache = self.response_cache
+        return CostTracking(
+            model=model,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            cost_usd=cost_usd,
+            cache_hit=cache_hit,
+            cache_hits=cache.hits if cache else 0,
+            cache_misses=cache.misses if cache else 0,
+            saved_cost_usd=cache.saved_cost_usd if cache else 0.0,
+        )
+
+    def _cached_result(self, cached: CachedTier2Response, reasoning: str) -> CommitMessageResult:
+        """Tier 2 result served from the response cache ($0 spent)."""
+        return CommitMessageResult(
+            message=cached.message,
+            approach_used=CommitApproach.TIER_2,
+            confidence=0.95,
+            cost_estimate=0.0,
+            reasoning=reasoning,
+            tier1_score=None,
+            cost_tracking=self._cost_tracking(
+                model=cached.model,
+                tokens_input=cached.tokens_input,
+                tokens_output=cached.tokens_output,
+                cache_hit=True,
+            ),
+        )
+
+    def generate_from_staged(
+        self,
+        repo_path: str = ".",
+        staged_files: Optional[List[str]] = None,
+        user_message: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> CommitMessageResult:
+        """
+        Generate a message for the index of ``repo_path``.
+
+        Streams ``git diff --cached`` through the summarizer, so memory stays
+        bounded however large the staged change is. ``staged_files`` defaults
+        to the paths found in the diff.
+        """
+        if user_message:
+            return self.generate(staged_files or [], user_message=user_message, dry_run=dry_run)
+        summary = summarize_staged_diff(repo_path, categorize=self._file_category)
+        return self.generate(
+            staged_files=staged_files if staged_files is not None else summary.paths,
+            user_message=user_message,
+            dry_run=dry_run,
+            diff_summary=summary,
+        )
+
+    def _summarize(self, diff: DiffInput) -> Optional[DiffSummary]:
+        """Normalize a raw diff string into a DiffSummary (None when empty)."""
+        if isinstance(diff, DiffSummary):
+            return diff
+        if not diff:
+            return None
+        return summarize_diff_text(diff, categorize=self._file_category)
+
+    def _tier1_generate(self, staged_files: List[str], diff: DiffInput = "") -> Tier1Score:
         """Tier 1: Deterministic heuristics."""
         
         if not staged_files:
@@ -238,42 +398,35 @@ class CommitMessageSkill:
 
     def _categorize_files(self, files: List[str]) -> List[str]:
         """Determine file categories (src, docs, tests, etc.)."""
-        categories = set()
-        
-        for file_path in files:
-            path = Path(file_path)
-            
-            # Check extension-based rules
-            ext = path.suffix.lower()
-            if ext in ['.md', '.txt']:
-                categories.add('documentation')
-                continue
-            if ext in ['.yml', '.yaml', '.json']:
-                categories.add('config')
-                continue
-            
-            # Check directory-based rules
-            parts = path.parts
-            
-            if 'src' in parts:
-                categories.add('src')
-                continue
-            if 'tests' in parts:
-                categories.add('tests')
-                continue
-            if 'skills' in parts:
-                categories.add('skills')
-                continue
-            if 'docs' in parts or 'docs' == parts[0]:
-                categories.add('documentation')
-                continue
-            
-            # Fallback: treat as 'other'
-            categories.add('other')
-        
-        return sorted(list(categories))
+        return sorted({self._file_category(file_path) for file_path in files})
 
-    def _tier1_single_file(self, file_path: str, categories: List[str], diff: str) -> Tier1Score:
+    def _file_category(self, file_path: str) -> str:
+        """Category for a single path."""
+        path = Path(file_path)
+        
+        # Check extension-based rules
+        ext = path.suffix.lower()
+        if ext in ['.md', '.txt']:
+            return 'documentation'
+        if ext in ['.yml', '.yaml', '.json']:
+            return 'config'
+        
+        # Check directory-based rules
+        parts = path.parts
+        
+        if 'src' in parts:
+            return 'src'
+        if 'tests' in parts:
+            return 'tests'
+        if 'skills' in parts:
+            return 'skills'
+        if 'docs' in parts or (parts and 'docs' == parts[0]):
+            return 'documentation'
+        
+        # Fallback: treat as 'other'
+        return 'other'
+
+    def _tier1_single_file(self, file_path: str, categories: List[str], diff: DiffInput) -> Tier1Score:
         """Generate message for single-file change."""
         path = Path(file_path)
         ext = path.suffix.lower()
@@ -362,7 +515,7 @@ class CommitMessageSkill:
         )
 
     def _tier1_multiple_files_same_category(
-        self, files: List[str], category: str, diff: str
+        self, files: List[str], category: str, diff: DiffInput
     ) -> Tier1Score:
         """Generate message for multiple files in same category."""
         
@@ -387,26 +540,25 @@ class CommitMessageSkill:
             reasoning=f"{len(files)} files in {category}/",
         )
 
-    def _extract_action_from_diff(self, diff: str) -> Optional[str]:
+    def _extract_action_from_diff(self, diff: Optional[DiffInput]) -> Optional[str]:
         """Try to infer action verb from diff content."""
         
-        if not diff:
+        summary = self._summarize(diff) if diff is not None else None
+        if summary is None or summary.line_count == 0:
             return None
         
-        diff_lower = diff.lower()
-        
         # Simple heuristics
-        if '+' in diff and '-' not in diff:
+        if summary.has_plus and not summary.has_minus:
             return 'add'
-        if '-' in diff and '+' not in diff:
+        if summary.has_minus and not summary.has_plus:
             return 'remove'
-        if '+' in diff and '-' in diff:
+        if summary.has_plus and summary.has_minus:
             return 'update'
         
         # Based on keywords
-        if 'def ' in diff or 'class ' in diff:
+        if summary.has_def_or_class:
             return 'implement'
-        if 'raise ' in diff or 'error' in diff or 'exception' in diff:
+        if summary.has_error_keyword:
             return 'handle error'
         
         return None
@@ -419,61 +571,52 @@ class CommitMessageSkill:
             name = name[len(prefix):]
         return name.replace('_', ' ')
 
-    def _tier2_generate(self, staged_files: List[str], diff: str) -> CommitMessageResult:
+    def _tier2_prompt(self, staged_files: List[str], summary: Optional[DiffSummary]) -> str:
         """
-        Tier 2: Call Claude API to generate message.
-        
-        NOTE: This requires ANTHROPIC_API_KEY environment variable.
-        """
-        try:
-            import anthropic
-        except ImportError:
-            sys.stderr.write("Error: anthropic library not installed. Run: py -m pip install anthropic\n")
-            # Fallback to Tier 1 result
-            tier1 = self._tier1_generate(staged_files, diff)
-            return CommitMessageResult(
-                message=tier1.message,
-                approach_used=CommitApproach.TIER_1,
-                confidence=tier1.confidence,
-                cost_estimate=0.0,
-                reasoning=f"{tier1.reasoning} (Tier 2: anthropic library not installed, fallback to Tier 1)",
-                tier1_score=tier1,
-                cost_tracking=CostTracking(
-                    model=None,
-                    tokens_input=0,
-                    tokens_output=0,
-                    cost_usd=0.0,
-                ),
-            )
+        Build the compact Tier 2 prompt.
 
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
-            sys.stderr.write("Warning: ANTHROPIC_API_KEY not set. Falling back to Tier 1.\n")
-            tier1 = self._tier1_generate(staged_files, diff)
-            return CommitMessageResult(
-                message=tier1.message,
-                approach_used=CommitApproach.TIER_1,
-                confidence=tier1.confidence,
-                cost_estimate=0.0,
-                reasoning=f"{tier1.reasoning} (Tier 2: API key not set)",
-                tier1_score=tier1,
-                cost_tracking=CostTracking(
-                    model=None,
-                    tokens_input=0,
-                    tokens_output=0,
-                    cost_usd=0.0,
-                ),
+        Only the highest-churn files are listed individually; the rest of the
+        change is described by per-category totals and new symbols, followed
+        by the bounded diff excerpt.
+        """
+        lines: List[str] = []
+        if summary is not None and summary.files:
+            shown = summary.top_files(TIER2_MAX_FILES)
+            for stats in shown:
+                detail = "binary" if stats.binary else f"+{stats.added}/-{stats.removed}"
+                status = "" if stats.status == "modified" else f" [{stats.status}]"
+                lines.append(f"  - {stats.path} ({detail}){status}")
+            hidden = len(summary.files) - len(shown)
+        else:
+            lines.extend(f"  - {f}" for f in staged_files[:TIER2_MAX_FILES])
+            hidden = len(staged_files) - TIER2_MAX_FILES
+        if hidden > 0:
+            lines.append(f"  ... and {hidden} more")
+        files_list = '\n'.join(lines)
+
+        stats_block = ""
+        changes = ""
+        if summary is not None:
+            category_lines = [
+                f"  - {name or 'unknown'}: {bucket.files} files, +{bucket.added}/-{bucket.removed}"
+                for name, bucket in sorted(summary.categories.items())
+            ]
+            stats_block = (
+                f"\nSummary: {len(summary.files)} files, +{summary.added}/-{summary.removed} lines\n"
+                + '\n'.join(category_lines)
             )
+            if summary.new_symbols:
+                stats_block += f"\nNew definitions: {', '.join(summary.new_symbols)}"
+            stats_block += "\n"
+            changes = summary.excerpt
 
-        # Build prompt
-        files_list = '\n'.join(f"  - {f}" for f in staged_files)
-        prompt = f"""You are generating a git commit message using Conventional Commits format (https://www.conventionalcommits.org/).
+        return f"""You are generating a git commit message using Conventional Commits format (https://www.conventionalcommits.org/).
 
 Staged files:
 {files_list}
-
-Changes:
-{diff[:2000]}  # Truncate to 2000 chars
+{stats_block}
+Changes (excerpt):
+{changes}
 
 Generate a concise commit message following these rules:
 - Format: type(scope): subject
@@ -484,11 +627,76 @@ Generate a concise commit message following these rules:
 
 Output ONLY the commit message, no explanations or markdown formatting."""
 
-        model = self.config['tier2'].get('model', 'claude-3-5-sonnet-20241022')
+    def _tier2_generate(self, staged_files: List[str], diff: Optional[DiffInput]) -> CommitMessageResult:
+        """
+        Tier 2: Call Claude API to generate message.
+        
+        Identical requests (same staged files, diff content, model and prompt
+        version) are answered from the local response cache without an API
+        call.
+        
+        NOTE: This requires ANTHROPIC_API_KEY environment variable, unless
+        an ``llm_client`` was injected.
+        """
+        summary = self._summarize(diff) if diff is not None else None
+        model = self._tier2_model()
+        cache = self.response_cache
+        cache_key = self._tier2_cache_key(staged_files, summary)
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached, "Tier 2 response served from cache (identical staged diff)")
+
+        client = self.llm_client
+        if client is None:
+            try:
+                import anthropic
+            except ImportError:
+                sys.stderr.write("Error: anthropic library not installed. Run: py -m pip install anthropic\n")
+                # Fallback to Tier 1 result
+                tier1 = self._tier1_generate(staged_files, summary)
+                return CommitMessageResult(
+                    message=tier1.message,
+                    approach_used=CommitApproach.TIER_1,
+                    confidence=tier1.confidence,
+                    cost_estimate=0.0,
+                    reasoning=f"{tier1.reasoning} (Tier 2: anthropic library not installed, fallback to Tier 1)",
+                    tier1_score=tier1,
+                    cost_tracking=CostTracking(
+                        model=None,
+                        tokens_input=0,
+                        tokens_output=0,
+                        cost_usd=0.0,
+                    ),
+                )
+
+            api_key = os.getenv('ANTHROPIC_API_KEY')
+            if not api_key:
+                sys.stderr.write("Warning: ANTHROPIC_API_KEY not set. Falling back to Tier 1.\n")
+                tier1 = self._tier1_generate(staged_files, summary)
+                return CommitMessageResult(
+                    message=tier1.message,
+                    approach_used=CommitApproach.TIER_1,
+                    confidence=tier1.confidence,
+                    cost_estimate=0.0,
+                    reasoning=f"{tier1.reasoning} (Tier 2: API key not set)",
+                    tier1_score=tier1,
+                    cost_tracking=CostTracking(
+                        model=None,
+                        tokens_input=0,
+                        tokens_output=0,
+                        cost_usd=0.0,
+                    ),
+                )
+
+        # Build prompt
+        prompt = self._tier2_prompt(staged_files, summary)
+
         max_tokens = self.config['tier2'].get('max_tokens', 500)
 
         try:
-            client = anthropic.Anthropic(api_key=api_key)
+            if client is None:
+                client = anthropic.Anthropic(api_key=api_key)
             response = client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
@@ -521,6 +729,16 @@ Output ONLY the commit message, no explanations or markdown formatting."""
                 'cost_usd': cost_usd,
             })
             
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, CachedTier2Response(
+                    message=message,
+                    model=model,
+                    tokens_input=input_tokens,
+                    tokens_output=output_tokens,
+                    cost_usd=cost_usd,
+                    created_at=time.time(),
+                ))
+            
             return CommitMessageResult(
                 message=message,
                 approach_used=CommitApproach.TIER_2,
@@ -528,7 +746,7 @@ Output ONLY the commit message, no explanations or markdown formatting."""
                 cost_estimate=cost_usd,
                 reasoning=f"Tier 2 LLM called (Tier 1 confidence < threshold)",
                 tier1_score=None,
-                cost_tracking=CostTracking(
+                cost_tracking=self._cost_tracking(
                     model=model,
                     tokens_input=input_tokens,
                     tokens_output=output_tokens,
@@ -539,7 +757,7 @@ Output ONLY the commit message, no explanations or markdown formatting."""
         except Exception as e:
             sys.stderr.write(f"Error calling Tier 2 API: {e}\n")
             # Fallback to Tier 1
-            tier1 = self._tier1_generate(staged_files, diff)
+            tier1 = self._tier1_generate(staged_files, summary)
             return CommitMessageResult(
                 message=tier1.message,
                 approach_used=CommitApproach.TIER_1,
@@ -583,6 +801,11 @@ Examples:
         '--diff',
         help='Unified diff as string (optional)',
     )
+    parser.add_argument(
+        '--staged',
+        action='store_true',
+        help='Stream `git diff --cached` from the current repo (implies --staged-files)',
+    )
     parser.add_argument(
         '--user-message',
         help='User-provided commit message (Tier 3 override)',
@@ -611,9 +834,9 @@ Examples:
     args = parser.parse_args()
     
     # Validate arguments
-    if not args.staged_files and not args.user_message:
+    if not args.staged_files and not args.user_message and not args.staged:
         parser.print_help()
-        print("\nError: Must provide --staged-files or --user-message", file=sys.stderr)
+        print("\nError: Must provide --staged-files, --staged or --user-message", file=sys.stderr)
         sys.exit(1)
     
     try:
@@ -622,26 +845,34 @@ Examples:
         print(f"Error loading config: {e}", file=sys.stderr)
         sys.exit(1)
     
-    # Read diff if provided
+    # Summarize diff if provided (streamed; never read whole)
     diff = ""
+    summary = None
     if args.diff:
         diff = args.diff
     elif args.diff_file:
         try:
-            with open(args.diff_file, 'r') as f:
-                diff = f.read()
+            summary = summarize_diff_file(args.diff_file, categorize=skill._file_category)
         except IOError as e:
             print(f"Error reading diff file: {e}", file=sys.stderr)
             sys.exit(1)
     
     # Generate commit message
     try:
-        result = skill.generate(
-            staged_files=args.staged_files or [],
-            diff=diff,
-            user_message=args.user_message,
-            dry_run=args.dry_run,
-        )
+        if args.staged and not args.diff and not args.diff_file:
+            result = skill.generate_from_staged(
+                staged_files=args.staged_files,
+                user_message=args.user_message,
+                dry_run=args.dry_run,
+            )
+        else:
+            result = skill.generate(
+                staged_files=args.staged_files or [],
+                diff=diff,
+                user_message=args.user_message,
+                dry_run=args.dry_run,
+                diff_summary=summary,
+            )
     except Exception as e:
         print(f"Error generating message: {e}", file=sys.stderr)
         sys.exit(1)
@@ -660,6 +891,12 @@ Examples:
                 'input': result.cost_tracking.tokens_input,
                 'output': result.cost_tracking.tokens_output,
             }
+            output['cache'] = {
+                'hit': result.cost_tracking.cache_hit,
+                'hits': result.cost_tracking.cache_hits,
+                'misses': result.cost_tracking.cache_misses,
+                'saved_cost_usd': result.cost_tracking.saved_cost_usd,
+            }
         print(json.dumps(output, indent=2))
     else:
         print(f"Commit Message (Tier {result.approach_used.value[-1]}):")
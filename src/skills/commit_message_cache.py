@@ -0,0 +1,176 @@
+"""
+Local response cache for Tier 2 commit-message generation.
+
+Retrying a push with the same staged change (e.g. after a failed preflight)
+used to call the LLM again for an identical prompt. Responses are now kept
+in a small JSON file keyed by:
+
+    (staged file list, diff content hash, model, prompt template version)
+
+Entries expire after ``ttl_seconds`` and the least recently used entries are
+evicted beyond ``max_entries``. Hit/miss counts and the LLM spend avoided by
+hits are persisted with the entries so they accumulate across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CACHE_PATH = "data/commit_message_cache/tier2.json"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 256
+
+
+def tier2_cache_key(
+    staged_files: List[str],
+    diff_hash: str,
+    model: str,
+    prompt_version: int,
+) -> str:
+    """Stable key for one Tier 2 request."""
+    payload = json.dumps([list(staged_files), diff_hash, model, prompt_version], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedTier2Response:
+    """A stored Tier 2 answer and what it originally cost."""
+    message: str
+    model: str
+    tokens_input: int
+    tokens_output: int
+    cost_usd: float
+    created_at: float
+
+
+class Tier2ResponseCache:
+    """TTL + LRU bounded cache of Tier 2 responses, persisted as JSON."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock=time.time,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(0, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.saved_cost_usd = 0.0
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["Tier2ResponseCache"]:
+        """Build from the ``tier2.cache`` config section (None when disabled)."""
+        section = config.get('tier2', {}).get('cache', {}) or {}
+        if not section.get('enabled', True):
+            return None
+        return cls(
+            path=section.get('path', DEFAULT_CACHE_PATH),
+            ttl_seconds=float(section.get('ttl_seconds', DEFAULT_TTL_SECONDS)),
+            max_entries=int(section.get('max_entries', DEFAULT_MAX_ENTRIES)),
+        )
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict):
+            return
+        stats = payload.get("stats", {}) if isinstance(payload.get("stats"), dict) else {}
+        self.hits = int(stats.get("hits", 0))
+        self.misses = int(stats.get("misses", 0))
+        self.saved_cost_usd = float(stats.get("saved_cost_usd", 0.0))
+        for key, entry in payload.get("entries", []):
+            if isinstance(entry, dict) and not self._expired(entry):
+                self._entries[key] = entry
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "stats": {
+                        "hits": self.hits,
+                        "misses": self.misses,
+                        "saved_cost_usd": self.saved_cost_usd,
+                    },
+                    "entries": list(self._entries.items()),
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        if self.ttl_seconds <= 0:
+            return False
+        return self._clock() - float(entry.get("created_at", 0.0)) > self.ttl_seconds
+
+    def get(self, key: str, record: bool = True) -> Optional[CachedTier2Response]:
+        """
+        Return a live entry and mark it most recently used.
+
+        With ``record=False`` (dry-run previews) counters are left untouched.
+        Misses are only counted in memory; the next ``put`` or hit persists them.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                if record:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            response = CachedTier2Response(**entry)
+            if record:
+                self.hits += 1
+                self.saved_cost_usd += response.cost_usd
+                self._save_quietly()
+            return response
+
+    def put(self, key: str, response: CachedTier2Response) -> None:
+        """Store a response, evicting expired then least recently used entries."""
+        with self._lock:
+            self._entries[key] = {
+                "message": response.message,
+                "model": response.model,
+                "tokens_input": response.tokens_input,
+                "tokens_output": response.tokens_output,
+                "cost_usd": response.cost_usd,
+                "created_at": response.created_at,
+            }
+            self._entries.move_to_end(key)
+            for stale in [k for k, entry in self._entries.items() if self._expired(entry)]:
+                del self._entries[stale]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save_quietly()
+
+    def _save_quietly(self) -> None:
+        # The cache is an optimization; never fail message generation over it.
+        try:
+            self._save()
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
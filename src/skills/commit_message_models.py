@@ -47,6 +47,12 @@ class CostTracking:
     tokens_output: int = 0                  # Output tokens consumed
     cost_usd: float = 0.0                  # $ spent on this call
     
+    # Tier 2 response cache (see commit_message_cache.py)
+    cache_hit: bool = False                 # Served from the local cache?
+    cache_hits: int = 0                     # Cumulative cache hits
+    cache_misses: int = 0                   # Cumulative cache misses
+    saved_cost_usd: float = 0.0             # Cumulative $ avoided by hits
+    
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
@@ -83,8 +89,9 @@ class CommitMessageResult:
             assert self.tier1_score is not None, "Tier 1 should have scoring details"
         
         if self.approach_used == CommitApproach.TIER_2:
-            assert self.cost_estimate > 0.0, "Tier 2 should track cost > $0"
             assert self.cost_tracking is not None, "Tier 2 should have cost details"
+            assert self.cost_estimate > 0.0 or self.cost_tracking.cache_hit, \
+                "Tier 2 should track cost > $0 unless served from cache"
         
         if self.approach_used == CommitApproach.TIER_3:
             assert self.cost_estimate == 0.0, "Tier 3 override should have $0 cost"
@@ -48,6 +48,7 @@ from .config_resolver import (
 
 from .skill_loader import (
     SkillLoader,
+    LazySkill,
     SkillLoaderError,
     InterfaceValidationError
 )
@@ -91,6 +92,7 @@ __all__ = [
     
     # Loader
     'SkillLoader',
+    'LazySkill',
     'SkillLoaderError',
     'InterfaceValidationError'
 ]
@@ -3,10 +3,15 @@ config_resolver.py (Phase 3) - Configuration resolution
 
 Implements config source priority: hard-code -> .env -> Secrets
 Allows DAG to make runtime decisions about config sources.
+
+Registered, .env-file and secrets values are layered once into a flat
+snapshot with provenance; the snapshot is rebuilt when a value is
+registered or the .env/secrets file changes on disk.
 """
 
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 from enum import Enum
 import json
@@ -31,16 +36,29 @@ class ConfigResolver:
     4. Default values (lowest priority)
     
     Used by DAGExecutor to decide where to get config values.
+    
+    os.environ is always consulted live; every other source is served
+    from the snapshot. File mtimes are re-checked at most once per
+    file_check_interval seconds.
     """
     
-    def __init__(self):
-        """Initialize resolver."""
+    def __init__(self, file_check_interval: float = 1.0):
+        """
+        Initialize resolver.
+        
+        Args:
+            file_check_interval: Seconds between .env/secrets mtime checks
+        """
         self.hardcoded_config: Dict[str, Any] = {}
         self.env_config: Dict[str, Any] = {}
         self.secrets_config: Dict[str, Any] = {}
         self.default_config: Dict[str, Any] = {}
         self._secrets_file: Optional[Path] = None
         self._env_file: Optional[Path] = None
+        self.file_check_interval = file_check_interval
+        self._snapshot: Optional[Dict[str, Tuple[Any, ConfigSource, str]]] = None
+        self._file_mtimes: Dict[str, Optional[int]] = {"env": None, "secrets": None}
+        self._last_file_check = 0.0
     
     def set_secrets_file(self, path: str) -> None:
         """Set path to secrets file (JSON)."""
@@ -52,8 +70,21 @@ class ConfigResolver:
         self._env_file = Path(path)
         self._load_env_file()
     
+    @staticmethod
+    def _mtime(path: Optional[Path]) -> Optional[int]:
+        """Return file mtime in ns, or None if missing."""
+        if not path:
+            return None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
     def _load_env_file(self) -> None:
         """Load environment variables from .env file."""
+        self._snapshot = None
+        self._file_mtimes["env"] = self._mtime(self._env_file)
+        self.env_config = {}
         if not self._env_file or not self._env_file.exists():
             return
         
@@ -72,6 +103,9 @@ class ConfigResolver:
     
     def _load_secrets(self) -> None:
         """Load secrets from JSON file."""
+        self._snapshot = None
+        self._file_mtimes["secrets"] = self._mtime(self._secrets_file)
+        self.secrets_config = {}
         if not self._secrets_file or not self._secrets_file.exists():
             return
         
@@ -84,18 +118,74 @@ class ConfigResolver:
     def register_hardcoded(self, key: str, value: Any) -> None:
         """Register hard-coded configuration value."""
         self.hardcoded_config[key] = value
+        self._snapshot = None
     
     def register_hardcoded_batch(self, config: Dict[str, Any]) -> None:
         """Register batch of hard-coded values."""
         self.hardcoded_config.update(config)
+        self._snapshot = None
     
     def register_default(self, key: str, value: Any) -> None:
         """Register default configuration value."""
         self.default_config[key] = value
+        self._snapshot = None
     
     def register_defaults_batch(self, config: Dict[str, Any]) -> None:
         """Register batch of default values."""
         self.default_config.update(config)
+        self._snapshot = None
+    
+    def invalidate(self) -> None:
+        """Drop the resolved snapshot (e.g. after editing config dicts directly)."""
+        self._snapshot = None
+    
+    def _refresh_files(self) -> None:
+        """Reload .env/secrets files whose mtime changed."""
+        now = time.monotonic()
+        if now - self._last_file_check < self.file_check_interval:
+            return
+        self._last_file_check = now
+        
+        if self._env_file and self._mtime(self._env_file) != self._file_mtimes["env"]:
+            self._load_env_file()
+        if self._secrets_file and self._mtime(self._secrets_file) != self._file_mtimes["secrets"]:
+            self._load_secrets()
+    
+    def _resolved(self) -> Dict[str, Tuple[Any, ConfigSource, str]]:
+        """
+        Get flat snapshot of non-os.environ sources.
+        
+        Returns:
+            {key: (value, source, origin)} where origin is one of
+            hardcoded/env_file/secrets/default
+        """
+        self._refresh_files()
+        if self._snapshot is not None:
+            return self._snapshot
+        
+        snapshot: Dict[str, Tuple[Any, ConfigSource, str]] = {}
+        layers = (
+            (self.default_config, ConfigSource.DEFAULT, "default"),
+            (self.secrets_config, ConfigSource.SECRETS, "secrets"),
+            (self.env_config, ConfigSource.ENV, "env_file"),
+            (self.hardcoded_config, ConfigSource.HARDCODED, "hardcoded"),
+        )
+        # Lowest priority first so higher layers overwrite
+        for config, source, origin in layers:
+            for key, value in config.items():
+                snapshot[key] = (value, source, origin)
+        
+        self._snapshot = snapshot
+        return snapshot
+    
+    def _lookup(self, key: str) -> Optional[Tuple[Any, ConfigSource, str]]:
+        """Resolve key against snapshot and os.environ in priority order."""
+        entry = self._resolved().get(key)
+        if entry is not None and entry[2] in ("hardcoded", "env_file"):
+            return entry
+        if key in os.environ:
+            return os.environ[key], ConfigSource.ENV, "os_environ"
+        return entry
     
     def get(
         self,
@@ -117,24 +207,9 @@ class ConfigResolver:
         Raises:
             KeyError: If required=True and key not found
         """
-        # Check priorities in order
-        if key in self.hardcoded_config:
-            return self.hardcoded_config[key]
-        
-        # Check environment (both .env and os.environ)
-        if key in self.env_config:
-            return self.env_config[key]
-        
-        if key in os.environ:
-            return os.environ[key]
-        
-        # Check secrets
-        if key in self.secrets_config:
-            return self.secrets_config[key]
-        
-        # Check defaults
-        if key in self.default_config:
-            return self.default_config[key]
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry[0]
         
         # Not found
         if required:
@@ -142,6 +217,20 @@ class ConfigResolver:
         
         return default
     
+    def get_many(self, prefix: str) -> Dict[str, Any]:
+        """
+        Get all configuration values whose key starts with prefix.
+        
+        Args:
+            prefix: Key prefix (e.g. "GITHUB_API_")
+        
+        Returns:
+            {key: value} resolved with normal priority
+        """
+        keys = {k for k in self._resolved() if k.startswith(prefix)}
+        keys.update(k for k in os.environ if k.startswith(prefix))
+        return {key: self._lookup(key)[0] for key in sorted(keys)}
+    
     def get_source(self, key: str) -> Optional[ConfigSource]:
         """
         Get the source of a configuration value.
@@ -152,15 +241,8 @@ class ConfigResolver:
         Returns:
             ConfigSource enum indicating where value came from, or None if not found
         """
-        if key in self.hardcoded_config:
-            return ConfigSource.HARDCODED
-        if key in self.env_config or key in os.environ:
-            return ConfigSource.ENV
-        if key in self.secrets_config:
-            return ConfigSource.SECRETS
-        if key in self.default_config:
-            return ConfigSource.DEFAULT
-        return None
+        entry = self._lookup(key)
+        return entry[1] if entry is not None else None
     
     def get_with_source(self, key: str, default: Optional[Any] = None) -> tuple[Any, Optional[ConfigSource]]:
         """
@@ -173,18 +255,15 @@ class ConfigResolver:
         Returns:
             (value, source) tuple
         """
-        value = self.get(key, default)
-        source = self.get_source(key)
-        return value, source
+        entry = self._lookup(key)
+        if entry is None:
+            return default, None
+        return entry[0], entry[1]
     
     def get_all_keys(self) -> list[str]:
         """Get all registered configuration keys."""
-        keys = set()
-        keys.update(self.hardcoded_config.keys())
-        keys.update(self.env_config.keys())
+        keys = set(self._resolved().keys())
         keys.update(os.environ.keys())
-        keys.update(self.secrets_config.keys())
-        keys.update(self.default_config.keys())
         return sorted(list(keys))
     
     def debug_config(self, key: Optional[str] = None) -> Dict[str, Any]:
@@ -198,13 +277,16 @@ class ConfigResolver:
             Debug information
         """
         if key:
+            entry = self._lookup(key)
             return {
                 "key": key,
-                "value": self.get(key),
-                "source": self.get_source(key),
+                "value": entry[0] if entry else None,
+                "source": entry[1] if entry else None,
+                "origin": entry[2] if entry else None,
                 "sources_checked": self._get_sources_for_key(key)
             }
         
+        self._refresh_files()
         return {
             "hardcoded_keys": list(self.hardcoded_config.keys()),
             "env_keys": list(self.env_config.keys()),
@@ -231,6 +313,19 @@ class SkillConfigResolver(ConfigResolver):
     Provides convenience methods for common skill configuration patterns.
     """
     
+    def get_skill_config_all(self, skill_name: str) -> Dict[str, Any]:
+        """
+        Get all configuration for a skill in one pass.
+        
+        Example: get_skill_config_all("github_api")
+                 returns {"token": ..., "url": ...} for GITHUB_API_* keys
+        """
+        prefix = f"{skill_name.upper()}_"
+        return {
+            key[len(prefix):].lower(): value
+            for key, value in self.get_many(prefix).items()
+        }
+    
     def get_skill_config(self, skill_name: str, key: str, default: Optional[Any] = None) -> Any:
         """
         Get skill-specific configuration.
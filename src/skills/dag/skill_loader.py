@@ -3,13 +3,21 @@ skill_loader.py (Phase 3) - Skill loader with interface validation
 
 Loads skills dynamically from entry_point paths and validates they
 implement the SkillBase interface correctly.
+
+Skills can also be loaded lazily: load_lazy() returns a LazySkill proxy
+that defers the module import until the DAG actually executes it, so cold
+start for large DAGs is bounded by the skills that run.
 """
 
 import importlib.util
 import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Type
 
+from .execution_models import ExecutionContext, SkillResult
 from .skill_base import SkillBase, SkillInterfaceVersion
 from ..registry.registry_models import SkillMetadata
 
@@ -24,6 +32,60 @@ class InterfaceValidationError(Exception):
     pass
 
 
+class LazySkill(SkillBase):
+    """
+    Proxy for a registry skill whose module is imported on first use.
+    
+    Name and version come from metadata, so the proxy can be added to a
+    SkillDAG and ordered without touching the entry_point file. The real
+    skill is resolved through the owning SkillLoader on execute() or
+    validate_inputs().
+    """
+    
+    def __init__(
+        self,
+        metadata: SkillMetadata,
+        loader: "SkillLoader",
+        root_dir: str = ""
+    ):
+        """
+        Initialize lazy proxy.
+        
+        Args:
+            metadata: SkillMetadata with entry_point
+            loader: SkillLoader used to resolve the real skill
+            root_dir: Root directory for relative paths
+        """
+        super().__init__(skill_name=metadata.name, skill_version=metadata.version)
+        self._metadata = metadata
+        self._loader = loader
+        self._root_dir = root_dir
+        self._entry_point = metadata.entry_point
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying skill module has been imported."""
+        return self._loader.is_loaded(self._metadata)
+    
+    def resolve(self) -> SkillBase:
+        """Import (if needed) and return the real skill instance."""
+        return self._loader.load(self._metadata, self._root_dir)
+    
+    def description(self) -> str:
+        """Use registry description when available to avoid an import."""
+        if self._metadata.description:
+            return self._metadata.description
+        return self.resolve().description()
+    
+    def validate_inputs(self, inputs: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+        """Delegate input validation to the real skill."""
+        return self.resolve().validate_inputs(inputs)
+    
+    def execute(self, context: ExecutionContext) -> SkillResult:
+        """Delegate execution to the real skill."""
+        return self.resolve().execute(context)
+
+
 class SkillLoader:
     """
     Loads skills from entry_point files and validates interface.
@@ -36,6 +98,10 @@ class SkillLoader:
         errors = loader.validate(skill)
         if errors:
             print(f"Validation errors: {errors}")
+        
+        # Or defer the import until the DAG executes the skill
+        lazy = loader.load_lazy(metadata, root_dir="/path/to/project")
+        print(loader.get_import_times())
     """
     
     # List of required abstract methods that must be implemented
@@ -49,6 +115,10 @@ class SkillLoader:
         """Initialize skill loader."""
         self._loaded_skills: Dict[str, SkillBase] = {}
         self._validation_cache: Dict[str, list[str]] = {}
+        # (entry_point, mtime_ns, size) -> (skill class, interface errors)
+        self._class_cache: Dict[tuple[str, int, int], tuple[Type[SkillBase], list[str]]] = {}
+        self._import_times: Dict[str, float] = {}  # skill_name -> import ms
+        self._lock = threading.Lock()
     
     def load(
         self,
@@ -86,19 +156,32 @@ class SkillLoader:
             if not path.exists():
                 raise SkillLoaderError(f"Entry point file not found: {path}")
             
-            # Load module
-            module = self._load_module(path)
-            
-            # Find SkillBase subclass
-            skill_class = self._find_skill_class(module)
-            
-            if not skill_class:
-                raise SkillLoaderError(
-                    f"No SkillBase subclass found in {path}"
-                )
+            # Reuse the imported class while the file is unchanged
+            stat = path.stat()
+            signature = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+            start = time.perf_counter()
+            cached = self._class_cache.get(signature)
+            if cached is None:
+                module = self._load_module(path)
+                
+                # Find SkillBase subclass
+                skill_class = self._find_skill_class(module)
+                with self._lock:
+                    self._import_times[metadata.name] = (time.perf_counter() - start) * 1000
+                
+                if not skill_class:
+                    raise SkillLoaderError(
+                        f"No SkillBase subclass found in {path}"
+                    )
+                
+                errors = self._validate_interface(skill_class)
+                with self._lock:
+                    self._class_cache[signature] = (skill_class, errors)
+            else:
+                skill_class, errors = cached
+                with self._lock:
+                    self._import_times[metadata.name] = (time.perf_counter() - start) * 1000
             
-            # Validate interface
-            errors = self._validate_interface(skill_class)
             if errors:
                 self._validation_cache[cache_key] = errors
                 error_msg = "\n".join(f"  - {e}" for e in errors)
@@ -113,7 +196,8 @@ class SkillLoader:
             )
             
             # Cache
-            self._loaded_skills[cache_key] = instance
+            with self._lock:
+                instance = self._loaded_skills.setdefault(cache_key, instance)
             
             return instance
         
@@ -125,6 +209,66 @@ class SkillLoader:
                 f"Failed to load skill {metadata.name}: {e}"
             ) from e
     
+    def load_lazy(
+        self,
+        metadata: SkillMetadata,
+        root_dir: str = ""
+    ) -> LazySkill:
+        """
+        Return a proxy that imports the skill on first execution.
+        
+        Args:
+            metadata: SkillMetadata with entry_point
+            root_dir: Root directory for relative paths
+        
+        Returns:
+            LazySkill proxy (already-loaded skills resolve immediately)
+        
+        Raises:
+            SkillLoaderError: If metadata has no entry_point
+        """
+        if not metadata.entry_point:
+            raise SkillLoaderError(f"No entry_point for {metadata.name}")
+        return LazySkill(metadata, self, root_dir)
+    
+    def is_loaded(self, metadata: SkillMetadata) -> bool:
+        """Check whether a skill has already been imported and instantiated."""
+        return f"{metadata.name}:{metadata.version}" in self._loaded_skills
+    
+    def preload(
+        self,
+        metadata_list: list[SkillMetadata],
+        root_dir: str = "",
+        max_workers: int = 4
+    ) -> Dict[str, str]:
+        """
+        Import skills concurrently ahead of execution.
+        
+        Args:
+            metadata_list: List of SkillMetadata
+            root_dir: Root directory for relative paths
+            max_workers: Thread pool size
+        
+        Returns:
+            {skill_name: error} for skills that failed to load
+        """
+        failures: Dict[str, str] = {}
+        if not metadata_list:
+            return failures
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                pool.submit(self.load, metadata, root_dir): metadata
+                for metadata in metadata_list
+            }
+            for future, metadata in futures.items():
+                try:
+                    future.result()
+                except (SkillLoaderError, InterfaceValidationError) as e:
+                    failures[metadata.name] = str(e)
+        
+        return failures
+    
     def _load_module(self, path: Path) -> Any:
         """Load Python module from path."""
         spec = importlib.util.spec_from_file_location(path.stem, path)
@@ -255,7 +399,9 @@ class SkillLoader:
     def load_from_metadata_batch(
         self,
         metadata_list: list[SkillMetadata],
-        root_dir: str = ""
+        root_dir: str = "",
+        lazy: bool = False,
+        preload_workers: int = 0
     ) -> Dict[str, SkillBase]:
         """
         Load multiple skills from metadata.
@@ -263,13 +409,30 @@ class SkillLoader:
         Args:
             metadata_list: List of SkillMetadata
             root_dir: Root directory for relative paths
+            lazy: Return LazySkill proxies instead of importing now
+            preload_workers: If > 0, import in a thread pool of this size first
         
         Returns:
             {skill_name: SkillBase} for all successfully loaded skills
         """
         results = {}
         
+        if lazy:
+            for metadata in metadata_list:
+                try:
+                    results[metadata.name] = self.load_lazy(metadata, root_dir)
+                except SkillLoaderError as e:
+                    print(f"[WARN] Failed to load {metadata.name}: {e}")
+            return results
+        
+        failures: Dict[str, str] = {}
+        if preload_workers > 0:
+            failures = self.preload(metadata_list, root_dir, max_workers=preload_workers)
+        
         for metadata in metadata_list:
+            if metadata.name in failures:
+                print(f"[WARN] Failed to load {metadata.name}: {failures[metadata.name]}")
+                continue
             try:
                 skill = self.load(metadata, root_dir)
                 results[metadata.name] = skill
@@ -282,11 +445,17 @@ class SkillLoader:
         """Clear loaded skills cache."""
         self._loaded_skills.clear()
         self._validation_cache.clear()
+        self._class_cache.clear()
+        self._import_times.clear()
     
     def get_loaded_skills(self) -> Dict[str, SkillBase]:
         """Get all loaded skills."""
         return self._loaded_skills.copy()
     
+    def get_import_times(self) -> Dict[str, float]:
+        """Get per-skill import time in milliseconds."""
+        return self._import_times.copy()
+    
     def get_validation_errors(self, skill_name: str) -> Optional[list[str]]:
         """Get cached validation errors for skill."""
         return self._validation_cache.get(skill_name)
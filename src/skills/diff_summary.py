@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+diff_summary.py
+
+Single-pass, bounded-memory summary of a unified diff.
+
+A DiffSummary is built by streaming diff lines (from a string, a file or
+`git diff --cached`) once. It keeps per-file stats (added/removed lines,
+new defs/classes), per-category totals and a short excerpt, so commit
+message generation never needs the full diff text in memory no matter how
+large the changeset is.
+
+Memory grows with the number of files, not with the size of the diff:
+symbol names and the excerpt are capped. A SHA-256 of the normalized diff
+text (lines joined with "\n") is computed on the fly so callers can key
+caches on diff content without keeping it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@")
+_NEW_SYMBOL = re.compile(r"^\+\s*(?:async\s+)?(def|class)\s+([A-Za-z_][A-Za-z0-9_]*)")
+_ERROR_KEYWORDS = ("raise ", "error", "exception")
+
+DEFAULT_EXCERPT_CHARS = 2000
+DEFAULT_MAX_SYMBOLS = 30
+STAGED_DIFF_COMMAND = ("git", "diff", "--cached", "--no-color", "--no-ext-diff")
+
+
+@dataclass
+class FileDiffStats:
+    """Per-file counters collected while streaming a diff."""
+    path: str
+    status: str = "modified"                 # modified|added|deleted|renamed
+    category: str = ""
+    added: int = 0
+    removed: int = 0
+    new_defs: int = 0
+    new_classes: int = 0
+    binary: bool = False
+
+    @property
+    def churn(self) -> int:
+        return self.added + self.removed
+
+
+@dataclass
+class CategoryStats:
+    files: int = 0
+    added: int = 0
+    removed: int = 0
+
+
+@dataclass
+class DiffSummary:
+    """Aggregated view of a unified diff."""
+    files: List[FileDiffStats] = field(default_factory=list)
+    categories: Dict[str, CategoryStats] = field(default_factory=dict)
+    line_count: int = 0
+    added: int = 0
+    removed: int = 0
+    new_symbols: List[str] = field(default_factory=list)
+    excerpt: str = ""
+    content_hash: str = ""
+    # Raw substring flags, matching checks made against the whole diff text.
+    has_plus: bool = False
+    has_minus: bool = False
+    has_def_or_class: bool = False
+    has_error_keyword: bool = False
+
+    @property
+    def paths(self) -> List[str]:
+        return [stats.path for stats in self.files]
+
+    def top_files(self, limit: int) -> List[FileDiffStats]:
+        """Files with the most changed lines first (stable for ties)."""
+        return sorted(self.files, key=lambda stats: stats.churn, reverse=True)[:limit]
+
+
+class DiffSummarizer:
+    """Incremental unified-diff parser; feed lines, then read ``summary``."""
+
+    def __init__(
+        self,
+        categorize: Optional[Callable[[str], str]] = None,
+        excerpt_chars: int = DEFAULT_EXCERPT_CHARS,
+        max_symbols: int = DEFAULT_MAX_SYMBOLS,
+    ):
+        self.categorize = categorize
+        self.excerpt_chars = excerpt_chars
+        self.max_symbols = max_symbols
+        self.summary = DiffSummary()
+        self._excerpt_parts: List[str] = []
+        self._excerpt_len = 0
+        self._hasher = hashlib.sha256()
+        self._current: Optional[FileDiffStats] = None
+        self._current_has_hunks = False
+        self._old_remaining = 0
+        self._new_remaining = 0
+
+    # -- file bookkeeping ---------------------------------------------------
+
+    def _start_file(self, path: str) -> FileDiffStats:
+        self._finish_file()
+        self._current = FileDiffStats(path=path)
+        self._current_has_hunks = False
+        return self._current
+
+    def _finish_file(self) -> None:
+        current = self._current
+        if current is None:
+            return
+        current.category = self.categorize(current.path) if self.categorize else ""
+        self.summary.files.append(current)
+        bucket = self.summary.categories.setdefault(current.category, CategoryStats())
+        bucket.files += 1
+        bucket.added += current.added
+        bucket.removed += current.removed
+        self._current = None
+
+    @staticmethod
+    def _strip_prefix(path: str) -> str:
+        path = path.strip().split("\t", 1)[0]
+        if path.startswith(("a/", "b/")):
+            return path[2:]
+        return path
+
+    # -- streaming ----------------------------------------------------------
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip("\r\n")
+        summary = self.summary
+        summary.line_count += 1
+        self._hasher.update(line.encode("utf-8", "surrogatepass") + b"\n")
+
+        if self._excerpt_len < self.excerpt_chars:
+            take = line[: self.excerpt_chars - self._excerpt_len]
+            self._excerpt_parts.append(take)
+            self._excerpt_len += len(take) + 1
+
+        if not summary.has_plus and "+" in line:
+            summary.has_plus = True
+        if not summary.has_minus and "-" in line:
+            summary.has_minus = True
+        if not summary.has_def_or_class and ("def " in line or "class " in line):
+            summary.has_def_or_class = True
+        if not summary.has_error_keyword and any(word in line for word in _ERROR_KEYWORDS):
+            summary.has_error_keyword = True
+
+        if self._old_remaining > 0 or self._new_remaining > 0:
+            self._feed_hunk_line(line)
+            return
+        self._feed_header_line(line)
+
+    def _feed_hunk_line(self, line: str) -> None:
+        current = self._current
+        marker = line[:1]
+        if marker == "+":
+            self._new_remaining -= 1
+            self.summary.added += 1
+            if current is not None:
+                current.added += 1
+                symbol = _NEW_SYMBOL.match(line)
+                if symbol:
+                    if symbol.group(1) == "def":
+                        current.new_defs += 1
+                    else:
+                        current.new_classes += 1
+                    if len(self.summary.new_symbols) < self.max_symbols:
+                        self.summary.new_symbols.append(f"{symbol.group(1)} {symbol.group(2)}")
+        elif marker == "-":
+            self._old_remaining -= 1
+            self.summary.removed += 1
+            if current is not None:
+                current.removed += 1
+        elif marker == "\\":
+            pass  # "\ No newline at end of file"
+        else:
+            self._old_remaining -= 1
+            self._new_remaining -= 1
+
+    def _feed_header_line(self, line: str) -> None:
+        if line.startswith("diff --git "):
+            rest = line[len("diff --git "):]
+            split_at = rest.rfind(" b/")
+            self._start_file(self._strip_prefix(rest[split_at + 1:] if split_at >= 0 else rest))
+            return
+
+        if line.startswith("@@"):
+            header = _HUNK_HEADER.match(line)
+            if header:
+                self._old_remaining = int(header.group(1)) if header.group(1) is not None else 1
+                self._new_remaining = int(header.group(2)) if header.group(2) is not None else 1
+                if self._current is None:
+                    self._start_file("")
+                self._current_has_hunks = True
+            return
+
+        if line.startswith("--- "):
+            old_path = line[4:].strip()
+            if self._current is None or self._current_has_hunks:
+                self._start_file(self._strip_prefix(old_path))
+            elif old_path == "/dev/null":
+                self._current.status = "added"
+            return
+
+        if line.startswith("+++ "):
+            new_path = line[4:].strip()
+            if self._current is None:
+                self._start_file("")
+            if new_path == "/dev/null":
+                self._current.status = "deleted"
+            else:
+                self._current.path = self._strip_prefix(new_path)
+            return
+
+        current = self._current
+        if current is None:
+            return
+        if line.startswith("new file mode"):
+            current.status = "added"
+        elif line.startswith("deleted file mode"):
+            current.status = "deleted"
+        elif line.startswith("rename to "):
+            current.status = "renamed"
+            current.path = line[len("rename to "):].strip()
+        elif line.startswith("Binary files ") or line == "GIT binary patch":
+            current.binary = True
+
+    def feed_lines(self, lines: Iterable[str]) -> "DiffSummarizer":
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def finish(self) -> DiffSummary:
+        self._finish_file()
+        self.summary.excerpt = "\n".join(self._excerpt_parts)[: self.excerpt_chars]
+        self.summary.content_hash = self._hasher.hexdigest()
+        return self.summary
+
+
+def summarize_diff_lines(
+    lines: Iterable[str],
+    categorize: Optional[Callable[[str], str]] = None,
+    excerpt_chars: int = DEFAULT_EXCERPT_CHARS,
+    max_symbols: int = DEFAULT_MAX_SYMBOLS,
+) -> DiffSummary:
+    """Summarize a diff from any line iterable in one pass."""
+    return DiffSummarizer(categorize, excerpt_chars, max_symbols).feed_lines(lines).finish()
+
+
+def summarize_diff_text(diff: str, categorize: Optional[Callable[[str], str]] = None) -> DiffSummary:
+    """Summarize an in-memory diff string."""
+    return summarize_diff_lines(_iter_lines(diff), categorize)
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _decode_lines(handle: Iterable[bytes]) -> Iterator[str]:
+    # Binary iteration splits on b"\n" only (text mode also splits on a lone
+    # "\r", even with newline=""), matching _iter_lines and summarize_diff_text.
+    for raw in handle:
+        yield raw.decode("utf-8", "replace")
+
+
+def summarize_diff_file(path: str | Path, categorize: Optional[Callable[[str], str]] = None) -> DiffSummary:
+    """Summarize a patch file without reading it into memory."""
+    with open(path, "rb") as handle:
+        return summarize_diff_lines(_decode_lines(handle), categorize)
+
+
+def summarize_staged_diff(
+    repo_path: str | Path = ".",
+    categorize: Optional[Callable[[str], str]] = None,
+    timeout: int = 120,
+) -> DiffSummary:
+    """Stream ``git diff --cached`` through the summarizer.
+
+    stderr goes to a temporary file so a chatty git cannot stall on a full
+    pipe, and a watchdog kills git if the whole read takes over ``timeout``
+    seconds.
+
+    Raises:
+        subprocess.TimeoutExpired: when git runs longer than ``timeout``.
+        RuntimeError: when git exits non-zero.
+    """
+    command = list(STAGED_DIFF_COMMAND)
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            command,
+            cwd=str(repo_path),
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        )
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, _kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            assert process.stdout is not None
+            with process.stdout:
+                summary = summarize_diff_lines(_decode_lines(process.stdout), categorize)
+            process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", "replace")
+            raise RuntimeError(f"git diff --cached failed: {stderr.strip()}")
+    return summary
@@ -27,13 +27,13 @@ from typing import Optional, Dict, Any
 import subprocess
 import json
 import sys
-import re
 import uuid
 import os
 
 from src.skills.auth_validator import AuthValidator
 from src.skills.commit_message import CommitMessageSkill
 from src.skills.executor import SRCGEEEExecutor, ComposedAction
+from src.skills.intent_router import get_router
 from src.skills.rules_engine import evaluate as evaluate_rules
 from src.skills.telemetry_logger import TelemetryLogger
 from src.skills.telemetry_logger_models import TelemetryEntry
@@ -453,38 +453,16 @@ def _match_push_prompt(prompt: str) -> bool:
     NOTE: This is a static-regex approximation of the SRCGEEE Sense phase.
     The real solution is a PPA orchestrator that does a NN query over the
     skill embedding space and routes to this skill without any regex.
-    Patterns here are deliberately broad to cover natural-language variants
+    Patterns are deliberately broad to cover natural-language variants
     until that orchestrator exists.
+
+    Patterns live in config/intent-routes.yaml (router: git_push_autonomous).
     """
-    normalized = (prompt or "").strip().lower()
-    if not normalized:
-        return False
-
-    patterns = (
-        # Explicit git push phrases
-        r"\bgit\s+push\b",
-        r"\bdo\s+a\s+(git\s+)?push\b",
-        # "push [the] [all] [my] [latest/current/recent] [changes/commits/code/stuff/work/files/everything/it]"
-        r"\bpush\b.{0,30}\b(changes?|commits?|code|stuff|work|files?|everything|latest|current|recent|all|it)\b",
-        # "push [everything/all/it] to [the] [repo/remote/github/origin]"
-        r"\bpush\b.{0,20}\bto\b.{0,20}\b(repo|remote|github|origin|upstream)\b",
-        # commit and push / stage and push / save and push
-        r"\b(commit|stage|save)\s+and\s+push\b",
-        # "upload/sync/send [my] changes/commits"
-        r"\b(upload|sync|send)\b.{0,20}\b(changes?|commits?|updates?)\b",
-        # "push to repo/github/remote/origin" (without intervening object noun)
-        r"\bpush\s+(to\s+)?(the\s+)?(repo|remote|github|origin|upstream)\b",
-        # gpush / git-push as a keyword
-        r"\bgpush\b",
-    )
-    return any(re.search(pattern, normalized) for pattern in patterns)
+    return get_router("git_push_autonomous").matches(prompt, "git_push")
 
 
-def _stage_and_commit(
-    repo_path: Path,
-    commit_message: str,
-) -> Dict[str, Any]:
-    """Stage all changes and commit when there is staged content."""
+def _stage_all(repo_path: Path) -> Optional[Dict[str, Any]]:
+    """Stage all changes; return a failed commit result when git add fails."""
     add_proc = _run_git(repo_path, ["add", "-A"], timeout=20)
     if add_proc.returncode != 0:
         return {
@@ -492,6 +470,19 @@ def _stage_and_commit(
             "committed": False,
             "error": f"git add failed: {add_proc.stderr.strip()}",
         }
+    return None
+
+
+def _stage_and_commit(
+    repo_path: Path,
+    commit_message: str,
+    already_staged: bool = False,
+) -> Dict[str, Any]:
+    """Stage all changes (unless the caller just did) and commit when there is staged content."""
+    if not already_staged:
+        add_error = _stage_all(repo_path)
+        if add_error is not None:
+            return add_error
 
     staged_proc = _run_git(repo_path, ["diff", "--cached", "--name-only"], timeout=10)
     if staged_proc.returncode != 0:
@@ -652,9 +643,19 @@ def execute(input_data: dict) -> dict:
 
         if changed_files:
             message = input_data.get("message")
+            staged = False
             if not message:
+                # Stage first so the generator sees the real diff (and keys its
+                # Tier 2 cache on diff content, not just file names).
+                add_error = _stage_all(repo_path)
+                if add_error is not None:
+                    result["errors"].append(add_error["error"])
+                    result["commit"] = {**commit_result, **add_error}
+                    _log("ERROR", "Commit step failed", {"commit": result["commit"]})
+                    return result
+                staged = True
                 commit_skill = CommitMessageSkill(config_path=commit_strategy_path)
-                generated = commit_skill.generate(staged_files=changed_files)
+                generated = commit_skill.generate_from_staged(str(repo_path), staged_files=changed_files)
                 message = generated.message
                 commit_result["generator"] = {
                     "approach": str(generated.approach_used.value),
@@ -664,7 +665,7 @@ def execute(input_data: dict) -> dict:
             commit_result["message"] = message
             commit_result = {
                 **commit_result,
-                **_stage_and_commit(repo_path=repo_path, commit_message=message),
+                **_stage_and_commit(repo_path=repo_path, commit_message=message, already_staged=staged),
             }
 
             if not commit_result.get("success", False):
@@ -0,0 +1,225 @@
+"""Data-driven prompt -> intent routing with a combined compiled pattern.
+
+Routes are read from config/intent-routes.yaml. Every intent's patterns are
+compiled into one expression per router: each intent becomes a named
+lookahead group anchored at the start of the prompt, so a single ``match``
+call reports every intent that would have matched a sequential
+``re.search`` loop. The first intent in config order wins, preserving the
+priority semantics of the original hand-written tuples.
+
+Patterns must not use numbered backreferences, since groups are renumbered
+when combined.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+import yaml
+
+DEFAULT_ROUTES_PATH = Path(__file__).resolve().parents[2] / "config" / "intent-routes.yaml"
+UNKNOWN_INTENT = "unknown"
+
+
+class IntentRouterError(ValueError):
+    """Raised when intent routes are missing or malformed."""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt the same way the routing patterns expect."""
+    return (prompt or "").strip().lower()
+
+
+class IntentRouter:
+    """Route normalized prompts to the first matching configured intent."""
+
+    def __init__(
+        self,
+        routes: Sequence[tuple[str, Sequence[str]]],
+        cache_size: int = 4096,
+    ):
+        self.intents: list[str] = []
+        self.routes: list[tuple[str, list[str]]] = []
+        self._group_to_intent: dict[str, str] = {}
+        branches: list[str] = []
+
+        for index, (intent, patterns) in enumerate(routes):
+            if not intent:
+                raise IntentRouterError(f"Route {index} has no intent name")
+            valid = [str(p) for p in patterns if str(p)]
+            if not valid:
+                continue
+            for pattern in valid:
+                try:
+                    re.compile(pattern)
+                except re.error as exc:
+                    raise IntentRouterError(f"Invalid pattern for intent '{intent}': {pattern} ({exc})") from exc
+            group = f"intent_{index}"
+            self.intents.append(intent)
+            self.routes.append((intent, valid))
+            self._group_to_intent[group] = intent
+            alternation = "|".join(f"(?:{p})" for p in valid)
+            branches.append(rf"(?=[\s\S]*?(?P<{group}>{alternation}))?")
+
+        self._groups = list(self._group_to_intent)
+        self._pattern = re.compile("".join(branches)) if branches else None
+        self.cache_size = max(0, cache_size)
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        router: str,
+        path: Optional[str | Path] = None,
+        cache_size: int = 4096,
+    ) -> "IntentRouter":
+        """Build a router from a named section of intent-routes.yaml."""
+        routes_path = Path(path) if path else DEFAULT_ROUTES_PATH
+        if not routes_path.exists():
+            raise IntentRouterError(f"Intent routes file not found: {routes_path}")
+
+        with open(routes_path, "r", encoding="utf-8") as handle:
+            data = yaml.safe_load(handle) or {}
+
+        routers = data.get("routers", {}) if isinstance(data, dict) else {}
+        entries = routers.get(router) if isinstance(routers, dict) else None
+        if not isinstance(entries, list):
+            raise IntentRouterError(f"Router '{router}' not defined in {routes_path}")
+
+        routes: list[tuple[str, list[str]]] = []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            patterns = entry.get("patterns", [])
+            if not isinstance(patterns, list):
+                patterns = [patterns]
+            routes.append((str(entry.get("intent", "")).strip(), [str(p) for p in patterns]))
+
+        return cls(routes, cache_size=cache_size)
+
+    def route(self, prompt: str) -> str:
+        """Return the intent for a prompt, or ``"unknown"``."""
+        normalized = normalize_prompt(prompt)
+        if not normalized:
+            return UNKNOWN_INTENT
+
+        if self.cache_size:
+            with self._lock:
+                cached = self._cache.get(normalized)
+                if cached is not None:
+                    self._cache.move_to_end(normalized)
+                    self.hits += 1
+                    return cached
+
+        intent = self._route_uncached(normalized)
+
+        if self.cache_size:
+            with self._lock:
+                self.misses += 1
+                self._cache[normalized] = intent
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return intent
+
+    def matches(self, prompt: str, intent: str) -> bool:
+        """Return True when the prompt routes to ``intent``."""
+        return self.route(prompt) == intent
+
+    def _route_uncached(self, normalized: str) -> str:
+        if self._pattern is None:
+            return UNKNOWN_INTENT
+        found = self._pattern.match(normalized)
+        if found is None:
+            return UNKNOWN_INTENT
+        for group in self._groups:
+            if found.group(group) is not None:
+                return self._group_to_intent[group]
+        return UNKNOWN_INTENT
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_ROUTER_CACHE: dict[tuple[str, str], tuple[int, IntentRouter]] = {}
+_ROUTER_CACHE_LOCK = threading.Lock()
+
+
+def get_router(router: str, path: Optional[str | Path] = None) -> IntentRouter:
+    """Return a shared router for ``router``, rebuilt when the file changes."""
+    routes_path = (Path(path) if path else DEFAULT_ROUTES_PATH).resolve()
+    try:
+        mtime = routes_path.stat().st_mtime_ns
+    except OSError:
+        raise IntentRouterError(f"Intent routes file not found: {routes_path}")
+
+    key = (str(routes_path), router)
+    with _ROUTER_CACHE_LOCK:
+        cached = _ROUTER_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        built = IntentRouter.from_config(router, routes_path)
+        _ROUTER_CACHE[key] = (mtime, built)
+        return built
+
+
+def benchmark_router(
+    router: IntentRouter,
+    prompts: Iterable[str],
+    total: int = 100_000,
+) -> dict[str, Any]:
+    """Route ``total`` prompts (cycling ``prompts``) cold and cached.
+
+    Returns throughput for the uncached combined pattern, the LRU-cached
+    path, and the equivalent sequential ``re.search`` loop for comparison.
+    """
+    samples = [normalize_prompt(p) for p in prompts if normalize_prompt(p)]
+    if not samples:
+        raise IntentRouterError("benchmark_router needs at least one non-empty prompt")
+    stream = [samples[i % len(samples)] for i in range(total)]
+
+    sequential = [
+        (intent, [re.compile(p) for p in patterns])
+        for intent, patterns in router.routes
+    ]
+
+    def _sequential(text: str) -> str:
+        for intent, compiled in sequential:
+            if any(c.search(text) for c in compiled):
+                return intent
+        return UNKNOWN_INTENT
+
+    def _timed(fn) -> float:
+        start = time.perf_counter()
+        for text in stream:
+            fn(text)
+        return time.perf_counter() - start
+
+    router.clear_cache()
+    combined_s = _timed(router._route_uncached)
+    sequential_s = _timed(_sequential)
+    cached_s = _timed(router.route)
+
+    def _rate(seconds: float) -> float:
+        return round(total / seconds, 1) if seconds > 0 else float("inf")
+
+    return {
+        "prompts": total,
+        "distinct_prompts": len(set(samples)),
+        "sequential_search_per_sec": _rate(sequential_s),
+        "combined_pattern_per_sec": _rate(combined_s),
+        "cached_route_per_sec": _rate(cached_s),
+        "cache_hits": router.hits,
+        "cache_misses": router.misses,
+    }
+
@@ -0,0 +1,125 @@
+"""Compiled index over config/known-solutions.yaml for failure recovery.
+
+Solutions are bucketed by (intent, error_code) with message patterns
+compiled once, so a failure lookup only visits the entries that could
+apply to it instead of scanning and re-normalizing the whole library.
+An empty intent or error-code list on a solution acts as a wildcard, and
+the first matching solution in file order wins, as before.
+
+Indexes are shared per file and rebuilt when the file's mtime changes.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+WILDCARD = ""
+
+
+@dataclass
+class IndexedSolution:
+    """A known solution with pre-normalized match criteria."""
+
+    order: int
+    solution: dict[str, Any]
+    patterns: list[re.Pattern] = field(default_factory=list)
+    requires_pattern: bool = False
+
+    def matches_message(self, normalized_message: str) -> bool:
+        if not self.requires_pattern:
+            return True
+        return any(pattern.search(normalized_message) for pattern in self.patterns)
+
+
+class KnownSolutionIndex:
+    """(intent, error_code) -> ordered candidate solutions."""
+
+    def __init__(self, solutions: list[Any]):
+        self.solutions: list[dict[str, Any]] = [item for item in solutions if isinstance(item, dict)]
+        self._buckets: dict[tuple[str, str], list[IndexedSolution]] = {}
+
+        for order, solution in enumerate(self.solutions):
+            matches = solution.get("matches", {}) if isinstance(solution.get("matches"), dict) else {}
+            raw_patterns = [str(item) for item in matches.get("message_patterns", []) or []]
+            compiled: list[re.Pattern] = []
+            for pattern in raw_patterns:
+                try:
+                    compiled.append(re.compile(pattern))
+                except re.error:
+                    # An invalid pattern can never match; keep the entry gated.
+                    continue
+
+            indexed = IndexedSolution(
+                order=order,
+                solution=solution,
+                patterns=compiled,
+                requires_pattern=bool(raw_patterns),
+            )
+
+            intent = str(solution.get("intent", "") or "").strip().lower()
+            codes = [str(item).upper() for item in matches.get("error_codes", []) or []]
+            for code in codes or [WILDCARD]:
+                self._buckets.setdefault((intent, code), []).append(indexed)
+
+    def lookup(self, intent: str, error_code: str, message: str) -> Optional[dict[str, Any]]:
+        """Return the first solution (in file order) matching this failure."""
+        intent_key = (intent or "").strip().lower()
+        code_key = (error_code or "").upper()
+        normalized_message = (message or "").lower()
+
+        keys = {
+            (intent_key, code_key),
+            (intent_key, WILDCARD),
+            (WILDCARD, code_key),
+            (WILDCARD, WILDCARD),
+        }
+        candidates = [self._buckets[key] for key in keys if key in self._buckets]
+        if not candidates:
+            return None
+
+        for indexed in heapq.merge(*candidates, key=lambda item: item.order):
+            if indexed.matches_message(normalized_message):
+                return indexed.solution
+        return None
+
+    def __len__(self) -> int:
+        return len(self.solutions)
+
+
+def _read_solutions(path: Path) -> list[Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = yaml.safe_load(handle) or {}
+    except Exception:
+        return []
+    solutions = data.get("solutions", []) if isinstance(data, dict) else []
+    return solutions if isinstance(solutions, list) else []
+
+
+_INDEX_CACHE: dict[str, tuple[Optional[int], KnownSolutionIndex]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def load_known_solution_index(path: str | Path) -> KnownSolutionIndex:
+    """Return the shared index for ``path``, rebuilding it if the file changed."""
+    resolved = Path(path).resolve()
+    try:
+        mtime: Optional[int] = resolved.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    key = str(resolved)
+    with _INDEX_CACHE_LOCK:
+        cached = _INDEX_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        index = KnownSolutionIndex(_read_solutions(resolved) if mtime is not None else [])
+        _INDEX_CACHE[key] = (mtime, index)
+        return index
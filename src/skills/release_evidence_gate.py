@@ -3,11 +3,29 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+TELEMETRY_MODES = ("full", "sample")
+VALIDATION_CACHE_VERSION = 1
+# JSONL files are validated in line-aligned byte ranges of this size, so a
+# single multi-GB file is spread over all workers.
+RANGE_BYTES = 64 * 1024 * 1024
+# Below this many bytes to scan the process pool costs more than it saves.
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+READ_BLOCK_BYTES = 4 * 1024 * 1024
+# Sampling mode reads this many evenly spaced windows (including head and tail).
+SAMPLE_WINDOWS = 16
+SAMPLE_WINDOW_BYTES = 256 * 1024
+
+_DECODE = json.JSONDecoder().decode
+
 
 REQUIRED_EVIDENCE_KEYS = [
     "release_decision_record",
@@ -152,6 +170,7 @@ class GateEvaluationResult:
     invalid_evidence_files: list[str]
     invalid_telemetry_files: list[str]
     checked_at: str
+    telemetry_validation: list[dict[str, Any]] = field(default_factory=list)
 
 
 def build_default_manifest(repo_root: str = ".") -> dict[str, Any]:
@@ -198,8 +217,19 @@ def build_default_manifest(repo_root: str = ".") -> dict[str, Any]:
     }
 
 
-def evaluate_manifest(manifest_path: str, repo_root: str = ".") -> GateEvaluationResult:
-    """Evaluate release evidence manifest into deterministic Go/No-Go decision."""
+def evaluate_manifest(
+    manifest_path: str,
+    repo_root: str = ".",
+    telemetry_mode: str = "full",
+    workers: int | None = None,
+    cache: TelemetryValidationCache | None = None,
+) -> GateEvaluationResult:
+    """Evaluate release evidence manifest into deterministic Go/No-Go decision.
+
+    Telemetry files are validated concurrently (see ``validate_telemetry_files``);
+    ``telemetry_mode="sample"`` checks evenly spaced windows of large JSONL
+    files instead of every line.
+    """
 
     root = Path(repo_root)
     payload = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
@@ -236,6 +266,7 @@ def evaluate_manifest(manifest_path: str, repo_root: str = ".") -> GateEvaluatio
 
     missing_blocking_telemetry: list[str] = []
     invalid_telemetry_files: list[str] = []
+    telemetry_files: dict[str, Path] = {}
     for key in BLOCKING_TELEMETRY_KEYS:
         entry = telemetry_map.get(key) or {}
         path = str(entry.get("path") or "").strip()
@@ -247,11 +278,13 @@ def evaluate_manifest(manifest_path: str, repo_root: str = ".") -> GateEvaluatio
         if not full_path.exists():
             missing_blocking_telemetry.append(key)
             continue
+        telemetry_files[key] = full_path
 
-        valid, has_records = _validate_telemetry_file(full_path)
-        if not valid:
+    validation = validate_telemetry_files(telemetry_files, mode=telemetry_mode, workers=workers, cache=cache)
+    for key, stats in validation.items():
+        if not stats["valid"]:
             invalid_telemetry_files.append(key)
-        elif not has_records:
+        elif not stats["has_records"]:
             missing_blocking_telemetry.append(key)
 
     decision = "GO"
@@ -271,9 +304,171 @@ def evaluate_manifest(manifest_path: str, repo_root: str = ".") -> GateEvaluatio
         invalid_evidence_files=sorted(invalid_evidence_files),
         invalid_telemetry_files=sorted(invalid_telemetry_files),
         checked_at=datetime.now(timezone.utc).isoformat(),
+        telemetry_validation=[{"key": key, **stats} for key, stats in validation.items()],
     )
 
 
+class TelemetryValidationCache:
+    """Telemetry validation outcomes keyed by (path, size, mtime).
+
+    A full-mode result also answers sample-mode lookups; a sample-mode result
+    never answers a full-mode lookup. Optionally persisted as JSON.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == VALIDATION_CACHE_VERSION:
+                self._entries = payload.get("entries") or {}
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(path.resolve())
+
+    def get(self, path: Path, stat: os.stat_result, mode: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+        if not entry or entry.get("size") != stat.st_size or entry.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        if mode == "full" and entry.get("mode") != "full":
+            return None
+        return entry
+
+    def put(self, path: Path, stat: os.stat_result, mode: str, valid: bool, has_records: bool, records: int) -> None:
+        with self._lock:
+            self._entries[self._key(path)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "mode": mode,
+                "valid": valid,
+                "has_records": has_records,
+                "records": records,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with self._lock:
+            tmp_path.write_text(
+                json.dumps({"version": VALIDATION_CACHE_VERSION, "entries": self._entries}), encoding="utf-8"
+            )
+            self._dirty = False
+        os.replace(tmp_path, self.path)
+
+
+def validate_telemetry_files(
+    files: dict[str, Path],
+    mode: str = "full",
+    workers: int | None = None,
+    cache: TelemetryValidationCache | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Validate telemetry files concurrently and report per-file throughput.
+
+    JSONL files are split into line-aligned byte ranges that are scanned in a
+    process pool (inline when there is little to scan). Returns, per key,
+    ``valid``/``has_records`` plus ``mode``, ``bytes``, ``bytes_read``,
+    ``records``, ``scan_seconds``, ``mb_per_s`` and ``cached``.
+    """
+
+    if mode not in TELEMETRY_MODES:
+        raise ValueError(f"Unknown telemetry mode: {mode!r} (expected one of {TELEMETRY_MODES})")
+
+    results: dict[str, dict[str, Any]] = {}
+    jobs: list[tuple[str, int, int]] = []
+    job_keys: list[str] = []
+    stats_by_key: dict[str, os.stat_result] = {}
+    for key, path in files.items():
+        stat = path.stat()
+        stats_by_key[key] = stat
+        cached = cache.get(path, stat, mode) if cache else None
+        if cached is not None:
+            results[key] = {
+                "path": str(path),
+                "mode": cached["mode"],
+                "valid": cached["valid"],
+                "has_records": cached["has_records"],
+                "bytes": stat.st_size,
+                "bytes_read": 0,
+                "records": cached["records"],
+                "scan_seconds": 0.0,
+                "mb_per_s": None,
+                "cached": True,
+            }
+            continue
+
+        is_jsonl = path.suffix.lower() == ".jsonl"
+        results[key] = {
+            "path": str(path),
+            "mode": "sample" if is_jsonl and _is_sampled(stat.st_size, mode) else "full",
+            "valid": True,
+            "has_records": False,
+            "bytes": stat.st_size,
+            "bytes_read": 0,
+            "records": 0,
+            "scan_seconds": 0.0,
+            "mb_per_s": None,
+            "cached": False,
+        }
+        if is_jsonl:
+            for start, end in _jsonl_ranges(stat.st_size, mode):
+                jobs.append((str(path), start, end))
+                job_keys.append(key)
+        else:
+            started = time.perf_counter()
+            valid, has_records = _validate_non_jsonl(path)
+            results[key].update(
+                valid=valid,
+                has_records=has_records,
+                records=int(has_records),
+                bytes_read=stat.st_size if path.suffix.lower() == ".json" else 0,
+                scan_seconds=time.perf_counter() - started,
+            )
+
+    workers = workers or os.cpu_count() or 1
+    total_bytes = sum(end - start for _, start, end in jobs)
+    if workers > 1 and len(jobs) > 1 and total_bytes >= PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            outcomes = list(pool.map(_scan_jsonl_range, *zip(*jobs)))
+    else:
+        outcomes = [_scan_jsonl_range(*job) for job in jobs]
+
+    for key, (valid, records, scanned, seconds) in zip(job_keys, outcomes):
+        entry = results[key]
+        entry["valid"] = entry["valid"] and valid
+        entry["records"] += records
+        entry["bytes_read"] += scanned
+        entry["scan_seconds"] += seconds
+
+    for key, entry in results.items():
+        if entry["cached"]:
+            continue
+        if not entry["valid"]:
+            entry["has_records"] = False
+        elif files[key].suffix.lower() == ".jsonl":
+            entry["has_records"] = entry["records"] > 0
+        if entry["scan_seconds"] > 0 and entry["bytes_read"]:
+            entry["mb_per_s"] = round(entry["bytes_read"] / entry["scan_seconds"] / 1_000_000, 1)
+        entry["scan_seconds"] = round(entry["scan_seconds"], 6)
+        if cache:
+            # An invalid line found by sampling is as conclusive as a full scan.
+            cache_mode = entry["mode"] if entry["valid"] else "full"
+            cache.put(files[key], stats_by_key[key], cache_mode, entry["valid"], entry["has_records"], entry["records"])
+
+    if cache:
+        cache.save()
+    return results
+
+
 def write_json_report(output_path: str, result: GateEvaluationResult) -> None:
     """Write GateEvaluationResult to JSON report file."""
 
@@ -287,23 +482,140 @@ def _is_non_empty(path: Path) -> bool:
 
 
 def _validate_telemetry_file(path: Path) -> tuple[bool, bool]:
-    suffix = path.suffix.lower()
-
-    if suffix == ".jsonl":
-        has_any = False
-        with open(path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped:
+    if path.suffix.lower() == ".jsonl":
+        valid, records, _, _ = _scan_jsonl_range(str(path), 0, path.stat().st_size)
+        return valid, valid and records > 0
+    return _validate_non_jsonl(path)
+
+
+def _is_sampled(size: int, mode: str) -> bool:
+    """Sampling only applies to files larger than the sampling windows combined."""
+
+    return mode == "sample" and size > SAMPLE_WINDOWS * SAMPLE_WINDOW_BYTES
+
+
+def _jsonl_ranges(size: int, mode: str) -> list[tuple[int, int]]:
+    """Byte ranges to scan: the whole file in RANGE_BYTES pieces, or sampling windows."""
+
+    if _is_sampled(size, mode):
+        step = (size - SAMPLE_WINDOW_BYTES) / (SAMPLE_WINDOWS - 1)
+        return [
+            (int(index * step), min(size, int(index * step) + SAMPLE_WINDOW_BYTES))
+            for index in range(SAMPLE_WINDOWS)
+        ]
+    return [(start, min(size, start + RANGE_BYTES)) for start in range(0, size, RANGE_BYTES)] or [(0, 0)]
+
+
+def _scan_jsonl_range(path: str, start: int, end: int) -> tuple[bool, int, int, float]:
+    """Validate the JSONL lines that *start* in [start, end).
+
+    Returns (valid, records, bytes_read, seconds). Matches the line-by-line
+    ``json.loads`` check exactly: every non-blank line (universal newlines,
+    ``str.strip`` semantics) must be a JSON object. Lines that start with
+    ``{`` take a fast path that decodes the raw line once; anything unusual
+    falls back to the reference check.
+    """
+
+    started = time.perf_counter()
+    records = 0
+    read = 0
+    with open(path, "rb") as handle:
+        position = start
+        if start:
+            # The line straddling ``start`` belongs to the previous range.
+            handle.seek(start - 1)
+            skipped = handle.readline()
+            read += len(skipped)
+            position = start - 1 + len(skipped)
+        carry = b""
+        while position < end:
+            block = handle.read(min(READ_BLOCK_BYTES, end - position))
+            position += len(block)
+            read += len(block)
+            buffer = carry + block
+            if position >= end or not block:
+                # The last line starts before ``end``: read it to its newline.
+                if buffer and not buffer.endswith(b"\n"):
+                    tail = handle.readline()
+                    read += len(tail)
+                    buffer += tail
+                carry = b""
+                position = end
+                complete = buffer[:-1] if buffer.endswith(b"\n") else buffer
+            else:
+                cut = buffer.rfind(b"\n")
+                complete, carry = buffer[:cut], buffer[cut + 1:]
+                if cut < 0:
+                    complete, carry = b"", buffer
                     continue
-                has_any = True
-                try:
-                    payload = json.loads(stripped)
-                except json.JSONDecodeError:
-                    return False, False
-                if not isinstance(payload, dict):
-                    return False, False
-        return True, has_any
+            ok, counted = _check_lines(complete)
+            records += counted
+            if not ok:
+                return False, records, read, time.perf_counter() - started
+            if not block:
+                break
+    return True, records, read, time.perf_counter() - started
+
+
+def _check_lines(chunk: bytes) -> tuple[bool, int]:
+    """Check a run of complete "\n"-separated lines; returns (valid, non_blank_lines)."""
+
+    if not chunk:
+        return True, 0
+    try:
+        text = chunk.decode("utf-8")
+    except UnicodeDecodeError:
+        records = 0
+        for raw in chunk.split(b"\n"):
+            try:
+                ok, counted = _check_line_slow(raw.decode("utf-8"))
+            except UnicodeDecodeError:
+                return False, records
+            records += counted
+            if not ok:
+                return False, records
+        return True, records
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    lone_cr = "\r" in text
+    records = 0
+    for line in text.split("\n"):
+        if line[:1] == "{" and not (lone_cr and "\r" in line):
+            try:
+                _DECODE(line)
+                records += 1
+                continue
+            except ValueError:
+                pass
+        ok, counted = _check_line_slow(line)
+        records += counted
+        if not ok:
+            return False, records
+    return True, records
+
+
+def _check_line_slow(line: str) -> tuple[bool, int]:
+    """Reference check for one physical line; returns (valid, non_blank_lines)."""
+
+    counted = 0
+    # Text-mode iteration also treats a lone "\r" as a line break.
+    for part in line.split("\r"):
+        stripped = part.strip()
+        if not stripped:
+            continue
+        counted += 1
+        try:
+            payload = json.loads(stripped)
+        except json.JSONDecodeError:
+            return False, counted
+        if not isinstance(payload, dict):
+            return False, counted
+    return True, counted
+
+
+def _validate_non_jsonl(path: Path) -> tuple[bool, bool]:
+    suffix = path.suffix.lower()
 
     if suffix == ".json":
         try:
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+GATE_CACHE_VERSION = 1
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class GateResult:
@@ -40,47 +50,50 @@ class MockGateProvider:
     }
     """
 
+    # Bump a gate's "version" whenever its logic changes so cached outcomes are discarded.
     DEFAULT_GATES = [
-        {"name": "fingerprint_verified", "blocking": True, "weight": 25},
-        {"name": "version_provenance_verified", "blocking": True, "weight": 20},
-        {"name": "security_review_passed", "blocking": True, "weight": 20},
-        {"name": "test_coverage_minimum", "blocking": True, "weight": 15},
-        {"name": "capability_fit", "blocking": False, "weight": 10},
-        {"name": "author_reputation", "blocking": False, "weight": 10},
+        {"name": "fingerprint_verified", "blocking": True, "weight": 25, "version": 1},
+        {"name": "version_provenance_verified", "blocking": True, "weight": 20, "version": 1},
+        {"name": "security_review_passed", "blocking": True, "weight": 20, "version": 1},
+        {"name": "test_coverage_minimum", "blocking": True, "weight": 15, "version": 1},
+        {"name": "capability_fit", "blocking": False, "weight": 10, "version": 1},
+        {"name": "author_reputation", "blocking": False, "weight": 10, "version": 1},
     ]
 
     def __init__(self, overrides: dict[str, dict[str, dict[str, Any]]] | None = None) -> None:
         self.overrides = overrides or {}
 
+    def gates(self) -> list[dict[str, Any]]:
+        """Gate definitions in evaluation order; gates are independent of each other."""
+
+        return self.DEFAULT_GATES
+
     def evaluate(self, skill_name: str, metadata: dict[str, Any]) -> list[GateResult]:
-        skill_overrides = self.overrides.get(skill_name, {})
-        results: list[GateResult] = []
-
-        for gate in self.DEFAULT_GATES:
-            gate_name = gate["name"]
-            blocking = bool(gate["blocking"])
-            weight = int(gate["weight"])
-
-            passed, reason = self._default_gate_outcome(gate_name, metadata)
-
-            override = skill_overrides.get(gate_name)
-            if isinstance(override, dict):
-                if "passed" in override:
-                    passed = bool(override["passed"])
-                if "reason" in override and isinstance(override["reason"], str):
-                    reason = override["reason"]
-
-            results.append(
-                GateResult(
-                    gate_name=gate_name,
-                    passed=passed,
-                    blocking=blocking,
-                    score_weight=weight,
-                    reason=reason,
-                )
-            )
+        return [self.evaluate_gate(skill_name, metadata, gate) for gate in self.gates()]
+
+    def evaluate_gate(self, skill_name: str, metadata: dict[str, Any], gate: dict[str, Any]) -> GateResult:
+        gate_name = gate["name"]
+        passed, reason = self._default_gate_outcome(gate_name, metadata)
 
-        return results
+        override = self.overrides.get(skill_name, {}).get(gate_name)
+        if isinstance(override, dict):
+            if "passed" in override:
+                passed = bool(override["passed"])
+            if "reason" in override and isinstance(override["reason"], str):
+                reason = override["reason"]
+
+        return GateResult(
+            gate_name=gate_name,
+            passed=passed,
+            blocking=bool(gate["blocking"]),
+            score_weight=int(gate["weight"]),
+            reason=reason,
+        )
+
+    def cache_token(self, skill_name: str, gate_name: str) -> Any:
+        """Provider inputs other than skill metadata that affect a gate outcome."""
+
+        return self.overrides.get(skill_name, {}).get(gate_name)
 
     def _default_gate_outcome(self, gate_name: str, metadata: dict[str, Any]) -> tuple[bool, str]:
         if gate_name == "fingerprint_verified":
@@ -118,8 +131,10 @@ class MockGateProvider:
 def evaluate_skill(skill_name: str, metadata: dict[str, Any], gate_provider: MockGateProvider) -> TrustScorecard:
     """Evaluate one skill into a trust decision."""
 
-    gate_results = gate_provider.evaluate(skill_name, metadata)
+    return _build_scorecard(skill_name, gate_provider.evaluate(skill_name, metadata))
 
+
+def _build_scorecard(skill_name: str, gate_results: list[GateResult]) -> TrustScorecard:
     max_score = sum(item.score_weight for item in gate_results)
     score = sum(item.score_weight for item in gate_results if item.passed)
 
@@ -142,19 +157,221 @@ def evaluate_skill(skill_name: str, metadata: dict[str, Any], gate_provider: Moc
     )
 
 
+def skill_fingerprint(skill_name: str, metadata: dict[str, Any]) -> str:
+    """Digest of a skill's whole registry entry.
+
+    The registry ``fingerprint`` field only covers the skill's code; gates also
+    read version, status, coverage, capabilities and author, so all of it is
+    part of the cache key.
+    """
+
+    payload = json.dumps({"name": skill_name, "metadata": metadata}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GateResultCache:
+    """Gate outcomes keyed by skill fingerprint + gate name/version.
+
+    Optionally persisted as JSON so unchanged skills are not re-evaluated on
+    the next run. Thread-safe; ``save`` keeps only the keys used since load.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+        if self.path and self.path.exists():
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == GATE_CACHE_VERSION:
+                self._entries = payload.get("entries") or {}
+
+    @staticmethod
+    def key(provider_name: str, fingerprint: str, gate: dict[str, Any], token: Any = None) -> str:
+        raw = json.dumps(
+            [provider_name, fingerprint, gate["name"], gate.get("version", 0), gate.get("blocking"),
+             gate.get("weight"), token],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> GateResult | None:
+        with self._lock:
+            self._used.add(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return GateResult(**entry)
+
+    def put(self, key: str, result: GateResult) -> None:
+        with self._lock:
+            self._used.add(key)
+            self._entries[key] = asdict(result)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            entries = {key: value for key, value in self._entries.items() if key in self._used}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"version": GATE_CACHE_VERSION, "entries": entries}), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+@dataclass
+class RegistryEvaluation:
+    scorecards: list[TrustScorecard]
+    timing: dict[str, Any] = field(default_factory=dict)
+
+
+class GateExecutionEngine:
+    """Evaluate skills and their independent gates concurrently.
+
+    Providers exposing ``gates()``/``evaluate_gate()`` (like MockGateProvider)
+    are scheduled per (skill, gate) and cached per gate; providers with only
+    ``evaluate()`` are scheduled per skill without caching. A gate that raises
+    fails closed and is not cached.
+    """
+
+    def __init__(
+        self,
+        gate_provider: MockGateProvider | None = None,
+        cache: GateResultCache | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self.provider = gate_provider or MockGateProvider()
+        self.cache = cache
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+
+    def run(self, skills: dict[str, dict[str, Any]]) -> RegistryEvaluation:
+        started = time.perf_counter()
+        provider = self.provider
+        provider_name = f"{type(provider).__module__}.{type(provider).__qualname__}"
+        per_gate = hasattr(provider, "gates") and hasattr(provider, "evaluate_gate")
+        names = sorted(skills)
+
+        results: dict[str, list[GateResult | None]] = {}
+        jobs: list[tuple[str, int, dict[str, Any] | None, str | None]] = []
+        for name in names:
+            metadata = skills[name]
+            if not per_gate:
+                results[name] = []
+                jobs.append((name, 0, None, None))
+                continue
+            gates = provider.gates()
+            results[name] = [None] * len(gates)
+            fingerprint = skill_fingerprint(name, metadata) if self.cache else ""
+            for position, gate in enumerate(gates):
+                key = None
+                if self.cache:
+                    token = provider.cache_token(name, gate["name"]) if hasattr(provider, "cache_token") else None
+                    key = GateResultCache.key(provider_name, fingerprint, gate, token)
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        results[name][position] = cached
+                        continue
+                jobs.append((name, position, gate, key))
+
+        def execute(job: tuple[str, int, dict[str, Any] | None, str | None]) -> tuple[Any, float, bool]:
+            name, _, gate, _ = job
+            job_started = time.perf_counter()
+            try:
+                if gate is None:
+                    outcome: Any = provider.evaluate(name, skills[name])
+                else:
+                    outcome = provider.evaluate_gate(name, skills[name], gate)
+                ok = True
+            except Exception as e:
+                if gate is None:
+                    raise
+                outcome = GateResult(
+                    gate_name=gate["name"],
+                    passed=False,
+                    blocking=bool(gate["blocking"]),
+                    score_weight=int(gate["weight"]),
+                    reason=f"gate error: {type(e).__name__}: {e}",
+                )
+                ok = False
+            return outcome, (time.perf_counter() - job_started) * 1000, ok
+
+        if self.max_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+                outcomes = list(pool.map(execute, jobs))
+        else:
+            outcomes = [execute(job) for job in jobs]
+
+        gate_stats: dict[str, dict[str, Any]] = {}
+        skill_ms: dict[str, float] = {name: 0.0 for name in names}
+        errors = 0
+        for (name, position, gate, key), (outcome, elapsed_ms, ok) in zip(jobs, outcomes):
+            skill_ms[name] += elapsed_ms
+            if gate is None:
+                results[name] = list(outcome)
+                continue
+            results[name][position] = outcome
+            stats = gate_stats.setdefault(gate["name"], {"evaluations": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["evaluations"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            if not ok:
+                errors += 1
+            elif self.cache and key:
+                self.cache.put(key, outcome)
+
+        scorecards = [_build_scorecard(name, [item for item in results[name] if item is not None]) for name in names]
+        if self.cache:
+            self.cache.save()
+
+        timing = {
+            "total_ms": round((time.perf_counter() - started) * 1000, 3),
+            "workers": self.max_workers,
+            "skills": len(names),
+            "gate_evaluations": len(jobs),
+            "gate_errors": errors,
+            "cache_hits": self.cache.hits if self.cache else 0,
+            "cache_misses": self.cache.misses if self.cache else 0,
+            "gates": {
+                name: {key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()}
+                for name, stats in gate_stats.items()
+            },
+            "slowest_skills": [
+                {"skill": name, "ms": round(ms, 3)}
+                for name, ms in sorted(skill_ms.items(), key=lambda pair: (-pair[1], pair[0]))[:5]
+            ],
+        }
+        return RegistryEvaluation(scorecards=scorecards, timing=timing)
+
+
+def run_registry_evaluation(
+    registry_path: str = "config/skills-registry.yaml",
+    gate_provider: MockGateProvider | None = None,
+    max_workers: int | None = None,
+    cache: GateResultCache | None = None,
+) -> RegistryEvaluation:
+    """Evaluate all registry skills and return scorecards plus a timing report."""
+
+    engine = GateExecutionEngine(gate_provider, cache=cache, max_workers=max_workers)
+    return engine.run(_load_registry_skills(registry_path))
+
+
 def evaluate_registry(
     registry_path: str = "config/skills-registry.yaml",
     gate_provider: MockGateProvider | None = None,
+    max_workers: int | None = None,
+    cache: GateResultCache | None = None,
 ) -> list[TrustScorecard]:
     """Evaluate all registry skills into trust scorecards."""
 
-    provider = gate_provider or MockGateProvider()
-    skills = _load_registry_skills(registry_path)
-    scorecards = [
-        evaluate_skill(skill_name=name, metadata=metadata, gate_provider=provider)
-        for name, metadata in sorted(skills.items(), key=lambda pair: pair[0])
-    ]
-    return scorecards
+    return run_registry_evaluation(registry_path, gate_provider, max_workers=max_workers, cache=cache).scorecards
 
 
 def summarize(scorecards: list[TrustScorecard]) -> dict[str, int]:
@@ -200,13 +417,33 @@ def build_trust_bundle(
     }
 
 
+_REGISTRY_CACHE: dict[str, tuple[tuple[int, int], dict[str, dict[str, Any]]]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
 def _load_registry_skills(registry_path: str) -> dict[str, dict[str, Any]]:
+    """Registry skills, re-parsed only when the file's mtime or size changes."""
+
     path = Path(registry_path)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return {}
 
-    payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    skills = payload.get("skills")
-    if isinstance(skills, dict):
-        return {name: metadata for name, metadata in skills.items() if isinstance(metadata, dict)}
-    return {}
+    cache_key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _REGISTRY_LOCK:
+        cached = _REGISTRY_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        payload = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER) or {}
+        skills = payload.get("skills") if isinstance(payload, dict) else None
+        parsed = (
+            {name: metadata for name, metadata in skills.items() if isinstance(metadata, dict)}
+            if isinstance(skills, dict)
+            else {}
+        )
+        cached = (signature, parsed)
+        with _REGISTRY_LOCK:
+            _REGISTRY_CACHE[cache_key] = cached
+    # Callers get their own copy; the memoized parse must not be mutated.
+    return copy.deepcopy(cached[1])
@@ -1,8 +1,14 @@
 """Tests for adaptive executor self-correct flow."""
 
+import os
+import sys
 from pathlib import Path
 
-from src.skills.adaptive_executor import AdaptiveExecutor, compute_mock_fingerprint
+from src.skills.adaptive_executor import (
+    AdaptiveExecutor,
+    SkillCallableCache,
+    compute_mock_fingerprint,
+)
 
 
 def _write_registry(registry_path: Path, skills: dict) -> None:
@@ -346,3 +352,61 @@ def test_list_skills_execution_via_prompt(tmp_path):
     assert "skills" in result.output
     assert "dummy_skill" in result.output["skills"]
     assert "registry_list" in result.output["skills"]
+
+
+def test_callable_cache_reuses_module_until_file_changes(tmp_path):
+    skill_file = tmp_path / "cached_skill.py"
+    skill_file.write_text(
+        "LOADS = []\nLOADS.append(1)\n\ndef execute(input_data):\n    return {'success': True, 'v': 1}\n",
+        encoding="utf-8",
+    )
+    cache = SkillCallableCache(max_entries=4)
+    executor = AdaptiveExecutor(repo_root=str(tmp_path), callable_cache=cache)
+
+    first = executor._load_skill_callable("cached_skill.py::execute", fingerprint="abc")
+    second = executor._load_skill_callable("cached_skill.py::execute", fingerprint="abc")
+
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+    stat = skill_file.stat()
+    skill_file.write_text(
+        "def execute(input_data):\n    return {'success': True, 'v': 2}\n",
+        encoding="utf-8",
+    )
+    os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = executor._load_skill_callable("cached_skill.py::execute", fingerprint="abc")
+    assert reloaded({})["v"] == 2
+    assert len(cache) == 1
+    assert sum(1 for name in sys.modules if name.startswith("adaptive_skill_cached_skill_")) == 1
+
+    refingerprinted = executor._load_skill_callable("cached_skill.py::execute", fingerprint="def")
+    assert refingerprinted is not reloaded
+    assert cache.misses == 3
+    cache.clear()
+
+
+def test_callable_cache_evicts_lru_and_cleans_sys_modules(tmp_path):
+    for name in ("skill_a", "skill_b", "skill_c"):
+        (tmp_path / f"{name}.py").write_text(
+            "def execute(input_data):\n    return True\n",
+            encoding="utf-8",
+        )
+    cache = SkillCallableCache(max_entries=2)
+    executor = AdaptiveExecutor(repo_root=str(tmp_path), callable_cache=cache)
+
+    executor._load_skill_callable("skill_a.py")
+    executor._load_skill_callable("skill_b.py")
+    executor._load_skill_callable("skill_a.py")
+    executor._load_skill_callable("skill_c.py")
+
+    assert len(cache) == 2
+    assert not any(name.startswith("adaptive_skill_skill_b_") for name in sys.modules)
+    assert any(name.startswith("adaptive_skill_skill_a_") for name in sys.modules)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert not any(name.startswith("adaptive_skill_skill_") for name in sys.modules)
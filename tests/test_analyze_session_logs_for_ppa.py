@@ -0,0 +1,226 @@
+"""Tests for the incremental session-log analyzer behind the PPA summaries."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from scripts import analyze_session_logs_for_ppa as analyzer
+
+LOG_TEMPLATE = """# Session Log {day}
+
+
+# Prompt: ({day} 09:00:00)
+<!--Start Prompt-->
+Should we keep the personal assistant memory in session logs? See [notes](file:///g%3A/notes.md)
+<!--End Prompt-->
+
+
+# Response: ({day} 09:00:10)
+<!--Start Response-->
+Yes, retrieval grounded strictly in session logs works. The auth policy gate stays deterministic.
+```python
+print("ignored")
+```
+<!--End Response-->
+
+
+# Prompt: ({day} 09:05:00)
+<!--Start Prompt-->
+I don't like the RBAC delegation idea; it was rejected at C:\\repos\\notes.txt
+<!--End Prompt-->
+"""
+
+
+def _reference_clean_text(text: str) -> str:
+    text = text.replace("\r\n", "\n")
+    text = re.sub(r"<!--Start (Prompt|Response)-->", "", text)
+    text = re.sub(r"<!--End (Prompt|Response)-->", "", text)
+    text = re.sub(r"!?\[[^\]]*\]\([^)]*\)", " ", text)
+    text = re.sub(r"file:///\S+", " ", text)
+    text = re.sub(r"https?://\S+", " ", text)
+    text = re.sub(r"[A-Za-z]:\\[^\s\"]+", " ", text)
+    text = re.sub(r"`{3}.*?`{3}", " ", text, flags=re.S)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _reference_stance(text: str) -> str:
+    lowered = text.lower()
+    for stance, cues in (
+        ("rejected-or-deprioritized", analyzer.REJECT_CUES),
+        ("adopted-or-endorsed", analyzer.ACCEPT_CUES),
+        ("open-question", analyzer.QUESTION_CUES),
+    ):
+        if any(re.search(pattern, lowered, re.I) for pattern in cues):
+            return stance
+    return "exploration"
+
+
+def _write_log(directory: Path, day: str, extra: str = "") -> Path:
+    path = directory / f"Session Log {day}.md"
+    path.write_text(LOG_TEMPLATE.format(day=day) + extra, encoding="utf-8")
+    return path
+
+
+def _run(logs: Path, out: Path, **kwargs) -> dict[str, object]:
+    return analyzer.run_analysis(logs, out, workers=1, **kwargs)
+
+
+def _outputs(out: Path) -> tuple[list[dict[str, object]], dict[str, object]]:
+    rows = [json.loads(line) for line in (out / analyzer.EVENTS_FILE_NAME).read_text(encoding="utf-8").splitlines()]
+    summary = json.loads((out / "ppa_approach_summary.json").read_text(encoding="utf-8"))
+    summary.pop("generated_at")
+    return rows, summary
+
+
+@pytest.fixture()
+def logs(tmp_path: Path) -> Path:
+    directory = tmp_path / "PromptTracking"
+    directory.mkdir()
+    for day in ("2026-01-01", "2026-01-02", "2026-02-01"):
+        _write_log(directory, day)
+    return directory
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "<!--Start Prompt-->Hello [x](y) ![img](z.png) file:///a/b https://e.com C:\\dir\\f.txt <!--End Prompt-->",
+        "plain\r\ntext\twith\x1c odd\u00a0spaces\u2003and ```code\n``` end ```unterminated",
+        "   ",
+    ],
+)
+def test_clean_text_matches_sequential_regex_passes(text: str) -> None:
+    assert analyzer.clean_text(text) == _reference_clean_text(text)
+
+
+def test_combined_cue_patterns_match_individual_cues() -> None:
+    samples = [
+        "I don't like this", "we should try it", "what if we did", "is this right?", "nothing here",
+        "The SpiceDB auth policy", "memory and RAG retrieval", "git commit in the repo", "Implemented the gate",
+    ]
+    for text in samples:
+        expected = [
+            approach
+            for approach, patterns in analyzer.APPROACH_PATTERNS.items()
+            if any(re.search(pattern, text.lower(), re.I) for pattern in patterns)
+        ] or ["general"]
+        assert analyzer.classify_approaches(text) == expected
+        assert analyzer.classify_stance(text) == _reference_stance(text)
+
+
+def test_incremental_summary_matches_in_memory_build(logs: Path, tmp_path: Path) -> None:
+    report = _run(logs, tmp_path / "out")
+    rows, summary = _outputs(tmp_path / "out")
+
+    events = [event for path in analyzer.iter_session_log_paths(logs) for event in analyzer.parse_blocks(path)]
+    expected, _ = analyzer.build_summary(events, [])
+    expected.pop("generated_at")
+    assert report["parsed"] == 3 and report["event_count"] == len(events) == 9
+    assert rows == [analyzer.event_row(event) for event in events]
+    assert summary == expected
+
+
+def test_unchanged_logs_are_not_reparsed(logs: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _run(logs, out)
+    before = (out / analyzer.EVENTS_FILE_NAME).read_bytes()
+
+    assert _run(logs, out)["parsed"] == 0
+
+    touched = logs / "Session Log 2026-01-02.md"
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    report = _run(logs, out)
+    assert (report["parsed"], report["unchanged"]) == (0, 1)
+    assert (out / analyzer.EVENTS_FILE_NAME).read_bytes() == before
+
+
+def _assert_matches_full_run(logs: Path, out: Path, full: Path) -> list[dict[str, object]]:
+    rows, summary = _outputs(out)
+    _run(logs, full, full=True)
+    full_rows, full_summary = _outputs(full)
+    # Row order is the event id ppa_ask breaks score ties on.
+    assert rows == full_rows
+    assert summary == full_summary
+    return rows
+
+
+def test_new_events_are_appended(logs: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _run(logs, out)
+    before = (out / analyzer.EVENTS_FILE_NAME).read_bytes()
+
+    _write_log(logs, "2026-02-01", "\n\n# Response: (2026-02-01 09:06:00)\nWe removed it.\n")
+    _write_log(logs, "2026-03-01")
+    report = _run(logs, out)
+
+    assert (report["parsed"], report["appended_rows"], report["rewritten"]) == (2, 4, False)
+    assert (out / analyzer.EVENTS_FILE_NAME).read_bytes().startswith(before)
+    _assert_matches_full_run(logs, out, tmp_path / "full")
+
+
+def test_out_of_order_additions_keep_full_run_order(logs: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _run(logs, out)
+
+    _write_log(logs, "2026-01-02", "\n\n# Response: (2026-01-02 09:06:00)\nWe removed it.\n")
+    _write_log(logs, "2026-01-15")
+    report = _run(logs, out)
+
+    assert (report["parsed"], report["appended_rows"], report["rewritten"]) == (2, 0, True)
+    rows = _assert_matches_full_run(logs, out, tmp_path / "full")
+    assert [row["source_file"] for row in rows][-3:] == ["Session Log 2026-02-01.md"] * 3
+
+
+def test_removed_and_rewritten_logs_rewrite_events(logs: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _run(logs, out)
+
+    (logs / "Session Log 2026-01-01.md").unlink()
+    edited = logs / "Session Log 2026-02-01.md"
+    edited.write_text(edited.read_text(encoding="utf-8").replace("RBAC delegation", "caching"), encoding="utf-8")
+    report = _run(logs, out)
+
+    assert (report["parsed"], report["rewritten"]) == (1, True)
+    rows = _assert_matches_full_run(logs, out, tmp_path / "full")
+    assert not any(row["source_file"] == "Session Log 2026-01-01.md" for row in rows)
+
+
+def test_events_file_edited_externally_triggers_full_rebuild(logs: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _run(logs, out)
+    events_path = out / analyzer.EVENTS_FILE_NAME
+    events_path.write_text("", encoding="utf-8")
+
+    report = _run(logs, out)
+    assert report["rewritten"] is True and report["parsed"] == 3
+    assert len(events_path.read_text(encoding="utf-8").splitlines()) == 9
+
+
+def test_process_pool_matches_serial_run(logs: Path, tmp_path: Path) -> None:
+    analyzer.run_analysis(logs, tmp_path / "serial", workers=1)
+    analyzer.run_analysis(logs, tmp_path / "pool", workers=2)
+    assert _outputs(tmp_path / "serial") == _outputs(tmp_path / "pool")
+
+
+def test_fts_index_tracks_incremental_runs(logs: Path, tmp_path: Path) -> None:
+    from scripts.session_log_index import SessionLogIndex
+
+    out = tmp_path / "out"
+    assert _run(logs, out)["fts_rows_indexed"] == 9
+    _write_log(logs, "2026-03-01")
+    assert _run(logs, out)["fts_rows_indexed"] == 3
+    (logs / "Session Log 2026-01-01.md").unlink()
+    _run(logs, out)
+
+    events_path = out / analyzer.EVENTS_FILE_NAME
+    with SessionLogIndex(events_path.with_suffix(".sqlite")) as index:
+        assert index.is_current(events_path)
+        assert index.search(limit=100).total == 9
+        assert index.search(source_file="Session Log 2026-01-01.md").total == 0
+        assert index.search("rbac", source_file="Session Log 2026-03-01.md").total == 1
@@ -0,0 +1,131 @@
+"""Tests for the incremental ast-based CODEBASE_INDEX builder."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts import build_codebase_index as builder
+from scripts.navigate_codebase import CodebaseNavigator
+
+TOOL = '''"""Tool that publishes posts.
+
+More detail.
+"""
+import os
+from pathlib import Path
+from .relative import thing
+
+
+class Publisher(Base):
+    def run(self):
+        pass
+
+    def _private(self):
+        pass
+
+
+async def fetch(url, retries):
+    pass
+
+
+def main():
+    pass
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+CURATED = {
+    "metadata": {"version": "2.0", "generated": "2026-02-19"},
+    "taxonomies": {"functional_paths": ["USER_PATH"]},
+    "entry_points": [{"file": "src/app.py", "command": "python src/app.py", "purpose": "Curated"}],
+    "common_tasks": {"publish": {"methods": []}},
+}
+
+
+def _bump(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "src" / "app.py").write_text('if __name__ == "__main__":\n    pass\n', encoding="utf-8")
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "pkg" / "tool.py").write_text(TOOL, encoding="utf-8")
+    (tmp_path / "src" / "broken.py").write_text("def (:\n", encoding="utf-8")
+    (tmp_path / "node_modules" / "skip.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "CODEBASE_INDEX_ENHANCED.json").write_text(json.dumps(CURATED), encoding="utf-8")
+    return tmp_path
+
+
+def test_summarize_source_extracts_symbols() -> None:
+    summary = builder.summarize_source(TOOL.encode("utf-8"), "src/pkg/tool.py")
+    assert summary["module"] == "src.pkg.tool"
+    assert summary["docstring"] == "Tool that publishes posts."
+    assert summary["classes"] == [{"name": "Publisher", "line": 10, "bases": ["Base"], "methods": ["run"]}]
+    assert [(f["name"], f["args"]) for f in summary["functions"]] == [("fetch", ["url", "retries"]), ("main", [])]
+    assert summary["imports"] == ["os", "pathlib"]
+    assert summary["entry_point"] is True
+    assert "error" in builder.summarize_source(b"def (:\n", "bad.py")
+
+
+def test_build_merges_generated_sections_and_keeps_curated_ones(repo: Path) -> None:
+    index_path = repo / "CODEBASE_INDEX_ENHANCED.json"
+    report = builder.build_index(repo, index_path, workers=1)
+    assert report["files"] == report["parsed"] == 4
+
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    assert list(index["modules"]) == ["src/app.py", "src/broken.py", "src/pkg/__init__.py", "src/pkg/tool.py"]
+    assert index["modules"]["src/pkg/__init__.py"]["module"] == "src.pkg"
+    assert index["common_tasks"] == CURATED["common_tasks"]
+    assert index["entry_points"][0] == CURATED["entry_points"][0]
+    assert [(e["file"], e["generated"]) for e in index["entry_points"][1:]] == [("src/pkg/tool.py", True)]
+    assert index["metadata"]["total_modules"] == 4
+
+    results = CodebaseNavigator("CODEBASE_INDEX_ENHANCED.json", repo_root=repo).find("^publisher$")
+    assert [(r["file"], r["category"]) for r in results] == [("src/pkg/tool.py", "class")]
+
+
+def test_incremental_runs_only_reparse_changed_content(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index_path = repo / "CODEBASE_INDEX_ENHANCED.json"
+    builder.build_index(repo, index_path, workers=1)
+    first = index_path.read_bytes()
+
+    report = builder.build_index(repo, index_path, workers=1)
+    assert (report["unchanged_stat"], report["parsed"], report["index_written"]) == (4, 0, False)
+
+    parsed = []
+    original = builder.summarize_source
+    monkeypatch.setattr(builder, "summarize_source", lambda source, rel: parsed.append(rel) or original(source, rel))
+
+    _bump(repo / "src" / "app.py")  # touched but identical bytes: rehash only
+    report = builder.build_index(repo, index_path, workers=1)
+    assert (report["rehashed"], report["parsed"], report["index_written"]) == (1, 0, False)
+    assert index_path.read_bytes() == first
+
+    (repo / "src" / "pkg" / "tool.py").write_text(TOOL + "\n\ndef extra():\n    pass\n", encoding="utf-8")
+    (repo / "src" / "broken.py").unlink()
+    report = builder.build_index(repo, index_path, workers=1)
+    assert (report["parsed"], report["removed"], report["index_written"]) == (1, 1, True)
+    assert parsed == ["src/pkg/tool.py"]
+    modules = json.loads(index_path.read_text(encoding="utf-8"))["modules"]
+    assert "src/broken.py" not in modules
+    assert modules["src/pkg/tool.py"]["functions"][-1]["name"] == "extra"
+
+
+def test_pool_matches_serial_build(repo: Path, tmp_path: Path) -> None:
+    serial = repo / "serial.json"
+    pooled = repo / "pooled.json"
+    for path in (serial, pooled):
+        path.write_text(json.dumps(CURATED), encoding="utf-8")
+    builder.build_index(repo, serial, workers=1)
+    builder.build_index(repo, pooled, workers=2)
+    assert json.loads(serial.read_text(encoding="utf-8")) == json.loads(pooled.read_text(encoding="utf-8"))
@@ -16,6 +16,7 @@ Tests validate:
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -517,3 +518,246 @@ class TestCommitMessageResultStructure:
             staged_files=["src/main.py"],
         )
         assert result.cost_estimate >= 0.0
+
+
+# ===================================================================
+# Streaming diff summary
+# ===================================================================
+
+class TestDiffSummaryIntegration:
+    """Tier 1/2 read diffs through the single-pass DiffSummary."""
+
+    @staticmethod
+    def _legacy_action(diff: str):
+        if not diff:
+            return None
+        if '+' in diff and '-' not in diff:
+            return 'add'
+        if '-' in diff and '+' not in diff:
+            return 'remove'
+        if '+' in diff and '-' in diff:
+            return 'update'
+        if 'def ' in diff or 'class ' in diff:
+            return 'implement'
+        if 'raise ' in diff or 'error' in diff or 'exception' in diff:
+            return 'handle error'
+        return None
+
+    @pytest.mark.parametrize("diff", [
+        "",
+        "\n",
+        "+ added line",
+        "- removed line\n",
+        "+new\n-old\n",
+        "def foo():\n    pass",
+        "class\nBar",
+        "raise SomeError",
+        "an Error\r\nhappened",
+        "plain text",
+    ])
+    def test_action_matches_legacy_substring_rules(self, commit_skill, diff):
+        assert commit_skill._extract_action_from_diff(diff) == self._legacy_action(diff)
+
+    def test_tier2_prompt_is_compact_for_large_changes(self, commit_skill):
+        from src.skills.commit_message import TIER2_MAX_FILES
+        from src.skills.diff_summary import summarize_diff_text
+
+        diff = "".join(
+            f"diff --git a/src/m{i}.py b/src/m{i}.py\n--- a/src/m{i}.py\n+++ b/src/m{i}.py\n"
+            f"@@ -1 +1,{i % 5 + 1} @@\n-x\n" + "+y\n" * (i % 5 + 1)
+            for i in range(200)
+        )
+        summary = summarize_diff_text(diff, categorize=commit_skill._file_category)
+        files = summary.paths
+
+        prompt = commit_skill._tier2_prompt(files, summary)
+
+        assert f"... and {200 - TIER2_MAX_FILES} more" in prompt
+        assert "src: 200 files, +600/-200" in prompt
+        assert "  - src/m4.py (+5/-1)" in prompt
+        assert len(prompt) < 6000
+
+    def test_generate_accepts_precomputed_summary(self, commit_skill):
+        from src.skills.diff_summary import summarize_diff_text
+
+        summary = summarize_diff_text("+def login():\n")
+        result = commit_skill.generate(staged_files=["src/auth.py"], diff_summary=summary)
+
+        assert result.message == "feat: add auth"
+
+
+# ===================================================================
+# Tier 2 response cache
+# ===================================================================
+
+class _StubLLM:
+    """Anthropic-shaped client that counts calls."""
+
+    def __init__(self, text: str = "feat(auth): add token refresh"):
+        self.calls = 0
+        self.text = text
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return MagicMock(
+            content=[MagicMock(text=self.text)],
+            usage=MagicMock(input_tokens=1000, output_tokens=100),
+        )
+
+
+class TestTier2ResponseCache:
+    """Identical Tier 2 requests are served from the local cache."""
+
+    MIXED = ["src/auth.py", "docs/auth.md"]  # mixed categories → Tier 2
+    DIFF = "+def refresh():\n+    return token\n"
+
+    @pytest.fixture
+    def tier2_config(self, tmp_path):
+        config_file = tmp_path / "commit-strategy.yaml"
+        config_file.write_text(f"""
+commit_message:
+  confidence_threshold: 0.85
+  tier2:
+    enabled: true
+    model: "claude-3-5-sonnet-20241022"
+    max_tokens: 200
+    cache:
+      path: "{(tmp_path / 'cache' / 'tier2.json').as_posix()}"
+      ttl_seconds: 3600
+      max_entries: 2
+""")
+        return str(config_file)
+
+    def test_retry_hits_cache_and_records_savings(self, tier2_config):
+        llm = _StubLLM()
+        skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm)
+
+        first = skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+        assert first.is_tier2() and first.cost_estimate > 0
+        assert not first.cost_tracking.cache_hit
+        assert first.cost_tracking.cache_misses == 1
+
+        # A fresh process (new skill instance) retrying the same push.
+        retry_skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm)
+        second = retry_skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+
+        assert llm.calls == 1
+        assert second.message == first.message
+        assert second.cost_estimate == 0.0
+        assert second.cost_tracking.cache_hit
+        assert second.cost_tracking.cache_hits == 1
+        assert second.cost_tracking.saved_cost_usd == pytest.approx(first.cost_estimate)
+
+    def test_key_covers_files_diff_model_and_prompt_version(self, tier2_config, monkeypatch):
+        llm = _StubLLM()
+        skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm)
+
+        skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+        skill.generate(staged_files=self.MIXED, diff=self.DIFF + "+# more\n")
+        skill.generate(staged_files=self.MIXED + ["tests/test_auth.py"], diff=self.DIFF)
+        assert llm.calls == 3
+
+        skill.config['tier2']['model'] = "other-model"
+        skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+        assert llm.calls == 4
+
+        import src.skills.commit_message as commit_message_module
+        monkeypatch.setattr(commit_message_module, "TIER2_PROMPT_VERSION", 999)
+        skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+        assert llm.calls == 5
+
+    def test_different_staged_diffs_on_same_files_do_not_share_messages(self, tier2_config, tmp_path):
+        repo = tmp_path / "repo"
+        (repo / "src").mkdir(parents=True)
+        (repo / "docs").mkdir()
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+        def stage(code, doc):
+            (repo / "src" / "auth.py").write_text(code, encoding="utf-8")
+            (repo / "docs" / "auth.md").write_text(doc, encoding="utf-8")
+            git("add", "-A")
+
+        git("init", "-q")
+        llm = _StubLLM("feat(auth): add token refresh")
+        skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm)
+        stage("def refresh():\n    return 1\n", "Refresh tokens.\n")
+        first = skill.generate_from_staged(str(repo))
+
+        llm.text = "fix(auth): reject expired tokens"
+        stage("def reject():\n    return 0\n", "Reject expired tokens.\n")
+        second = skill.generate_from_staged(str(repo))
+
+        assert llm.calls == 2
+        assert (first.message, second.message) == ("feat(auth): add token refresh", "fix(auth): reject expired tokens")
+        assert not second.cost_tracking.cache_hit
+
+    def test_diffless_requests_bypass_cache(self, tier2_config):
+        llm = _StubLLM()
+        skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm)
+
+        skill.generate(staged_files=self.MIXED)
+        result = skill.generate(staged_files=self.MIXED, diff="")
+
+        assert llm.calls == 2
+        assert not result.cost_tracking.cache_hit
+        assert len(skill.response_cache) == 0
+
+    def test_ttl_and_size_bound_evict_entries(self, tmp_path):
+        from src.skills.commit_message_cache import CachedTier2Response, Tier2ResponseCache
+
+        now = [1000.0]
+        cache = Tier2ResponseCache(tmp_path / "c.json", ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+
+        def response(message):
+            return CachedTier2Response(message, "m", 1, 1, 0.01, created_at=now[0])
+
+        cache.put("a", response("a"))
+        cache.put("b", response("b"))
+        assert cache.get("a").message == "a"      # a is now most recent
+        cache.put("c", response("c"))             # evicts b (LRU)
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+        now[0] += 61
+        assert cache.get("a") is None             # expired
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_misses_persist_with_next_write(self, tmp_path):
+        from src.skills.commit_message_cache import CachedTier2Response, Tier2ResponseCache
+
+        path = tmp_path / "c.json"
+        cache = Tier2ResponseCache(path, clock=lambda: 1000.0)
+
+        assert cache.get("a") is None
+        assert not path.exists()
+
+        cache.put("a", CachedTier2Response("a", "m", 1, 1, 0.01, created_at=1000.0))
+        assert Tier2ResponseCache(path).misses == 1
+
+    def test_dry_run_uses_cached_answer_without_counting(self, tier2_config):
+        llm = _StubLLM()
+        skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm)
+
+        preview = skill.generate(staged_files=self.MIXED, diff=self.DIFF, dry_run=True)
+        assert preview.message.startswith("[DRY-RUN]")
+
+        real = skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+        again = skill.generate(staged_files=self.MIXED, diff=self.DIFF, dry_run=True)
+
+        assert llm.calls == 1
+        assert again.message == real.message
+        assert again.cost_tracking.cache_hit
+        assert skill.response_cache.hits == 0
+
+    def test_cache_can_be_disabled(self, tier2_config):
+        llm = _StubLLM()
+        skill = CommitMessageSkill(config_path=tier2_config, llm_client=llm, response_cache=None)
+
+        skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+        result = skill.generate(staged_files=self.MIXED, diff=self.DIFF)
+
+        assert llm.calls == 2
+        assert result.cost_tracking.cache_hits == 0
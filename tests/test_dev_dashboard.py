@@ -0,0 +1,107 @@
+"""Tests for the dev dashboard's cached data providers and telemetry counter."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts import dev_dashboard
+from scripts.dev_dashboard import CodebaseNavProvider, ProjectStateProvider, TelemetryCounter
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.fixture()
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "config").mkdir()
+    (tmp_path / "data").mkdir()
+    (tmp_path / "MEMORY.md").write_text("Phase 3 Complete\nLast Updated: 2026-01-01\n", encoding="utf-8")
+    (tmp_path / "config" / "skills-registry.yaml").write_text(
+        "metadata:\n  total_skills: 3\n  ready_skills: 2\n", encoding="utf-8"
+    )
+    (tmp_path / "data" / "telemetry.jsonl").write_text('{"a": 1}\n{"a": 2}\n', encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("content", ["", "one\n", "one\ntwo", "one\n\nthree\n"])
+def test_telemetry_counter_matches_line_iteration(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    path.write_text(content, encoding="utf-8")
+    with open(path, encoding="utf-8") as handle:
+        assert TelemetryCounter(path).count() == sum(1 for _ in handle)
+
+
+def test_telemetry_counter_reads_only_appended_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    path.write_text("x\n" * 5000, encoding="utf-8")
+    counter = TelemetryCounter(path)
+    assert counter.count() == 5000
+    state = json.loads(counter.sidecar_path.read_text(encoding="utf-8"))
+    assert state["offset"] == path.stat().st_size
+
+    # Tamper with the stored total: only bytes past the offset may be counted.
+    counter.sidecar_path.write_text(json.dumps({**state, "newlines": 7}), encoding="utf-8")
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("y\nz")
+    assert counter.count() == 7 + 2
+
+    path.write_text("rotated\n", encoding="utf-8")
+    assert counter.count() == 1
+    path.write_text("rotatedX\n" * 2, encoding="utf-8")
+    assert counter.count() == 2
+
+
+def test_project_state_is_cached_until_a_source_changes(workspace: Path) -> None:
+    provider = ProjectStateProvider(workspace)
+    first = provider.get_data()
+    assert first["active_skills"] == 3
+    assert first["telemetry_events"] == "2 total"
+
+    assert provider.get_data() is first
+    provider.wait()
+    assert provider.load_count == 1
+
+    telemetry = workspace / "data" / "telemetry.jsonl"
+    with telemetry.open("a", encoding="utf-8") as handle:
+        handle.write('{"a": 3}\n')
+    _bump_mtime(telemetry)
+    assert provider.get_data() is first  # served from cache while the worker reloads
+    provider.wait()
+    assert provider.get_data()["telemetry_events"] == "3 total"
+    assert provider.load_count == 2
+
+
+def test_refresh_reloads_synchronously_and_missing_sources_are_tracked(workspace: Path) -> None:
+    provider = ProjectStateProvider(workspace)
+    provider.get_data()
+    (workspace / "test_results.txt").write_text("12 passed in 1.0s\n", encoding="utf-8")
+    assert provider.refresh()["tests_passing"] == "12 passed in 1.0s"
+
+
+def test_codebase_index_is_loaded_once(workspace: Path) -> None:
+    index_path = workspace / "CODEBASE_INDEX_ENHANCED.json"
+    provider = CodebaseNavProvider(workspace)
+    assert provider.get_data() == {"error": "Index not found"}
+
+    index_path.write_text(json.dumps({"entry_points": [1, 2], "skills": [], "common_tasks": {"t": {}}}), encoding="utf-8")
+    data = provider.refresh()
+    assert data["entry_points"] == 2 and data["tasks"] == ["t"]
+    for _ in range(3):
+        provider.get_data()
+        provider.wait()
+    assert provider.load_count == 2
+
+
+def test_menu_system_warm_up_loads_providers(workspace: Path) -> None:
+    system = dev_dashboard.MenuSystem(workspace)
+    system.warm_up()
+    for menu_id in ("project_state", "skills_registry", "codebase_nav"):
+        provider = system.menus[menu_id].provider
+        provider.wait()
+        assert provider.load_count == 1
@@ -0,0 +1,164 @@
+"""Tests for the streaming diff summarizer used by commit_message.py."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.skills import diff_summary
+from src.skills.diff_summary import (
+    DEFAULT_EXCERPT_CHARS,
+    summarize_diff_lines,
+    summarize_diff_text,
+    summarize_staged_diff,
+)
+
+SAMPLE_DIFF = """diff --git a/src/auth.py b/src/auth.py
+index 1111111..2222222 100644
+--- a/src/auth.py
++++ b/src/auth.py
+@@ -1,3 +1,5 @@
+ import os
+--- a comment that starts with dashes
++class Token:
++    def refresh(self):
++        raise ValueError("expired")
+ x = 1
+diff --git a/docs/new.md b/docs/new.md
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/docs/new.md
+@@ -0,0 +1,2 @@
++# Title
++++ not a header
+diff --git a/old.txt b/old.txt
+deleted file mode 100644
+--- a/old.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+diff --git a/img.png b/img.png
+Binary files a/img.png and b/img.png differ
+diff --git a/a.py b/b.py
+similarity index 90%
+rename from a.py
+rename to b.py
+"""
+
+
+def _category(path: str) -> str:
+    return path.split("/", 1)[0] if "/" in path else "root"
+
+
+def test_summary_counts_files_lines_and_symbols():
+    summary = summarize_diff_text(SAMPLE_DIFF, categorize=_category)
+
+    by_path = {stats.path: stats for stats in summary.files}
+    assert list(by_path) == ["src/auth.py", "docs/new.md", "old.txt", "img.png", "b.py"]
+
+    auth = by_path["src/auth.py"]
+    assert (auth.added, auth.removed, auth.new_defs, auth.new_classes) == (3, 1, 1, 1)
+    assert (by_path["docs/new.md"].status, by_path["docs/new.md"].added) == ("added", 2)
+    assert (by_path["old.txt"].status, by_path["old.txt"].removed) == ("deleted", 1)
+    assert by_path["img.png"].binary
+    assert by_path["b.py"].status == "renamed"
+
+    assert (summary.added, summary.removed) == (5, 2)
+    assert summary.new_symbols == ["class Token", "def refresh"]
+    assert summary.categories["src"].files == 1
+    assert summary.categories["root"].files == 3
+    assert summary.categories["docs"].added == 2
+    assert summary.excerpt == SAMPLE_DIFF.rstrip("\n")
+
+
+def test_summary_memory_is_bounded_for_large_diffs():
+    def lines():
+        for index in range(2000):
+            yield f"diff --git a/pkg/m{index}.py b/pkg/m{index}.py\n"
+            yield f"--- a/pkg/m{index}.py\n"
+            yield f"+++ b/pkg/m{index}.py\n"
+            yield "@@ -1,1 +1,2 @@\n"
+            yield f"-old {index}\n"
+            yield f"+def fn_{index}():\n"
+            yield "+    return None\n"
+
+    summary = summarize_diff_lines(lines(), max_symbols=5)
+
+    assert len(summary.files) == 2000
+    assert (summary.added, summary.removed) == (4000, 2000)
+    assert len(summary.new_symbols) == 5
+    assert len(summary.excerpt) <= DEFAULT_EXCERPT_CHARS
+    assert summary.top_files(3)[0].churn == 3
+
+
+def test_summarize_staged_diff_streams_git_output(tmp_path: Path):
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "tool.py").write_text("def run():\n    return 1\n", encoding="utf-8")
+    git("add", "tool.py")
+
+    summary = summarize_staged_diff(tmp_path)
+
+    assert summary.paths == ["tool.py"]
+    assert summary.files[0].status == "added"
+    assert summary.new_symbols == ["def run"]
+
+
+def test_summarize_staged_diff_raises_outside_repo(tmp_path: Path):
+    with pytest.raises(RuntimeError):
+        summarize_staged_diff(tmp_path)
+
+
+def test_summarize_staged_diff_survives_stderr_flood(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    script = "import sys; sys.stderr.write('w' * 1_000_000); sys.stdout.write('+a\\n'); sys.exit(3)"
+    monkeypatch.setattr(diff_summary, "STAGED_DIFF_COMMAND", (sys.executable, "-c", script))
+
+    with pytest.raises(RuntimeError, match="www"):
+        summarize_staged_diff(tmp_path, timeout=30)
+
+
+def test_summarize_staged_diff_times_out_while_streaming(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    script = "import sys, time; print('+a', flush=True); time.sleep(30)"
+    monkeypatch.setattr(diff_summary, "STAGED_DIFF_COMMAND", (sys.executable, "-c", script))
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        summarize_staged_diff(tmp_path, timeout=1)
+
+
+def test_lone_carriage_return_stays_inside_its_line(tmp_path: Path):
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "f.txt").write_bytes(b"a\nb\nc\n")
+    git("add", "f.txt")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "base")
+    (tmp_path / "f.txt").write_bytes(b"a\rX\nb2\nc\n")
+    git("add", "f.txt")
+    diff = subprocess.run(
+        ["git", "diff", "--cached"], cwd=tmp_path, check=True, capture_output=True
+    ).stdout
+    patch = tmp_path / "staged.patch"
+    patch.write_bytes(diff)
+
+    expected = summarize_diff_text(diff.decode("utf-8"))
+    staged = summarize_staged_diff(tmp_path)
+    from_file = diff_summary.summarize_diff_file(patch)
+
+    assert (expected.files[0].added, expected.files[0].removed) == (2, 2)
+    for summary in (staged, from_file):
+        assert (summary.files[0].added, summary.files[0].removed) == (2, 2)
+        assert summary.content_hash == expected.content_hash
+
+
+def test_content_hash_tracks_diff_text():
+    first = summarize_diff_text("+a\n-b\n")
+
+    assert first.content_hash == summarize_diff_lines(["+a\n", "-b\r\n"]).content_hash
+    assert first.content_hash != summarize_diff_text("+a\n-c\n").content_hash
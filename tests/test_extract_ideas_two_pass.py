@@ -0,0 +1,99 @@
+"""Tests for the streaming map/reduce idea extraction pipeline."""
+
+from __future__ import annotations
+
+import csv
+import re
+from pathlib import Path
+
+import pytest
+
+from scripts import extract_ideas_two_pass as extract
+
+SHARED = (
+    "We should build the memory pipeline next, with the agent workflow spec as the core plan "
+    "for retrieval, routing, travel hotels and flight itineraries."
+)
+
+
+@pytest.fixture()
+def projects(tmp_path: Path) -> list[Path]:
+    roadtrip = tmp_path / "RoadTrip"
+    control = tmp_path / "ControlPlane"
+    for root in (roadtrip, control):
+        (root / "docs" / "deep").mkdir(parents=True)
+        (root / "node_modules" / "pkg").mkdir(parents=True)
+        (root / "build").mkdir()
+    (roadtrip / "notes.md").write_text(
+        f"{SHARED}\n\nshort\n\n00:12 - Should we decide how the travel itinerary dashboard works for the hotel flow?\n\n"
+        "<!-- hidden -->\n",
+        encoding="utf-8",
+    )
+    (roadtrip / "docs" / "plan.txt").write_text(
+        f"{SHARED} Expanded with more detail about evaluation.\n\n"
+        "The problem is a blocker: we need to implement the retrieval gate before the release.",
+        encoding="utf-8",
+    )
+    (roadtrip / "docs" / "deep" / "idea.MD").write_text(SHARED, encoding="utf-8")
+    (roadtrip / "docs" / "skip.py").write_text(SHARED, encoding="utf-8")
+    (control / "readme.md").write_text(SHARED + "\r\n\r\nconsider a proposal to automate the workflow pipeline checks", encoding="utf-8")
+    (control / "empty.md").write_text("   \n", encoding="utf-8")
+    for root in (roadtrip, control):
+        (root / "node_modules" / "pkg" / "README.md").write_text(SHARED, encoding="utf-8")
+        (root / "build" / "out.md").write_text(SHARED, encoding="utf-8")
+    return [roadtrip, control]
+
+
+def _csv(path: Path) -> list[dict[str, str]]:
+    with path.open(encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_walker_prunes_excluded_dirs_in_rglob_order(projects: list[Path]) -> None:
+    for root in projects:
+        expected = [
+            path
+            for path in root.rglob("*")
+            if path.is_file() and path.suffix.lower() in extract.INCLUDE_EXTS and not extract.is_excluded(path)
+        ]
+        assert list(extract.iter_candidate_files(root)) == expected
+    assert {path.name for path in extract.iter_candidate_files(projects[0])} == {"notes.md", "plan.txt", "idea.MD"}
+
+
+def test_normalize_and_tokenize_match_regex_reference() -> None:
+    text = "00:12 - Plan\r\n[01:02:03] next step\n00:01:02,500 --> 00:01:04,000\n  <!-- note -->  \nkeep: this one"
+    reference = text.replace("\r\n", "\n")
+    reference = re.sub(r"(?m)^\s*\d{1,2}:\d{2}(?::\d{2})?\s*[-–—]?\s*", "", reference)
+    reference = re.sub(r"(?m)^\s*\[\d{1,2}:\d{2}(?::\d{2})?\]\s*", "", reference)
+    reference = re.sub(r"(?m)^\s*\d{2}:\d{2}:\d{2}[,.]\d{3}\s*-->.*$", "", reference)
+    reference = re.sub(r"(?m)^\s*<!--.*?-->\s*$", "", reference)
+    assert extract.normalize_text(text) == reference
+
+    clean = re.sub(r"\s+", " ", re.sub(r"[^a-z0-9\s]", " ", text.lower())).strip()
+    assert extract.tokenize(text) == [t for t in clean.split(" ") if len(t) >= 3 and t not in extract.STOPWORDS]
+
+
+def test_partials_merge_into_shared_buckets(projects: list[Path], tmp_path: Path) -> None:
+    summary = extract.run_extraction(projects, tmp_path / "out", workers=1)
+    register = _csv(tmp_path / "out" / "idea_register.csv")
+    evidence = _csv(tmp_path / "out" / "idea_evidence.csv")
+
+    assert summary["files_scanned"] == 5
+    assert summary["candidates_found"] == len(evidence) == 7
+    shared = [row for row in register if row["mentions"] == "4"]
+    assert len(shared) == 1
+    assert shared[0]["source_count"] == "4"
+    assert shared[0]["idea_text"].endswith("Expanded with more detail about evaluation.")
+    assert shared[0]["sample_sources"].split(" | ")[0].endswith("notes.md")
+    assert not any("node_modules" in row["file_path"] or "build" in Path(row["file_path"]).parts for row in evidence)
+    assert [row["idea_id"] for row in evidence] == sorted(row["idea_id"] for row in evidence)
+
+
+def test_pool_and_spilled_evidence_match_serial_run(
+    projects: list[Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    extract.run_extraction(projects, tmp_path / "serial", workers=1)
+    monkeypatch.setattr(extract, "EVIDENCE_RUN_ROWS", 2)
+    extract.run_extraction(projects, tmp_path / "pool", workers=2)
+    for name in ("idea_register.csv", "idea_evidence.csv", "idea_themes.csv"):
+        assert (tmp_path / "serial" / name).read_bytes() == (tmp_path / "pool" / name).read_bytes()
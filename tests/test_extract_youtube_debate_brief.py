@@ -0,0 +1,89 @@
+"""Tests for single-pass debate brief analysis."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from scripts import extract_youtube_debate_brief as brief
+
+WORDS = (
+    "agents are always better than the benchmark and price cost never improved "
+    "why does this work like and subscribe thanks for watching model code"
+).split()
+
+
+def _per_section(full_text: str, segment_count: int):
+    sentences = brief.split_sentences(full_text)
+    topics = brief.infer_topics(full_text)
+    return (
+        topics,
+        brief.summarize_transcript(sentences, segment_count),
+        brief.build_analysis_section(sentences, topics),
+    )
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_single_pass_analysis_matches_per_section_passes(seed: int):
+    rng = random.Random(seed)
+    count = rng.choice([0, 1, 3, 40, 400, 5000])
+    texts = [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 15))) + rng.choice([".", "?", "!", "", ""])
+        for _ in range(count)
+    ]
+    full_text = " ".join(texts)
+
+    analysis = brief.analyze_transcript(full_text, count)
+
+    assert (analysis.topics, analysis.summary_lines, analysis.analysis_lines) == _per_section(full_text, count)
+
+
+def test_single_pass_question_answers_use_following_sentences():
+    full_text = (
+        "Why? Short. Second part of the answer. "
+        "Does this hold up when the benchmark numbers are independently reproduced by others? "
+        "Yes, and the reproduction used the exact same evaluation harness as the original paper. "
+        "Last one?"
+    )
+
+    analysis = brief.analyze_transcript(full_text, 4)
+
+    assert analysis.analysis_lines == _per_section(full_text, 4)[2]
+    assert "- Question: Why?" in analysis.analysis_lines
+    assert "  Implied answer: Short. Second part of the answer." in analysis.analysis_lines
+    assert "- Question: Last one?" not in analysis.analysis_lines
+
+
+def test_sentence_stream_matches_split_sentences():
+    rng = random.Random(11)
+    pieces = ["a", "b", " ", ".", "?", "!", "  ", "\t", ". ", "x.", "y?"]
+    for _ in range(500):
+        texts = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 6))) for _ in range(rng.randint(0, 8))]
+        stream = brief.SentenceStream()
+        sentences = [sentence for text in texts for sentence in stream.feed(text)] + stream.close()
+        assert sentences == brief.split_sentences(" ".join(texts))
+
+
+def test_streaming_writer_matches_in_memory_brief(tmp_path):
+    rng = random.Random(5)
+    segments = [
+        brief.Segment(start=i * 1.5, duration=1.5, text=" ".join(rng.choice(WORDS) for _ in range(8)) + rng.choice([".", "?", ""]))
+        for i in range(3000)
+    ]
+    frontmatter = {"title": "Debate: agents", "topics_detected": [], "generator_script": "test"}
+
+    analysis = brief.analyze_transcript(" ".join(seg.text for seg in segments), len(segments))
+    expected = brief.write_brief(
+        tmp_path,
+        "in-memory",
+        {**frontmatter, "topics_detected": analysis.topics},
+        brief.transcript_to_markdown_lines(segments),
+        analysis.summary_lines,
+        analysis.analysis_lines,
+    )
+    streamed, streamed_analysis = brief.write_brief_streaming(tmp_path, "streamed", frontmatter, iter(segments))
+
+    assert streamed.read_bytes() == expected.read_bytes()
+    assert streamed_analysis == analysis
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["in-memory.md", "streamed.md"]
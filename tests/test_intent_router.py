@@ -0,0 +1,120 @@
+"""Tests for the config-driven intent router."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from src.skills.intent_router import (
+    IntentRouter,
+    IntentRouterError,
+    benchmark_router,
+    get_router,
+)
+from src.skills.git_push_autonomous import _match_push_prompt
+
+PROMPTS = [
+    "please push the latest changes",
+    "Push my changes",
+    "git push",
+    "promote memory entry foo from working to episodic",
+    "move entry risk-list from prospective to long_term then git push",
+    "show me a list of skills",
+    "Registry list",
+    "list skills from working to episodic",
+    "what time is it",
+    "sync my updates",
+    "do a push",
+    "",
+    "   ",
+]
+
+
+def _sequential(routes, prompt: str) -> str:
+    normalized = (prompt or "").strip().lower()
+    if not normalized:
+        return "unknown"
+    for intent, patterns in routes:
+        if any(re.search(pattern, normalized) for pattern in patterns):
+            return intent
+    return "unknown"
+
+
+@pytest.mark.parametrize("router_name", ["adaptive_executor", "git_push_autonomous"])
+def test_combined_pattern_matches_sequential_search(router_name):
+    router = IntentRouter.from_config(router_name)
+
+    for prompt in PROMPTS:
+        assert router.route(prompt) == _sequential(router.routes, prompt), prompt
+
+
+def test_first_configured_intent_wins():
+    router = IntentRouter.from_config("adaptive_executor")
+
+    assert router.route("move entry x from working to episodic then git push") == "git_push"
+    assert router.route("list skills from working to episodic") == "memory_transition"
+    assert router.route("show skills") == "list_skills"
+    assert router.route("hello") == "unknown"
+
+
+def test_route_cache_is_bounded_lru():
+    router = IntentRouter([("greet", [r"\bhello\b"])], cache_size=2)
+
+    router.route("hello a")
+    router.route("hello b")
+    router.route("Hello A ")
+    router.route("hello c")
+
+    assert router.hits == 1
+    assert router.misses == 3
+    assert list(router._cache) == ["hello a", "hello c"]
+
+
+def test_invalid_pattern_and_missing_router(tmp_path: Path):
+    with pytest.raises(IntentRouterError):
+        IntentRouter([("bad", ["(unclosed"])])
+
+    routes = tmp_path / "intent-routes.yaml"
+    routes.write_text("routers:\n  other: []\n", encoding="utf-8")
+    with pytest.raises(IntentRouterError):
+        IntentRouter.from_config("adaptive_executor", routes)
+
+
+def test_get_router_reloads_on_file_change(tmp_path: Path):
+    routes = tmp_path / "intent-routes.yaml"
+    routes.write_text(
+        "routers:\n  demo:\n    - intent: greet\n      patterns: ['\\bhello\\b']\n",
+        encoding="utf-8",
+    )
+    first = get_router("demo", routes)
+    assert get_router("demo", routes) is first
+    assert first.route("hello there") == "greet"
+
+    stat = routes.stat()
+    routes.write_text(
+        "routers:\n  demo:\n    - intent: wave\n      patterns: ['\\bhello\\b']\n",
+        encoding="utf-8",
+    )
+    os.utime(routes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert get_router("demo", routes).route("hello there") == "wave"
+
+
+def test_git_push_prompt_matcher_uses_router():
+    assert _match_push_prompt("commit and push") is True
+    assert _match_push_prompt("push everything to the remote") is True
+    assert _match_push_prompt("show me a list of skills") is False
+    assert _match_push_prompt("") is False
+
+
+def test_benchmark_router_reports_throughput():
+    router = IntentRouter.from_config("adaptive_executor")
+
+    stats = benchmark_router(router, ["git push", "list skills", "noop"], total=300)
+
+    assert stats["prompts"] == 300
+    assert stats["cache_misses"] == 3
+    assert stats["cache_hits"] == 297
+    assert stats["combined_pattern_per_sec"] > 0
@@ -0,0 +1,73 @@
+"""Tests for the compiled known-solutions index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.skills.known_solutions import KnownSolutionIndex, load_known_solution_index
+
+SOLUTIONS = [
+    {
+        "id": "push-auth",
+        "intent": "git_push",
+        "matches": {
+            "error_codes": ["EXECUTION_FAILED", "execution_exception"],
+            "message_patterns": ["authentication failed", "credential"],
+        },
+    },
+    {
+        "id": "any-timeout",
+        "matches": {"message_patterns": [r"timed?\s*out"]},
+    },
+    {
+        "id": "push-catch-all",
+        "intent": "GIT_PUSH",
+        "matches": {},
+    },
+    {
+        "id": "bad-pattern",
+        "intent": "memory_transition",
+        "matches": {"message_patterns": ["(unclosed"]},
+    },
+    "not-a-dict",
+]
+
+
+def test_lookup_respects_intent_code_and_patterns():
+    index = KnownSolutionIndex(SOLUTIONS)
+
+    assert len(index) == 4
+    assert index.lookup("git_push", "EXECUTION_EXCEPTION", "Credential helper missing")["id"] == "push-auth"
+    assert index.lookup("git_push", "FINGERPRINT_MISMATCH", "credential")["id"] == "push-catch-all"
+    assert index.lookup("list_skills", "ANY", "request TIMED OUT")["id"] == "any-timeout"
+    assert index.lookup("list_skills", "ANY", "boom") is None
+    assert index.lookup("memory_transition", "ANY", "(unclosed") is None
+
+
+def test_lookup_prefers_file_order_across_buckets():
+    index = KnownSolutionIndex(
+        [
+            {"id": "wild", "matches": {"message_patterns": ["disk"]}},
+            {"id": "specific", "intent": "git_push", "matches": {"error_codes": ["X"]}},
+        ]
+    )
+
+    assert index.lookup("git_push", "X", "disk full")["id"] == "wild"
+    assert index.lookup("git_push", "X", "other")["id"] == "specific"
+
+
+def test_shared_index_reloads_on_file_change(tmp_path: Path):
+    path = tmp_path / "known-solutions.yaml"
+    path.write_text("solutions:\n  - id: first\n", encoding="utf-8")
+
+    first = load_known_solution_index(path)
+    assert load_known_solution_index(path) is first
+    assert first.lookup("x", "Y", "z")["id"] == "first"
+
+    stat = path.stat()
+    path.write_text("solutions:\n  - id: second\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_known_solution_index(path).lookup("x", "Y", "z")["id"] == "second"
+    assert len(load_known_solution_index(tmp_path / "missing.yaml")) == 0
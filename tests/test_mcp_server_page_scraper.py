@@ -0,0 +1,269 @@
+"""Tests for the page scraper batch engine against a local HTTP server."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+import mcp_server_page_scraper as scraper
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\nfake"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: list[int] = []
+    requests: list[str] = []
+    not_modified: list[str] = []
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with self.lock:
+            self.connections.append(id(self.connection))
+
+    def log_message(self, *_args) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/html", extra: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        with self.lock:
+            self.requests.append(self.path)
+        if self.path.startswith("/cached/") or self.path.startswith("/asset/"):
+            etag = '"v1"'
+            if self.headers.get("If-None-Match") == etag:
+                with self.lock:
+                    self.not_modified.append(self.path)
+                self._send(304, b"", extra={"ETag": etag})
+                return
+            if self.path.startswith("/asset/"):
+                self._send(200, PNG_BYTES, content_type="image/png", extra={"ETag": etag})
+                return
+            name = self.path.rsplit("/", 1)[-1]
+            html = (
+                f"<html><head><title>Cached {name}</title></head><body><article>"
+                f'<p>Text {name}</p><img src="/asset/{name}-a.png"><img src="/asset/{name}-b.png">'
+                "</article></body></html>"
+            )
+            self._send(200, html.encode("utf-8"), extra={"ETag": etag})
+        elif self.path.startswith("/page/"):
+            name = self.path.rsplit("/", 1)[-1]
+            html = (
+                f"<html><head><title>Page {name}</title></head><body><article>"
+                f"<h1>Heading {name}</h1><p>Body of {name}.</p>"
+                f'<img src="/img/shared.png" alt="shared"><img src="/img/{name}.png" alt="own">'
+                "</article></body></html>"
+            )
+            self._send(200, html.encode("utf-8"))
+        elif self.path.startswith("/img/"):
+            self._send(200, PNG_BYTES, content_type="image/png")
+        elif self.path == "/moved":
+            self._send(301, b"", extra={"Location": "/page/target"})
+        else:
+            self._send(404, b"missing")
+
+
+@pytest.fixture()
+def server():
+    _Handler.connections = []
+    _Handler.requests = []
+    _Handler.not_modified = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_batch_scrapes_concurrently_with_reused_connections(server, tmp_path: Path):
+    urls = [f"{server}/page/p{i}" for i in range(12)]
+
+    result = scraper.scrape_pages_batch(
+        ",".join(urls),
+        output_dir=str(tmp_path),
+        prefer_raw_markdown=False,
+        max_workers=6,
+        per_host_limit=3,
+        use_http_cache=False,
+    )
+
+    assert result["succeeded"] == 12
+    assert [item["source_url"] for item in result["results"]] == urls
+    assert all(item["elapsed_ms"] >= 0 for item in result["results"])
+    assert result["per_host_limit"] == 3
+    # Keep-alive: far fewer TCP connections than requests, never above the per-host cap.
+    assert len(_Handler.requests) == 12 * 3
+    assert len(_Handler.connections) <= 3
+
+    first = tmp_path / result["results"][0]["slug"]
+    markdown = first.with_suffix(".md").read_text(encoding="utf-8")
+    assert "# Heading p0" in markdown
+    assert f"]({first.name}-images/shared_png)" in markdown
+    assert (tmp_path / f"{first.name}-images" / "p0_png").read_bytes() == PNG_BYTES
+
+
+def test_batch_reports_errors_and_follows_redirects(server, tmp_path: Path):
+    result = scraper.scrape_pages_batch(
+        f"{server}/nope,{server}/moved",
+        output_dir=str(tmp_path),
+        localize_images=False,
+        prefer_raw_markdown=False,
+        use_http_cache=False,
+    )
+
+    missing, moved = result["results"]
+    assert missing["status"] == "error"
+    assert "404" in missing["error"]
+    assert moved["status"] == "ok"
+    assert moved["title"] == "Page target"
+    assert result["succeeded"] == 1 and result["failed"] == 1
+
+
+def test_fetch_text_uses_shared_pool(server):
+    pool = scraper._HttpPool(per_host_limit=1)
+    try:
+        for _ in range(3):
+            assert "Page a" in scraper._fetch_text(f"{server}/page/a", pool=pool)
+    finally:
+        pool.close()
+
+    assert len(_Handler.connections) == 1
+
+
+def test_rescrape_revalidates_and_dedupes_images(server, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    out = tmp_path / "out"
+    url = f"{server}/cached/doc"
+
+    first = scraper.scrape_page_to_markdown(
+        url, output_dir=str(out), prefer_raw_markdown=False, cache_dir=str(cache_dir)
+    )
+    assert first["status"] == "ok"
+    assert first["image_count"] == 2
+    local_a, local_b = (Path(item["local_path"]) for item in first["images"])
+    # Identical image bytes from two URLs share one inode with the cache blob.
+    assert local_a.stat().st_ino == local_b.stat().st_ino
+    assert local_a.read_bytes() == PNG_BYTES
+
+    for image in first["images"]:
+        Path(image["local_path"]).unlink()
+    second = scraper.scrape_page_to_markdown(
+        url, output_dir=str(out), prefer_raw_markdown=False, cache_dir=str(cache_dir)
+    )
+
+    assert second["status"] == "ok"
+    assert sorted(_Handler.not_modified) == sorted(
+        ["/cached/doc", "/asset/doc-a.png", "/asset/doc-b.png"]
+    )
+    assert Path(second["images"][0]["local_path"]).read_bytes() == PNG_BYTES
+    cache = scraper._get_http_cache(True, cache_dir)
+    assert cache.revalidated == 3
+    assert (cache_dir / "index.json").exists()
+
+
+def test_http_cache_evicts_least_recently_used(tmp_path: Path):
+    from email.message import Message
+
+    headers = Message()
+    headers["ETag"] = '"x"'
+    cache = scraper._HttpCache(tmp_path, max_bytes=10)
+
+    cache.put("http://h/a", headers, b"aaaa")
+    cache.put("http://h/b", headers, b"bbbb")
+    assert cache.read("http://h/a") == b"aaaa"
+    cache.put("http://h/c", headers, b"cccc")
+
+    assert cache.read("http://h/b") is None
+    assert cache.read("http://h/a") == b"aaaa"
+    assert cache.total_bytes == 8
+    assert len(list((tmp_path / "blobs").iterdir())) == 2
+    # Puts and LRU touches only mark the index dirty until flush().
+    assert not (tmp_path / "index.json").exists()
+    cache.flush()
+
+    reloaded = scraper._HttpCache(tmp_path, max_bytes=10)
+    assert reloaded.validators("http://h/c") == {"If-None-Match": '"x"'}
+    assert reloaded.total_bytes == 8
+    # The touch of "a" above survives the reload: "c" is now the oldest entry.
+    reloaded.put("http://h/e", headers, b"eeee")
+    assert reloaded.read("http://h/c") is None
+    assert reloaded.read("http://h/a") == b"aaaa"
+
+    untagged = Message()
+    cache.put("http://h/d", untagged, b"dddd")
+    assert cache.read("http://h/d") is None
+
+
+MARKDOWN_CORPUS = [
+    "<h1>Title</h1><p>Intro with <a href=\"/docs\">docs</a> and <code>x = 1</code>.</p>",
+    "<h2>Links &amp; images</h2><p><a href=\"https://e.com/a\"></a><img src=\"/i.png\" alt=\" Pic \"></p>",
+    "<ul><li>one <a href=\"/1\">first</a></li><li><code>two</code></li><li></li></ul><hr>",
+    "<div><script>var a = '<p>';</script><style>p{}</style><noscript>js</noscript>Body<br/>line</div>",
+    "<article><h3><a href=\"/x\">Linked <code>heading</code></a></h3><pre><code>flat code</code></pre></article>",
+    "<p>Entities: &copy; &#169; &#xA9; AT&T &nbsp;spaced\ttabs</p><!-- gone --><section>s</section>",
+    "<ul><li>unclosed item<li>another</ul><p><a href=\"/open\">never closed",
+    "<pre><code>def f():\n    return 1 &lt; 2\n\n\n\tpass  \n</code></pre><p>after   code</p>",
+    "<ul><li>item <pre><code>  nested\n  block</code></pre></li></ul><h2>&lt;tag&gt; &amp;lt;kept&amp;gt;</h2>",
+    "<h2>Outer <h3>inner</h3> tail</h2><h3><h2>flattened</h2></h3><a href=\"/q?a=1&amp;b=2\"><li>x</li></a>",
+    "<li><code>x</li><code>y</code><pre><code>unterminated block",
+]
+
+
+@pytest.mark.parametrize("fragment", MARKDOWN_CORPUS)
+def test_parser_markdown_matches_regex_pipeline(fragment: str):
+    base_url = "https://example.com/page/"
+    expected = scraper._html_fragment_to_markdown_regex(fragment, base_url)
+
+    assert scraper._html_fragment_to_markdown_parser(fragment, base_url) == expected
+    assert scraper._html_fragment_to_markdown(fragment, base_url) == expected
+
+
+def test_markdown_keeps_code_blocks_verbatim():
+    code_block = "<pre><code>def f():\n    return 1 &lt; 2\n</code></pre>"
+    fragment = code_block + "<ul><li>after</li></ul><h2>&lt;tag&gt; title</h2>"
+
+    markdown = scraper._html_fragment_to_markdown(fragment, "https://example.com/")
+
+    assert markdown == "```\ndef f():\n    return 1 < 2\n```\n- after\n\n## <tag> title\n"
+    # An unrelated unclosed tag must not change how the code block renders.
+    sloppy = scraper._html_fragment_to_markdown(code_block + "<ul><li>unclosed", "https://example.com/")
+    assert sloppy.startswith("```\ndef f():\n    return 1 < 2\n```\n")
+
+
+def test_markdown_handles_many_unclosed_tags():
+    items = scraper._html_fragment_to_markdown("<ul>" + "<li>item " * 5000 + "</ul>", "https://e.com/")
+    links = scraper._html_fragment_to_markdown("<p>" + '<a href="/x">link ' * 5000, "https://e.com/")
+
+    assert items == ("item " * 5000).strip() + "\n"
+    assert links == ("link " * 5000).strip() + "\n"
+
+
+def test_extract_best_fragment_prefers_article_then_page_wrapper():
+    html = (
+        "<body><main>m</main><div id=\"w\" class=\"x page-wrapper\"><div>in</div>w</div>"
+        "<article><div>a</div></article></body>"
+    )
+    assert scraper._extract_best_fragment(html) == "<article><div>a</div></article>"
+
+    no_article = html.replace("<article><div>a</div></article>", "")
+    assert scraper._extract_best_fragment(no_article) == "<main>m</main>"
+
+    # The wrapper lookup returns the closest <div> opened before the match.
+    wrapped = "<body><div id=\"shell\"><div class=\"page-wrapper\">w</div></div><p>x</p></body>"
+    assert scraper._extract_best_fragment(wrapped) == (
+        "<div id=\"shell\"><div class=\"page-wrapper\">w</div></div>"
+    )
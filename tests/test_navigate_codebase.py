@@ -0,0 +1,154 @@
+"""Tests for the navigate_codebase trigram search index."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from scripts import navigate_codebase
+from scripts.navigate_codebase import CodebaseNavigator, SearchIndex, exists_many
+
+OLD_INDEX = {
+    "index": {
+        "USER_PATH": {
+            "description": "User-facing flows",
+            "orchestrators": ["src/publish_blog.py", "src/orchestrate_blog_publish.py"],
+            "skills": ["src/skills/blog_publisher.py", "src/skills/auth_validator.py"],
+        },
+        "DEV_PATH": {
+            "description": "Tooling",
+            "scripts": ["scripts/navigate_codebase.py", "scripts/dev_dashboard.py", "README.md"],
+            "docs": ["docs/PUBLISHING_Guide.md", "src/README_Main.md"],
+        },
+    }
+}
+
+ENHANCED_INDEX = {
+    "taxonomies": {},
+    "file_classifications": {
+        "by_layer": {"SKILL": ["src/skills/blog_publisher.py"], "CONFIG": ["config/skills-registry.yaml"]},
+    },
+    "skills": [{"name": "blog_publisher", "file": "src/skills/blog_publisher.py", "layer": "SKILL"}],
+    "libraries": [{"file": "src/skills/models/fingerprint.py", "layer": "SKILL", "exports": ["calculate_fingerprint"]}],
+    "entry_points": {"programmatic_apis": ["src/skills/blog_publisher.py::BlogPublisher"]},
+}
+
+
+def _write_index(root: Path, name: str, index: dict) -> Path:
+    path = root / name
+    path.write_text(json.dumps(index), encoding="utf-8")
+    return path
+
+
+def _naive(index: dict, query: str, case_sensitive: bool = False) -> list[tuple[str, str, str]]:
+    pattern = re.compile(query, flags=0 if case_sensitive else re.IGNORECASE)
+    return [
+        (file, path_name, category)
+        for path_name, path_data in index["index"].items()
+        for category, files in path_data.items()
+        if category != "description" and isinstance(files, list)
+        for file in files
+        if pattern.search(file)
+    ]
+
+
+@pytest.fixture()
+def old_navigator(tmp_path: Path) -> CodebaseNavigator:
+    _write_index(tmp_path, "CODEBASE_INDEX.json", OLD_INDEX)
+    (tmp_path / "src" / "skills").mkdir(parents=True)
+    (tmp_path / "src" / "publish_blog.py").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "skills" / "blog_publisher.py").write_text("", encoding="utf-8")
+    return CodebaseNavigator("CODEBASE_INDEX.json", repo_root=tmp_path)
+
+
+@pytest.mark.parametrize(
+    "query, case_sensitive",
+    [
+        ("blog", False),
+        ("BLOG", False),
+        ("BLOG", True),
+        ("README", True),
+        ("readme", True),
+        ("Main", True),
+        ("_Guide", True),
+        ("_GUIDE", True),
+        ("py", False),
+        ("skills/.*_pub", False),
+        ("^src/(skills|publish)", False),
+        ("dash|navig", False),
+        (r"\.md$", False),
+        ("x" * 5, False),
+        ("", False),
+    ],
+)
+def test_trigram_search_matches_naive_scan(old_navigator: CodebaseNavigator, query: str, case_sensitive: bool) -> None:
+    found = [(r["file"], r["path"], r["category"]) for r in old_navigator.find(query, case_sensitive)]
+    assert found == _naive(OLD_INDEX, query, case_sensitive)
+
+
+def test_required_literals_only_prefilter_safe_runs() -> None:
+    assert navigate_codebase._required_literals("Blog.*pub", case_sensitive=False) == ["blog", "pub"]
+    assert navigate_codebase._required_literals("a|bcd", case_sensitive=False) == []
+    assert navigate_codebase._required_literals("(blog)", case_sensitive=False) == []
+    assert navigate_codebase._required_literals("Blog", case_sensitive=True) == ["blog"]
+
+
+def test_existence_is_checked_per_directory(old_navigator: CodebaseNavigator, tmp_path: Path) -> None:
+    results = {r["file"]: r["exists"] for r in old_navigator.find("blog")}
+    assert results == {
+        "src/publish_blog.py": True,
+        "src/orchestrate_blog_publish.py": False,
+        "src/skills/blog_publisher.py": True,
+    }
+    assert exists_many(tmp_path, ["missing/dir/file.py", "src/publish_blog.py"]) == {
+        "missing/dir/file.py": False,
+        "src/publish_blog.py": True,
+    }
+
+
+def test_enhanced_index_searches_files_and_symbols(tmp_path: Path) -> None:
+    _write_index(tmp_path, "CODEBASE_INDEX_ENHANCED.json", ENHANCED_INDEX)
+    navigator = CodebaseNavigator(repo_root=tmp_path)
+    assert [(r["symbol"], r["file"]) for r in navigator.find("fingerprint")] == [
+        ("calculate_fingerprint", "src/skills/models/fingerprint.py")
+    ]
+    assert [(r["path"], r["category"]) for r in navigator.find("blog_?publisher")] == [
+        ("by_layer", "SKILL"),
+        ("skills", "SKILL"),
+        ("entry_points", "programmatic_apis"),
+    ]
+
+
+def test_search_index_is_persisted_and_rebuilt_when_stale(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index_path = _write_index(tmp_path, "CODEBASE_INDEX.json", OLD_INDEX)
+    sidecar = SearchIndex.sidecar_path(index_path)
+    CodebaseNavigator("CODEBASE_INDEX.json", repo_root=tmp_path).find("blog")
+    assert sidecar.exists()
+
+    builds = []
+    original_build = SearchIndex.build.__func__
+    monkeypatch.setattr(SearchIndex, "build", classmethod(lambda cls, index: builds.append(1) or original_build(cls, index)))
+    assert len(CodebaseNavigator("CODEBASE_INDEX.json", repo_root=tmp_path).find("blog")) == 3
+    assert builds == []
+
+    updated = {"index": {"NEW": {"scripts": ["scripts/new_blog_tool.py"]}}}
+    _write_index(tmp_path, "CODEBASE_INDEX.json", updated)
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    results = CodebaseNavigator("CODEBASE_INDEX.json", repo_root=tmp_path).find("blog")
+    assert [r["file"] for r in results] == ["scripts/new_blog_tool.py"]
+    assert builds == [1]
+
+
+def test_interactive_results_are_cached(old_navigator: CodebaseNavigator, capsys: pytest.CaptureFixture[str]) -> None:
+    old_navigator.cache_results = True
+    first = old_navigator.find("blog")
+    assert old_navigator.find("blog") is first
+    assert old_navigator.find("blog", case_sensitive=True) is not first
+
+    old_navigator.search("(unclosed")
+    assert "Invalid search pattern" in capsys.readouterr().out
@@ -5,8 +5,10 @@ Tests execution_models, skill_base, config_resolver, skill_dag, dag_builder,
 skill_loader, and dag_executor.
 """
 
+import os
 import pytest
 import time
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
 
@@ -31,8 +33,10 @@ from src.skills.dag import (
     ConfigSource,
     SkillLoader,
     SkillLoaderError,
-    InterfaceValidationError
+    InterfaceValidationError,
+    LazySkill
 )
+from src.skills.registry.registry_models import SkillMetadata
 
 
 # ============================================================================
@@ -306,6 +310,72 @@ class TestConfigResolver:
         
         value = resolver.get("missing", default="default_value")
         assert value == "default_value"
+    
+    def test_env_file_reloaded_on_mtime_change(self, tmp_path):
+        """Test snapshot is rebuilt when the .env file changes."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("RT_TEST_KEY=one\n")
+        
+        resolver = ConfigResolver(file_check_interval=0)
+        resolver.set_env_file(str(env_file))
+        resolver.register_defaults_batch({"RT_TEST_KEY": "default"})
+        assert resolver.get("RT_TEST_KEY") == "one"
+        
+        stat = env_file.stat()
+        env_file.write_text("RT_TEST_OTHER=two\n")
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert resolver.get("RT_TEST_KEY") == "default"
+        assert resolver.get_source("RT_TEST_KEY") == ConfigSource.DEFAULT
+        assert resolver.get("RT_TEST_OTHER") == "two"
+    
+    def test_deleted_env_and_secrets_files_are_dropped(self, tmp_path):
+        """Test values from a deleted .env or secrets file stop being served."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("RT_TEST_ENV_ONLY=from_file\n")
+        secrets_file = tmp_path / "secrets.json"
+        secrets_file.write_text('{"RT_TEST_SECRET": "hunter2"}')
+    
+        resolver = ConfigResolver(file_check_interval=0)
+        resolver.set_env_file(str(env_file))
+        resolver.set_secrets_file(str(secrets_file))
+        assert resolver.get("RT_TEST_ENV_ONLY") == "from_file"
+        assert resolver.get("RT_TEST_SECRET") == "hunter2"
+    
+        env_file.unlink()
+        secrets_file.unlink()
+    
+        assert resolver.get("RT_TEST_ENV_ONLY", default="gone") == "gone"
+        assert resolver.get("RT_TEST_SECRET", default="gone") == "gone"
+    
+    def test_os_environ_stays_live_over_snapshot(self, monkeypatch):
+        """Test os.environ overrides secrets/defaults but not hardcoded."""
+        resolver = ConfigResolver()
+        resolver.register_default("RT_TEST_LIVE", "default")
+        resolver.register_hardcoded("RT_TEST_PINNED", "hardcoded")
+        assert resolver.get("RT_TEST_LIVE") == "default"
+        
+        monkeypatch.setenv("RT_TEST_LIVE", "from_env")
+        monkeypatch.setenv("RT_TEST_PINNED", "from_env")
+        
+        assert resolver.get_with_source("RT_TEST_LIVE") == ("from_env", ConfigSource.ENV)
+        assert resolver.debug_config("RT_TEST_LIVE")["origin"] == "os_environ"
+        assert resolver.get("RT_TEST_PINNED") == "hardcoded"
+    
+    def test_get_many_prefix(self):
+        """Test bulk prefix lookup for per-skill config."""
+        resolver = SkillConfigResolver()
+        resolver.register_skill_defaults("rt_github", {"url": "https://x", "token": "d"})
+        resolver.register_skill_hardcoded("rt_github", "token", "abc123")
+        
+        assert resolver.get_many("RT_GITHUB_") == {
+            "RT_GITHUB_TOKEN": "abc123",
+            "RT_GITHUB_URL": "https://x",
+        }
+        assert resolver.get_skill_config_all("rt_github") == {
+            "token": "abc123",
+            "url": "https://x",
+        }
 
 
 # ============================================================================
@@ -549,6 +619,101 @@ class TestSkillLoader:
         
         errors = loader.validate(skill)
         assert len(errors) > 0
+    
+    @staticmethod
+    def _write_skill_file(path: Path, class_name: str) -> SkillMetadata:
+        path.write_text(
+            "from src.skills.dag import SkillBase, SkillResult, ExecutionStatus\n"
+            "\n"
+            f"class {class_name}(SkillBase):\n"
+            "    def description(self):\n"
+            "        return 'file skill'\n"
+            "\n"
+            "    def validate_inputs(self, inputs):\n"
+            "        return True, None\n"
+            "\n"
+            "    def execute(self, context):\n"
+            "        return SkillResult(skill_name=self.name, skill_version=self.version,\n"
+            "                           status=ExecutionStatus.COMPLETED, output='ran')\n",
+            encoding="utf-8"
+        )
+        return SkillMetadata(
+            name=path.stem,
+            version="1.0.0",
+            fingerprint="",
+            author="test",
+            capabilities=[],
+            entry_point=path.name
+        )
+    
+    def test_lazy_load_defers_import_until_execution(self, tmp_path):
+        """Test lazy proxies import only the skills that execute."""
+        ran = self._write_skill_file(tmp_path / "lazy_ran.py", "RanSkill")
+        idle = self._write_skill_file(tmp_path / "lazy_idle.py", "IdleSkill")
+        
+        loader = SkillLoader()
+        skills = loader.load_from_metadata_batch([ran, idle], str(tmp_path), lazy=True)
+        
+        assert all(isinstance(s, LazySkill) for s in skills.values())
+        assert loader.get_import_times() == {}
+        
+        dag = SkillDAG()
+        dag.add_node(skills["lazy_ran"])
+        result = DAGExecutor(dag).execute()
+        
+        assert result.status == ExecutionStatus.COMPLETED
+        assert skills["lazy_ran"].is_loaded
+        assert not skills["lazy_idle"].is_loaded
+        assert set(loader.get_import_times()) == {"lazy_ran"}
+    
+    def test_preload_batch(self, tmp_path):
+        """Test thread-pool preload of several entry points."""
+        metadata = [
+            self._write_skill_file(tmp_path / f"pre_{i}.py", "PreSkill")
+            for i in range(3)
+        ]
+        
+        loader = SkillLoader()
+        skills = loader.load_from_metadata_batch(metadata, str(tmp_path), preload_workers=3)
+        
+        assert set(skills) == {"pre_0", "pre_1", "pre_2"}
+        assert set(loader.get_import_times()) == {"pre_0", "pre_1", "pre_2"}
+    
+    def test_class_cache_skips_import_until_file_changes(self, tmp_path):
+        """Test an unchanged entry point is imported and validated once."""
+        path = tmp_path / "shared.py"
+        v1 = self._write_skill_file(path, "SharedSkill")
+        v2 = replace(v1, version="2.0.0")
+        
+        loader = SkillLoader()
+        first = loader.load(v1, str(tmp_path))
+        second = loader.load(v2, str(tmp_path))
+        
+        assert type(first) is type(second)
+        assert len(loader._class_cache) == 1
+        
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        v3 = replace(v1, version="3.0.0")
+        
+        assert type(loader.load(v3, str(tmp_path))) is not type(first)
+        assert len(loader._class_cache) == 2
+    
+    def test_preload_reports_failures(self, tmp_path):
+        """Test preload returns errors for broken entry points."""
+        missing = SkillMetadata(
+            name="missing",
+            version="1.0.0",
+            fingerprint="",
+            author="test",
+            capabilities=[],
+            entry_point="missing.py"
+        )
+        
+        loader = SkillLoader()
+        failures = loader.preload([missing], str(tmp_path))
+        
+        assert "missing" in failures
 
 
 # ============================================================================
@@ -0,0 +1,120 @@
+"""Tests for ppa_ask memory-search scoring over the persistent evidence index."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from scripts import ppa_ask
+
+SUMMARY = {
+    "approaches": [
+        {"approach": "memory-and-retrieval", "keywords": ["memory", "retrieval", "notebooklm"]},
+        {"approach": "identity-auth-governance", "keywords": ["auth", "policy"]},
+    ],
+    "principles": [{"principle": "retrieval should be grounded in your own artifacts"}],
+}
+
+
+def _stamp(days_ago: int) -> str:
+    return (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _events() -> list[dict[str, object]]:
+    return [
+        {"source_file": "Session Log 1.md", "event_kind": "prompt", "timestamp": _stamp(2), "pair_index": 1,
+         "approaches": ["memory-and-retrieval"], "stance": "adopted-or-endorsed",
+         "text": "We decided memory retrieval should use session logs memory memory memory."},
+        {"source_file": "Session Log 1.md", "event_kind": "response", "timestamp": _stamp(20), "pair_index": 1,
+         "approaches": ["memory-and-retrieval", "identity-auth-governance"], "stance": "open-question",
+         "text": "Should auth policy gate memory access?"},
+        {"source_file": "Session Log 2.md", "event_kind": "prompt", "timestamp": "not a timestamp", "pair_index": 1,
+         "approaches": ["general"], "stance": "exploration", "text": "Retrieval of youtube transcripts."},
+        {"source_file": "Session Log 2.md", "event_kind": "response", "timestamp": None, "pair_index": 1,
+         "approaches": ["memory-and-retrieval"], "stance": "exploration", "text": ""},
+        {"source_file": "Session Log 3.md", "event_kind": "prompt", "timestamp": _stamp(60), "pair_index": 2,
+         "approaches": ["memory-and-retrieval"], "stance": "rejected-or-deprioritized",
+         "text": "Rejected notebooklm as the only memory store."},
+        {"source_file": "Session Log 3.md", "event_kind": "response", "timestamp": _stamp(200), "pair_index": 2,
+         "approaches": ["developer-workflow"], "stance": "adopted-or-endorsed", "text": "Unrelated build script."},
+    ] + [
+        # Identical rows tie on score; rank order must fall back to file order.
+        {"source_file": "Session Log 5.md", "event_kind": "prompt", "timestamp": _stamp(3), "pair_index": index,
+         "approaches": ["memory-and-retrieval"], "stance": "exploration", "text": f"memory tie {index}"}
+        for index in range(4)
+    ]
+
+
+@pytest.fixture()
+def events_file(tmp_path: Path) -> Path:
+    path = tmp_path / "session_log_events.jsonl"
+    lines = [json.dumps(row) for row in _events()]
+    lines.insert(2, "")  # blank lines are skipped like load_jsonl does
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("question", [
+    "what did we decide about memory retrieval",
+    "memory memory auth",
+    "youtube transcripts",
+    "policy",
+    "nothing matches here",
+])
+@pytest.mark.parametrize("mode", ["fast", "slow", "slower"])
+@pytest.mark.parametrize("vectorized", [False, pytest.param(True, marks=pytest.mark.skipif(ppa_ask.np is None, reason="numpy"))])
+def test_index_scores_match_full_scan(events_file: Path, question: str, mode: str, vectorized: bool):
+    events = ppa_ask.load_jsonl(events_file)
+    index = ppa_ask.EvidenceIndex.build(events_file)
+    hints = ppa_ask.infer_approach_hints(question, SUMMARY)
+    weights = {"Session Log 3.md": 0.3}
+
+    expected = ppa_ask.score_events(events, question, hints, weights, mode)
+    top, total = index.score(question, hints, weights, mode, limit=3, vectorized=vectorized)
+
+    assert total == len(expected)
+    assert [(item.score, item.event) for item in top] == [(item.score, item.event) for item in expected[:3]]
+
+
+def test_index_persists_and_rebuilds_when_events_change(events_file: Path):
+    index_dir = ppa_ask.default_evidence_index_dir(events_file)
+    first = ppa_ask.EvidenceIndex.open(events_file)
+    assert (index_dir / "meta.json").exists()
+    assert len(first) == 9
+    first.close()
+
+    reopened = ppa_ask.EvidenceIndex.load(events_file)
+    assert reopened is not None and reopened.terms == first.terms
+    reopened.close()
+
+    with events_file.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"source_file": "Session Log 4.md", "event_kind": "prompt",
+                                 "timestamp": _stamp(1), "approaches": [], "stance": "exploration",
+                                 "text": "brand new zanzibar idea"}) + "\n")
+    stat = events_file.stat()
+    os.utime(events_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert ppa_ask.EvidenceIndex.load(events_file) is None
+    rebuilt = ppa_ask.EvidenceIndex.open(events_file)
+    top, total = rebuilt.score("zanzibar", [], {}, "fast")
+    assert total == 1 and top[0].event["source_file"] == "Session Log 4.md"
+    rebuilt.close()
+
+
+def test_run_memory_search_accepts_index(events_file: Path, monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(ppa_ask, "TRIAGE_DIR", tmp_path / "triage")
+    question = "what did we decide about memory retrieval"
+
+    from_scan = ppa_ask.run_memory_search("q1", question, "memory-search", SUMMARY, ppa_ask.load_jsonl(events_file), {})
+    index = ppa_ask.EvidenceIndex.open(events_file)
+    from_index = ppa_ask.run_memory_search("q1", question, "memory-search", SUMMARY, index, {})
+    index.close()
+
+    for package in (from_scan, from_index):
+        package["completion_package"]["request"].pop("received_at")
+    assert from_index["evidence"] == from_scan["evidence"]
+    assert from_index["completion_package"]["retrieve"] == from_scan["completion_package"]["retrieve"]
@@ -5,12 +5,17 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
+from src.skills import release_evidence_gate
 from src.skills.release_evidence_gate import (
     ADVISORY_EVIDENCE_KEYS,
     BLOCKING_TELEMETRY_KEYS,
     REQUIRED_EVIDENCE_KEYS,
+    TelemetryValidationCache,
     build_default_manifest,
     evaluate_manifest,
+    validate_telemetry_files,
 )
 
 
@@ -118,3 +123,139 @@ def test_evaluate_manifest_no_go_when_telemetry_invalid(tmp_path: Path):
 
     assert result.decision == "NO-GO"
     assert sorted(result.invalid_telemetry_files) == sorted(BLOCKING_TELEMETRY_KEYS)
+
+
+def _reference_validate(path: Path) -> tuple[bool, bool]:
+    """The original line-by-line JSONL check."""
+
+    has_any = False
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                has_any = True
+                try:
+                    payload = json.loads(stripped)
+                except json.JSONDecodeError:
+                    return False, False
+                if not isinstance(payload, dict):
+                    return False, False
+    except UnicodeDecodeError:
+        return False, False
+    return True, has_any
+
+
+JSONL_CASES = [
+    b"",
+    b"\n\n  \n",
+    b'{"a": 1}\n{"b": 2}',
+    b'{"a": 1}\r\n\r\n{"b": [1, {"c": "\xe2\x82\xac"}]}\r\n',
+    b'{"a": 1}\r{"b": 2}\r',
+    b'{"a":\r1}\n',
+    b'  {"a": 1}  \n{"a": 1}\xc2\xa0\n\xc2\xa0\n',
+    b'{"a": 1}\n[1, 2]\n',
+    b'{"a": 1}\n{"a": 1}, {"b": 2}\n',
+    b'{"a":[{}\n{}]}\n{},{}\n',
+    b'{"a": 1}\n\xff\xfe\n',
+    b'\xef\xbb\xbf{"a": 1}\n',
+]
+
+
+@pytest.mark.parametrize("content", JSONL_CASES)
+def test_streaming_scanner_matches_line_by_line_reference(tmp_path: Path, monkeypatch, content: bytes):
+    path = tmp_path / "telemetry.jsonl"
+    path.write_bytes(content)
+    expected = _reference_validate(path)
+
+    assert release_evidence_gate._validate_telemetry_file(path) == expected
+
+    # Any split into byte ranges (and tiny read blocks) must agree as well.
+    monkeypatch.setattr(release_evidence_gate, "READ_BLOCK_BYTES", 3)
+    size = len(content)
+    for cuts in ([], [1], [size // 2], [1, size // 3, size - 1]):
+        bounds = sorted({0, size, *[cut for cut in cuts if 0 < cut < size]})
+        outcomes = [release_evidence_gate._scan_jsonl_range(str(path), a, b) for a, b in zip(bounds, bounds[1:])]
+        valid = all(outcome[0] for outcome in outcomes)
+        assert (valid, valid and sum(outcome[1] for outcome in outcomes) > 0) == expected
+
+
+def test_parallel_ranges_sampling_and_throughput_stats(tmp_path: Path, monkeypatch):
+    path = tmp_path / "telemetry.jsonl"
+    path.write_text("".join(json.dumps({"i": i, "pad": "x" * (i % 40)}) + "\n" for i in range(4000)), encoding="utf-8")
+    monkeypatch.setattr(release_evidence_gate, "RANGE_BYTES", 10_000)
+    monkeypatch.setattr(release_evidence_gate, "PARALLEL_MIN_BYTES", 0)
+
+    full = validate_telemetry_files({"k": path}, mode="full", workers=2)["k"]
+    assert (full["valid"], full["has_records"], full["records"], full["mode"]) == (True, True, 4000, "full")
+    assert full["bytes_read"] >= full["bytes"] == path.stat().st_size
+    assert full["mb_per_s"] is not None and not full["cached"]
+
+    monkeypatch.setattr(release_evidence_gate, "SAMPLE_WINDOWS", 4)
+    monkeypatch.setattr(release_evidence_gate, "SAMPLE_WINDOW_BYTES", 2_000)
+    sampled = validate_telemetry_files({"k": path}, mode="sample", workers=1)["k"]
+    assert (sampled["valid"], sampled["mode"]) == (True, "sample")
+    assert 0 < sampled["records"] < 4000
+    assert sampled["bytes_read"] < sampled["bytes"] // 4
+
+    # A corrupt line inside a sampled window is caught; one between windows is not.
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines[0] = "not-json\n"
+    path.write_text("".join(lines), encoding="utf-8")
+    assert validate_telemetry_files({"k": path}, mode="sample", workers=1)["k"]["valid"] is False
+    lines[0] = json.dumps({"i": 0, "pad": ""}) + "\n"
+    middle = len(lines) * 3 // 8
+    lines[middle] = "not-json\n"
+    path.write_text("".join(lines), encoding="utf-8")
+    assert validate_telemetry_files({"k": path}, mode="sample", workers=1)["k"]["valid"] is True
+    assert validate_telemetry_files({"k": path}, mode="full", workers=2)["k"]["valid"] is False
+
+    with pytest.raises(ValueError):
+        validate_telemetry_files({"k": path}, mode="fast")
+
+
+def test_validation_cache_is_keyed_by_size_and_mtime(tmp_path: Path, monkeypatch):
+    path = tmp_path / "telemetry.jsonl"
+    path.write_text('{"a": 1}\n', encoding="utf-8")
+    cache_path = tmp_path / "cache.json"
+
+    first = validate_telemetry_files({"k": path}, cache=TelemetryValidationCache(cache_path))["k"]
+    assert first["cached"] is False
+
+    scans = []
+    original = release_evidence_gate._scan_jsonl_range
+    monkeypatch.setattr(release_evidence_gate, "_scan_jsonl_range", lambda *a: scans.append(a) or original(*a))
+
+    cache = TelemetryValidationCache(cache_path)
+    assert validate_telemetry_files({"k": path}, mode="full", cache=cache)["k"]["cached"] is True
+    assert validate_telemetry_files({"k": path}, mode="sample", cache=cache)["k"]["cached"] is True
+    assert scans == []
+
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write("[1]\n")
+    stats = validate_telemetry_files({"k": path}, cache=cache)["k"]
+    assert (stats["cached"], stats["valid"]) == (False, False)
+    assert len(scans) == 1
+
+
+def test_evaluate_manifest_reports_telemetry_validation(tmp_path: Path):
+    evidence = {}
+    for key in REQUIRED_EVIDENCE_KEYS:
+        _write(tmp_path / f"evidence/{key}.md", "ok")
+        evidence[key] = {"path": f"evidence/{key}.md"}
+    telemetry = {}
+    for key in BLOCKING_TELEMETRY_KEYS:
+        _write(tmp_path / f"telemetry/{key}.jsonl", '{"ok": true}\n' * 3)
+        telemetry[key] = {"path": f"telemetry/{key}.jsonl"}
+    telemetry[BLOCKING_TELEMETRY_KEYS[0]] = {"path": "telemetry/empty.jsonl"}
+    _write(tmp_path / "telemetry/empty.jsonl", "\n")
+    manifest_path = tmp_path / "manifest.json"
+    _write(manifest_path, json.dumps({"evidence": evidence, "telemetry": telemetry}))
+
+    result = evaluate_manifest(str(manifest_path), repo_root=str(tmp_path), telemetry_mode="sample")
+
+    assert result.decision == "NO-GO"
+    assert result.missing_blocking_telemetry == [BLOCKING_TELEMETRY_KEYS[0]]
+    assert [stats["key"] for stats in result.telemetry_validation] == BLOCKING_TELEMETRY_KEYS
+    assert [stats["records"] for stats in result.telemetry_validation] == [0] + [3] * (len(BLOCKING_TELEMETRY_KEYS) - 1)
@@ -0,0 +1,114 @@
+"""Tests for the SQLite FTS5 session-log event index and its query CLI."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts import query_session_log_events as query_events
+from scripts.session_log_index import SessionLogIndex, fts_query
+
+
+def _row(source: str, timestamp: str | None, text: str, stance: str = "exploration", kind: str = "prompt",
+         approaches: list[str] | None = None) -> dict[str, object]:
+    return {"source_file": source, "event_kind": kind, "timestamp": timestamp, "pair_index": 1,
+            "approaches": approaches or ["general"], "stance": stance, "text": text}
+
+
+ROWS = [
+    _row("Session Log 1.md", "2026-01-05 10:00:00", "Memory retrieval over session logs.", approaches=["memory-and-retrieval"]),
+    _row("Session Log 1.md", "2026-01-06 10:00:00", "Authorization policy and delegation.", stance="adopted-or-endorsed",
+         kind="response", approaches=["identity-auth-governance"]),
+    _row("Session Log 2.md", "2026-02-10 09:00:00", "memory memory memory retrieval", approaches=["memory-and-retrieval"]),
+    _row("Session Log 2.md", None, "Unrelated build notes."),
+    _row("Session Log 3.md", "2026-03-01 08:00:00", "We rejected NotebookLM as the only memory store.",
+         stance="rejected-or-deprioritized", approaches=["memory-and-retrieval", "knowledge-ingestion"]),
+]
+
+
+@pytest.fixture()
+def events_file(tmp_path: Path) -> Path:
+    path = tmp_path / "session_log_events.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in ROWS), encoding="utf-8")
+    return path
+
+
+def test_fts_query_builds_prefix_or_terms() -> None:
+    assert fts_query('Auth "policy" auth-z') == '"auth"* OR "policy"* OR "z"*'
+    assert fts_query("  ") == ""
+
+
+def test_ranked_search_with_prefix_terms(events_file: Path) -> None:
+    with SessionLogIndex.open(events_file) as index:
+        page = index.search("memory")
+        assert page.total == 3
+        assert page.hits[0]["text"] == "memory memory memory retrieval"
+        assert index.search("auth").hits[0]["approaches"] == ["identity-auth-governance"]
+        assert index.search("nothing-matches-this").total == 0
+
+
+def test_filters_and_pagination(events_file: Path) -> None:
+    with SessionLogIndex.open(events_file) as index:
+        assert index.search("memory", approach="knowledge-ingestion").total == 1
+        assert index.search(stance="adopted-or-endorsed").hits[0]["event_kind"] == "response"
+        assert index.search(kind="response").total == 1
+        assert index.search(source_file="Session Log 2.md").total == 2
+        assert [hit["timestamp"] for hit in index.search(since="2026-02").hits] == [
+            "2026-03-01 08:00:00",
+            "2026-02-10 09:00:00",
+        ]
+        assert index.search(until="2026-01").total == 2
+
+        everything = index.search(limit=100)
+        assert everything.total == 5
+        pages = [index.search(limit=2, offset=offset).hits for offset in (0, 2, 4)]
+        assert [hit for page in pages for hit in page] == everything.hits
+
+
+def test_matches_scan_for_filters_without_text_query(events_file: Path) -> None:
+    rows = query_events.load_rows(events_file)
+    with SessionLogIndex.open(events_file) as index:
+        for filters in ({}, {"approach": "memory-and-retrieval"}, {"since": "2026-01-06", "until": "2026-02"}):
+            indexed = index.search(limit=50, **filters)
+            scanned = query_events.scan_rows(rows, limit=50, **filters)
+            assert indexed.total == scanned.total
+            assert [hit["text"] for hit in indexed.hits] == [hit["text"] for hit in scanned.hits]
+
+
+def test_stale_index_is_rebuilt_and_sync_applies_changes(events_file: Path) -> None:
+    db_path = events_file.with_suffix(".sqlite")
+    SessionLogIndex.open(events_file).close()
+
+    extra = _row("Session Log 4.md", "2026-04-01 00:00:00", "Fresh memory note.")
+    with events_file.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(extra) + "\n")
+    with SessionLogIndex(db_path) as index:
+        assert not index.is_current(events_file)
+    with SessionLogIndex.open(events_file) as index:
+        assert index.search("fresh").total == 1
+
+        kept = [json.dumps(row) + "\n" for row in ROWS + [extra] if row["source_file"] != "Session Log 1.md"]
+        events_file.write_text("".join(kept), encoding="utf-8")
+        index.sync(events_file, drop_sources=["Session Log 1.md"])
+        assert index.is_current(events_file)
+        assert index.search(source_file="Session Log 1.md").total == 0
+        assert index.search("authorization").total == 0
+        assert index.search().total == 4
+
+
+def test_same_size_rewrite_is_reindexed(events_file: Path) -> None:
+    SessionLogIndex.open(events_file).close()
+
+    text = events_file.read_text(encoding="utf-8")
+    stat = events_file.stat()
+    events_file.write_text(text.replace("Authorization", "Certification"), encoding="utf-8")
+    os.utime(events_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert events_file.stat().st_size == stat.st_size
+
+    with SessionLogIndex.open(events_file) as index:
+        assert index.is_current(events_file)
+        assert index.search("certification").total == 1
+        assert index.search("authorization").total == 0
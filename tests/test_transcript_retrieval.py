@@ -0,0 +1,143 @@
+"""Tests for indexed transcript ranking in mcp_server_transcript_retrieval."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import mcp_server_transcript_retrieval as retrieval
+
+
+def _write_transcript(
+    directory: Path,
+    name: str,
+    title: str,
+    creator: str,
+    topics: list[str],
+    summary: str,
+    analysis: str,
+) -> Path:
+    topic_lines = "\n".join(f"  - {topic}" for topic in topics)
+    path = directory / name
+    path.write_text(
+        "---\n"
+        f"title: {title}\n"
+        f"creator: {creator}\n"
+        f"video_id: vid-{path.stem}\n"
+        f"topics_detected:\n{topic_lines}\n"
+        "---\n\n"
+        f"## Summary\n\n{summary}\n\n"
+        f"## Analysis\n\n{analysis}\n\n"
+        "## Transcription\n\nraw words\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def transcripts(tmp_path: Path) -> Path:
+    directory = tmp_path / "Transcripts"
+    directory.mkdir()
+    _write_transcript(
+        directory, "agents-memory.md", "Agent memory systems", "Nate",
+        ["memory", "agent"], "Memory for agents. " * 30, "Context windows and retrieval.",
+    )
+    _write_transcript(
+        directory, "offline-server.md", "Offline server build", "Crosstalk",
+        ["server", "offline"], "Building an offline server.", "Power, storage and memory budgets.",
+    )
+    _write_transcript(
+        directory, "gpt-review.md", "GPT is really good", "Theo",
+        ["gpt", "code"], "A review of the new model.", "Agent coding benchmarks.",
+    )
+    (directory / "broken.md").write_text("---\ntitle: [unclosed\n---\n", encoding="utf-8")
+    retrieval._TOKEN_INDEXES.clear()
+    yield directory
+    retrieval._TOKEN_INDEXES.clear()
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["agent memory", "offline server storage", "theo gpt", "nothing matches here", "", "retrieval"],
+)
+def test_indexed_ranking_matches_full_scan(transcripts: Path, query: str):
+    expected_count, expected = retrieval._rank_documents_by_scan(query, transcripts, top_k=2)
+
+    result = retrieval.rank_transcript_documents(query, directory=str(transcripts), top_k=2)
+
+    assert result["candidate_count"] == expected_count
+    assert result["results"] == expected
+
+
+def test_ranking_reads_only_changed_transcripts(transcripts: Path, monkeypatch):
+    built = retrieval.build_transcript_frontmatter_index(
+        directory=str(transcripts), output_file=str(transcripts / "_frontmatter_index.yaml")
+    )
+    assert built["count"] == 3
+    assert built["token_index"] == {"indexed": 4, "reused": 0, "removed": 0}
+    assert Path(built["token_index_file"]).exists()
+
+    reads: list[str] = []
+    original = retrieval._read_transcript_doc
+    monkeypatch.setattr(
+        retrieval, "_read_transcript_doc", lambda path: reads.append(path.name) or original(path)
+    )
+
+    # A fresh process loads the persisted index instead of re-reading files.
+    retrieval._TOKEN_INDEXES.clear()
+    retrieval.rank_transcript_documents("agent", directory=str(transcripts))
+    assert reads == []
+
+    updated = _write_transcript(
+        transcripts, "gpt-review.md", "GPT is really good", "Theo",
+        ["gpt", "code"], "Now about kubernetes.", "Cluster notes.",
+    )
+    stat = updated.stat()
+    os.utime(updated, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (transcripts / "offline-server.md").unlink()
+
+    rebuilt = retrieval.build_transcript_frontmatter_index(
+        directory=str(transcripts), output_file=str(transcripts / "_frontmatter_index.yaml")
+    )
+    assert reads == ["gpt-review.md"]
+    assert rebuilt["token_index"] == {"indexed": 1, "reused": 2, "removed": 1}
+
+    result = retrieval.rank_transcript_documents("kubernetes", directory=str(transcripts), top_k=1)
+    assert result["results"][0]["file_path"] == str(transcripts / "gpt-review.md")
+    assert result["candidate_count"] == 2
+
+
+def test_bm25_mode_ranks_by_field_weighted_relevance(transcripts: Path):
+    result = retrieval.rank_transcript_documents(
+        "offline server", directory=str(transcripts), top_k=3, scoring="bm25"
+    )
+
+    assert result["scoring"] == "bm25"
+    assert result["candidate_count"] == 1
+    top = result["results"][0]
+    assert top["file_path"] == str(transcripts / "offline-server.md")
+    assert top["scores"]["bm25"] == top["scores"]["final"] > 0
+
+    agent = retrieval.rank_transcript_documents("agent", directory=str(transcripts), top_k=3, scoring="bm25")
+    names = [Path(row["file_path"]).name for row in agent["results"]]
+    # Title/topic (frontmatter) matches outweigh an analysis-only match.
+    assert names == ["agents-memory.md", "gpt-review.md"]
+
+
+def test_bm25_fallback_without_numpy_matches_numpy(transcripts: Path, monkeypatch):
+    pytest.importorskip("numpy")
+    query = "memory agent server gpt"
+    with_numpy = retrieval.rank_transcript_documents(query, directory=str(transcripts), top_k=5, scoring="bm25")
+
+    monkeypatch.setattr(retrieval, "np", None)
+    retrieval._TOKEN_INDEXES.clear()
+    without_numpy = retrieval.rank_transcript_documents(query, directory=str(transcripts), top_k=5, scoring="bm25")
+
+    assert without_numpy["results"] == with_numpy["results"]
+
+
+def test_unknown_scoring_mode_is_rejected(transcripts: Path):
+    result = retrieval.rank_transcript_documents("agent", directory=str(transcripts), scoring="tfidf")
+    assert result == {"status": "error", "reason": "unknown_scoring_mode", "scoring": "tfidf"}
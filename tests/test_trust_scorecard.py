@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 
+from src.skills import trust_scorecard
 from src.skills.trust_scorecard import (
+    GateResultCache,
     MockGateProvider,
+    _load_registry_skills,
     build_trust_bundle,
     evaluate_registry,
     evaluate_skill,
+    run_registry_evaluation,
     summarize,
 )
 
@@ -112,3 +117,124 @@ def test_build_trust_bundle_schema():
     assert bundle["decision"]["status"] in {"ALLOW_AUTO", "MANUAL_REVIEW", "BLOCK"}
     assert isinstance(bundle["gate_results"], list)
     assert bundle["evidence"]["test_evidence"] == "tests/test_blog_publisher.py"
+
+
+REGISTRY_YAML = """
+skills:
+  safe_skill:
+    version: 1.0.0
+    fingerprint: fff111
+    author: roadtrip
+    capabilities: [a]
+    status: active
+    test_coverage: 90.0
+  weak_skill:
+    version: 1.0.0
+    fingerprint: fff222
+    author: unknown
+    capabilities: []
+    status: active
+    test_coverage: 20.0
+  mid_skill:
+    version: 2.0.0
+    fingerprint: fff333
+    author: unknown
+    capabilities: []
+    status: active
+    test_coverage: 75.0
+""".strip()
+
+
+class CountingProvider(MockGateProvider):
+    def __init__(self, overrides=None, failing_gate: str = "") -> None:
+        super().__init__(overrides)
+        self.calls: list[tuple[str, str]] = []
+        self.failing_gate = failing_gate
+
+    def evaluate_gate(self, skill_name, metadata, gate):
+        self.calls.append((skill_name, gate["name"]))
+        if gate["name"] == self.failing_gate:
+            raise RuntimeError("scanner unavailable")
+        return super().evaluate_gate(skill_name, metadata, gate)
+
+
+def _sequential(registry: Path, provider: MockGateProvider) -> list[dict]:
+    skills = _load_registry_skills(str(registry))
+    return [asdict(evaluate_skill(name, skills[name], provider)) for name in sorted(skills)]
+
+
+def test_concurrent_engine_matches_sequential_evaluation(tmp_path: Path):
+    registry = tmp_path / "skills-registry.yaml"
+    registry.write_text(REGISTRY_YAML, encoding="utf-8")
+    overrides = {"mid_skill": {"author_reputation": {"passed": True, "reason": "vouched"}}}
+
+    expected = _sequential(registry, MockGateProvider(overrides))
+    for workers in (1, 4):
+        evaluation = run_registry_evaluation(str(registry), MockGateProvider(overrides), max_workers=workers)
+        assert [asdict(card) for card in evaluation.scorecards] == expected
+        assert evaluation.timing["skills"] == 3
+        assert evaluation.timing["gate_evaluations"] == 18
+        assert set(evaluation.timing["gates"]) == {gate["name"] for gate in MockGateProvider.DEFAULT_GATES}
+
+
+def test_gate_cache_skips_unchanged_skills_and_tracks_gate_versions(tmp_path: Path, monkeypatch):
+    registry = tmp_path / "skills-registry.yaml"
+    registry.write_text(REGISTRY_YAML, encoding="utf-8")
+    cache_path = tmp_path / "gate-cache.json"
+
+    first = run_registry_evaluation(str(registry), CountingProvider(), cache=GateResultCache(cache_path))
+    assert first.timing["cache_misses"] == 18
+
+    provider = CountingProvider()
+    second = run_registry_evaluation(str(registry), provider, cache=GateResultCache(cache_path))
+    assert provider.calls == []
+    assert second.timing["cache_hits"] == 18
+    assert [asdict(card) for card in second.scorecards] == [asdict(card) for card in first.scorecards]
+
+    registry.write_text(REGISTRY_YAML.replace("test_coverage: 20.0", "test_coverage: 95.0"), encoding="utf-8")
+    provider = CountingProvider(overrides={"safe_skill": {"capability_fit": {"passed": False}}})
+    run_registry_evaluation(str(registry), provider, cache=GateResultCache(cache_path))
+    assert sorted(provider.calls) == sorted(
+        [("safe_skill", "capability_fit")] + [("weak_skill", gate["name"]) for gate in MockGateProvider.DEFAULT_GATES]
+    )
+
+    bumped = [dict(gate, version=2) if gate["name"] == "author_reputation" else gate for gate in MockGateProvider.DEFAULT_GATES]
+    monkeypatch.setattr(MockGateProvider, "DEFAULT_GATES", bumped)
+    provider = CountingProvider(overrides={"safe_skill": {"capability_fit": {"passed": False}}})
+    run_registry_evaluation(str(registry), provider, cache=GateResultCache(cache_path))
+    assert sorted(provider.calls) == sorted((name, "author_reputation") for name in ("mid_skill", "safe_skill", "weak_skill"))
+
+
+def test_gate_errors_fail_closed_and_are_not_cached(tmp_path: Path):
+    registry = tmp_path / "skills-registry.yaml"
+    registry.write_text(REGISTRY_YAML, encoding="utf-8")
+    cache = GateResultCache()
+
+    evaluation = run_registry_evaluation(
+        str(registry), CountingProvider(failing_gate="security_review_passed"), max_workers=4, cache=cache
+    )
+    assert evaluation.timing["gate_errors"] == 3
+    assert all(card.decision == "BLOCK" for card in evaluation.scorecards)
+    assert "gate error: RuntimeError" in evaluation.scorecards[0].gates[2].reason
+
+    provider = CountingProvider()
+    run_registry_evaluation(str(registry), provider, cache=cache)
+    assert sorted(provider.calls) == sorted((name, "security_review_passed") for name in ("mid_skill", "safe_skill", "weak_skill"))
+
+
+def test_registry_yaml_is_parsed_once_per_file_version(tmp_path: Path, monkeypatch):
+    registry = tmp_path / "skills-registry.yaml"
+    registry.write_text(REGISTRY_YAML, encoding="utf-8")
+    loads = []
+    original = trust_scorecard.yaml.load
+    monkeypatch.setattr(trust_scorecard.yaml, "load", lambda *a, **k: loads.append(1) or original(*a, **k))
+
+    first = _load_registry_skills(str(registry))
+    first["safe_skill"]["status"] = "suspended"  # callers get their own copy
+    assert _load_registry_skills(str(registry))["safe_skill"]["status"] == "active"
+    assert len(loads) == 1
+
+    registry.write_text(REGISTRY_YAML + "\n  extra_skill:\n    version: 0.1.0\n", encoding="utf-8")
+    assert "extra_skill" in _load_registry_skills(str(registry))
+    assert len(loads) == 2
+    assert _load_registry_skills(str(tmp_path / "missing.yaml")) == {}
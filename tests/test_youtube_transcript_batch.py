@@ -0,0 +1,116 @@
+"""Tests for batch brief extraction with an injected fake fetch layer."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import mcp_server_youtube_transcript as server
+from scripts.extract_youtube_debate_brief import FetchLayer, RateLimiter, Segment, build_document_stem
+
+VIDEO_IDS = [f"vid{i:08d}" for i in range(6)]
+
+
+class _FakeYouTube:
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls: list[tuple[str, str]] = []
+
+    def _enter(self, kind: str, video_id: str) -> None:
+        with self.lock:
+            self.calls.append((kind, video_id))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+
+    def check(self, video_id: str, languages: list[str]) -> dict:
+        self._enter("check", video_id)
+        if video_id.endswith("5"):
+            return {"status": "no_transcript_available", "video_id": video_id, "reason": "no_tracks_returned"}
+        return {"status": "transcript_available", "video_id": video_id}
+
+    def metadata(self, video_id: str) -> dict:
+        self._enter("metadata", video_id)
+        return {
+            "watch_url": f"https://www.youtube.com/watch?v={video_id}",
+            "title": f"{video_id} agents debate",
+            "creator": "Fake Channel",
+            "upload_date": "2026-03-01T10:00:00-08:00",
+            "duration_seconds": 60,
+        }
+
+    def segments(self, video_id: str, languages: list[str]):
+        self._enter("segments", video_id)
+        if video_id.endswith("4"):
+            raise RuntimeError("caption endpoint failed")
+        segments = [
+            Segment(start=float(i), duration=1.0, text=f"Agents are always better at benchmark {i} tasks than people think.")
+            for i in range(5)
+        ]
+        return segments, {"language_selected": "en", "is_generated": False, "segment_count": len(segments)}
+
+    def playlist(self, url: str) -> list[str]:
+        self._enter("playlist", url)
+        return VIDEO_IDS[3:]
+
+    def layer(self) -> FetchLayer:
+        return FetchLayer(
+            check_availability=self.check,
+            fetch_metadata=self.metadata,
+            fetch_segments=self.segments,
+            list_playlist=self.playlist,
+        )
+
+
+def test_batch_fetches_concurrently_and_refreshes_index_once(tmp_path: Path, monkeypatch):
+    fake = _FakeYouTube()
+    refreshes: list[str] = []
+    monkeypatch.setattr(server, "_try_refresh_frontmatter_index", lambda directory: refreshes.append(directory) or {"status": "ok"})
+    stem = build_document_stem(
+        creator="Fake Channel", upload_date="2026-03-01", title=f"{VIDEO_IDS[0]} agents debate"
+    )
+    stale = tmp_path / f"{stem}-transcript.md"
+    stale.write_text("old transcript-only file", encoding="utf-8")
+
+    result = server._extract_briefs_batch(
+        VIDEO_IDS[:3] + ["not a video"],
+        output_dir=str(tmp_path),
+        playlist_url="https://www.youtube.com/playlist?list=PLfake",
+        max_workers=4,
+        requests_per_second=0,
+        fetch=fake.layer(),
+    )
+
+    assert result["requested"] == 6
+    assert result["written"] == 4
+    assert result["invalid_inputs"] == ["not a video"]
+    assert [item["video_id"] for item in result["results"]] == VIDEO_IDS
+    statuses = {item["video_id"]: item["status"] for item in result["results"]}
+    assert statuses[VIDEO_IDS[4]] == "error"
+    assert statuses[VIDEO_IDS[5]] == "no_transcript_available"
+    assert fake.peak > 1
+    assert refreshes == [str(tmp_path.resolve())]
+    assert result["results"][0]["deleted_transcript_file"] == str(stale.resolve())
+    assert not stale.exists()
+
+    brief = Path(result["results"][0]["output_file"]).read_text(encoding="utf-8")
+    assert "generator_mcp_server: mcp_server_youtube_transcript.py" in brief
+    assert "## Transcription\n- [00:00:00] Agents are always better" in brief
+    assert len(list(tmp_path.glob("*.md"))) == 4
+
+
+def test_rate_limiter_spaces_requests_after_burst():
+    limiter = RateLimiter(rate=50.0, burst=2)
+    start = time.monotonic()
+    for _ in range(7):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # Two calls ride the burst; the other five wait ~20 ms each.
+    assert elapsed >= 0.09